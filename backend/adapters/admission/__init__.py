@@ -0,0 +1 @@
+# Контроль допуска запросов: лимиты клиентов и защита общих ресурсов
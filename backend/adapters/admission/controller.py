@@ -0,0 +1,106 @@
+"""Контроллер допуска ingest-запросов: лимит клиента, конкурентность и давление ресурсов."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+
+from backend.adapters.admission.token_buckets import TokenBuckets
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+
+@dataclass(frozen=True, slots=True)
+class Admission:
+    """Решение о допуске: при отказе — причина и через сколько секунд повторить."""
+
+    admitted: bool
+    reason: str = "admitted"
+    retry_after: float = 0.0
+
+
+ADMITTED = Admission(admitted=True)
+
+
+class AdmissionController:
+    """Решает, пускать ли запрос на запись, до того как он займёт соединение.
+
+    Проверки идут от общих ресурсов к клиенту: свободные соединения пула сверх
+    reserved_connections (их держим для читателей /state; проверка первая, так
+    как глубина outbox считается запросом к БД), глубина очереди пересчёта,
+    число запросов в работе и, последней, корзина клиента —
+    чтобы отказ по общей перегрузке не списывал токены. Значение 0 или None
+    в лимите отключает соответствующую проверку. Допущенный запрос обязан
+    вызвать release().
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 0,
+        rate_per_second: float = 0.0,
+        burst: float = 1.0,
+        pool_headroom: Callable[[], int | None] = lambda: None,
+        reserved_connections: int = 0,
+        queue_depth: Callable[[], int] = lambda: 0,
+        max_queue_depth: int = 0,
+        retry_after_seconds: float = 1.0,
+        metrics: MetricsPort | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_in_flight = max_in_flight
+        self._buckets = TokenBuckets(rate_per_second, burst, clock=clock)
+        self._rate_limited = rate_per_second > 0
+        self._pool_headroom = pool_headroom
+        self._reserved = reserved_connections
+        self._queue_depth = queue_depth
+        self._max_queue_depth = max_queue_depth
+        self._retry_after = retry_after_seconds
+        self._metrics = metrics or NullMetrics()
+        self._in_flight = 0
+        self._lock = Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Число допущенных и ещё не завершённых запросов."""
+
+        return self._in_flight
+
+    def admit(self, client: str) -> Admission:
+        """Принять решение о запросе клиента и учесть его в метриках."""
+
+        decision = self._shed()
+        with self._lock:
+            if decision is None and self._max_in_flight and self._in_flight >= self._max_in_flight:
+                decision = Admission(False, "concurrency", self._retry_after)
+            if decision is None and self._rate_limited:
+                wait = self._buckets.take(client)
+                decision = Admission(False, "rate", wait) if wait > 0 else None
+            if decision is None:
+                self._in_flight += 1
+            in_flight, clients = self._in_flight, self._buckets.clients
+        decision = decision or ADMITTED
+        self._metrics.inc("admission_requests_total", result=decision.reason)
+        self._metrics.set_gauge("admission_in_flight", in_flight)
+        self._metrics.set_gauge("admission_clients", clients)
+        return decision
+
+    def release(self) -> None:
+        """Отметить завершение допущенного запроса."""
+
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            in_flight = self._in_flight
+        self._metrics.set_gauge("admission_in_flight", in_flight)
+
+    def _shed(self) -> Admission | None:
+        headroom = self._pool_headroom()
+        if headroom is not None:
+            self._metrics.set_gauge("admission_pool_headroom", headroom)
+            if headroom <= self._reserved:
+                return Admission(False, "pool", self._retry_after)
+        depth = self._queue_depth()
+        self._metrics.set_gauge("admission_queue_depth", depth)
+        if self._max_queue_depth and depth >= self._max_queue_depth:
+            return Admission(False, "queue", self._retry_after)
+        return None
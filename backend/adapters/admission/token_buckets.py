@@ -0,0 +1,52 @@
+"""Token bucket на клиента с ограниченным числом отслеживаемых клиентов."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class TokenBuckets:
+    """Корзины токенов по ключу клиента: rate токенов в секунду, не больше burst.
+
+    Корзины лениво пополняются при обращении, а самые давние клиенты
+    вытесняются после max_clients — вытесненный клиент вернётся с полной
+    корзиной, что безопасно: лимит лишь на время становится мягче.
+    Потокобезопасность обеспечивает вызывающий (AdmissionController).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_clients: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = max(burst, 1.0)
+        self._max_clients = max_clients
+        self._clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    @property
+    def clients(self) -> int:
+        """Число отслеживаемых клиентов."""
+
+        return len(self._buckets)
+
+    def take(self, client: str, cost: float = 1.0) -> float:
+        """Списать cost токенов; вернуть 0 при успехе или секунды до нужного запаса."""
+
+        now = self._clock()
+        tokens, updated = self._buckets.pop(client, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / self._rate
+        self._buckets[client] = (tokens, now)
+        while len(self._buckets) > self._max_clients:
+            self._buckets.popitem(last=False)
+        return wait
@@ -0,0 +1,123 @@
+"""Журнал стоимости LLM-вызовов по сделкам: токены, число вызовов и деньги."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+
+
+@dataclass(frozen=True, slots=True)
+class ModelPrice:
+    """Цена модели за 1000 токенов промпта и ответа (в рублях)."""
+
+    prompt_per_1k: float
+    completion_per_1k: float
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """Посчитать стоимость вызова."""
+
+        return (
+            prompt_tokens * self.prompt_per_1k + completion_tokens * self.completion_per_1k
+        ) / 1000
+
+
+DEFAULT_PRICES: dict[str, ModelPrice] = {
+    "GigaChat": ModelPrice(prompt_per_1k=0.2, completion_per_1k=0.2),
+    "GigaChat-Pro": ModelPrice(prompt_per_1k=1.5, completion_per_1k=1.5),
+}
+_FREE = ModelPrice(prompt_per_1k=0.0, completion_per_1k=0.0)
+
+
+@dataclass(slots=True)
+class DealCost:
+    """Накопленные расходы сделки; by_task — стоимость в разрезе use case."""
+
+    deal_id: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    by_task: dict[str, float] = field(default_factory=dict)
+
+    def add(self, task: str, prompt_tokens: int, completion_tokens: int, cost: float) -> None:
+        """Прибавить один вызов к накопленным расходам."""
+
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost += cost
+        self.by_task[task] = self.by_task.get(task, 0.0) + cost
+
+    def copy(self) -> DealCost:
+        """Вернуть независимую копию записи."""
+
+        return DealCost(
+            deal_id=self.deal_id,
+            calls=self.calls,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            cost=self.cost,
+            by_task=dict(self.by_task),
+        )
+
+
+TOTAL_KEY = "*"
+
+
+class CostLedger:
+    """Потокобезопасный in-memory журнал расходов на LLM по сделкам.
+
+    По сделкам хранится не больше max_deals записей (LRU по последнему вызову),
+    итоги процесса копятся отдельно и при вытеснении сделок не уменьшаются.
+    """
+
+    def __init__(
+        self, prices: Mapping[str, ModelPrice] = DEFAULT_PRICES, max_deals: int = 10_000
+    ) -> None:
+        self._prices = dict(prices)
+        self._max_deals = max_deals
+        self._deals: OrderedDict[str, DealCost] = OrderedDict()
+        self._totals = DealCost(deal_id=TOTAL_KEY)
+        self._lock = Lock()
+
+    def record(
+        self,
+        deal_id: str,
+        task: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+    ) -> float:
+        """Учесть вызов и вернуть его стоимость (неизвестная модель считается бесплатной)."""
+
+        cost = self._prices.get(model, _FREE).cost(prompt_tokens, completion_tokens)
+        with self._lock:
+            entry = self._deals.setdefault(deal_id, DealCost(deal_id=deal_id))
+            self._deals.move_to_end(deal_id)
+            entry.add(task, prompt_tokens, completion_tokens, cost)
+            self._totals.add(task, prompt_tokens, completion_tokens, cost)
+            while len(self._deals) > self._max_deals:
+                self._deals.popitem(last=False)
+        return cost
+
+    def for_deal(self, deal_id: str) -> DealCost:
+        """Вернуть копию расходов сделки (нулевую, если вызовов не было)."""
+
+        with self._lock:
+            entry = self._deals.get(deal_id)
+            return entry.copy() if entry else DealCost(deal_id=deal_id)
+
+    def totals(self) -> DealCost:
+        """Вернуть расходы процесса по всем сделкам, включая вытесненные (deal_id="*")."""
+
+        with self._lock:
+            return self._totals.copy()
+
+    def top(self, limit: int = 10) -> list[DealCost]:
+        """Сделки с наибольшими расходами, по убыванию стоимости."""
+
+        with self._lock:
+            entries = sorted(self._deals.values(), key=lambda entry: entry.cost, reverse=True)
+            return [entry.copy() for entry in entries[:limit]]
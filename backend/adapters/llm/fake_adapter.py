@@ -0,0 +1,72 @@
+"""Детерминированный фейковый LLM-провайдер для тестов и локальной разработки."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable, Iterator
+
+from backend.adapters.llm.streaming import rechunk
+from backend.ports.llm_client import LLMRequest, LLMResponse, LLMStreamingClientPort
+
+Responder = Callable[[LLMRequest], str]
+
+
+def _approx_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+class FakeLLMClient(LLMStreamingClientPort):
+    """Отвечает заранее заданным текстом с опциональной задержкой и журналом вызовов.
+
+    В потоковом режиме ответ отдаётся фрагментами по chunk_size символов, между
+    фрагментами выдерживается chunk_delay.
+    """
+
+    def __init__(
+        self,
+        responder: Responder | str = "[]",
+        delay: float = 0.0,
+        model: str = "fake",
+        chunk_size: int = 16,
+        chunk_delay: float = 0.0,
+    ) -> None:
+        self._responder = responder
+        self._delay = delay
+        self._model = model
+        self._chunk_size = chunk_size
+        self._chunk_delay = chunk_delay
+        self._lock = Lock()
+        self.calls: list[LLMRequest] = []
+
+    @property
+    def model(self) -> str:
+        """Имя модели в ответах (и в учёте потоковых вызовов)."""
+
+        return self._model
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Вернуть ответ responder после задержки delay."""
+
+        text = self._respond(request)
+        return LLMResponse(
+            text=text,
+            model=self._model,
+            prompt_tokens=_approx_tokens(request.system) + _approx_tokens(request.user),
+            completion_tokens=_approx_tokens(text),
+        )
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Отдать ответ responder фрагментами с задержкой chunk_delay между ними."""
+
+        for chunk in rechunk(self._respond(request), self._chunk_size):
+            yield chunk
+            if self._chunk_delay:
+                time.sleep(self._chunk_delay)
+
+    def _respond(self, request: LLMRequest) -> str:
+        with self._lock:
+            self.calls.append(request)
+        if self._delay:
+            time.sleep(self._delay)
+        return self._responder if isinstance(self._responder, str) else self._responder(request)
@@ -0,0 +1,138 @@
+"""Инструментированный LLM-клиент: токены, стоимость, латентность, ретраи и кэш."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterator, TypedDict
+
+from backend.adapters.llm.cost_ledger import CostLedger
+from backend.adapters.llm.response_schema import ResponseValidator
+from backend.pipelines.token_estimator import approx_tokens
+from backend.ports.llm_client import (
+    LLMClientPort,
+    LLMDeadlineExceeded,
+    LLMError,
+    LLMRequest,
+    LLMResponse,
+)
+from backend.ports.metrics import MetricsPort
+
+TokenCounter = Callable[[str], int]
+
+
+class CallLabels(TypedDict):
+    """Метки метрик вызова LLM (к ним добавляется model, когда модель известна)."""
+
+    use_case: str
+    framework: str
+
+
+class ModelLabels(CallLabels):
+    """Метки вызова вместе с моделью ответа."""
+
+    model: str
+
+
+class InstrumentedLLMClient(LLMClientPort):
+    """Декоратор LLM-порта: метрики по use case, модели и фреймворку + журнал стоимости.
+
+    Временные ошибки провайдера (LLMError, кроме просроченных дедлайнов) и ответы,
+    не прошедшие схему, повторяются до max_retries раз; каждая попытка учитывается
+    в метриках и в журнале стоимости, так как провайдер её тоже тарифицирует.
+    Потоковый ответ не несёт usage: токены промпта и ответа оцениваются
+    token_counter, модель берётся из атрибута model провайдера.
+    """
+
+    def __init__(
+        self,
+        client: LLMClientPort,
+        metrics: MetricsPort,
+        ledger: CostLedger | None = None,
+        validator: ResponseValidator | None = None,
+        max_retries: int = 1,
+        timer: Callable[[], float] = time.perf_counter,
+        token_counter: TokenCounter = approx_tokens,
+    ) -> None:
+        self._client = client
+        self._metrics = metrics
+        self._ledger = ledger
+        self._validator = validator
+        self._max_retries = max_retries
+        self._timer = timer
+        self._token_counter = token_counter
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Выполнить запрос с учётом метрик и ретраев."""
+
+        labels = _labels(request)
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                self._metrics.inc("llm_retries_total", **labels)
+            started = self._timer()
+            try:
+                response = self._client.complete(request)
+            except LLMDeadlineExceeded:
+                raise
+            except LLMError:
+                self._metrics.inc("llm_errors_total", **labels)
+                if attempt == self._max_retries:
+                    raise
+                continue
+            self._record(request, response, self._timer() - started, labels)
+            if self._validator is None or self._validator(request, response.text):
+                return response
+            self._metrics.inc("llm_schema_failures_total", model=response.model, **labels)
+        return response
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Потоковый вызов: время до первого фрагмента, латентность, токены и стоимость."""
+
+        labels = _labels(request)
+        stream = getattr(self._client, "stream", None)
+        if not callable(stream):
+            yield self.complete(request).text
+            return
+        started = self._timer()
+        chunks: list[str] = []
+        for chunk in stream(request):
+            if not chunks:
+                self._metrics.observe("llm_first_chunk_seconds", self._timer() - started, **labels)
+            chunks.append(chunk)
+            yield chunk
+        text = "".join(chunks)
+        response = LLMResponse(
+            text=text,
+            model=str(getattr(self._client, "model", "unknown")),
+            prompt_tokens=self._token_counter(request.system) + self._token_counter(request.user),
+            completion_tokens=self._token_counter(text),
+        )
+        self._record(request, response, self._timer() - started, labels)
+
+    def _record(
+        self,
+        request: LLMRequest,
+        response: LLMResponse,
+        elapsed: float,
+        labels: CallLabels,
+    ) -> None:
+        labeled = ModelLabels(model=response.model, **labels)
+        self._metrics.inc("llm_calls_total", **labeled)
+        self._metrics.observe("llm_latency_seconds", elapsed, **labeled)
+        self._metrics.inc("llm_prompt_tokens_total", response.prompt_tokens, **labeled)
+        self._metrics.inc("llm_completion_tokens_total", response.completion_tokens, **labeled)
+        if response.cached_tokens:
+            self._metrics.inc("llm_cache_hits_total", **labeled)
+            self._metrics.inc("llm_cached_tokens_total", response.cached_tokens, **labeled)
+        if self._ledger is not None and request.deal_id:
+            cost = self._ledger.record(
+                request.deal_id,
+                request.task,
+                response.model,
+                response.prompt_tokens,
+                response.completion_tokens,
+            )
+            self._metrics.inc("llm_cost_total", cost, **labeled)
+
+
+def _labels(request: LLMRequest) -> CallLabels:
+    return CallLabels(use_case=request.task, framework=request.framework or "none")
@@ -0,0 +1,24 @@
+"""Клиент-порт LLM, привязанный к одной полосе планировщика."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from backend.ports.llm_client import LLMClientPort, LLMRequest, LLMResponse
+
+if TYPE_CHECKING:
+    from backend.adapters.llm.scheduler import LLMScheduler
+
+
+class LaneClient(LLMClientPort):
+    """Отправляет все вызовы в заданную полосу; use case не знает о приоритетах."""
+
+    def __init__(self, scheduler: "LLMScheduler", lane: str, timeout: float | None) -> None:
+        self._scheduler = scheduler
+        self._lane = lane
+        self._timeout = timeout
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Поставить запрос в полосу и дождаться результата."""
+
+        return self._scheduler.submit(request, self._lane, self._timeout).result()
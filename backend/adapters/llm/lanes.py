@@ -0,0 +1,135 @@
+"""Полосы приоритета LLM-запросов и взвешенная справедливая очередь (WFQ)."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Sequence
+
+from backend.ports.llm_client import LLMRequest, LLMResponse
+
+DEADLINE_KEEP = "keep"
+DEADLINE_DROP = "drop"
+DEADLINE_DEMOTE = "demote"
+
+
+@dataclass(frozen=True, slots=True)
+class LaneConfig:
+    """Настройки полосы: вес в WFQ, лимит параллелизма и политика просрочки."""
+
+    name: str
+    weight: float
+    max_concurrency: int
+    on_deadline: str = DEADLINE_KEEP
+    demote_to: str | None = None
+
+
+DEFAULT_LANES: tuple[LaneConfig, ...] = (
+    LaneConfig("interactive", weight=8.0, max_concurrency=4),
+    LaneConfig(
+        "near_real_time",
+        weight=3.0,
+        max_concurrency=2,
+        on_deadline=DEADLINE_DEMOTE,
+        demote_to="backfill",
+    ),
+    LaneConfig("backfill", weight=1.0, max_concurrency=1, on_deadline=DEADLINE_DROP),
+)
+
+
+@dataclass(slots=True)
+class QueuedJob:
+    """Запрос в очереди вместе с future, дедлайном и тегом виртуального времени."""
+
+    request: LLMRequest
+    future: Future[LLMResponse]
+    enqueued_at: float
+    deadline: float | None = None
+    lane: str = ""
+    tag: float = 0.0
+
+
+class FairQueue:
+    """WFQ по виртуальному времени завершения с лимитами полос; не потокобезопасна."""
+
+    def __init__(self, lanes: Sequence[LaneConfig]) -> None:
+        self._lanes = {lane.name: lane for lane in lanes}
+        for lane in lanes:
+            if lane.weight <= 0 or lane.max_concurrency < 1:
+                raise ValueError(f"Некорректные параметры полосы {lane.name}")
+            if lane.on_deadline == DEADLINE_DEMOTE and lane.demote_to not in self._lanes:
+                raise ValueError(f"Полоса {lane.name}: неизвестная полоса демоута")
+        self._queues: dict[str, deque[QueuedJob]] = {name: deque() for name in self._lanes}
+        self._last_tag = dict.fromkeys(self._lanes, 0.0)
+        self._active = dict.fromkeys(self._lanes, 0)
+        self._virtual_time = 0.0
+
+    def push(self, job: QueuedJob, lane: str) -> None:
+        """Поставить задачу в конец полосы, присвоив тег завершения."""
+
+        config = self._lanes.get(lane)
+        if config is None:
+            raise KeyError(f"Неизвестная полоса LLM: {lane}")
+        job.lane = lane
+        job.tag = max(self._virtual_time, self._last_tag[lane]) + 1.0 / config.weight
+        self._last_tag[lane] = job.tag
+        self._queues[lane].append(job)
+
+    def pop_ready(self, now: float, expired: list[tuple[QueuedJob, str]]) -> QueuedJob | None:
+        """Извлечь задачу с минимальным тегом среди полос, не упёршихся в лимит.
+
+        Просроченные головы полос обрабатываются по политике полосы и
+        дописываются в expired как пары (задача, действие).
+        """
+
+        while True:
+            lane = self._pick_lane()
+            if lane is None:
+                return None
+            job = self._queues[lane].popleft()
+            config = self._lanes[lane]
+            if job.deadline is not None and now > job.deadline:
+                if config.on_deadline == DEADLINE_DROP:
+                    expired.append((job, DEADLINE_DROP))
+                    continue
+                if config.on_deadline == DEADLINE_DEMOTE and config.demote_to:
+                    job.deadline = None
+                    expired.append((job, DEADLINE_DEMOTE))
+                    self.push(job, config.demote_to)
+                    continue
+            self._virtual_time = max(self._virtual_time, job.tag)
+            self._active[lane] += 1
+            return job
+
+    def release(self, lane: str) -> None:
+        """Освободить слот полосы после завершения вызова."""
+
+        self._active[lane] -= 1
+
+    def depth(self, lane: str) -> int:
+        """Количество задач, ожидающих в полосе."""
+
+        return len(self._queues[lane])
+
+    def lanes(self) -> tuple[str, ...]:
+        """Имена полос в порядке конфигурации."""
+
+        return tuple(self._lanes)
+
+    def drain(self) -> list[QueuedJob]:
+        """Извлечь все ожидающие задачи (для остановки планировщика)."""
+
+        jobs = [job for queue in self._queues.values() for job in queue]
+        for queue in self._queues.values():
+            queue.clear()
+        return jobs
+
+    def _pick_lane(self) -> str | None:
+        best: str | None = None
+        for name, queue in self._queues.items():
+            if not queue or self._active[name] >= self._lanes[name].max_concurrency:
+                continue
+            if best is None or queue[0].tag < self._queues[best][0].tag:
+                best = name
+        return best
@@ -0,0 +1,33 @@
+"""Проверка ответов LLM по JSON-схеме задачи для ретраев InstrumentedLLMClient."""
+
+from __future__ import annotations
+
+import json
+from typing import Callable
+
+from backend.ports.llm_client import LLMRequest
+from backend.prompts.renderer import PromptRenderer
+
+ResponseValidator = Callable[[LLMRequest, str], bool]
+# Задача LLMRequest → вид схемы ответа в PromptRenderer.
+SCHEMA_BY_TASK: dict[str, str] = {
+    "extract": "extract",
+    "reasoner": "reasoner",
+    "arbiter": "arbiter_batch",
+}
+
+
+def schema_validator(renderer: PromptRenderer) -> ResponseValidator:
+    """Проверка ответа по JSON-схеме задачи; задачи без схемы считаются валидными."""
+
+    def validate(request: LLMRequest, text: str) -> bool:
+        kind = SCHEMA_BY_TASK.get(request.task)
+        if kind is None:
+            return True
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return False
+        return renderer.validator(kind).is_valid(data)
+
+    return validate
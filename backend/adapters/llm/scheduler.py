@@ -0,0 +1,147 @@
+"""Планировщик LLM-запросов с полосами приоритета поверх любого провайдера."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future
+from threading import Condition, Thread
+from typing import Callable, Sequence
+
+from backend.adapters.llm.lane_client import LaneClient
+from backend.adapters.llm.lanes import (
+    DEADLINE_DROP,
+    DEFAULT_LANES,
+    FairQueue,
+    LaneConfig,
+    QueuedJob,
+)
+from backend.ports.llm_client import (
+    LLMClientPort,
+    LLMDeadlineExceeded,
+    LLMRequest,
+    LLMResponse,
+)
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+
+class LLMScheduler(LLMClientPort):
+    """Пул воркеров, выбирающий задачи по WFQ с учётом лимитов и дедлайнов полос."""
+
+    def __init__(
+        self,
+        client: LLMClientPort,
+        lanes: Sequence[LaneConfig] = DEFAULT_LANES,
+        workers: int = 4,
+        metrics: MetricsPort | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._queue = FairQueue(lanes)
+        self._metrics = metrics or NullMetrics()
+        self._clock = clock
+        self._cond = Condition()
+        self._closed = False
+        self._threads = [
+            Thread(target=self._worker, name=f"llm-worker-{idx}", daemon=True)
+            for idx in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        request: LLMRequest,
+        lane: str = "interactive",
+        timeout: float | None = None,
+    ) -> Future[LLMResponse]:
+        """Поставить запрос в полосу; timeout задаёт дедлайн ожидания в очереди."""
+
+        now = self._clock()
+        job = QueuedJob(
+            request=request,
+            future=Future(),
+            enqueued_at=now,
+            deadline=now + timeout if timeout is not None else None,
+        )
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Планировщик LLM остановлен.")
+            self._queue.push(job, lane)
+            self._metrics.set_gauge("llm_queue_depth", self._queue.depth(lane), lane=lane)
+            self._cond.notify()
+        return job.future
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Выполнить запрос в интерактивной полосе."""
+
+        return self.submit(request).result()
+
+    def lane(self, name: str, timeout: float | None = None) -> LaneClient:
+        """Вернуть клиента-порт, привязанного к полосе name."""
+
+        if name not in self._queue.lanes():
+            raise KeyError(f"Неизвестная полоса LLM: {name}")
+        return LaneClient(self, name, timeout)
+
+    def depth(self, lane: str) -> int:
+        """Текущая глубина очереди полосы."""
+
+        with self._cond:
+            return self._queue.depth(lane)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """Остановить воркеры, дождавшись очереди или отменив ожидающие задачи."""
+
+        with self._cond:
+            self._closed = True
+            if cancel_pending:
+                for job in self._queue.drain():
+                    job.future.cancel()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+            if job is None:
+                return
+            self._run(job)
+
+    def _next_job(self) -> QueuedJob | None:
+        while True:
+            expired: list[tuple[QueuedJob, str]] = []
+            job = self._queue.pop_ready(self._clock(), expired)
+            for stale, action in expired:
+                self._on_expired(stale, action)
+            if job is not None:
+                self._metrics.set_gauge(
+                    "llm_queue_depth", self._queue.depth(job.lane), lane=job.lane
+                )
+                return job
+            if self._closed and not any(self._queue.depth(n) for n in self._queue.lanes()):
+                return None
+            self._cond.wait()
+
+    def _on_expired(self, job: QueuedJob, action: str) -> None:
+        if action != DEADLINE_DROP:
+            self._metrics.inc("llm_jobs_demoted_total", to=job.lane)
+            return
+        self._metrics.inc("llm_jobs_dropped_total", lane=job.lane)
+        if job.future.set_running_or_notify_cancel():
+            job.future.set_exception(LLMDeadlineExceeded(f"Просрочен запрос в полосе {job.lane}"))
+
+    def _run(self, job: QueuedJob) -> None:
+        started = self._clock()
+        self._metrics.observe("llm_queue_wait_seconds", started - job.enqueued_at, lane=job.lane)
+        try:
+            if job.future.set_running_or_notify_cancel():
+                try:
+                    job.future.set_result(self._client.complete(job.request))
+                except BaseException as exc:  # noqa: BLE001 - ошибка уходит в future
+                    job.future.set_exception(exc)
+        finally:
+            with self._cond:
+                self._queue.release(job.lane)
+                self._cond.notify_all()
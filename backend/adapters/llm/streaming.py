@@ -0,0 +1,39 @@
+"""Адаптеры потока токенов: потоковый интерфейс поверх любых LLM-клиентов."""
+
+from __future__ import annotations
+
+from typing import Iterator, cast
+
+from backend.ports.llm_client import LLMClientPort, LLMRequest, LLMResponse, LLMStreamingClientPort
+
+
+class BufferedStreamAdapter(LLMStreamingClientPort):
+    """Даёт stream() клиентам без потоковой выдачи: ответ приходит одним фрагментом."""
+
+    def __init__(self, client: LLMClientPort) -> None:
+        self._client = client
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Передать вызов исходному клиенту."""
+
+        return self._client.complete(request)
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Отдать ответ исходного клиента целиком как единственный фрагмент."""
+
+        yield self._client.complete(request).text
+
+
+def as_streaming(client: LLMClientPort) -> LLMStreamingClientPort:
+    """Вернуть клиент с stream(): сам клиент, если он потоковый, иначе обёртку."""
+
+    if callable(getattr(client, "stream", None)):
+        return cast(LLMStreamingClientPort, client)
+    return BufferedStreamAdapter(client)
+
+
+def rechunk(text: str, chunk_size: int) -> Iterator[str]:
+    """Нарезать готовый текст на фрагменты фиксированной длины (эмуляция токенов)."""
+
+    for start in range(0, len(text), max(1, chunk_size)):
+        yield text[start : start + chunk_size]
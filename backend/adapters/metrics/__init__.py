@@ -0,0 +1 @@
+# Адаптеры сбора метрик
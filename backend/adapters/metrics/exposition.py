@@ -0,0 +1,93 @@
+"""Снимок метрик, слияние снимков процессов и текстовый формат Prometheus 0.0.4."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Sequence
+
+from backend.adapters.metrics.in_memory_metrics import MetricKey
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass(slots=True)
+class MetricsSnapshot:
+    """Значения метрик на момент снимка.
+
+    Гистограмма хранится как [счётчики корзин..., счётчик +Inf, сумма]
+    с некумулятивными корзинами — так снимки разных потоков и процессов
+    складываются поэлементно.
+    """
+
+    buckets: tuple[float, ...]
+    counters: dict[MetricKey, float] = field(default_factory=dict)
+    gauges: dict[MetricKey, float] = field(default_factory=dict)
+    histograms: dict[MetricKey, list[float]] = field(default_factory=dict)
+
+    def add(self, other: "MetricsSnapshot", **gauge_labels: str) -> None:
+        """Прибавить счётчики и гистограммы other; его gauge взять с доп. метками."""
+
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0.0) + value
+        for key, values in other.histograms.items():
+            current = self.histograms.setdefault(key, [0.0] * len(values))
+            for index, value in enumerate(values):
+                current[index] += value
+        extra = tuple(gauge_labels.items())
+        for (name, labels), value in other.gauges.items():
+            self.gauges[(name, tuple(sorted(labels + extra)))] = value
+
+
+def render(snapshot: MetricsSnapshot) -> str:
+    """Отрендерить снимок в текстовый формат экспозиции Prometheus."""
+
+    lines: list[str] = []
+    for kind, series in (("counter", snapshot.counters), ("gauge", snapshot.gauges)):
+        for name, group in _by_name(series):
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in group)
+    for name, group in _by_name(snapshot.histograms):
+        lines.append(f"# TYPE {name} histogram")
+        for labels, values in group:
+            lines.extend(_histogram_lines(name, labels, values, snapshot.buckets))
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(
+    name: str,
+    labels: tuple[tuple[str, str], ...],
+    values: Sequence[float],
+    buckets: Sequence[float],
+) -> Iterable[str]:
+    cumulative = 0.0
+    bounds = [_number(bound) for bound in buckets] + ["+Inf"]
+    for bound, count in zip(bounds, values):
+        cumulative += count
+        yield f"{name}_bucket{_labels(labels + (('le', bound),))} {_number(cumulative)}"
+    yield f"{name}_sum{_labels(labels)} {_number(values[-1])}"
+    yield f"{name}_count{_labels(labels)} {_number(cumulative)}"
+
+
+def _by_name(series: Mapping[MetricKey, object]) -> Iterable[tuple[str, list]]:
+    grouped: dict[str, list] = {}
+    for (name, labels), value in sorted(series.items()):
+        grouped.setdefault(name, []).append((labels, value))
+    return grouped.items()
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,71 @@
+"""In-memory реализация порта метрик для процесса и тестов."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+
+from backend.ports.metrics import MetricsPort
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class HistogramSummary:
+    """Агрегат наблюдений: количество, сумма и максимум."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+def metric_key(name: str, labels: dict[str, str]) -> MetricKey:
+    """Построить детерминированный ключ метрики по имени и меткам."""
+
+    return name, tuple(sorted(labels.items()))
+
+
+class InMemoryMetrics(MetricsPort):
+    """Хранит счётчики, gauge и сводки гистограмм в памяти процесса."""
+
+    def __init__(self) -> None:
+        self._counters: dict[MetricKey, float] = {}
+        self._gauges: dict[MetricKey, float] = {}
+        self._histograms: dict[MetricKey, HistogramSummary] = {}
+        self._lock = Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = metric_key(name, labels)
+        with self._lock:
+            summary = self._histograms.setdefault(key, HistogramSummary())
+            summary.count += 1
+            summary.total += value
+            summary.max = max(summary.max, value)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges[metric_key(name, labels)] = value
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Вернуть значение счётчика (0.0, если его не было)."""
+
+        with self._lock:
+            return self._counters.get(metric_key(name, labels), 0.0)
+
+    def gauge(self, name: str, **labels: str) -> float | None:
+        """Вернуть последнее значение gauge или None."""
+
+        with self._lock:
+            return self._gauges.get(metric_key(name, labels))
+
+    def histogram(self, name: str, **labels: str) -> HistogramSummary:
+        """Вернуть копию сводки гистограммы."""
+
+        with self._lock:
+            summary = self._histograms.get(metric_key(name, labels), HistogramSummary())
+            return HistogramSummary(summary.count, summary.total, summary.max)
@@ -0,0 +1,135 @@
+"""Обмен снимками метрик между воркерами uvicorn через общий каталог."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+from backend.adapters.metrics.exposition import MetricsSnapshot
+from backend.adapters.metrics.snapshot_file import read_snapshot, write_snapshot
+
+SnapshotSource = Callable[[], MetricsSnapshot]
+
+
+def pid_alive(pid: int) -> bool:
+    """Жив ли процесс pid (сигнал 0 ничего не посылает, только проверяет)."""
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SnapshotDirectory:
+    """Каталог, где каждый процесс держит файл <pid>.json со своим снимком.
+
+    Запись атомарна (временный файл + os.replace), поэтому читатель видит
+    либо старый, либо новый снимок. Счётчики и гистограммы завершившихся
+    соседей остаются в сумме — иначе сумма уменьшится и Prometheus примет это
+    за сброс счётчика, — а их gauge нет: значение мёртвого процесса ничего не
+    описывает. При старте процесса retire_dead() переносит счётчики и
+    гистограммы мёртвых PID в общий файл retired.json и удаляет их снимки,
+    чтобы каталог не рос с каждым перезапуском воркера.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        pid: int | None = None,
+        is_alive: Callable[[int], bool] = pid_alive,
+    ) -> None:
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._pid = pid if pid is not None else os.getpid()
+        self._is_alive = is_alive
+
+    def retire_dead(self) -> int:
+        """Перенести снимки завершившихся процессов в retired.json; вернуть их число.
+
+        Gauge мёртвых процессов отбрасываются, недописанные .tmp удаляются.
+        Соседи, стартующие одновременно, сериализуются блокировкой файла,
+        чтобы один снимок не был сложен в retired.json дважды.
+        """
+
+        retired_path = self._path / "retired.json"
+        with open(self._path / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            retired = read_snapshot(retired_path)
+            dead = [
+                file
+                for file in self._path.glob("*.json")
+                if file.stem.isdigit() and not self._is_alive(int(file.stem))
+            ]
+            for file in dead:
+                snapshot = read_snapshot(file)
+                if snapshot is None:
+                    continue
+                if retired is None or retired.buckets != snapshot.buckets:
+                    retired = MetricsSnapshot(snapshot.buckets)
+                retired.add(replace(snapshot, gauges={}))
+            if dead and retired is not None:
+                write_snapshot(retired_path, retired)
+            for file in [*dead, *self._path.glob("*.tmp")]:
+                if file.stem.isdigit() and not self._is_alive(int(file.stem)):
+                    file.unlink(missing_ok=True)
+        return len(dead)
+
+    def write(self, snapshot: MetricsSnapshot) -> None:
+        """Сохранить снимок текущего процесса."""
+
+        write_snapshot(self._path / f"{self._pid}.json", snapshot)
+
+    def merged(self, own: MetricsSnapshot) -> MetricsSnapshot:
+        """Сложить свежий снимок процесса со снимками остальных; gauge живых — с меткой pid."""
+
+        total = MetricsSnapshot(own.buckets)
+        total.add(own, pid=str(self._pid))
+        for file in sorted(self._path.glob("*.json")):
+            if file.stem == str(self._pid):
+                continue
+            other = read_snapshot(file)
+            if other is None or other.buckets != own.buckets:
+                continue
+            if not (file.stem.isdigit() and self._is_alive(int(file.stem))):
+                other = replace(other, gauges={})
+            total.add(other, pid=file.stem)
+        return total
+
+
+class SnapshotFlusher:
+    """Фоновый поток, раз в interval секунд записывающий снимок процесса."""
+
+    def __init__(
+        self, directory: SnapshotDirectory, source: SnapshotSource, interval: float = 5.0
+    ) -> None:
+        self._directory = directory
+        self._source = source
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-flusher", daemon=True)
+
+    def start(self) -> None:
+        """Запустить поток записи."""
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановить поток, записав последний снимок."""
+
+        self._stop.set()
+        self._directory.write(self._source())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self._directory.write(self._source())
+            except OSError:  # диск временно недоступен — следующая попытка через interval
+                continue
+
@@ -0,0 +1,107 @@
+"""Метрики процесса с потоковыми шардами и экспозицией в формате Prometheus."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Callable, Sequence
+
+from backend.adapters.metrics.exposition import MetricsSnapshot
+from backend.adapters.metrics.in_memory_metrics import MetricKey
+from backend.ports.metrics import MetricsPort
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)  # fmt: skip
+
+Collector = Callable[[MetricsPort], None]
+
+
+class _Shard:
+    """Счётчики и гистограммы одного потока: пишет только он сам."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        self.counters: dict[MetricKey, float] = {}
+        self.histograms: dict[MetricKey, list[float]] = {}
+
+
+class PrometheusMetrics(MetricsPort):
+    """Реализация MetricsPort без блокировок на горячем пути.
+
+    Каждый поток пишет в свой шард (threading.local), поэтому inc/observe —
+    это поиск в словаре и пара сложений без Lock. Снимок копирует шарды под
+    GIL (копия dict атомарна в CPython) и складывает их. Gauge — одно
+    присваивание в общий словарь. Collector-функции вызываются перед снимком,
+    чтобы обновить gauge, которые дешевле считать по запросу (пул соединений).
+    Шард завершившегося потока складывается в базовый снимок и удаляется
+    (weakref.finalize на объекте потока), так что пулы с ротацией потоков
+    не копят шарды.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._retired = MetricsSnapshot(self._buckets)
+        self._gauges: dict[MetricKey, float] = {}
+        self._collectors: list[Collector] = []
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        histograms = self._shard().histograms
+        values = histograms.get(key)
+        if values is None:
+            values = histograms[key] = [0.0] * (len(self._buckets) + 2)
+        values[bisect_left(self._buckets, value)] += 1
+        values[-1] += value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        self._gauges[(name, tuple(sorted(labels.items())) if labels else ())] = value
+
+    def register_collector(self, collector: Collector) -> None:
+        """Добавить функцию, обновляющую gauge перед каждым снимком."""
+
+        self._collectors.append(collector)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Собрать текущие значения всех потоков процесса."""
+
+        for collector in list(self._collectors):
+            collector(self)
+        total = MetricsSnapshot(self._buckets, gauges=dict(self._gauges))
+        with self._shards_lock:
+            shards = list(self._shards)
+            total.add(self._retired)
+        for shard in shards:
+            total.add(_frozen(shard, self._buckets))
+        return total
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            weakref.finalize(threading.current_thread(), self._retire, shard)
+            return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        # Поток завершён и больше не пишет в шард: переносим его значения в базу.
+        with self._shards_lock:
+            self._retired.add(_frozen(shard, self._buckets))
+            self._shards.remove(shard)
+
+
+def _frozen(shard: _Shard, buckets: tuple[float, ...]) -> MetricsSnapshot:
+    histograms = {key: list(values) for key, values in dict(shard.histograms).items()}
+    return MetricsSnapshot(buckets, dict(shard.counters), {}, histograms)
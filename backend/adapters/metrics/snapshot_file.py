@@ -0,0 +1,50 @@
+"""Снимок метрик в JSON-файле: атомарная запись и чтение."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from backend.adapters.metrics.exposition import MetricsSnapshot
+
+
+def write_snapshot(target: Path, snapshot: MetricsSnapshot) -> None:
+    """Записать снимок через временный файл и os.replace: читатель не увидит половину."""
+
+    temporary = target.with_suffix(".tmp")
+    temporary.write_text(json.dumps(_encode(snapshot)), encoding="utf-8")
+    os.replace(temporary, target)
+
+
+def read_snapshot(source: Path) -> MetricsSnapshot | None:
+    """Прочитать снимок; None, если файла нет или он повреждён."""
+
+    try:
+        return _decode(json.loads(source.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _encode(snapshot: MetricsSnapshot) -> dict[str, Any]:
+    return {
+        "buckets": list(snapshot.buckets),
+        "counters": [[name, labels, value] for (name, labels), value in snapshot.counters.items()],
+        "gauges": [[name, labels, value] for (name, labels), value in snapshot.gauges.items()],
+        "histograms": [
+            [name, labels, values] for (name, labels), values in snapshot.histograms.items()
+        ],
+    }
+
+
+def _decode(data: dict[str, Any]) -> MetricsSnapshot:
+    def series(rows: list) -> dict:
+        return {(name, tuple(map(tuple, labels))): value for name, labels, value in rows}
+
+    return MetricsSnapshot(
+        buckets=tuple(data["buckets"]),
+        counters=series(data["counters"]),
+        gauges=series(data["gauges"]),
+        histograms=series(data["histograms"]),
+    )
@@ -0,0 +1,45 @@
+"""Хранилище ключей идемпотентности с индексом процесса перед SQL-таблицей."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from backend.adapters.persistence.idempotency_index import IdempotencyIndex
+from backend.domain.entities import IdempotencyRecord
+from backend.ports.repositories import IdempotencyRepository
+
+
+class CachedIdempotencyRepository(IdempotencyRepository):
+    """Декоратор: LRU, затем Bloom-фильтр, и только потом запрос к таблице.
+
+    В LRU попадают лишь записи, прочитанные из хранилища, то есть уже
+    зафиксированные: вставка внутри транзакции отмечает ключ только в Bloom,
+    чтобы откат не оставил в памяти ответ, которого нет в базе.
+    """
+
+    def __init__(self, inner: IdempotencyRepository, index: IdempotencyIndex) -> None:
+        self._inner = inner
+        self._index = index
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, IdempotencyRecord]:
+        """Ответить из LRU, запросить хранилище только для ключей «возможно виденных»."""
+
+        found: dict[str, IdempotencyRecord] = {}
+        candidates: list[str] = []
+        for key in dict.fromkeys(keys):
+            record = self._index.recall(key)
+            if record is not None:
+                found[key] = record
+            elif self._index.may_contain(key):
+                candidates.append(key)
+        for key, record in self._inner.get_many(candidates).items() if candidates else ():
+            self._index.remember(record)
+            found[key] = record
+        return found
+
+    def add_many(self, records: Sequence[IdempotencyRecord]) -> set[str]:
+        """Вставить записи; все ключи, включая занятые, отмечаются в Bloom."""
+
+        for record in records:
+            self._index.note(record.key)
+        return self._inner.add_many(records)
@@ -0,0 +1,80 @@
+"""Репозиторий read-model с кэшем процесса перед SQL-хранилищем."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.domain.entities import DealReadModel, ReadModelStamp
+from backend.ports.repositories import ReadModelRepository
+
+
+class CachedReadModelRepository(ReadModelRepository):
+    """Декоратор репозитория: чтения идут через кэш, записи его инвалидируют.
+
+    Предназначен для UnitOfWork путей чтения. Запись внутри транзакции только
+    удаляет запись из кэша: свежее состояние кладётся туда после commit через
+    StateNotifierPort, чтобы откат не оставил в кэше незафиксированные данные.
+    С fill=False промахи кэш не заполняют: так читают реплики, иначе
+    отстающая реплика вернула бы в кэш версию, только что инвалидированную.
+    """
+
+    def __init__(
+        self, inner: ReadModelRepository, cache: ReadModelCache, fill: bool = True
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._fill = fill
+
+    def get(self, deal_id: str) -> DealReadModel | None:
+        """Вернуть read-model из кэша или из хранилища (с заполнением кэша, если fill)."""
+
+        cached = self._cache.get(deal_id)
+        if cached is not None:
+            return cached
+        model = self._inner.get(deal_id)
+        if model is not None and self._fill:
+            self._cache.put(model)
+        return model
+
+    def get_stamp(self, deal_id: str) -> ReadModelStamp | None:
+        """Вернуть версию из кэша или лёгким запросом к хранилищу."""
+
+        cached = self._cache.get(deal_id)
+        return cached.stamp if cached is not None else self._inner.get_stamp(deal_id)
+
+    def get_many(self, deal_ids: Sequence[str]) -> dict[str, DealReadModel]:
+        """Взять найденное в кэше, остальное — одним запросом к хранилищу."""
+
+        found: dict[str, DealReadModel] = {}
+        missing: list[str] = []
+        for deal_id in dict.fromkeys(deal_ids):
+            cached = self._cache.get(deal_id)
+            if cached is None:
+                missing.append(deal_id)
+            else:
+                found[deal_id] = cached
+        for model in self._inner.get_many(missing).values() if missing else ():
+            if self._fill:
+                self._cache.put(model)
+            found[model.deal_id] = model
+        return found
+
+    def save(self, model: DealReadModel) -> None:
+        """Сохранить в хранилище и убрать устаревшую запись из кэша."""
+
+        self._inner.save(model)
+        self._cache.invalidate(model.deal_id)
+
+    def save_many(self, models: Sequence[DealReadModel]) -> None:
+        """Сохранить пачку и убрать устаревшие записи из кэша."""
+
+        self._inner.save_many(models)
+        for model in models:
+            self._cache.invalidate(model.deal_id)
+
+    def delete(self, deal_id: str) -> None:
+        """Удалить read-model и запись кэша."""
+
+        self._inner.delete(deal_id)
+        self._cache.invalidate(deal_id)
@@ -23,6 +23,13 @@ class InMemoryEventRepository(EventRepository):
         with self._lock:
             self._storage[event.deal_id].append(event)
 
+    def add_many(self, events: Sequence[Event]) -> None:
+        """Сохранить пачку событий под одной блокировкой."""
+
+        with self._lock:
+            for event in events:
+                self._storage[event.deal_id].append(event)
+
     def list_for_deal(self, deal_id: str) -> Sequence[Event]:
         """Вернуть список событий сделки."""
 
@@ -0,0 +1,34 @@
+"""In-memory адаптер ключей идемпотентности."""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Sequence
+
+from backend.domain.entities import IdempotencyRecord
+from backend.ports.repositories import IdempotencyRepository
+
+
+class InMemoryIdempotencyRepository(IdempotencyRepository):
+    """Хранит записи в словаре; первая запись по ключу побеждает, как в SQL."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, IdempotencyRecord] = {}
+        self._lock = Lock()
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, IdempotencyRecord]:
+        """Вернуть записи по ключам."""
+
+        with self._lock:
+            return {key: self._records[key] for key in keys if key in self._records}
+
+    def add_many(self, records: Sequence[IdempotencyRecord]) -> set[str]:
+        """Добавить записи со свободными ключами и вернуть эти ключи."""
+
+        inserted: set[str] = set()
+        with self._lock:
+            for record in records:
+                if record.key not in self._records:
+                    self._records[record.key] = record
+                    inserted.add(record.key)
+        return inserted
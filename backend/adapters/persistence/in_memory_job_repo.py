@@ -0,0 +1,94 @@
+"""In-memory адаптер outbox фоновых задач."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from itertools import count
+from threading import RLock
+from typing import Sequence
+
+from backend.domain.entities import Job
+from backend.ports.repositories import JobRepository
+
+
+@dataclass(slots=True)
+class _Row:
+    job: Job
+    status: str = "pending"
+    locked_until: datetime | None = None
+    last_error: str | None = None
+
+
+class InMemoryJobRepository(JobRepository):
+    """Хранит задачи в памяти процесса с той же семантикой захвата, что и SQL."""
+
+    def __init__(self) -> None:
+        self._rows: dict[int, _Row] = {}
+        self._ids = count(1)
+        self._lock = RLock()
+
+    def enqueue(self, jobs: Sequence[Job]) -> None:
+        """Добавить задачи, присвоив идентификаторы."""
+
+        with self._lock:
+            for job in jobs:
+                job_id = next(self._ids)
+                self._rows[job_id] = _Row(replace(job, id=job_id))
+
+    def claim(self, limit: int, now: datetime, lease_until: datetime) -> Sequence[Job]:
+        """Захватить готовые задачи и остальные готовые задачи тех же сделок."""
+
+        with self._lock:
+            ready = sorted(
+                (row for row in self._rows.values() if self._is_ready(row, now)),
+                key=lambda row: (row.job.available_at, row.job.id),
+            )
+            deals = {(row.job.deal_id, row.job.kind) for row in ready[:limit]}
+            claimed = []
+            for row in ready:
+                if (row.job.deal_id, row.job.kind) in deals:
+                    row.job = replace(row.job, attempts=row.job.attempts + 1)
+                    row.locked_until = lease_until
+                    claimed.append(row.job)
+            return claimed
+
+    def complete(self, job_ids: Sequence[int]) -> None:
+        """Удалить выполненные задачи."""
+
+        with self._lock:
+            for job_id in job_ids:
+                self._rows.pop(job_id, None)
+
+    def retry(self, job_ids: Sequence[int], available_at: datetime, error: str) -> None:
+        """Отложить задачи и снять захват."""
+
+        with self._lock:
+            for row in (self._rows[job_id] for job_id in job_ids if job_id in self._rows):
+                row.job = replace(row.job, available_at=available_at)
+                row.locked_until = None
+                row.last_error = error
+
+    def bury(self, job_ids: Sequence[int], error: str) -> None:
+        """Пометить задачи как упавшие окончательно."""
+
+        with self._lock:
+            for row in (self._rows[job_id] for job_id in job_ids if job_id in self._rows):
+                row.status = "dead"
+                row.last_error = error
+
+    def count_pending(self) -> int:
+        """Число ожидающих задач."""
+
+        return len(self.pending())
+
+    def pending(self) -> list[Job]:
+        """Вернуть ожидающие задачи (для тестов и диагностики)."""
+
+        with self._lock:
+            return [row.job for row in self._rows.values() if row.status == "pending"]
+
+    @staticmethod
+    def _is_ready(row: _Row, now: datetime) -> bool:
+        unlocked = row.locked_until is None or row.locked_until <= now
+        return row.status == "pending" and row.job.available_at <= now and unlocked
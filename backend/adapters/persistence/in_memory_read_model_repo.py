@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from threading import RLock
+from typing import Sequence
 
-from backend.domain.entities import DealReadModel
+from backend.domain.entities import DealReadModel, ReadModelStamp
 from backend.ports.repositories import ReadModelRepository
 
 
@@ -21,12 +22,32 @@ class InMemoryReadModelRepository(ReadModelRepository):
         with self._lock:
             return self._storage.get(deal_id)
 
+    def get_stamp(self, deal_id: str) -> ReadModelStamp | None:
+        """Вернуть версию read-model или None."""
+
+        with self._lock:
+            model = self._storage.get(deal_id)
+        return model.stamp if model else None
+
+    def get_many(self, deal_ids: Sequence[str]) -> dict[str, DealReadModel]:
+        """Вернуть найденные read-model по списку сделок."""
+
+        with self._lock:
+            return {key: self._storage[key] for key in deal_ids if key in self._storage}
+
     def save(self, model: DealReadModel) -> None:
         """Идемпотентно сохранить read-model."""
 
         with self._lock:
             self._storage[model.deal_id] = model
 
+    def save_many(self, models: Sequence[DealReadModel]) -> None:
+        """Сохранить несколько read-model под одной блокировкой."""
+
+        with self._lock:
+            for model in models:
+                self._storage[model.deal_id] = model
+
     def delete(self, deal_id: str) -> None:
         """Удалить read-model сделки."""
 
@@ -0,0 +1,34 @@
+"""In-memory адаптер для хранения рассуждений Reasoner."""
+
+from __future__ import annotations
+
+from threading import RLock
+
+from backend.domain.entities import Reasoning
+from backend.ports.repositories import ReasoningRepository
+
+
+class InMemoryReasoningRepository(ReasoningRepository):
+    """Хранит последнее рассуждение каждой сделки в памяти процесса."""
+
+    def __init__(self) -> None:
+        self._storage: dict[str, Reasoning] = {}
+        self._lock = RLock()
+
+    def get(self, deal_id: str) -> Reasoning | None:
+        """Вернуть рассуждение сделки или None."""
+
+        with self._lock:
+            return self._storage.get(deal_id)
+
+    def save(self, reasoning: Reasoning) -> None:
+        """Сохранить рассуждение, заменив предыдущее."""
+
+        with self._lock:
+            self._storage[reasoning.deal_id] = reasoning
+
+    def delete(self, deal_id: str) -> None:
+        """Удалить рассуждение сделки."""
+
+        with self._lock:
+            self._storage.pop(deal_id, None)
@@ -0,0 +1,79 @@
+"""In-memory UnitOfWork для тестов и локального запуска без СУБД."""
+
+from __future__ import annotations
+
+from backend.adapters.persistence.in_memory_event_repo import InMemoryEventRepository
+from backend.adapters.persistence.in_memory_fact_repo import InMemoryFactRepository
+from backend.adapters.persistence.in_memory_idempotency_repo import (
+    InMemoryIdempotencyRepository,
+)
+from backend.adapters.persistence.in_memory_job_repo import InMemoryJobRepository
+from backend.adapters.persistence.in_memory_read_model_repo import InMemoryReadModelRepository
+from backend.adapters.persistence.in_memory_reasoning_repo import InMemoryReasoningRepository
+from backend.ports.repositories import (
+    EventRepository,
+    FactRepository,
+    IdempotencyRepository,
+    JobRepository,
+    ReadModelRepository,
+    ReasoningRepository,
+)
+from backend.ports.unit_of_work import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """UnitOfWork, объединяющий in-memory реализации репозиториев."""
+
+    def __init__(
+        self,
+        event_repo: InMemoryEventRepository | None = None,
+        fact_repo: InMemoryFactRepository | None = None,
+        read_model_repo: InMemoryReadModelRepository | None = None,
+        reasoning_repo: InMemoryReasoningRepository | None = None,
+        job_repo: InMemoryJobRepository | None = None,
+        idempotency_repo: InMemoryIdempotencyRepository | None = None,
+    ) -> None:
+        self._event_repo = event_repo or InMemoryEventRepository()
+        self._fact_repo = fact_repo or InMemoryFactRepository()
+        self._read_model_repo = read_model_repo or InMemoryReadModelRepository()
+        self._reasoning_repo = reasoning_repo or InMemoryReasoningRepository()
+        self._job_repo = job_repo or InMemoryJobRepository()
+        self._idempotency_repo = idempotency_repo or InMemoryIdempotencyRepository()
+
+    def __enter__(self) -> "InMemoryUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    @property
+    def events(self) -> EventRepository:
+        return self._event_repo
+
+    @property
+    def facts(self) -> FactRepository:
+        return self._fact_repo
+
+    @property
+    def read_models(self) -> ReadModelRepository:
+        return self._read_model_repo
+
+    @property
+    def reasonings(self) -> ReasoningRepository:
+        return self._reasoning_repo
+
+    @property
+    def jobs(self) -> JobRepository:
+        return self._job_repo
+
+    @property
+    def idempotency(self) -> IdempotencyRepository:
+        return self._idempotency_repo
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+
@@ -0,0 +1,97 @@
+"""UnitOfWork-декоратор с метриками длительности транзакции и числа commit."""
+
+from __future__ import annotations
+
+import time
+from types import TracebackType
+from typing import Callable
+
+from backend.ports.metrics import MetricsPort
+from backend.ports.repositories import (
+    EventRepository,
+    FactRepository,
+    IdempotencyRepository,
+    JobRepository,
+    ReadModelRepository,
+    ReasoningRepository,
+)
+from backend.ports.unit_of_work import UnitOfWork
+
+
+class InstrumentedUnitOfWork(UnitOfWork):
+    """Оборачивает любой UnitOfWork и пишет uow_seconds{uow, outcome} и uow_commits_total.
+
+    outcome — commit, rollback (явный откат без commit), error (исключение)
+    или closed (контекст закрыт без commit, например путь чтения).
+    """
+
+    def __init__(
+        self,
+        inner: UnitOfWork,
+        metrics: MetricsPort,
+        name: str = "write",
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._inner = inner
+        self._metrics = metrics
+        self._name = name
+        self._timer = timer
+        self._started = 0.0
+        self._outcome = "closed"
+
+    def __enter__(self) -> "InstrumentedUnitOfWork":
+        self._inner.__enter__()
+        self._started = self._timer()
+        self._outcome = "closed"
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            self._inner.__exit__(exc_type, exc, tb)
+        finally:
+            outcome = "error" if exc_type is not None else self._outcome
+            elapsed = self._timer() - self._started
+            self._metrics.observe("uow_seconds", elapsed, uow=self._name, outcome=outcome)
+
+    @property
+    def events(self) -> EventRepository:
+        return self._inner.events
+
+    @property
+    def facts(self) -> FactRepository:
+        return self._inner.facts
+
+    @property
+    def read_models(self) -> ReadModelRepository:
+        return self._inner.read_models
+
+    @property
+    def reasonings(self) -> ReasoningRepository:
+        return self._inner.reasonings
+
+    @property
+    def jobs(self) -> JobRepository:
+        return self._inner.jobs
+
+    @property
+    def idempotency(self) -> IdempotencyRepository:
+        return self._inner.idempotency
+
+    def commit(self) -> None:
+        """Зафиксировать изменения и посчитать commit."""
+
+        self._inner.commit()
+        self._outcome = "commit"
+        self._metrics.inc("uow_commits_total", uow=self._name)
+
+    def rollback(self) -> None:
+        """Откатить изменения."""
+
+        self._inner.rollback()
+        if self._outcome != "commit":
+            self._outcome = "rollback"
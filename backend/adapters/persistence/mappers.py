@@ -4,13 +4,23 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import Any, overload
 
 from backend.adapters.persistence.orm_models import EventORM, FactORM, ReadModelORM
 from backend.domain.entities import DealReadModel, Event, Fact
 
 
-def _normalize_dt(value: datetime | None) -> datetime | None:
+@overload
+def normalize_dt(value: datetime) -> datetime: ...
+
+
+@overload
+def normalize_dt(value: None) -> None: ...
+
+
+def normalize_dt(value: datetime | None) -> datetime | None:
+    """Привести время к UTC; naive-значения (SQLite) считаются UTC."""
+
     if value is None:
         return None
     if value.tzinfo is None:
@@ -18,7 +28,9 @@ def _normalize_dt(value: datetime | None) -> datetime | None:
     return value.astimezone(timezone.utc)
 
 
-def _to_float(value: float | Decimal | None) -> float | None:
+def to_float(value: float | Decimal | None) -> float | None:
+    """Сконвертировать Numeric из БД во float."""
+
     if value is None:
         return None
     return float(value)
@@ -31,10 +43,21 @@ def event_to_orm(event: Event) -> EventORM:
         deal_id=event.deal_id,
         kind=event.kind,
         payload=dict(event.payload),
-        created_at=_normalize_dt(event.created_at),
+        created_at=normalize_dt(event.created_at),
     )
 
 
+def event_to_row(event: Event) -> dict[str, Any]:
+    """Сконвертировать событие в словарь колонок для bulk INSERT."""
+
+    return {
+        "deal_id": event.deal_id,
+        "kind": event.kind,
+        "payload": dict(event.payload),
+        "created_at": normalize_dt(event.created_at),
+    }
+
+
 def event_from_orm(model: EventORM) -> Event:
     """Сконвертировать ORM-событие в доменный объект."""
 
@@ -42,7 +65,7 @@ def event_from_orm(model: EventORM) -> Event:
         deal_id=model.deal_id,
         kind=model.kind,
         payload=dict(model.payload),
-        created_at=_normalize_dt(model.created_at),
+        created_at=normalize_dt(model.created_at),
     )
 
 
@@ -55,12 +78,12 @@ def fact_to_orm(fact: Fact, target: FactORM | None = None) -> FactORM:
             kind=fact.kind,
             payload=dict(fact.payload),
             confidence=fact.confidence,
-            observed_at=_normalize_dt(fact.observed_at),
+            observed_at=normalize_dt(fact.observed_at),
             source=fact.source,
         )
     target.payload = dict(fact.payload)
     target.confidence = fact.confidence
-    target.observed_at = _normalize_dt(fact.observed_at)
+    target.observed_at = normalize_dt(fact.observed_at)
     target.source = fact.source
     return target
 
@@ -72,8 +95,8 @@ def fact_from_orm(model: FactORM) -> Fact:
         deal_id=model.deal_id,
         kind=model.kind,
         payload=dict(model.payload),
-        confidence=_to_float(model.confidence),
-        observed_at=_normalize_dt(model.observed_at),
+        confidence=to_float(model.confidence),
+        observed_at=normalize_dt(model.observed_at),
         source=model.source,
     )
 
@@ -90,14 +113,16 @@ def read_model_to_orm(
             status=model.status,
             score=model.score,
             last_event=dict(model.last_event) if model.last_event else None,
-            updated_at=_normalize_dt(model.updated_at),
+            updated_at=normalize_dt(model.updated_at),
             letters=dict(model.letters),
+            version=model.version,
         )
     target.status = model.status
     target.score = model.score
     target.last_event = dict(model.last_event) if model.last_event else None
-    target.updated_at = _normalize_dt(model.updated_at)
+    target.updated_at = normalize_dt(model.updated_at)
     target.letters = dict(model.letters)
+    target.version = model.version
     return target
 
 
@@ -107,10 +132,9 @@ def read_model_from_orm(model: ReadModelORM) -> DealReadModel:
     return DealReadModel(
         deal_id=model.deal_id,
         status=model.status,
-        score=_to_float(model.score),
+        score=to_float(model.score),
         last_event=dict(model.last_event) if model.last_event else None,
-        updated_at=_normalize_dt(model.updated_at),
+        updated_at=normalize_dt(model.updated_at),
         letters=dict(model.letters or {}),
+        version=model.version or 0,
     )
-
-
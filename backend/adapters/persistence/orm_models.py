@@ -56,5 +56,52 @@ class ReadModelORM(Base):
     last_event: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     letters: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
+    # UPDATE ... WHERE version = <прочитанная>: параллельная запись даёт StaleDataError,
+    # а не тихую потерю обновления. Новую версию выставляет домен.
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": False}
 
+
+class ReasoningORM(Base):
+    """Таблица последнего рассуждения Reasoner (одна строка на сделку)."""
+
+    __tablename__ = "deal_reasonings"
+
+    deal_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    score: Mapped[float | None] = mapped_column(Numeric(10, 4), nullable=True)
+    facet_digests: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    result: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class JobORM(Base):
+    """Outbox фоновых задач: строка пишется в транзакции события, воркер её забирает."""
+
+    __tablename__ = "deal_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    deal_id: Mapped[str] = mapped_column(String(64), index=True, nullable=False)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+
+class IdempotencyKeyORM(Base):
+    """Ключи идемпотентности приёма событий: первичный ключ — уникальный индекс."""
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(160), primary_key=True)
+    deal_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    response: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
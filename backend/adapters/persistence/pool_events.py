@@ -0,0 +1,126 @@
+"""Инструментирование пула соединений SQLAlchemy и проверка живости после простоя."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, cast
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection, QueuePool
+
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+_CHECKED_IN_AT = "checked_in_at"
+_CHECKED_OUT_AT = "checked_out_at"
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool, замеряющий ожидание соединения: db_pool_wait_seconds{pool}.
+
+    Время включает очередь за свободным соединением, открытие нового и
+    проверку живости; исчерпание pool_timeout считается в db_pool_timeouts_total.
+    Метрики переживают engine.dispose(): recreate() переносит их в новый пул.
+    """
+
+    _metrics: MetricsPort = NullMetrics()
+    _label = "primary"
+
+    def instrument(self, metrics: MetricsPort, label: str) -> None:
+        """Писать метрики ожидания в metrics с меткой pool=label."""
+
+        self._metrics = metrics
+        self._label = label
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self._metrics.inc("db_pool_timeouts_total", pool=self._label)
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self._metrics.observe("db_pool_wait_seconds", waited, pool=self._label)
+
+    def recreate(self) -> TimedQueuePool:
+        pool = cast(TimedQueuePool, super().recreate())
+        pool.instrument(self._metrics, self._label)
+        return pool
+
+
+class PoolListener:
+    """События пула: удержание соединений, переподключения, инвалидации и пинги.
+
+    db_pool_checkout_seconds{pool} — сколько соединение было на руках;
+    db_pool_connects_total, db_pool_invalidations_total{kind=hard|soft},
+    db_pool_pings_total{result}. Если ping_idle_seconds > 0, соединение
+    проверяется SELECT 1 только когда простаивало в пуле дольше этого
+    времени: после свежего возврата лишнего round trip нет, а обрыв после
+    долгого простоя (файрвол, рестарт БД) ловится до выдачи приложению.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsPort | None = None,
+        label: str = "primary",
+        ping_idle_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._metrics = metrics or NullMetrics()
+        self._label = label
+        self._ping_idle_seconds = ping_idle_seconds
+        self._clock = clock
+
+    def attach(self, engine: Engine) -> None:
+        """Подписаться на события пула engine (сохраняются при dispose)."""
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "soft_invalidate", self._on_soft_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        record.info[_CHECKED_IN_AT] = self._clock()
+        self._metrics.inc("db_pool_connects_total", pool=self._label)
+
+    def _on_checkout(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, proxy: PoolProxiedConnection
+    ) -> None:
+        now = self._clock()
+        idle = now - record.info.get(_CHECKED_IN_AT, now)
+        record.info[_CHECKED_OUT_AT] = now
+        if self._ping_idle_seconds > 0 and idle > self._ping_idle_seconds:
+            self._ping(dbapi_connection)
+
+    def _on_checkin(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        now = self._clock()
+        record.info[_CHECKED_IN_AT] = now
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            held = now - checked_out_at
+            self._metrics.observe("db_pool_checkout_seconds", held, pool=self._label)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, error: Any
+    ) -> None:
+        self._metrics.inc("db_pool_invalidations_total", pool=self._label, kind="hard")
+
+    def _on_soft_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, error: Any
+    ) -> None:
+        self._metrics.inc("db_pool_invalidations_total", pool=self._label, kind="soft")
+
+    def _ping(self, dbapi_connection: Any) -> None:
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as error:  # noqa: BLE001 - любой сбой драйвера значит «мёртвое»
+            self._metrics.inc("db_pool_pings_total", pool=self._label, result="failed")
+            # DisconnectionError: пул закроет соединение и выдаст новое (до трёх попыток).
+            raise exc.DisconnectionError("Соединение не ответило после простоя") from error
+        self._metrics.inc("db_pool_pings_total", pool=self._label, result="ok")
@@ -0,0 +1,98 @@
+"""Ограниченный LRU+TTL кэш read-model сделок в памяти процесса."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+from backend.domain.entities import DealReadModel
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.notifier import StateNotifierPort
+
+
+class ReadModelCache(StateNotifierPort):
+    """Кэш последних read-model с вытеснением по размеру и возрасту записи.
+
+    Как StateNotifierPort получает состояния после commit (write-through);
+    более старая версия никогда не вытесняет более новую, поэтому повторная
+    доставка или гонка чтения с записью не откатывают кэш назад.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 30.0,
+        metrics: MetricsPort | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._metrics = metrics or NullMetrics()
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[DealReadModel, float]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def size(self) -> int:
+        """Текущее число записей."""
+
+        return len(self._entries)
+
+    def get(self, deal_id: str) -> DealReadModel | None:
+        """Вернуть свежую запись или None (промах либо истёкший TTL)."""
+
+        with self._lock:
+            entry = self._entries.get(deal_id)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[deal_id]
+                self._evicted("ttl")
+                entry = None
+            if entry is None:
+                self._metrics.inc("read_model_cache_misses_total")
+                return None
+            self._entries.move_to_end(deal_id)
+        self._metrics.inc("read_model_cache_hits_total")
+        return entry[0]
+
+    def put(self, model: DealReadModel) -> None:
+        """Положить состояние, если оно не старше уже закэшированного."""
+
+        with self._lock:
+            current = self._entries.get(model.deal_id)
+            if current is not None and current[0].version > model.version:
+                return
+            self._entries[model.deal_id] = (model, self._clock() + self._ttl)
+            self._entries.move_to_end(model.deal_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evicted("size")
+            self._metrics.set_gauge("read_model_cache_entries", len(self._entries))
+
+    def invalidate(self, deal_id: str, below_version: int | None = None) -> None:
+        """Удалить запись; с below_version — только если она старше этой версии."""
+
+        with self._lock:
+            current = self._entries.get(deal_id)
+            if current is None:
+                return
+            if below_version is None or current[0].version < below_version:
+                del self._entries[deal_id]
+                self._evicted("invalidated")
+
+    def clear(self) -> None:
+        """Сбросить кэш целиком."""
+
+        with self._lock:
+            self._entries.clear()
+            self._metrics.set_gauge("read_model_cache_entries", 0)
+
+    def publish(self, model: DealReadModel) -> None:
+        """Write-through: новое состояние после commit сразу попадает в кэш."""
+
+        self.put(model)
+
+    def _evicted(self, reason: str) -> None:
+        self._metrics.inc("read_model_cache_evictions_total", reason=reason)
+        self._metrics.set_gauge("read_model_cache_entries", len(self._entries))
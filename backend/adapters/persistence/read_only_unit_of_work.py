@@ -0,0 +1,77 @@
+"""UnitOfWork только для чтения: транзакция READ ONLY и никакого commit."""
+
+from __future__ import annotations
+
+from types import TracebackType
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+# (включить при открытии, выключить перед возвратом соединения в пул) по диалекту.
+_READ_ONLY_STATEMENTS: dict[str, tuple[str, str | None]] = {
+    "postgresql": ("SET TRANSACTION READ ONLY", None),
+    "sqlite": ("PRAGMA query_only = ON", "PRAGMA query_only = OFF"),
+}
+
+
+class ReadOnlySqlAlchemyUnitOfWork(SqlAlchemyUnitOfWork):
+    """UnitOfWork путей чтения, в том числе на репликах.
+
+    Транзакция открывается как READ ONLY (в PostgreSQL — SET TRANSACTION
+    READ ONLY, в SQLite — PRAGMA query_only), поэтому случайная запись падает
+    ошибкой БД, а не уходит на реплику. commit запрещён, при выходе
+    транзакция откатывается. С fill_read_model_cache=False (чтение с реплики)
+    промахи не заполняют кэш read-model: отстающая реплика не вернёт в него
+    версию, которую только что инвалидировала запись в primary.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        read_model_cache: ReadModelCache | None = None,
+        fill_read_model_cache: bool = True,
+    ) -> None:
+        super().__init__(session_factory, read_model_cache=read_model_cache)
+        self._fill_read_model_cache = fill_read_model_cache
+
+    def __enter__(self) -> "ReadOnlySqlAlchemyUnitOfWork":
+        super().__enter__()
+        enable, _ = self._statements()
+        if enable is not None and self._session is not None:
+            try:
+                self._session.execute(text(enable))
+            except BaseException:
+                self._session.close()
+                self._session = None
+                raise
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._session is not None:
+            _, disable = self._statements()
+            try:
+                if disable is not None:
+                    self._session.execute(text(disable))
+                self._session.rollback()
+            finally:
+                # commit в родительском __exit__ не нужен: транзакция уже закрыта.
+                self._committed = True
+        super().__exit__(exc_type, exc, tb)
+
+    def commit(self) -> None:
+        """Запрещено: путь чтения ничего не фиксирует."""
+
+        raise RuntimeError("UnitOfWork только для чтения: commit недоступен.")
+
+    def _statements(self) -> tuple[str | None, str | None]:
+        if self._session is None:
+            return None, None
+        return _READ_ONLY_STATEMENTS.get(self._session.get_bind().dialect.name, (None, None))
@@ -0,0 +1,117 @@
+"""Маршрутизация чтений между primary и репликами с read-your-writes."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Generic, Iterator, Sequence, TypeVar
+
+TTarget = TypeVar("TTarget")
+
+
+@dataclass(slots=True)
+class ReadSession:
+    """Read-your-writes текущего запроса: до primary_until (unix-время) читать из primary."""
+
+    primary_until: float = 0.0
+    wrote: bool = False
+
+
+# Сессия текущего HTTP-запроса; None — фоновые потоки и CLI.
+current_reads: ContextVar[ReadSession | None] = ContextVar("current_reads", default=None)
+_primary_only: ContextVar[bool] = ContextVar("primary_only", default=False)
+
+
+@contextmanager
+def reading_from_primary() -> Iterator[None]:
+    """Внутри блока все чтения идут в primary (например, сразу после чужого commit)."""
+
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+class ReadYourWrites:
+    """После записи чтения того же клиента window_seconds идут в primary.
+
+    Срок хранит клиент, а не процесс: запрос приносит его (cookie или
+    заголовок) в ReadSession, commit в primary продлевает срок, ответ отдаёт
+    его обратно. Поэтому срок соблюдает любой воркер и хост; часы — unix-время.
+    Принесённый срок урезается до now + window_seconds: клиент не может
+    надолго закрепить свои чтения за primary.
+    """
+
+    def __init__(self, window_seconds: float, clock: Callable[[], float] = time.time) -> None:
+        self._window = window_seconds
+        self._clock = clock
+
+    @property
+    def window_seconds(self) -> float:
+        """Окно чтения из primary после записи."""
+
+        return self._window
+
+    def session(self, *tokens: str | None) -> ReadSession:
+        """Сессия запроса по срокам, которые принёс клиент; нечисловые игнорируются."""
+
+        until = 0.0
+        for token in tokens:
+            try:
+                until = max(until, float(token or 0.0))
+            except ValueError:
+                continue
+        return ReadSession(min(until, self._clock() + self._window))
+
+    def note_write(self) -> None:
+        """Продлить срок текущего запроса; вне запроса (фоновая работа) ничего не делает."""
+
+        reads = current_reads.get()
+        if reads is None or self._window <= 0:
+            return
+        reads.primary_until = self._clock() + self._window
+        reads.wrote = True
+
+    def is_sticky(self) -> bool:
+        """Должен ли текущий запрос читать из primary."""
+
+        reads = current_reads.get()
+        return reads is not None and reads.primary_until > self._clock()
+
+
+class ReadRouter(Generic[TTarget]):
+    """Выбирает, куда идёт чтение: реплики по кругу или primary.
+
+    primary — если реплик нет, текущий запрос в окне ReadYourWrites
+    или чтение идёт внутри reading_from_primary().
+    """
+
+    def __init__(
+        self,
+        primary: TTarget,
+        replicas: Sequence[TTarget] = (),
+        stickiness: ReadYourWrites | None = None,
+    ) -> None:
+        self._primary = primary
+        self._replicas = itertools.cycle(replicas) if replicas else None
+        self._stickiness = stickiness or ReadYourWrites(0.0)
+        self._lock = Lock()
+
+    @property
+    def stickiness(self) -> ReadYourWrites:
+        """Политика read-your-writes."""
+
+        return self._stickiness
+
+    def choose(self) -> tuple[TTarget, bool]:
+        """Вернуть (цель, это реплика)."""
+
+        if self._replicas is None or _primary_only.get() or self._stickiness.is_sticky():
+            return self._primary, False
+        with self._lock:
+            return next(self._replicas), True
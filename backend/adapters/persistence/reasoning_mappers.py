@@ -0,0 +1,34 @@
+"""Мапперы ORM ↔ dataclass для рассуждений Reasoner."""
+
+from __future__ import annotations
+
+from backend.adapters.persistence.mappers import normalize_dt, to_float
+from backend.adapters.persistence.orm_models import ReasoningORM
+from backend.domain.entities import Reasoning
+
+
+def reasoning_to_orm(reasoning: Reasoning, target: ReasoningORM | None = None) -> ReasoningORM:
+    """Сконвертировать рассуждение в ORM, переиспользуя экземпляр, если он задан."""
+
+    target = target or ReasoningORM(deal_id=reasoning.deal_id)
+    target.fingerprint = reasoning.fingerprint
+    target.status = reasoning.status
+    target.score = reasoning.score
+    target.facet_digests = dict(reasoning.facet_digests)
+    target.result = dict(reasoning.result)
+    target.created_at = normalize_dt(reasoning.created_at)
+    return target
+
+
+def reasoning_from_orm(model: ReasoningORM) -> Reasoning:
+    """Сконвертировать ORM-рассуждение в доменный объект."""
+
+    return Reasoning(
+        deal_id=model.deal_id,
+        fingerprint=model.fingerprint,
+        status=model.status,
+        score=to_float(model.score),
+        facet_digests=dict(model.facet_digests or {}),
+        result=dict(model.result),
+        created_at=normalize_dt(model.created_at),
+    )
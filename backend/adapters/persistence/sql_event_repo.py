@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
-from backend.adapters.persistence.mappers import event_from_orm, event_to_orm
+from backend.adapters.persistence.mappers import event_from_orm, event_to_orm, event_to_row
 from backend.adapters.persistence.orm_models import EventORM
 from backend.domain.entities import Event
 from backend.ports.repositories import EventRepository
@@ -24,6 +24,12 @@ class SqlEventRepository(EventRepository):
 
         self._session.add(event_to_orm(event))
 
+    def add_many(self, events: Sequence[Event]) -> None:
+        """Вставить события одним multi-row INSERT (executemany без ORM-объектов)."""
+
+        if events:
+            self._session.execute(insert(EventORM), [event_to_row(event) for event in events])
+
     def list_for_deal(self, deal_id: str) -> Sequence[Event]:
         """Вернуть события сделки в порядке создания."""
 
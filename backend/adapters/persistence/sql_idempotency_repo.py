@@ -0,0 +1,104 @@
+"""SQL-адаптер ключей идемпотентности: поиск по первичному ключу и INSERT без конфликтов."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.mappers import normalize_dt
+from backend.adapters.persistence.orm_models import IdempotencyKeyORM
+from backend.domain.entities import DealReadModel, IdempotencyRecord
+from backend.ports.repositories import IdempotencyRepository
+
+_INSERTS: dict[str, Callable[..., Any]] = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class SqlIdempotencyRepository(IdempotencyRepository):
+    """Работает с таблицей idempotency_keys.
+
+    Вставка — INSERT ... ON CONFLICT (key) DO NOTHING RETURNING key: занятый
+    параллельным запросом ключ не роняет транзакцию, а просто не попадает в
+    ответ, и юзкейс откатывает свою запись. Стоимость поиска и вставки — один
+    проход по уникальному индексу независимо от числа сохранённых ключей.
+    Для СУБД без ON CONFLICT каждая строка вставляется в своём SAVEPOINT, а
+    нарушение уникальности откатывает только её.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, IdempotencyRecord]:
+        """Вернуть записи по ключам одним запросом."""
+
+        if not keys:
+            return {}
+        stmt = select(IdempotencyKeyORM).where(IdempotencyKeyORM.key.in_(list(keys)))
+        return {row.key: _record_from_orm(row) for row in self._session.scalars(stmt)}
+
+    def add_many(self, records: Sequence[IdempotencyRecord]) -> set[str]:
+        """Вставить записи одним multi-row INSERT, пропустив занятые ключи."""
+
+        if not records:
+            return set()
+        rows = [
+            {
+                "key": record.key,
+                "deal_id": record.deal_id,
+                "response": _response_to_json(record.response),
+                "created_at": normalize_dt(record.created_at),
+            }
+            for record in records
+        ]
+        dialect = self._session.get_bind().dialect.name
+        if dialect not in _INSERTS:
+            return self._insert_each(rows)
+        stmt = (
+            _INSERTS[dialect](IdempotencyKeyORM)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[IdempotencyKeyORM.key])
+            .returning(IdempotencyKeyORM.key)
+        )
+        return set(self._session.scalars(stmt))
+
+    def _insert_each(self, rows: list[dict[str, Any]]) -> set[str]:
+        inserted: set[str] = set()
+        for row in rows:
+            try:
+                with self._session.begin_nested():
+                    self._session.execute(insert(IdempotencyKeyORM).values(row))
+            except IntegrityError:
+                continue
+            inserted.add(row["key"])
+        return inserted
+
+
+def _response_to_json(model: DealReadModel) -> dict[str, Any]:
+    return {
+        "deal_id": model.deal_id,
+        "status": model.status,
+        "score": model.score,
+        "last_event": dict(model.last_event) if model.last_event else None,
+        "updated_at": model.updated_at.isoformat() if model.updated_at else None,
+        "letters": dict(model.letters),
+        "version": model.version,
+    }
+
+
+def _record_from_orm(row: IdempotencyKeyORM) -> IdempotencyRecord:
+    data = row.response
+    updated_at = data.get("updated_at")
+    response = DealReadModel(
+        deal_id=data["deal_id"],
+        status=data["status"],
+        score=data.get("score"),
+        last_event=data.get("last_event"),
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        letters=data.get("letters") or {},
+        version=data.get("version", 0),
+    )
+    return IdempotencyRecord(row.key, row.deal_id, response, normalize_dt(row.created_at))
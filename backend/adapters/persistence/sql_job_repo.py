@@ -0,0 +1,123 @@
+"""SQL-адаптер outbox фоновых задач с захватом через SKIP LOCKED и аренду строк."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, and_, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.mappers import normalize_dt
+from backend.adapters.persistence.orm_models import JobORM
+from backend.domain.entities import Job
+from backend.ports.repositories import JobRepository
+
+_RETURNED = (JobORM.id, JobORM.deal_id, JobORM.kind, JobORM.available_at, JobORM.attempts)
+
+
+class SqlJobRepository(JobRepository):
+    """Работает с таблицей deal_jobs.
+
+    Захват — UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+    RETURNING, и для пачки, и для догрузки задач тех же сделок: в PostgreSQL
+    конкурирующие воркеры пропускают строки друг друга и не ждут их.
+    SQLite не знает SKIP LOCKED, там захват эмулирует аренда: UPDATE меняет
+    только строки без действующего locked_until, а запись в SQLite
+    сериализуется блокировкой базы. Истёкшая аренда возвращает задачу в очередь.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def enqueue(self, jobs: Sequence[Job]) -> None:
+        """Добавить задачи одним multi-row INSERT."""
+
+        if not jobs:
+            return
+        rows = [
+            {
+                "deal_id": job.deal_id,
+                "kind": job.kind,
+                "status": "pending",
+                "attempts": job.attempts,
+                "available_at": normalize_dt(job.available_at),
+            }
+            for job in jobs
+        ]
+        self._session.execute(insert(JobORM), rows)
+
+    def claim(self, limit: int, now: datetime, lease_until: datetime) -> Sequence[Job]:
+        """Захватить готовые задачи, затем догрузить готовые задачи тех же сделок."""
+
+        now, lease_until = normalize_dt(now), normalize_dt(lease_until)
+        ready = self._ready(now)
+        claimed = self._lease(self._unlocked(ready, limit), lease_until)
+        deals = list({(job.deal_id, job.kind) for job in claimed})
+        if deals:
+            same_deals = and_(ready, tuple_(JobORM.deal_id, JobORM.kind).in_(deals))
+            claimed.extend(self._lease(self._unlocked(same_deals), lease_until))
+        return claimed
+
+    def complete(self, job_ids: Sequence[int]) -> None:
+        """Удалить выполненные задачи."""
+
+        if job_ids:
+            self._session.execute(delete(JobORM).where(JobORM.id.in_(job_ids)))
+
+    def retry(self, job_ids: Sequence[int], available_at: datetime, error: str) -> None:
+        """Снять аренду и отложить задачи до available_at."""
+
+        values = {
+            "available_at": normalize_dt(available_at),
+            "locked_until": None,
+            "last_error": error[:500],
+        }
+        self._session.execute(update(JobORM).where(JobORM.id.in_(job_ids)).values(**values))
+
+    def bury(self, job_ids: Sequence[int], error: str) -> None:
+        """Пометить задачи как упавшие окончательно."""
+
+        values = {"status": "dead", "locked_until": None, "last_error": error[:500]}
+        self._session.execute(update(JobORM).where(JobORM.id.in_(job_ids)).values(**values))
+
+    def count_pending(self) -> int:
+        """Посчитать задачи со status = 'pending' одним COUNT."""
+
+        stmt = select(func.count()).select_from(JobORM).where(JobORM.status == "pending")
+        return int(self._session.execute(stmt).scalar_one())
+
+    def _lease(self, condition: ColumnElement[bool], lease_until: datetime | None) -> list[Job]:
+        stmt = (
+            update(JobORM)
+            .where(condition)
+            .values(locked_until=lease_until, attempts=JobORM.attempts + 1)
+            .returning(*_RETURNED)
+            .execution_options(synchronize_session=False)
+        )
+        return [
+            Job(
+                deal_id=row.deal_id,
+                kind=row.kind,
+                available_at=normalize_dt(row.available_at),
+                attempts=row.attempts,
+                id=row.id,
+            )
+            for row in self._session.execute(stmt)
+        ]
+
+    @staticmethod
+    def _unlocked(condition: ColumnElement[bool], limit: int | None = None) -> ColumnElement[bool]:
+        # Обе выборки захвата — со SKIP LOCKED: строки, которые держит другой воркер,
+        # пропускаются, а не ждутся (иначе два claim ждали бы друг друга по кругу).
+        picked = select(JobORM.id).where(condition).order_by(JobORM.available_at, JobORM.id)
+        picked = picked.limit(limit).with_for_update(skip_locked=True)
+        return JobORM.id.in_(picked.scalar_subquery())
+
+    @staticmethod
+    def _ready(now: datetime | None) -> ColumnElement[bool]:
+        return and_(
+            JobORM.status == "pending",
+            JobORM.available_at <= now,
+            or_(JobORM.locked_until.is_(None), JobORM.locked_until <= now),
+        )
@@ -2,41 +2,93 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
-from backend.adapters.persistence.mappers import read_model_from_orm, read_model_to_orm
+from backend.adapters.persistence.mappers import (
+    normalize_dt,
+    read_model_from_orm,
+    read_model_to_orm,
+)
 from backend.adapters.persistence.orm_models import ReadModelORM
-from backend.domain.entities import DealReadModel
-from backend.ports.repositories import ReadModelRepository
+from backend.domain.entities import DealReadModel, ReadModelStamp
+from backend.ports.repositories import ReadModelConflict, ReadModelRepository
 
 
 class SqlReadModelRepository(ReadModelRepository):
-    """Работает с таблицей read-model, обеспечивая идемпотентный апдейт."""
+    """Работает с таблицей read-model, обеспечивая идемпотентный апдейт.
+
+    Прочитанные строки (и отсутствие строки) запоминаются до конца транзакции:
+    save обновляет строку с условием WHERE version = <прочитанная> или вставляет
+    новую, если её не было. Запись сразу сбрасывается в БД, и конфликт с
+    параллельной транзакцией превращается в ReadModelConflict.
+    """
 
     def __init__(self, session: Session) -> None:
         self._session = session
+        self._read: dict[str, ReadModelORM | None] = {}
 
     def get(self, deal_id: str) -> DealReadModel | None:
         """Получить read-model по идентификатору сделки."""
 
-        stmt = select(ReadModelORM).where(ReadModelORM.deal_id == deal_id)
-        row = self._session.execute(stmt).scalar_one_or_none()
+        row = self._rows([deal_id]).get(deal_id)
         return read_model_from_orm(row) if row else None
 
+    def get_stamp(self, deal_id: str) -> ReadModelStamp | None:
+        """Прочитать только version и updated_at — без JSON-колонок."""
+
+        stmt = select(ReadModelORM.version, ReadModelORM.updated_at).where(
+            ReadModelORM.deal_id == deal_id
+        )
+        row = self._session.execute(stmt).one_or_none()
+        if row is None:
+            return None
+        return ReadModelStamp(version=row.version or 0, updated_at=normalize_dt(row.updated_at))
+
+    def get_many(self, deal_ids: Sequence[str]) -> dict[str, DealReadModel]:
+        """Получить read-model нескольких сделок одним запросом WHERE deal_id IN (...)."""
+
+        return {
+            deal_id: read_model_from_orm(row) for deal_id, row in self._rows(deal_ids).items()
+        }
+
     def save(self, model: DealReadModel) -> None:
-        """Сохранить read-model, обновляя существующую строку."""
+        """Сохранить read-model, обновляя прочитанную строку."""
+
+        self.save_many([model])
 
-        stmt = select(ReadModelORM).where(ReadModelORM.deal_id == model.deal_id)
-        existing = self._session.execute(stmt).scalar_one_or_none()
-        orm = read_model_to_orm(model, existing)
-        if existing is None:
-            self._session.add(orm)
+    def save_many(self, models: Sequence[DealReadModel]) -> None:
+        """Сохранить несколько read-model: непрочитанные — одним SELECT ... IN."""
+
+        self._rows([model.deal_id for model in models if model.deal_id not in self._read])
+        for model in models:
+            current = self._read[model.deal_id]
+            orm = read_model_to_orm(model, current)
+            if current is None:
+                self._session.add(orm)
+                self._read[model.deal_id] = orm
+        # StaleDataError — строку обновили после чтения, IntegrityError — её уже вставили.
+        try:
+            self._session.flush()
+        except (StaleDataError, IntegrityError) as exc:
+            raise ReadModelConflict(str(exc)) from exc
 
     def delete(self, deal_id: str) -> None:
         """Удалить read-model сделки."""
 
         stmt = delete(ReadModelORM).where(ReadModelORM.deal_id == deal_id)
         self._session.execute(stmt)
+        self._read.pop(deal_id, None)
 
-
+    def _rows(self, deal_ids: Sequence[str]) -> dict[str, ReadModelORM]:
+        if not deal_ids:
+            return {}
+        stmt = select(ReadModelORM).where(ReadModelORM.deal_id.in_(set(deal_ids)))
+        rows = {row.deal_id: row for row in self._session.execute(stmt).scalars()}
+        for deal_id in deal_ids:
+            self._read[deal_id] = rows.get(deal_id)
+        return rows
@@ -0,0 +1,39 @@
+"""SQL-адаптер репозитория рассуждений Reasoner."""
+
+from __future__ import annotations
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.orm_models import ReasoningORM
+from backend.adapters.persistence.reasoning_mappers import reasoning_from_orm, reasoning_to_orm
+from backend.domain.entities import Reasoning
+from backend.ports.repositories import ReasoningRepository
+
+
+class SqlReasoningRepository(ReasoningRepository):
+    """Работает с таблицей deal_reasonings: одна строка на сделку."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get(self, deal_id: str) -> Reasoning | None:
+        """Получить рассуждение по идентификатору сделки."""
+
+        stmt = select(ReasoningORM).where(ReasoningORM.deal_id == deal_id)
+        row = self._session.execute(stmt).scalar_one_or_none()
+        return reasoning_from_orm(row) if row else None
+
+    def save(self, reasoning: Reasoning) -> None:
+        """Сохранить рассуждение, обновляя существующую строку."""
+
+        existing = self._session.get(ReasoningORM, reasoning.deal_id)
+        orm = reasoning_to_orm(reasoning, existing)
+        if existing is None:
+            self._session.add(orm)
+
+    def delete(self, deal_id: str) -> None:
+        """Удалить рассуждение сделки."""
+
+        stmt = delete(ReasoningORM).where(ReasoningORM.deal_id == deal_id)
+        self._session.execute(stmt)
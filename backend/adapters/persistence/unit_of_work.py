@@ -2,29 +2,58 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, TypeVar
 
 from sqlalchemy.orm import Session, sessionmaker
 
-from backend.adapters.persistence.in_memory_event_repo import InMemoryEventRepository
-from backend.adapters.persistence.in_memory_fact_repo import InMemoryFactRepository
-from backend.adapters.persistence.in_memory_read_model_repo import InMemoryReadModelRepository
+from backend.adapters.persistence.cached_idempotency_repo import CachedIdempotencyRepository
+from backend.adapters.persistence.cached_read_model_repo import CachedReadModelRepository
+from backend.adapters.persistence.idempotency_index import IdempotencyIndex
+from backend.adapters.persistence.in_memory_unit_of_work import InMemoryUnitOfWork
+from backend.adapters.persistence.read_model_cache import ReadModelCache
 from backend.adapters.persistence.sql_event_repo import SqlEventRepository
 from backend.adapters.persistence.sql_fact_repo import SqlFactRepository
+from backend.adapters.persistence.sql_idempotency_repo import SqlIdempotencyRepository
+from backend.adapters.persistence.sql_job_repo import SqlJobRepository
 from backend.adapters.persistence.sql_read_model_repo import SqlReadModelRepository
-from backend.ports.repositories import EventRepository, FactRepository, ReadModelRepository
+from backend.adapters.persistence.sql_reasoning_repo import SqlReasoningRepository
+from backend.ports.repositories import (
+    EventRepository,
+    FactRepository,
+    IdempotencyRepository,
+    JobRepository,
+    ReadModelRepository,
+    ReasoningRepository,
+)
 from backend.ports.unit_of_work import UnitOfWork
 
+TRepository = TypeVar("TRepository")
+
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
-    """UnitOfWork на базе SQLAlchemy: один Session на юзкейс."""
+    """UnitOfWork на базе SQLAlchemy: один Session на юзкейс.
+
+    С read_model_cache read-model читаются через кэш процесса — для путей чтения.
+    С idempotency_index ключи идемпотентности сперва проверяются в памяти процесса.
+    """
 
-    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        read_model_cache: ReadModelCache | None = None,
+        idempotency_index: IdempotencyIndex | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_model_cache = read_model_cache
+        self._fill_read_model_cache = True
+        self._idempotency_index = idempotency_index
         self._session: Optional[Session] = None
         self._events: Optional[EventRepository] = None
         self._facts: Optional[FactRepository] = None
         self._read_models: Optional[ReadModelRepository] = None
+        self._reasonings: Optional[ReasoningRepository] = None
+        self._jobs: Optional[JobRepository] = None
+        self._idempotency: Optional[IdempotencyRepository] = None
         self._committed = False
 
     def __enter__(self) -> "SqlAlchemyUnitOfWork":
@@ -32,6 +61,17 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         self._events = SqlEventRepository(self._session)
         self._facts = SqlFactRepository(self._session)
         self._read_models = SqlReadModelRepository(self._session)
+        if self._read_model_cache is not None:
+            self._read_models = CachedReadModelRepository(
+                self._read_models, self._read_model_cache, self._fill_read_model_cache
+            )
+        self._reasonings = SqlReasoningRepository(self._session)
+        self._jobs = SqlJobRepository(self._session)
+        self._idempotency = SqlIdempotencyRepository(self._session)
+        if self._idempotency_index is not None:
+            self._idempotency = CachedIdempotencyRepository(
+                self._idempotency, self._idempotency_index
+            )
         self._committed = False
         return self
 
@@ -46,34 +86,45 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         finally:
             self._session.close()
             self._session = None
-            self._events = None
-            self._facts = None
-            self._read_models = None
+            self._events = self._facts = self._read_models = None
+            self._reasonings = self._jobs = self._idempotency = None
             self._committed = False
 
     @property
     def events(self) -> EventRepository:
         """Вернуть репозиторий событий."""
 
-        if self._events is None:
-            raise RuntimeError("UnitOfWork не открыт через контекстный менеджер.")
-        return self._events
+        return _opened(self._events)
 
     @property
     def facts(self) -> FactRepository:
         """Вернуть репозиторий фактов."""
 
-        if self._facts is None:
-            raise RuntimeError("UnitOfWork не открыт через контекстный менеджер.")
-        return self._facts
+        return _opened(self._facts)
 
     @property
     def read_models(self) -> ReadModelRepository:
         """Вернуть репозиторий read-model."""
 
-        if self._read_models is None:
-            raise RuntimeError("UnitOfWork не открыт через контекстный менеджер.")
-        return self._read_models
+        return _opened(self._read_models)
+
+    @property
+    def reasonings(self) -> ReasoningRepository:
+        """Вернуть репозиторий рассуждений Reasoner."""
+
+        return _opened(self._reasonings)
+
+    @property
+    def jobs(self) -> JobRepository:
+        """Вернуть outbox фоновых задач."""
+
+        return _opened(self._jobs)
+
+    @property
+    def idempotency(self) -> IdempotencyRepository:
+        """Вернуть хранилище ключей идемпотентности."""
+
+        return _opened(self._idempotency)
 
     def commit(self) -> None:
         """Зафиксировать изменения."""
@@ -90,41 +141,10 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
             self._session.rollback()
 
 
-class InMemoryUnitOfWork(UnitOfWork):
-    """UnitOfWork, объединяющий in-memory реализации репозиториев."""
-
-    def __init__(
-        self,
-        event_repo: InMemoryEventRepository | None = None,
-        fact_repo: InMemoryFactRepository | None = None,
-        read_model_repo: InMemoryReadModelRepository | None = None,
-    ) -> None:
-        self._event_repo = event_repo or InMemoryEventRepository()
-        self._fact_repo = fact_repo or InMemoryFactRepository()
-        self._read_model_repo = read_model_repo or InMemoryReadModelRepository()
-
-    def __enter__(self) -> "InMemoryUnitOfWork":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        return None
-
-    @property
-    def events(self) -> EventRepository:
-        return self._event_repo
-
-    @property
-    def facts(self) -> FactRepository:
-        return self._fact_repo
-
-    @property
-    def read_models(self) -> ReadModelRepository:
-        return self._read_model_repo
-
-    def commit(self) -> None:
-        return None
-
-    def rollback(self) -> None:
-        return None
+def _opened(repository: TRepository | None) -> TRepository:
+    if repository is None:
+        raise RuntimeError("UnitOfWork не открыт через контекстный менеджер.")
+    return repository
 
 
+__all__ = ["InMemoryUnitOfWork", "SqlAlchemyUnitOfWork"]
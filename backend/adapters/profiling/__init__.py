@@ -0,0 +1 @@
+# Профилирование запросов: сэмплер стеков и кольцевой буфер результатов
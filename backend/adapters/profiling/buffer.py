@@ -0,0 +1,63 @@
+"""Результаты профилирования запросов и ограниченный кольцевой буфер для них."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import count
+from threading import Lock
+
+
+@dataclass(frozen=True, slots=True)
+class RequestProfile:
+    """Профиль одного запроса: длительность, доли слоёв и самые частые стеки.
+
+    breakdown — секунды по слоям (routing, di, uow, sql, serialization, app,
+    other), оценённые как доля сэмплов слоя от длительности запроса;
+    top_stacks — свёрнутые стеки «корень;...;лист» со счётчиками сэмплов.
+    """
+
+    id: int
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    duration: float
+    samples: int
+    breakdown: dict[str, float] = field(default_factory=dict)
+    top_stacks: list[tuple[str, int]] = field(default_factory=list)
+
+
+class ProfileBuffer:
+    """Хранит последние capacity профилей; при переполнении вытесняется самый старый."""
+
+    def __init__(self, capacity: int = 50) -> None:
+        self._profiles: deque[RequestProfile] = deque(maxlen=capacity)
+        self._ids = count(1)
+        self._lock = Lock()
+
+    def next_id(self) -> int:
+        """Выдать идентификатор для нового профиля."""
+
+        with self._lock:
+            return next(self._ids)
+
+    def add(self, profile: RequestProfile) -> None:
+        """Сохранить профиль, вытеснив самый старый при переполнении."""
+
+        with self._lock:
+            self._profiles.append(profile)
+
+    def recent(self) -> list[RequestProfile]:
+        """Профили от новых к старым."""
+
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> RequestProfile | None:
+        """Профиль по идентификатору, если он ещё в буфере."""
+
+        with self._lock:
+            return next((item for item in self._profiles if item.id == profile_id), None)
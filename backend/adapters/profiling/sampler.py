@@ -0,0 +1,109 @@
+"""Статистический сэмплер стеков потоков с разбивкой времени по слоям приложения."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Callable, Iterable
+
+# Слой определяется по файлу самого глубокого кадра; порядок важен (первое совпадение).
+LAYERS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("sql", ("sqlalchemy/", "psycopg", "sqlite3")),
+    ("uow", ("backend/adapters/persistence/",)),
+    ("serialization", ("pydantic", "backend/schemas/", "/json/")),
+    ("di", ("fastapi/dependencies/", "backend/app/di.py")),
+    ("routing", ("starlette/", "fastapi/", "anyio/")),
+    ("app", ("backend/",)),
+)
+# Кадры ожидания: поток простаивает, такие сэмплы не считаются.
+IDLE_FILES = ("selectors.py", "threading.py", "queue.py", "asyncio/base_events.py")
+MAX_DEPTH = 40
+# Один активный сэмплер на процесс: каждый опрашивает все потоки раз в interval.
+_ACTIVE = threading.Lock()
+
+
+def layer_of(filename: str) -> str | None:
+    """Слой кадра по имени файла; None — поток простаивает."""
+
+    path = filename.replace("\\", "/")
+    if path.endswith(IDLE_FILES):
+        return None
+    for layer, markers in LAYERS:
+        if any(marker in path for marker in markers):
+            return layer
+    return "other"
+
+
+class StackSampler:
+    """Раз в interval секунд снимает стеки выбранных потоков и копит статистику.
+
+    Потоки выбирает predicate по (ident, name); сам сэмплер живёт в отдельном
+    потоке только между start() и stop(), поэтому вне профилирования затрат нет.
+    max_seconds ограничивает сэмплирование долгих запросов (SSE, выгрузки):
+    после него поток сэмплера завершается сам, не дожидаясь stop();
+    sampled_seconds — сколько секунд запроса реально покрыто сэмплами.
+    Пока работает один сэмплер, start() остальных возвращает False.
+    """
+
+    def __init__(
+        self,
+        predicate: Callable[[int, str], bool],
+        interval: float = 0.001,
+        max_seconds: float | None = None,
+    ) -> None:
+        self._predicate = predicate
+        self._interval = interval
+        self._max_seconds = max_seconds
+        self.sampled_seconds = 0.0
+        self.layers: Counter[str] = Counter()
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> bool:
+        """Начать сэмплирование; False, если в процессе уже работает другой сэмплер."""
+
+        if not _ACTIVE.acquire(blocking=False):
+            return False
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Остановить сэмплирование и дождаться потока (если он был запущен)."""
+
+        self._stop.set()
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own, started = threading.get_ident(), time.perf_counter()
+        deadline = started + self._max_seconds if self._max_seconds else float("inf")
+        try:
+            while not self._stop.wait(self._interval) and time.perf_counter() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident != own and self._predicate(ident, names.get(ident, "")):
+                        self._record(frame)
+        finally:
+            self.sampled_seconds = time.perf_counter() - started
+            _ACTIVE.release()
+
+    def _record(self, frame: FrameType) -> None:
+        layer = layer_of(frame.f_code.co_filename)
+        if layer is None:
+            return
+        self.samples += 1
+        self.layers[layer] += 1
+        self.stacks[";".join(reversed(list(_labels(frame))))] += 1
+
+
+def _labels(frame: FrameType | None) -> Iterable[str]:
+    depth = 0
+    while frame is not None and depth < MAX_DEPTH:
+        code = frame.f_code
+        yield f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}"
+        frame, depth = frame.f_back, depth + 1
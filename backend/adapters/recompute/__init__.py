@@ -0,0 +1 @@
+# Фоновый пересчёт read-model: диспетчер в процессе и воркеры очереди
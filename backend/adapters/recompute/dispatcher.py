@@ -0,0 +1,146 @@
+"""Диспетчер фонового пересчёта с дебаунсом по сделке и ограниченным пулом потоков."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from threading import Condition, Thread
+from typing import Callable
+
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.recompute_queue import RecomputeQueuePort
+
+
+@dataclass(slots=True)
+class _Pending:
+    first_at: float
+    due_at: float
+
+
+class RecomputeDispatcher(RecomputeQueuePort):
+    """Копит запросы на пересчёт и запускает по одному на сделку после затишья.
+
+    Каждый enqueue сдвигает запуск на debounce_seconds, но не дальше чем на
+    max_delay_seconds от первого запроса серии. Одна сделка не пересчитывается
+    параллельно: запрос во время пересчёта ставит её в очередь повторно.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[str], object],
+        debounce_seconds: float = 0.5,
+        max_delay_seconds: float = 5.0,
+        workers: int = 2,
+        metrics: MetricsPort | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._run = run
+        self._debounce = debounce_seconds
+        self._max_delay = max_delay_seconds
+        self._metrics = metrics or NullMetrics()
+        self._clock = clock
+        self._cond = Condition()
+        self._pending: dict[str, _Pending] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._running: set[str] = set()
+        self._rerun: set[str] = set()
+        self._closed = False
+        self._threads = [
+            Thread(target=self._worker, name=f"recompute-{idx}", daemon=True)
+            for idx in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def enqueue(self, deal_id: str) -> None:
+        """Запланировать пересчёт; стоимость — запись в словарь и heap под блокировкой."""
+
+        now = self._clock()
+        with self._cond:
+            if self._closed:
+                return
+            if deal_id in self._running:
+                self._rerun.add(deal_id)
+                self._metrics.inc("recompute_coalesced_total")
+                return
+            pending = self._pending.get(deal_id)
+            if pending is None:
+                pending = self._pending[deal_id] = _Pending(first_at=now, due_at=now)
+            else:
+                self._metrics.inc("recompute_coalesced_total")
+            pending.due_at = min(now + self._debounce, pending.first_at + self._max_delay)
+            heapq.heappush(self._heap, (pending.due_at, deal_id))
+            self._metrics.set_gauge("recompute_queue_depth", len(self._pending))
+            self._cond.notify()
+
+    def depth(self) -> int:
+        """Число сделок, ожидающих пересчёта."""
+
+        with self._cond:
+            return len(self._pending)
+
+    def lag(self) -> float:
+        """Возраст самого старого ожидающего запроса в секундах."""
+
+        with self._cond:
+            oldest = min((item.first_at for item in self._pending.values()), default=None)
+        return 0.0 if oldest is None else self._clock() - oldest
+
+    def shutdown(self, drain: bool = True) -> None:
+        """Остановить воркеры; с drain ожидающие пересчёты выполняются сразу."""
+
+        with self._cond:
+            self._closed = True
+            if not drain:
+                self._pending.clear()
+                self._heap.clear()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                picked = self._next()
+            if picked is None:
+                return
+            deal_id, first_at = picked
+            self._execute(deal_id, first_at)
+
+    def _next(self) -> tuple[str, float] | None:
+        while True:
+            now = self._clock()
+            while self._heap:
+                due_at, deal_id = self._heap[0]
+                pending = self._pending.get(deal_id)
+                if pending is None or pending.due_at != due_at:
+                    heapq.heappop(self._heap)
+                    continue
+                if due_at > now and not self._closed:
+                    break
+                heapq.heappop(self._heap)
+                del self._pending[deal_id]
+                self._running.add(deal_id)
+                self._metrics.set_gauge("recompute_queue_depth", len(self._pending))
+                return deal_id, pending.first_at
+            if self._closed and not self._pending:
+                return None
+            self._cond.wait(timeout=self._heap[0][0] - now if self._heap else None)
+
+    def _execute(self, deal_id: str, first_at: float) -> None:
+        started = self._clock()
+        self._metrics.observe("recompute_lag_seconds", started - first_at)
+        try:
+            self._run(deal_id)
+        except Exception:  # noqa: BLE001 - ошибка одной сделки не останавливает воркер
+            self._metrics.inc("recompute_errors_total")
+        self._metrics.observe("recompute_seconds", self._clock() - started)
+        with self._cond:
+            self._running.discard(deal_id)
+            if deal_id in self._rerun:
+                self._rerun.discard(deal_id)
+                now = self._clock()
+                self._pending[deal_id] = _Pending(first_at=now, due_at=now + self._debounce)
+                heapq.heappush(self._heap, (now + self._debounce, deal_id))
+                self._cond.notify()
@@ -0,0 +1,121 @@
+"""Воркер outbox: захват задач пачками, дедупликация по сделке и ретраи с backoff."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Mapping, Sequence
+
+from backend.domain.entities import Job
+from backend.ports.clock import ClockPort
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+JobHandler = Callable[[str], object]
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """Выполняет задачи deal_jobs: одна обработка на пару (сделка, вид) в пачке.
+
+    Захват и завершение — короткие отдельные транзакции, сама обработка идёт
+    вне них. Упавшая задача откладывается на backoff_seconds * 2^(попытка-1),
+    но не дольше max_backoff_seconds; после max_attempts она помечается dead.
+    Несколько процессов с таким воркером делят очередь без координации.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        handlers: Mapping[str, JobHandler],
+        clock: ClockPort,
+        batch_size: int = 50,
+        lease_seconds: float = 60.0,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 300.0,
+        max_attempts: int = 8,
+        metrics: MetricsPort | None = None,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._handlers = dict(handlers)
+        self._clock = clock
+        self._batch_size = batch_size
+        self._lease = timedelta(seconds=lease_seconds)
+        self._backoff = backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._max_attempts = max_attempts
+        self._metrics = metrics or NullMetrics()
+        self._timer = timer
+
+    def run_once(self) -> int:
+        """Захватить пачку и обработать её; вернуть число обработанных сделок."""
+
+        now = self._clock.utcnow()
+        with self._uow_factory() as uow:
+            jobs = list(uow.jobs.claim(self._batch_size, now, now + self._lease))
+            uow.commit()
+        groups: dict[tuple[str, str], list[Job]] = {}
+        for job in jobs:
+            groups.setdefault((job.deal_id, job.kind), []).append(job)
+        self._metrics.inc("outbox_jobs_claimed_total", len(jobs))
+        for (deal_id, kind), group in groups.items():
+            self._process(deal_id, kind, group, now)
+        return len(groups)
+
+    def run_forever(self, stop: threading.Event, idle_seconds: float = 1.0) -> None:
+        """Крутить run_once, засыпая на idle_seconds при пустой очереди.
+
+        Ошибка захвата или завершения (БД недоступна, таймаут) не останавливает
+        поток: она пишется в лог и outbox_worker_errors_total, а следующая
+        попытка откладывается с тем же backoff, что и у задач.
+        """
+
+        failures = 0
+        while not stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:  # noqa: BLE001 - поток воркера живёт, пока не попросят stop
+                failures += 1
+                logger.exception("Сбой цикла outbox-воркера, попытка %d", failures)
+                self._metrics.inc("outbox_worker_errors_total")
+                stop.wait(min(self._max_backoff, self._backoff * 2 ** (failures - 1)))
+                continue
+            failures = 0
+            if processed == 0:
+                stop.wait(idle_seconds)
+
+    def _process(self, deal_id: str, kind: str, group: Sequence[Job], now: datetime) -> None:
+        job_ids = [job.id for job in group if job.id is not None]
+        oldest = min(job.available_at for job in group)
+        self._metrics.observe("outbox_job_lag_seconds", (now - oldest).total_seconds(), kind=kind)
+        started = self._timer()
+        try:
+            handler = self._handlers.get(kind)
+            if handler is None:
+                raise LookupError(f"Нет обработчика задач вида {kind!r}")
+            handler(deal_id)
+        except Exception as exc:  # noqa: BLE001 - задача уходит в ретрай, воркер живёт
+            self._fail(job_ids, kind, max(job.attempts for job in group), exc)
+            return
+        self._metrics.observe("outbox_job_seconds", self._timer() - started, kind=kind)
+        with self._uow_factory() as uow:
+            uow.jobs.complete(job_ids)
+            uow.commit()
+        self._metrics.inc("outbox_jobs_done_total", len(job_ids), kind=kind)
+
+    def _fail(self, job_ids: list[int], kind: str, attempts: int, exc: Exception) -> None:
+        error = f"{type(exc).__name__}: {exc}"
+        with self._uow_factory() as uow:
+            if attempts >= self._max_attempts:
+                uow.jobs.bury(job_ids, error)
+                self._metrics.inc("outbox_jobs_dead_total", len(job_ids), kind=kind)
+            else:
+                delay = min(self._max_backoff, self._backoff * 2 ** max(attempts - 1, 0))
+                available_at = self._clock.utcnow() + timedelta(seconds=delay)
+                uow.jobs.retry(job_ids, available_at, error)
+                self._metrics.inc("outbox_jobs_retried_total", len(job_ids), kind=kind)
+            uow.commit()
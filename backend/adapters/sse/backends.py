@@ -0,0 +1,103 @@
+"""Backends межпроцессной рассылки уведомлений об изменении read-model."""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+
+
+@dataclass(frozen=True, slots=True)
+class StateChange:
+    """Уведомление об изменении: сделка, версия и момент отправки.
+
+    Само состояние не передаётся — получатель дочитывает его только если у него
+    есть подписчики на сделку. sent_at нужен для замера задержки доставки.
+    """
+
+    deal_id: str
+    version: int
+    sent_at: float
+
+    def to_payload(self) -> str:
+        """Компактный JSON для канала уведомлений."""
+
+        return json.dumps({"d": self.deal_id, "v": self.version, "t": self.sent_at})
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "StateChange":
+        """Разобрать уведомление, полученное из канала."""
+
+        data = json.loads(payload)
+        return cls(deal_id=str(data["d"]), version=int(data["v"]), sent_at=float(data["t"]))
+
+
+ChangeCallback = Callable[[StateChange], None]
+
+
+class BroadcastBackend(ABC):
+    """Канал уведомлений между воркерами приложения."""
+
+    @abstractmethod
+    def publish(self, change: StateChange) -> None:
+        """Отправить уведомление всем воркерам, включая текущий."""
+
+    @abstractmethod
+    def start(self, callback: ChangeCallback) -> None:
+        """Начать приём уведомлений; callback может вызываться из другого потока."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Остановить приём уведомлений."""
+
+
+class InProcessHub:
+    """Общая шина для нескольких InProcessBackend: воркеры в одном процессе для тестов."""
+
+    def __init__(self) -> None:
+        self._callbacks: list[ChangeCallback] = []
+        self._lock = Lock()
+
+    def attach(self, callback: ChangeCallback) -> None:
+        """Подключить получателя уведомлений."""
+
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def detach(self, callback: ChangeCallback) -> None:
+        """Отключить получателя уведомлений."""
+
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def dispatch(self, payload: str) -> None:
+        """Синхронно доставить уведомление всем получателям."""
+
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(StateChange.from_payload(payload))
+
+
+class InProcessBackend(BroadcastBackend):
+    """Backend поверх InProcessHub; payload сериализуется так же, как для PostgreSQL."""
+
+    def __init__(self, hub: InProcessHub | None = None) -> None:
+        self._hub = hub or InProcessHub()
+        self._callback: ChangeCallback | None = None
+
+    def publish(self, change: StateChange) -> None:
+        self._hub.dispatch(change.to_payload())
+
+    def start(self, callback: ChangeCallback) -> None:
+        if self._callback is None:
+            self._callback = callback
+            self._hub.attach(callback)
+
+    def stop(self) -> None:
+        if self._callback is not None:
+            self._hub.detach(self._callback)
+            self._callback = None
@@ -1,2 +1,112 @@
-# In-memory broadcaster для SSE подписок в рамках одного процесса
+"""In-memory broadcaster для SSE подписок в рамках одного процесса."""
+
+from __future__ import annotations
+
+import asyncio
+
+from backend.adapters.sse.subscription import Subscription
+from backend.domain.entities import DealReadModel
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.notifier import StateNotifierPort
+
+# Комментарий SSE: клиенты его игнорируют, а прокси не закрывают простаивающее соединение.
+HEARTBEAT_FRAME = ": heartbeat\n\n"
+
+
+class SSEBroadcaster(StateNotifierPort):
+    """Раздаёт новые read-model подписчикам по топикам-сделкам.
+
+    Подписки живут в event loop приложения; publish можно звать из потоков
+    threadpool — доставка переносится в loop через call_soon_threadsafe.
+    Версия read-model отсекает повторы: одно и то же состояние может прийти
+    и локально, и через межпроцессный backend.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsPort | None = None,
+        queue_size: int = 16,
+        heartbeat_seconds: float = 15.0,
+    ) -> None:
+        self.heartbeat_seconds = heartbeat_seconds
+        self._metrics = metrics or NullMetrics()
+        self._queue_size = queue_size
+        self._topics: dict[str, set[Subscription]] = {}
+        self._versions: dict[str, int] = {}
+        self._count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def subscribers(self) -> int:
+        """Текущее число подписок во всех топиках."""
+
+        return self._count
+
+    def subscribe(self, deal_id: str) -> Subscription:
+        """Создать подписку; вызывается из event loop."""
+
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(deal_id, self._queue_size)
+        self._topics.setdefault(deal_id, set()).add(subscription)
+        self._count += 1
+        self._metrics.set_gauge("sse_subscribers", self._count)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Удалить подписку и пустой топик."""
+
+        topic = self._topics.get(subscription.deal_id)
+        if topic is None or subscription not in topic:
+            return
+        topic.discard(subscription)
+        if not topic:
+            del self._topics[subscription.deal_id]
+            self._versions.pop(subscription.deal_id, None)
+        self._count -= 1
+        self._metrics.set_gauge("sse_subscribers", self._count)
+
+    def wants(self, deal_id: str, version: int) -> bool:
+        """Есть ли подписчики сделки, которым эта версия ещё не доставлена."""
+
+        return deal_id in self._topics and version > self._versions.get(deal_id, 0)
+
+    def publish(self, model: DealReadModel) -> None:
+        """Разослать состояние подписчикам сделки из любого потока."""
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self.deliver(model)
+        else:
+            loop.call_soon_threadsafe(self.deliver, model)
+
+    def deliver(self, model: DealReadModel) -> None:
+        """Положить состояние в очереди подписчиков; только из event loop."""
+
+        topic = self._topics.get(model.deal_id)
+        if topic is None:
+            return
+        if model.version:
+            if model.version <= self._versions.get(model.deal_id, 0):
+                return
+            self._versions[model.deal_id] = model.version
+        self._metrics.inc("sse_published_total")
+        dropped = sum(sub.push(model) for sub in topic)
+        if dropped:
+            self._metrics.inc("sse_dropped_total", dropped)
+
+
+def format_event(data: str, event: str = "state", event_id: str | None = None) -> str:
+    """Собрать SSE-кадр из уже сериализованных данных."""
+
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
 
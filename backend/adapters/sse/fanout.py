@@ -0,0 +1,66 @@
+"""Связка SSE broadcaster с межпроцессным backend уведомлений."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from backend.adapters.sse.backends import BroadcastBackend, StateChange
+from backend.adapters.sse.broadcaster import SSEBroadcaster
+from backend.domain.entities import DealReadModel
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.notifier import StateNotifierPort
+
+
+class FanoutNotifier(StateNotifierPort):
+    """Доставляет состояние своим получателям сразу, остальным воркерам — через backend."""
+
+    def __init__(
+        self,
+        local: StateNotifierPort,
+        backend: BroadcastBackend,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._local = local
+        self._backend = backend
+        self._clock = clock
+
+    def publish(self, model: DealReadModel) -> None:
+        """Опубликовать локально и разослать уведомление (deal_id + версия)."""
+
+        self._local.publish(model)
+        self._backend.publish(StateChange(model.deal_id, model.version, self._clock()))
+
+
+class StateRelay:
+    """Получатель уведомлений backend на стороне воркера.
+
+    Read-model дочитывается только при наличии подписчиков, которым эта версия
+    ещё не доставлена; своё же уведомление обычно отсекается по версии.
+    """
+
+    def __init__(
+        self,
+        broadcaster: SSEBroadcaster,
+        load: Callable[[str], DealReadModel],
+        metrics: MetricsPort | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._broadcaster = broadcaster
+        self._load = load
+        self._metrics = metrics or NullMetrics()
+        self._clock = clock
+
+    def __call__(self, change: StateChange) -> None:
+        """Обработать уведомление; ошибки чтения не должны ронять listener."""
+
+        if not self._broadcaster.wants(change.deal_id, change.version):
+            self._metrics.inc("sse_relay_skipped_total")
+            return
+        try:
+            model = self._load(change.deal_id)
+        except Exception:  # noqa: BLE001 - listener обслуживает все сделки воркера
+            self._metrics.inc("sse_relay_errors_total")
+            return
+        self._broadcaster.publish(model)
+        self._metrics.observe("sse_delivery_latency_seconds", self._clock() - change.sent_at)
@@ -0,0 +1,101 @@
+"""Backend уведомлений поверх PostgreSQL LISTEN/NOTIFY."""
+
+from __future__ import annotations
+
+import re
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.adapters.sse.backends import BroadcastBackend, ChangeCallback, StateChange
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+_CHANNEL_RE = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+
+
+class PostgresNotifyBackend(BroadcastBackend):
+    """NOTIFY через пул приложения, LISTEN — на одном выделенном соединении воркера.
+
+    Listener живёт в daemon-потоке с autocommit-соединением psycopg и
+    переподключается после ошибок; уведомления, пришедшие во время разрыва,
+    теряются — подписчики получат следующее изменение сделки.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str = "deal_state",
+        metrics: MetricsPort | None = None,
+        poll_seconds: float = 1.0,
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        if not _CHANNEL_RE.match(channel):
+            raise ValueError(f"Недопустимое имя канала: {channel!r}")
+        self._engine = engine
+        self._channel = channel
+        self._metrics = metrics or NullMetrics()
+        self._poll_seconds = poll_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._callback: ChangeCallback | None = None
+
+    def publish(self, change: StateChange) -> None:
+        """Отправить NOTIFY; ошибка БД или пула только считается в метрике.
+
+        Вызов идёт после commit события: исключение отдало бы клиенту 500 за
+        уже сохранённую запись и пропустило бы постановку пересчёта.
+        """
+
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": self._channel, "payload": change.to_payload()},
+                )
+        except SQLAlchemyError:
+            self._metrics.inc("sse_notify_errors_total")
+            return
+        self._metrics.inc("sse_notify_total")
+
+    def start(self, callback: ChangeCallback) -> None:
+        if self._thread is not None:
+            return
+        self._callback = callback
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-listen", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_seconds * 2)
+            self._thread = None
+
+    def _run(self) -> None:
+        import psycopg
+
+        dsn = self._engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(dsn, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {self._channel}")
+                    self._metrics.set_gauge("sse_listener_connected", 1)
+                    while not self._stop.is_set():
+                        for notify in connection.notifies(timeout=self._poll_seconds):
+                            self._dispatch(notify.payload)
+            except psycopg.Error:
+                self._metrics.inc("sse_listener_errors_total")
+            self._metrics.set_gauge("sse_listener_connected", 0)
+            self._stop.wait(self._reconnect_seconds)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            change = StateChange.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            self._metrics.inc("sse_listener_bad_payload_total")
+            return
+        if self._callback is not None:
+            self._callback(change)
@@ -0,0 +1,49 @@
+"""Подписка SSE на обновления одной сделки."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+from backend.domain.entities import DealReadModel
+
+
+class Subscription:
+    """Подписка на одну сделку с ограниченной очередью состояний.
+
+    Каждое состояние — полный снимок read-model, поэтому при переполнении
+    промежуточные снимки отбрасываются и остаётся только последний.
+    """
+
+    def __init__(self, deal_id: str, maxsize: int) -> None:
+        self.deal_id = deal_id
+        self.dropped = 0
+        self._maxsize = maxsize
+        self._queue: deque[DealReadModel] = deque()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def push(self, model: DealReadModel) -> int:
+        """Положить состояние в очередь; вернуть число схлопнутых снимков."""
+
+        dropped = 0
+        if len(self._queue) >= self._maxsize:
+            dropped = len(self._queue)
+            self._queue.clear()
+            self.dropped += dropped
+        self._queue.append(model)
+        self._ready.set()
+        return dropped
+
+    async def next(self, timeout: float) -> DealReadModel | None:
+        """Дождаться следующего состояния; None — истёк интервал heartbeat."""
+
+        if not self._queue:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._queue.popleft()
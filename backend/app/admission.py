@@ -0,0 +1,93 @@
+"""Сборка контроля допуска ingest-маршрутов по настройкам и состоянию пула соединений."""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.app.database import pool_sizing
+from backend.config.settings import Settings
+from backend.ports.metrics import MetricsPort
+from backend.ports.recompute_queue import RecomputeQueuePort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+def pool_headroom(engine: Engine, max_overflow: int) -> Callable[[], int | None]:
+    """Функция «сколько соединений ещё можно взять»; None для пулов без лимита.
+
+    max_overflow — тот же, с которым собран пул (pool_sizing); отрицательный
+    значит overflow без ограничений, как и в QueuePool, — лимита нет.
+    """
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool) or max_overflow < 0:
+        return lambda: None
+    capacity = pool.size() + max_overflow
+    return lambda: capacity - pool.checkedout()
+
+
+class OutboxDepth:
+    """Глубина outbox — число pending задач deal_jobs, пересчитываемое не чаще раза в ttl.
+
+    В режиме outbox пересчёт идёт во внешнем воркере, и очередь процесса всегда
+    пуста; давление на запись видно только по таблице задач. COUNT кэшируется,
+    чтобы проверка допуска не добавляла запрос к каждому событию.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        ttl_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._depth = 0
+        self._counted_at = float("-inf")
+        self._lock = Lock()
+
+    def __call__(self) -> int:
+        # Пересчитывает один поток, остальные не ждут его COUNT и берут прошлое значение.
+        if not self._lock.acquire(blocking=False):
+            return self._depth
+        try:
+            if self._clock() - self._counted_at >= self._ttl:
+                with self._uow_factory() as uow:
+                    self._depth = uow.jobs.count_pending()
+                self._counted_at = self._clock()
+            return self._depth
+        finally:
+            self._lock.release()
+
+
+def build_admission(
+    settings: Settings,
+    engine: Engine,
+    recompute_queue: RecomputeQueuePort,
+    uow_factory: UnitOfWorkFactory,
+    metrics: MetricsPort | None = None,
+) -> AdmissionController:
+    """Создать контроллер допуска записи, привязанный к пулу и очереди пересчёта.
+
+    Глубина очереди — очередь процесса (background) или pending-задачи outbox.
+    """
+
+    queue_depth: Callable[[], int] = recompute_queue.depth
+    if settings.recompute_mode == "outbox":
+        queue_depth = OutboxDepth(uow_factory)
+    return AdmissionController(
+        max_in_flight=settings.ingest_max_in_flight,
+        rate_per_second=settings.ingest_rate_per_second,
+        burst=settings.ingest_burst,
+        pool_headroom=pool_headroom(engine, pool_sizing(settings)[1]),
+        reserved_connections=settings.ingest_reserved_connections,
+        queue_depth=queue_depth,
+        max_queue_depth=settings.ingest_max_queue_depth,
+        metrics=metrics,
+    )
@@ -0,0 +1,36 @@
+"""Сборка фонового пересчёта read-model по настройкам."""
+
+from __future__ import annotations
+
+from backend.adapters.recompute.dispatcher import RecomputeDispatcher
+from backend.application.use_cases.recompute import RecomputeCommand, RecomputeHandler
+from backend.config.settings import Settings
+from backend.ports.metrics import MetricsPort
+from backend.ports.notifier import StateNotifierPort
+from backend.ports.recompute_queue import NullRecomputeQueue, RecomputeQueuePort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+def outbox_kinds(settings: Settings) -> tuple[str, ...]:
+    """Виды задач, которые приём событий пишет в outbox своей транзакцией."""
+
+    return ("recompute",) if settings.recompute_mode == "outbox" else ()
+
+
+def build_recompute_queue(
+    settings: Settings,
+    uow_factory: UnitOfWorkFactory,
+    notifier: StateNotifierPort,
+    metrics: MetricsPort | None = None,
+) -> RecomputeQueuePort:
+    """Создать очередь пересчёта: диспетчер в процессе или заглушку."""
+
+    if settings.recompute_mode != "background":
+        return NullRecomputeQueue()
+    recompute = RecomputeHandler(uow_factory=uow_factory, notifier=notifier, metrics=metrics)
+    return RecomputeDispatcher(
+        run=lambda deal_id: recompute.execute(RecomputeCommand(deal_id=deal_id)),
+        debounce_seconds=settings.recompute_debounce_seconds,
+        workers=settings.recompute_workers,
+        metrics=metrics,
+    )
@@ -0,0 +1,17 @@
+"""Идентификация клиента запроса для лимитов записи."""
+
+from __future__ import annotations
+
+from starlette.requests import Request
+
+CLIENT_HEADER = "X-Client-Id"
+
+
+def client_id(request: Request) -> str:
+    """Ключ клиента: X-Client-Id, иначе адрес подключения."""
+
+    header = request.headers.get(CLIENT_HEADER, "").strip()
+    if header:
+        return header[:128]
+    return request.client.host if request.client else "anonymous"
+
@@ -0,0 +1,147 @@
+"""Контейнер приложения: сборка БД, кэшей, очередей и обработчиков use case.
+
+Модуль тянет SQLAlchemy и адаптеры, поэтому импортируется лениво из
+backend.app.di при первом обращении к контейнеру (или при прогреве).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.adapters.llm.cost_ledger import CostLedger
+from backend.adapters.llm.instrumented import InstrumentedLLMClient
+from backend.adapters.sse.broadcaster import SSEBroadcaster
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.admission import build_admission
+from backend.app.background import build_recompute_queue, outbox_kinds
+from backend.app.database import build_engines, build_uow_factories
+from backend.app.llm import build_llm
+from backend.app.metrics import get_metrics_runtime, watch_pool
+from backend.app.notifications import build_notifier, build_read_model_cache
+from backend.application.use_cases import (
+    ExplainDealStateHandler,
+    GetDealStateHandler,
+    GetDealStatesHandler,
+    IngestBatchHandler,
+    IngestEventHandler,
+)
+from backend.config.settings import get_settings
+from backend.ports.recompute_queue import RecomputeQueuePort
+
+
+class AppContainer:
+    """Хранит singleton-объекты приложения без сложной инфраструктуры."""
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        metrics = get_metrics_runtime().registry
+        self._engines = build_engines(settings, metrics)
+        for name, pool_engine in self._engines.items():
+            watch_pool(metrics, pool_engine, name)
+        engine, *replicas = self._engines.values()
+        cache = build_read_model_cache(settings, metrics)
+        uow_factory, read_uow_factory = build_uow_factories(
+            settings, engine, metrics, cache, replicas
+        )
+        self._get_state = GetDealStateHandler(uow_factory=read_uow_factory)
+        self._get_states = GetDealStatesHandler(uow_factory=read_uow_factory)
+        self._explain = ExplainDealStateHandler(uow_factory=read_uow_factory)
+        self._broadcaster = SSEBroadcaster(metrics)
+        notifier = build_notifier(
+            settings, engine, self._broadcaster, self._get_state, cache, metrics
+        )
+        self._recompute_queue = build_recompute_queue(settings, uow_factory, notifier, metrics)
+        clock, kinds = SystemClock(), outbox_kinds(settings)
+        self._ingest_event = IngestEventHandler(
+            uow_factory=uow_factory,
+            clock=clock,
+            notifier=notifier,
+            recompute_queue=self._recompute_queue,
+            outbox_kinds=kinds,
+        )
+        self._ingest_batch = IngestBatchHandler(
+            uow_factory=uow_factory,
+            clock=clock,
+            notifier=notifier,
+            recompute_queue=self._recompute_queue,
+            outbox_kinds=kinds,
+        )
+        self._admission = build_admission(
+            settings, engine, self._recompute_queue, uow_factory, metrics
+        )
+        # Адаптеры GigaChat и локальной модели пока заглушки: провайдера нет, LLM выключен.
+        self._llm, self._cost_ledger = build_llm(metrics, provider=None)
+
+    @property
+    def engine(self) -> Engine:
+        """Вернуть engine основной БД."""
+
+        return self._engines["primary"]
+
+    def close(self) -> None:
+        """Дожать очередь пересчёта и закрыть пулы primary и реплик (shutdown процесса)."""
+
+        self._recompute_queue.shutdown(drain=True)
+        for engine in self._engines.values():
+            engine.dispose()
+
+    @property
+    def ingest_event(self) -> IngestEventHandler:
+        """Вернуть обработчик приёма события."""
+
+        return self._ingest_event
+
+    @property
+    def ingest_batch(self) -> IngestBatchHandler:
+        """Вернуть обработчик пакетного приёма событий."""
+
+        return self._ingest_batch
+
+    @property
+    def get_state(self) -> GetDealStateHandler:
+        """Вернуть обработчик получения read-model."""
+
+        return self._get_state
+
+    @property
+    def get_states(self) -> GetDealStatesHandler:
+        """Вернуть обработчик пакетного чтения read-model."""
+
+        return self._get_states
+
+    @property
+    def explain(self) -> ExplainDealStateHandler:
+        """Вернуть обработчик разбора пересчёта сделки."""
+
+        return self._explain
+
+    @property
+    def recompute_queue(self) -> RecomputeQueuePort:
+        """Вернуть очередь фонового пересчёта."""
+
+        return self._recompute_queue
+
+    @property
+    def admission(self) -> AdmissionController:
+        """Вернуть контроль допуска ingest-запросов."""
+
+        return self._admission
+
+    @property
+    def llm(self) -> InstrumentedLLMClient | None:
+        """Вернуть LLM-клиент процесса (None, если провайдер не настроен)."""
+
+        return self._llm
+
+    @property
+    def cost_ledger(self) -> CostLedger | None:
+        """Вернуть журнал расходов на LLM по сделкам (None без провайдера)."""
+
+        return self._cost_ledger
+
+    @property
+    def broadcaster(self) -> SSEBroadcaster:
+        """Вернуть broadcaster SSE-подписок процесса."""
+
+        return self._broadcaster
@@ -0,0 +1,142 @@
+"""Сборка подключения к БД и фабрик UnitOfWork для путей записи и чтения."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from typing import Any, Sequence
+
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from backend.adapters.persistence.idempotency_index import IdempotencyIndex
+from backend.adapters.persistence.instrumented_unit_of_work import InstrumentedUnitOfWork
+from backend.adapters.persistence.pool_events import PoolListener, TimedQueuePool
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.adapters.persistence.read_only_unit_of_work import ReadOnlySqlAlchemyUnitOfWork
+from backend.adapters.persistence.read_routing import ReadRouter, ReadYourWrites
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.config.settings import Settings
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.unit_of_work import UnitOfWork, UnitOfWorkFactory
+
+
+def pool_sizing(settings: Settings) -> tuple[int, int]:
+    """Размер пула и overflow на воркер: (pool_size, max_overflow).
+
+    Бюджет воркера — DB_MAX_CONNECTIONS // WEB_CONCURRENCY, чтобы все воркеры
+    вместе не превысили max_connections сервера; overflow — не больше половины
+    бюджета, остальное — постоянные соединения. Явный DB_POOL_SIZE важнее бюджета.
+    """
+
+    budget = max(settings.db_max_connections // max(settings.web_workers, 1), 1)
+    overflow = max(min(settings.db_max_overflow, budget // 2), 0)
+    if settings.db_pool_size is not None:
+        return settings.db_pool_size, max(settings.db_max_overflow, 0)
+    return max(budget - overflow, 1), overflow
+
+
+def build_engine(
+    settings: Settings,
+    metrics: MetricsPort | None = None,
+    label: str = "primary",
+    database_url: str | None = None,
+) -> Engine:
+    """Создать engine (по умолчанию primary) с пулом из настроек и метриками db_pool_*{pool}.
+
+    Схему создаёт python -m backend.db.migrate или lifespan (DB_CREATE_SCHEMA).
+    """
+
+    url = make_url(database_url or settings.database_url)
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_ping_idle_seconds == 0}
+    if not _single_connection(url):
+        pool_size, max_overflow = pool_sizing(settings)
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if url.get_backend_name() == "postgresql" and settings.db_statement_timeout_ms > 0:
+        timeout = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        options["connect_args"] = {"options": timeout}
+    engine = create_engine(url, echo=False, future=True, **options)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.instrument(metrics or NullMetrics(), label)
+    PoolListener(metrics, label, settings.db_ping_idle_seconds).attach(engine)
+    return engine
+
+
+def build_engines(settings: Settings, metrics: MetricsPort | None = None) -> dict[str, Engine]:
+    """Engine primary и реплик из DATABASE_REPLICA_URLS: {"primary", "replica-0", ...}."""
+
+    engines = {"primary": build_engine(settings, metrics)}
+    for number, url in enumerate(settings.replica_urls):
+        label = f"replica-{number}"
+        engines[label] = build_engine(settings, metrics, label, url)
+    return engines
+
+
+def _single_connection(url: URL) -> bool:
+    # SQLite в памяти живёт в одном соединении: SQLAlchemy сам выбирает для него пул.
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """Открыть до connections соединений пула разом и вернуть их; вернуть число открытых."""
+
+    if isinstance(engine.pool, QueuePool):
+        connections = min(connections, engine.pool.size())
+    with ExitStack() as stack:
+        for _ in range(connections):
+            stack.enter_context(engine.connect()).exec_driver_sql("SELECT 1")
+    return max(connections, 0)
+
+
+def build_uow_factories(
+    settings: Settings,
+    engine: Engine,
+    metrics: MetricsPort,
+    read_model_cache: ReadModelCache | None,
+    replicas: Sequence[Engine] = (),
+) -> tuple[UnitOfWorkFactory, UnitOfWorkFactory]:
+    """Вернуть фабрики (запись, чтение) с метриками uow_seconds{uow=write|read|replica}.
+
+    Запись идёт в primary и проверяет ключи идемпотентности через индекс
+    процесса. Чтение — UnitOfWork только для чтения на репликах по кругу или
+    на primary, если реплик нет либо запрос в окне read-your-writes (срок
+    приносит клиент, см. ReadYourWritesMiddleware). read-model берётся через
+    кэш процесса; заполняют его только чтения из primary, чтобы отстающая
+    реплика не вернула в кэш старую версию после инвалидации.
+    """
+
+    primary = _sessions(engine)
+    router = ReadRouter(
+        primary,
+        [_sessions(replica) for replica in replicas],
+        ReadYourWrites(settings.read_your_writes_seconds),
+    )
+    stickiness = router.stickiness
+    event.listen(primary, "after_commit", lambda _: stickiness.note_write())
+    index = IdempotencyIndex(
+        settings.idempotency_bloom_capacity, settings.idempotency_lru_size, metrics=metrics
+    )
+
+    def write() -> UnitOfWork:
+        uow = SqlAlchemyUnitOfWork(primary, idempotency_index=index)
+        return InstrumentedUnitOfWork(uow, metrics, "write")
+
+    def read() -> UnitOfWork:
+        sessions, is_replica = router.choose()
+        uow = ReadOnlySqlAlchemyUnitOfWork(
+            sessions, read_model_cache=read_model_cache, fill_read_model_cache=not is_replica
+        )
+        return InstrumentedUnitOfWork(uow, metrics, "replica" if is_replica else "read")
+
+    return write, read
+
+
+def _sessions(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
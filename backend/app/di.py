@@ -1,67 +1,52 @@
-"""Простая DI-обвязка для FastAPI приложения."""
+"""Простая DI-обвязка для FastAPI приложения.
+
+Провайдеры лёгкие: контейнер (SQLAlchemy, адаптеры) импортируется и
+собирается при первом обращении, а не при импорте маршрутов.
+"""
 
 from __future__ import annotations
 
-from functools import lru_cache
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from backend.adapters.time.system_clock import SystemClock
-from backend.adapters.persistence.orm_models import Base
-from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
-from backend.application.use_cases import (
-    GetDealStateHandler,
-    IngestEventHandler,
-)
-from backend.config.settings import get_settings
-from backend.ports.unit_of_work import UnitOfWorkFactory
-
-
-class AppContainer:
-    """Хранит singleton-объекты приложения без сложной инфраструктуры."""
-
-    def __init__(self) -> None:
-        settings = get_settings()
-        engine = create_engine(
-            settings.database_url,
-            echo=False,
-            future=True,
-            pool_pre_ping=True,
-        )
-        if settings.create_schema:
-            Base.metadata.create_all(engine)
-        session_factory = sessionmaker(
-            bind=engine,
-            autoflush=False,
-            expire_on_commit=False,
-        )
-        self._uow_factory: UnitOfWorkFactory = lambda: SqlAlchemyUnitOfWork(session_factory)
-        self._clock = SystemClock()
-        self._ingest_event = IngestEventHandler(
-            uow_factory=self._uow_factory,
-            clock=self._clock,
-        )
-        self._get_state = GetDealStateHandler(uow_factory=self._uow_factory)
-
-    @property
-    def ingest_event(self) -> IngestEventHandler:
-        """Вернуть обработчик приёма события."""
-
-        return self._ingest_event
-
-    @property
-    def get_state(self) -> GetDealStateHandler:
-        """Вернуть обработчик получения read-model."""
-
-        return self._get_state
-
-
-@lru_cache(maxsize=1)
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.adapters.admission.controller import AdmissionController
+    from backend.adapters.llm.cost_ledger import CostLedger
+    from backend.adapters.sse.broadcaster import SSEBroadcaster
+    from backend.app.container import AppContainer
+    from backend.application.use_cases import (
+        ExplainDealStateHandler,
+        GetDealStateHandler,
+        GetDealStatesHandler,
+        IngestBatchHandler,
+        IngestEventHandler,
+    )
+
+_container: AppContainer | None = None
+_container_lock = Lock()
+
+
 def get_container() -> AppContainer:
-    """Создать и закешировать контейнер приложения."""
+    """Создать и закешировать контейнер приложения.
+
+    Блокировка нужна из-за прогрева: фоновая сборка и первый запрос не
+    должны создать два контейнера (и два пула соединений).
+    """
+
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                from backend.app.container import AppContainer
 
-    return AppContainer()
+                _container = AppContainer()
+    return _container
+
+
+def peek_container() -> AppContainer | None:
+    """Вернуть контейнер, если он уже собран, не создавая его."""
+
+    return _container
 
 
 def provide_ingest_event_handler() -> IngestEventHandler:
@@ -70,9 +55,43 @@ def provide_ingest_event_handler() -> IngestEventHandler:
     return get_container().ingest_event
 
 
+def provide_ingest_batch_handler() -> IngestBatchHandler:
+    """DI-провайдер обработчика пакетного приёма событий."""
+
+    return get_container().ingest_batch
+
+
+def provide_admission() -> AdmissionController:
+    """DI-провайдер контроля допуска ingest-запросов."""
+
+    return get_container().admission
+
+
 def provide_get_state_handler() -> GetDealStateHandler:
     """DI-провайдер обработчика получения read-model."""
 
     return get_container().get_state
 
 
+def provide_get_states_handler() -> GetDealStatesHandler:
+    """DI-провайдер обработчика пакетного чтения read-model."""
+
+    return get_container().get_states
+
+
+def provide_explain_handler() -> ExplainDealStateHandler:
+    """DI-провайдер обработчика разбора пересчёта сделки."""
+
+    return get_container().explain
+
+
+def provide_broadcaster() -> SSEBroadcaster:
+    """DI-провайдер broadcaster для SSE."""
+
+    return get_container().broadcaster
+
+
+def provide_cost_ledger() -> CostLedger | None:
+    """DI-провайдер журнала расходов на LLM (None, если LLM не настроен)."""
+
+    return get_container().cost_ledger
@@ -0,0 +1,33 @@
+"""Сборка LLM-клиента процесса: провайдер за метриками, ретраями и журналом стоимости."""
+
+from __future__ import annotations
+
+from backend.adapters.llm.cost_ledger import CostLedger
+from backend.adapters.llm.instrumented import InstrumentedLLMClient
+from backend.adapters.llm.response_schema import schema_validator
+from backend.ports.llm_client import LLMClientPort
+from backend.ports.metrics import MetricsPort
+from backend.prompts.renderer import PromptRenderer
+
+
+def build_llm(
+    metrics: MetricsPort,
+    provider: LLMClientPort | None,
+) -> tuple[InstrumentedLLMClient | None, CostLedger | None]:
+    """Обернуть провайдера в InstrumentedLLMClient с журналом стоимости по сделкам.
+
+    Вызовы use case через этот клиент попадают в /metrics (llm_*) и в
+    /admin/llm-costs. Без провайдера LLM выключен: подменять его FakeLLMClient
+    в рабочем процессе нельзя, поэтому возвращается (None, None).
+    """
+
+    if provider is None:
+        return None, None
+    ledger = CostLedger()
+    client = InstrumentedLLMClient(
+        provider,
+        metrics,
+        ledger,
+        validator=schema_validator(PromptRenderer()),
+    )
+    return client, ledger
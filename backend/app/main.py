@@ -4,12 +4,20 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 
+from backend.app.metrics import RouteMetricsMiddleware
+from backend.app.profiling import ProfilingMiddleware
+from backend.app.read_your_writes import ReadYourWritesMiddleware
 from backend.app.routes import setup_routes
+from backend.app.startup import lifespan
 
 app = FastAPI(
     title="Deal Qual Assistant",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(RouteMetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 setup_routes(app)
 
 
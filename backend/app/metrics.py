@@ -0,0 +1,112 @@
+"""Метрики приложения: общий реестр процесса, латентность маршрутов и пул соединений."""
+
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, MutableMapping
+
+from backend.adapters.metrics.exposition import render
+from backend.adapters.metrics.multiprocess import SnapshotDirectory, SnapshotFlusher
+from backend.adapters.metrics.prometheus_metrics import PrometheusMetrics
+from backend.config.settings import get_settings
+from backend.ports.metrics import MetricsPort
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+ASGIApp = Callable[[Scope, Callable[[], Awaitable[Message]], Callable], Awaitable[None]]
+
+
+class MetricsRuntime:
+    """Реестр метрик процесса и, в режиме нескольких воркеров, общий каталог снимков."""
+
+    def __init__(self, registry: PrometheusMetrics, directory: SnapshotDirectory | None) -> None:
+        self.registry = registry
+        self._directory = directory
+        self._flusher: SnapshotFlusher | None = None
+        if directory is not None:
+            self._flusher = SnapshotFlusher(directory, registry.snapshot)
+            self._flusher.start()
+
+    def exposition(self) -> str:
+        """Текст /metrics: свой снимок или сумма снимков всех воркеров."""
+
+        snapshot = self.registry.snapshot()
+        if self._directory is None:
+            return render(snapshot)
+        self._directory.write(snapshot)
+        return render(self._directory.merged(snapshot))
+
+
+@lru_cache(maxsize=1)
+def get_metrics_runtime() -> MetricsRuntime:
+    """Создать реестр метрик процесса по настройкам (один на процесс)."""
+
+    settings = get_settings()
+    directory = None
+    if settings.metrics_multiproc_dir:
+        directory = SnapshotDirectory(settings.metrics_multiproc_dir)
+        directory.retire_dead()
+    return MetricsRuntime(PrometheusMetrics(), directory)
+
+
+def get_metrics() -> MetricsPort:
+    """Вернуть реестр метрик процесса."""
+
+    return get_metrics_runtime().registry
+
+
+def watch_pool(registry: PrometheusMetrics, engine: Engine, name: str = "primary") -> None:
+    """Отдавать размер, занятые соединения и overflow пула как gauge при каждом снимке."""
+
+    from sqlalchemy.pool import QueuePool  # импорт здесь: /metrics не должен тянуть SQLAlchemy
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    def collect(metrics: MetricsPort) -> None:
+        metrics.set_gauge("db_pool_size", pool.size(), pool=name)
+        metrics.set_gauge("db_pool_checked_out", pool.checkedout(), pool=name)
+        metrics.set_gauge("db_pool_overflow", max(pool.overflow(), 0), pool=name)
+
+    registry.register_collector(collect)
+
+
+class RouteMetricsMiddleware:
+    """ASGI-middleware: гистограмма http_request_seconds по шаблону маршрута.
+
+    Метка route — шаблон пути (/state/{deal_id}), а не сам путь, чтобы
+    число рядов не росло с числом сделок; несовпавшие пути идут как unmatched.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Callable[[], MetricsPort] = get_metrics) -> None:
+        self._app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = ["500"]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self._metrics().observe(
+                "http_request_seconds",
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route,
+                status=status[0],
+            )
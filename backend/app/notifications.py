@@ -0,0 +1,90 @@
+"""Сборка получателей новых read-model: кэш процесса, SSE и рассылка между воркерами."""
+
+from __future__ import annotations
+
+from sqlalchemy import make_url
+from sqlalchemy.engine import Engine
+
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.adapters.persistence.read_routing import reading_from_primary
+from backend.adapters.sse.backends import BroadcastBackend, StateChange
+from backend.adapters.sse.broadcaster import SSEBroadcaster
+from backend.adapters.sse.fanout import FanoutNotifier, StateRelay
+from backend.adapters.sse.postgres_backend import PostgresNotifyBackend
+from backend.application.use_cases import GetDealStateHandler, GetDealStateQuery
+from backend.config.settings import Settings
+from backend.domain.entities import DealReadModel
+from backend.ports.metrics import MetricsPort
+from backend.ports.notifier import CompositeNotifier, StateNotifierPort
+
+
+def cross_worker_channel(settings: Settings) -> bool:
+    """Есть ли канал уведомлений между процессами: LISTEN/NOTIFY основной БД PostgreSQL."""
+
+    return make_url(settings.database_url).get_backend_name() == "postgresql"
+
+
+def build_read_model_cache(
+    settings: Settings,
+    metrics: MetricsPort | None = None,
+) -> ReadModelCache | None:
+    """Создать кэш read-model процесса или None, если он отключён.
+
+    Кэш сбрасывается уведомлениями об изменениях от других процессов (веб-воркеров
+    и воркера outbox) независимо от SSE_BACKEND. Без канала между процессами
+    (БД не PostgreSQL) кэш допустим только в единственном процессе, который
+    сам пишет и пересчитывает read-model: при WEB_CONCURRENCY > 1 или
+    RECOMPUTE_MODE=outbox он отключается, чтобы не отдавать устаревшее до TTL.
+    """
+
+    if settings.read_model_cache_size <= 0:
+        return None
+    shared = settings.web_workers > 1 or settings.recompute_mode == "outbox"
+    if shared and not cross_worker_channel(settings):
+        return None
+    return ReadModelCache(
+        max_entries=settings.read_model_cache_size,
+        ttl_seconds=settings.read_model_cache_ttl_seconds,
+        metrics=metrics,
+    )
+
+
+def build_notifier(
+    settings: Settings,
+    engine: Engine,
+    broadcaster: SSEBroadcaster,
+    get_state: GetDealStateHandler,
+    cache: ReadModelCache | None,
+    metrics: MetricsPort | None = None,
+    backend: BroadcastBackend | None = None,
+) -> StateNotifierPort:
+    """Собрать получателей состояний после commit: кэш, SSE и соседние воркеры.
+
+    Уведомления между процессами (по умолчанию PostgreSQL NOTIFY) сбрасывают
+    кэш read-model всегда, а дочитывают состояние для SSE — только при
+    SSE_BACKEND=postgres.
+    """
+
+    # Кэш обновляется раньше SSE: подписчик, перечитавший /state, увидит новую версию.
+    local = CompositeNotifier(cache, broadcaster) if cache is not None else broadcaster
+    relay_sse = settings.sse_backend == "postgres"
+    if backend is None and (cache is not None or relay_sse) and cross_worker_channel(settings):
+        backend = PostgresNotifyBackend(engine, metrics=metrics)
+    if backend is None:
+        return local
+
+    def load(deal_id: str) -> DealReadModel:
+        # Уведомление приходит сразу после commit: реплика может ещё не догнать primary.
+        with reading_from_primary():
+            return get_state.execute(GetDealStateQuery(deal_id))
+
+    relay = StateRelay(broadcaster, load, metrics)
+
+    def on_change(change: StateChange) -> None:
+        if cache is not None:
+            cache.invalidate(change.deal_id, below_version=change.version)
+        if relay_sse:
+            relay(change)
+
+    backend.start(on_change)
+    return FanoutNotifier(local, backend)
@@ -0,0 +1,150 @@
+"""Профилирование запросов по требованию: заголовок с токеном или доля сэмплирования."""
+
+from __future__ import annotations
+
+import hmac
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable
+
+from backend.adapters.profiling.buffer import ProfileBuffer, RequestProfile
+from backend.adapters.profiling.sampler import StackSampler
+from backend.app.metrics import ASGIApp, Message, Scope
+from backend.config.settings import get_settings
+
+PROFILE_HEADER = "X-Profile-Token"
+TOP_STACKS = 20
+STREAM_PREFIXES = ("/stream/",)
+
+
+@dataclass(slots=True)
+class ProfilingRuntime:
+    """Настройки профилирования процесса и буфер последних профилей."""
+
+    token: str | None = None
+    sample_rate: float = 0.0
+    interval: float = 0.001
+    max_seconds: float = 30.0
+    buffer: ProfileBuffer = field(default_factory=ProfileBuffer)
+
+    def authorized(self, value: str | None) -> bool:
+        """Совпадает ли значение заголовка с токеном (сравнение за постоянное время)."""
+
+        if not self.token or not value:
+            return False
+        return hmac.compare_digest(value.encode("utf-8"), self.token.encode("utf-8"))
+
+
+@lru_cache(maxsize=1)
+def get_profiling() -> ProfilingRuntime:
+    """Создать настройки профилирования процесса (одни на процесс)."""
+
+    settings = get_settings()
+    return ProfilingRuntime(
+        token=settings.profiling_token,
+        sample_rate=settings.profiling_sample_rate,
+        max_seconds=settings.profiling_max_seconds,
+        buffer=ProfileBuffer(settings.profiling_buffer_size),
+    )
+
+
+class ProfilingMiddleware:
+    """ASGI-middleware: профилирует запрос с верным X-Profile-Token или по sample_rate.
+
+    Непрофилируемый запрос стоит одного просмотра заголовков (и random() при
+    sample_rate > 0): сэмплер стеков запускается только на время
+    профилируемого запроса и снимает поток event loop и потоки threadpool,
+    где выполняются синхронные маршруты. Конкурентные запросы в тех же
+    потоках попадают в сэмплы — профиль показывает картину процесса под
+    нагрузкой, а не изолированный вызов. Id профиля приходит в X-Profile-Id.
+    Потоковые запросы (SSE) по sample_rate не профилируются, а по токену
+    сэмплируются не дольше max_seconds. Сэмплер в процессе один: запрос,
+    пришедший во время чужого профиля, выполняется без профилирования.
+    """
+
+    def __init__(
+        self, app: ASGIApp, runtime: Callable[[], ProfilingRuntime] = get_profiling
+    ) -> None:
+        self._app = app
+        self._runtime = runtime
+
+    async def __call__(self, scope: Scope, receive: Callable, send: Callable) -> None:
+        runtime = self._runtime()
+        if scope["type"] != "http" or not self._triggered(scope, runtime):
+            await self._app(scope, receive, send)
+            return
+        loop_thread = threading.get_ident()
+        sampler = StackSampler(
+            lambda ident, name: ident == loop_thread or name.startswith("AnyIO worker"),
+            runtime.interval,
+            runtime.max_seconds,
+        )
+        started_at, started = datetime.now(timezone.utc), time.perf_counter()
+        if not sampler.start():
+            await self._app(scope, receive, send)
+            return
+        profile_id, status = runtime.buffer.next_id(), [500]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                header = (b"x-profile-id", str(profile_id).encode("ascii"))
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            duration = time.perf_counter() - started
+            runtime.buffer.add(
+                _profile(profile_id, scope, status[0], started_at, duration, sampler)
+            )
+
+    @staticmethod
+    def _triggered(scope: Scope, runtime: ProfilingRuntime) -> bool:
+        if runtime.token:
+            header = PROFILE_HEADER.lower().encode("latin-1")
+            for name, value in scope.get("headers", ()):
+                if name == header:
+                    return runtime.authorized(value.decode("latin-1"))
+        if runtime.sample_rate <= 0 or _streaming(scope):
+            return False
+        return random.random() < runtime.sample_rate
+
+
+def _streaming(scope: Scope) -> bool:
+    if scope["path"].startswith(STREAM_PREFIXES):
+        return True
+    accept = dict(scope.get("headers", ())).get(b"accept", b"")
+    return b"text/event-stream" in accept
+
+
+def _profile(
+    profile_id: int,
+    scope: Scope,
+    status: int,
+    started_at: datetime,
+    duration: float,
+    sampler: StackSampler,
+) -> RequestProfile:
+    samples, sampled = sampler.samples, min(duration, sampler.sampled_seconds)
+    breakdown = {
+        layer: sampled * hits / samples for layer, hits in sampler.layers.most_common()
+    }
+    return RequestProfile(
+        id=profile_id,
+        method=scope["method"],
+        path=scope["path"],
+        route=getattr(scope.get("route"), "path", "unmatched"),
+        status=status,
+        started_at=started_at,
+        duration=duration,
+        samples=samples,
+        breakdown=breakdown,
+        top_stacks=sampler.stacks.most_common(TOP_STACKS),
+    )
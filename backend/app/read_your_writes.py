@@ -0,0 +1,74 @@
+"""Перенос срока read-your-writes между клиентом и воркерами через cookie или заголовок."""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Callable
+
+from starlette.requests import Request
+
+from backend.adapters.persistence.read_routing import ReadSession, ReadYourWrites, current_reads
+from backend.app.metrics import ASGIApp, Message, Scope
+from backend.config.settings import get_settings
+
+READ_YOUR_WRITES_COOKIE = "rw_until"
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes-Until"
+
+
+@lru_cache(maxsize=1)
+def get_read_your_writes() -> ReadYourWrites:
+    """Политика read-your-writes процесса (окно READ_YOUR_WRITES_SECONDS)."""
+
+    return ReadYourWrites(get_settings().read_your_writes_seconds)
+
+
+class ReadYourWritesMiddleware:
+    """ASGI-middleware: кладёт в current_reads срок чтения из primary, принесённый клиентом.
+
+    Срок приходит в cookie rw_until или в заголовке X-Read-Your-Writes-Until
+    (для клиентов без cookie) и действует на время запроса, в том числе в
+    потоках threadpool синхронных маршрутов. Если запрос записал в primary,
+    ответ возвращает новый срок в обоих видах, и следующий запрос клиента
+    читает из primary на любом воркере.
+    """
+
+    def __init__(
+        self, app: ASGIApp, policy: Callable[[], ReadYourWrites] = get_read_your_writes
+    ) -> None:
+        self._app = app
+        self._policy = policy
+
+    async def __call__(self, scope: Scope, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        policy, request = self._policy(), Request(scope)
+        reads = policy.session(
+            request.headers.get(READ_YOUR_WRITES_HEADER),
+            request.cookies.get(READ_YOUR_WRITES_COOKIE),
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and reads.wrote:
+                headers = _deadline_headers(reads, policy.window_seconds)
+                message["headers"] = [*message.get("headers", []), *headers]
+            await send(message)
+
+        token = current_reads.set(reads)
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            current_reads.reset(token)
+
+
+def _deadline_headers(reads: ReadSession, window_seconds: float) -> list[tuple[bytes, bytes]]:
+    until = f"{reads.primary_until:.3f}"
+    cookie = (
+        f"{READ_YOUR_WRITES_COOKIE}={until}; Max-Age={math.ceil(window_seconds)}; "
+        "Path=/; HttpOnly; SameSite=Lax"
+    )
+    return [
+        (READ_YOUR_WRITES_HEADER.lower().encode("latin-1"), until.encode("latin-1")),
+        (b"set-cookie", cookie.encode("latin-1")),
+    ]
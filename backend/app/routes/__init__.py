@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 
-from backend.app.routes import events, health, state
+from backend.app.routes import admin, events, health, metrics, state, stream
 
 
 def setup_routes(app: FastAPI) -> None:
     """Подключить все маршруты приложения."""
 
     app.include_router(health.router)
+    app.include_router(metrics.router)
     app.include_router(state.router)
     app.include_router(events.router)
+    app.include_router(stream.router)
+    app.include_router(admin.router)
 
 
@@ -0,0 +1,101 @@
+"""Административные маршруты: последние профили запросов и расходы на LLM."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from backend.adapters.llm.cost_ledger import CostLedger
+from backend.adapters.profiling.buffer import RequestProfile
+from backend.app.di import provide_cost_ledger
+from backend.app.profiling import ProfilingRuntime, get_profiling
+from backend.schemas.llm_costs import DealCostOut
+from backend.schemas.profiling import ProfileOut, ProfileSummaryOut, StackOut
+
+
+def require_profiling_token(
+    runtime: ProfilingRuntime = Depends(get_profiling),
+    token: str | None = Header(default=None, alias="X-Profile-Token"),
+) -> ProfilingRuntime:
+    """Пустить только с верным X-Profile-Token; без PROFILING_TOKEN маршрутов нет (404)."""
+
+    if not runtime.token:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Профилирование выключено")
+    if not runtime.authorized(token):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Неверный X-Profile-Token")
+    return runtime
+
+
+def require_cost_ledger(
+    ledger: CostLedger | None = Depends(provide_cost_ledger),
+) -> CostLedger:
+    """Вернуть журнал расходов; без настроенного LLM-провайдера маршрутов нет (404)."""
+
+    if ledger is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "LLM-провайдер не настроен")
+    return ledger
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profiles", response_model=list[ProfileSummaryOut])
+def list_profiles(
+    runtime: ProfilingRuntime = Depends(require_profiling_token),
+) -> list[ProfileSummaryOut]:
+    """Вернуть последние профили запросов, от новых к старым."""
+
+    return [_summary(profile) for profile in runtime.buffer.recent()]
+
+
+@router.get("/profiles/{profile_id}", response_model=ProfileOut)
+def read_profile(
+    profile_id: int,
+    runtime: ProfilingRuntime = Depends(require_profiling_token),
+) -> ProfileOut:
+    """Вернуть профиль запроса с разбивкой по слоям и стеками."""
+
+    profile = runtime.buffer.get(profile_id)
+    if profile is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"Профиль {profile_id} не найден")
+    return ProfileOut(
+        **_summary(profile).model_dump(),
+        breakdown=profile.breakdown,
+        top_stacks=[StackOut(stack=stack, samples=hits) for stack, hits in profile.top_stacks],
+    )
+
+
+@router.get("/llm-costs", response_model=list[DealCostOut])
+def list_llm_costs(
+    limit: int = Query(default=20, ge=1, le=500),
+    _: ProfilingRuntime = Depends(require_profiling_token),
+    ledger: CostLedger = Depends(require_cost_ledger),
+) -> list[DealCostOut]:
+    """Вернуть сделки с наибольшими расходами на LLM в этом процессе."""
+
+    return [DealCostOut(**asdict(entry)) for entry in ledger.top(limit)]
+
+
+@router.get("/llm-costs/{deal_id}", response_model=DealCostOut)
+def read_llm_cost(
+    deal_id: str,
+    _: ProfilingRuntime = Depends(require_profiling_token),
+    ledger: CostLedger = Depends(require_cost_ledger),
+) -> DealCostOut:
+    """Вернуть расходы сделки на LLM (нулевые, если вызовов не было)."""
+
+    return DealCostOut(**asdict(ledger.for_deal(deal_id)))
+
+
+def _summary(profile: RequestProfile) -> ProfileSummaryOut:
+    return ProfileSummaryOut(
+        id=profile.id,
+        method=profile.method,
+        path=profile.path,
+        route=profile.route,
+        status=profile.status,
+        started_at=profile.started_at,
+        duration=profile.duration,
+        samples=profile.samples,
+    )
@@ -0,0 +1,35 @@
+"""Зависимость FastAPI, пропускающая запросы записи через контроль допуска."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterator
+
+from fastapi import Depends, HTTPException, Request, status
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.app.clients import client_id
+from backend.app.di import provide_admission
+
+
+def admit_ingest(
+    request: Request,
+    controller: AdmissionController = Depends(provide_admission),
+) -> Iterator[None]:
+    """Допустить запрос или ответить 429 с Retry-After; слот освобождается после ответа.
+
+    Зависимость синхронная: FastAPI выполняет её в пуле потоков, и проверка
+    глубины outbox (COUNT в БД) не блокирует event loop с /state и SSE.
+    """
+
+    decision = controller.admit(client_id(request))
+    if not decision.admitted:
+        raise HTTPException(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            f"Запись временно ограничена: {decision.reason}",
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+        )
+    try:
+        yield
+    finally:
+        controller.release()
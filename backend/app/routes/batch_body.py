@@ -0,0 +1,76 @@
+"""Чтение тела /events:batch: лимит размера, JSON-массив или NDJSON."""
+
+from __future__ import annotations
+
+import json
+
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+
+from backend.config.settings import get_settings
+from backend.schemas.events import EventIn
+
+_NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+
+async def read_batch(request: Request) -> list[EventIn | str]:
+    """Прочитать пачку событий; строка в списке — причина отказа элемента.
+
+    Тело больше INGEST_MAX_BATCH_BYTES отклоняется с 413 ещё при чтении,
+    неразбираемое тело — с 400.
+    """
+
+    body = await _read_body(request, get_settings().ingest_max_batch_bytes)
+    return _parse_batch(body, request.headers.get("content-type", ""))
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    declared = request.headers.get("content-length", "")
+    if limit and declared.isdigit() and int(declared) > limit:
+        raise _too_large(limit)
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if limit and size > limit:
+            raise _too_large(limit)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, f"Тело пачки больше {limit} байт"
+    )
+
+
+def _parse_batch(body: bytes, content_type: str) -> list[EventIn | str]:
+    if content_type.split(";")[0].strip() in _NDJSON_TYPES:
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Тело не в UTF-8: {exc}")
+        return [_parse_item(line) for line in text.splitlines() if line.strip()]
+    try:
+        data = json.loads(body or b"[]")
+    except json.JSONDecodeError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Тело не является JSON: {exc}")
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Тело не в UTF-8: {exc}")
+    if not isinstance(data, list):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Ожидался JSON-массив событий")
+    return [_validate_item(item) for item in data]
+
+
+def _parse_item(line: str) -> EventIn | str:
+    try:
+        return _validate_item(json.loads(line))
+    except json.JSONDecodeError as exc:
+        return f"Строка не является JSON: {exc.msg}"
+
+
+def _validate_item(data: object) -> EventIn | str:
+    try:
+        return EventIn.model_validate(data)
+    except ValidationError as exc:
+        return "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors())
@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from collections import Counter
 
-from backend.app.di import provide_ingest_event_handler
+from fastapi import APIRouter, Depends, Header, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from backend.app.di import provide_ingest_batch_handler, provide_ingest_event_handler
+from backend.app.routes.admission import admit_ingest
+from backend.app.routes.batch_body import read_batch
 from backend.application.use_cases import (
+    IngestBatchCommand,
+    IngestBatchHandler,
     IngestEventCommand,
     IngestEventHandler,
 )
-from backend.schemas.events import EventIn
+from backend.config.settings import get_settings
+from backend.schemas.events import EventBatchItemOut, EventBatchOut, EventIn
 from backend.schemas.read_model import DealStateOut
+from backend.utils.idempotency import item_key, key_from_event, key_from_header
+
+router = APIRouter(prefix="/events", tags=["events"], dependencies=[Depends(admit_ingest)])
 
-router = APIRouter(prefix="/events", tags=["events"])
+_BATCH_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {"type": "array", "items": {"$ref": "#/components/schemas/EventIn"}},
+        },
+        "application/x-ndjson": {"schema": {"type": "string"}},
+    },
+}
 
 
 @router.post(
@@ -22,17 +41,77 @@ router = APIRouter(prefix="/events", tags=["events"])
 )
 def post_event(
     payload: EventIn,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     handler: IngestEventHandler = Depends(provide_ingest_event_handler),
 ) -> DealStateOut:
-    """Принять событие и вернуть обновлённое состояние сделки."""
+    """Принять событие и вернуть обновлённое состояние сделки.
+
+    Повтор с тем же Idempotency-Key (без заголовка — с тем же содержимым в
+    окне IDEMPOTENCY_PAYLOAD_WINDOW_SECONDS) возвращает сохранённый ответ
+    первого приёма, ничего не записывая.
+    """
 
     result = handler.execute(
         IngestEventCommand(
             deal_id=payload.deal_id,
             kind=payload.kind,
             payload=payload.payload,
+            idempotency_key=_event_key(idempotency_key, payload),
         )
     )
     return DealStateOut.from_domain(result)
 
 
+@router.post(":batch", response_model=EventBatchOut, openapi_extra={"requestBody": _BATCH_BODY})
+async def post_events_batch(
+    request: Request,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    handler: IngestBatchHandler = Depends(provide_ingest_batch_handler),
+) -> EventBatchOut:
+    """Принять пачку событий (JSON-массив или NDJSON) и вернуть результат по элементам.
+
+    Ключ элемента — Idempotency-Key пачки с номером элемента или отпечаток
+    содержимого; повторённые элементы получают статус duplicate. Тело больше
+    INGEST_MAX_BATCH_BYTES отклоняется с 413, неразбираемое — с 400.
+    """
+
+    parsed = await read_batch(request)
+    valid = [(index, item) for index, item in enumerate(parsed) if isinstance(item, EventIn)]
+    commands = [
+        IngestEventCommand(
+            item.deal_id, item.kind, item.payload, _event_key(idempotency_key, item, index)
+        )
+        for index, item in valid
+    ]
+    result = await run_in_threadpool(handler.execute, IngestBatchCommand(events=commands))
+    items = [
+        EventBatchItemOut(index=index, status="rejected", error=item)
+        for index, item in enumerate(parsed)
+        if isinstance(item, str)
+    ]
+    items.extend(
+        EventBatchItemOut(
+            index=valid[outcome.index][0],
+            deal_id=outcome.deal_id,
+            status=outcome.status,
+            error=outcome.error,
+        )
+        for outcome in result.items
+    )
+    items.sort(key=lambda item: item.index)
+    statuses = Counter(item.status for item in items)
+    return EventBatchOut(
+        accepted=statuses["accepted"],
+        duplicates=statuses["duplicate"],
+        rejected=statuses["rejected"],
+        failed=statuses["failed"],
+        items=items,
+    )
+
+
+def _event_key(header: str | None, item: EventIn, index: int | None = None) -> str:
+    if header is None or not header.strip():
+        window = get_settings().idempotency_payload_window_seconds
+        return key_from_event(item.deal_id, item.kind, item.payload, window)
+    key = key_from_header(header)
+    return key if index is None else item_key(key, index)
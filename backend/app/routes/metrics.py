@@ -0,0 +1,17 @@
+"""Маршрут экспозиции метрик в формате Prometheus."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Response
+
+from backend.adapters.metrics.exposition import CONTENT_TYPE
+from backend.app.metrics import MetricsRuntime, get_metrics_runtime
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+def read_metrics(runtime: MetricsRuntime = Depends(get_metrics_runtime)) -> Response:
+    """Вернуть метрики процесса (или всех воркеров при METRICS_MULTIPROC_DIR)."""
+
+    return Response(content=runtime.exposition(), media_type=CONTENT_TYPE)
@@ -2,26 +2,122 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from backend.app.di import provide_get_state_handler
+from backend.app.di import (
+    provide_explain_handler,
+    provide_get_state_handler,
+    provide_get_states_handler,
+)
 from backend.application.use_cases import (
+    ExplainDealStateHandler,
+    ExplainDealStateQuery,
     GetDealStateHandler,
     GetDealStateQuery,
+    GetDealStatesHandler,
+    GetDealStatesQuery,
 )
-from backend.schemas.read_model import DealStateOut
+from backend.domain.entities import ReadModelStamp
+from backend.schemas.explain import DealExplainOut
+from backend.schemas.read_model import DealStateOut, deal_state_json, deal_states_json
 
 router = APIRouter(prefix="/state", tags=["state"])
 
+MAX_BULK_IDS = 500
+
+
+@router.get("", response_model=list[DealStateOut])
+def read_states(
+    ids: list[str] = Query(..., description="Идентификаторы через запятую или повтором ids"),
+    fields: str | None = Query(
+        default=None,
+        description="Поля ответа через запятую (deal_id всегда включён), например status,score",
+    ),
+    handler: GetDealStatesHandler = Depends(provide_get_states_handler),
+) -> Response:
+    """Вернуть состояния нескольких сделок одним запросом; без данных — пустая заготовка."""
+
+    deal_ids = _split(ids)
+    if not deal_ids or len(deal_ids) > MAX_BULK_IDS:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            f"Нужно от 1 до {MAX_BULK_IDS} идентификаторов сделок",
+        )
+    projection = None
+    if fields:
+        projection = {"deal_id", *_split([fields])}
+        unknown = projection - DealStateOut.model_fields.keys()
+        if unknown:
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                f"Неизвестные поля: {', '.join(sorted(unknown))}",
+            )
+    models = handler.execute(GetDealStatesQuery(deal_ids=deal_ids))
+    return Response(content=deal_states_json(models, projection), media_type="application/json")
+
 
-@router.get("/{deal_id}", response_model=DealStateOut)
+@router.get(
+    "/{deal_id}",
+    response_model=DealStateOut,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Состояние не изменилось"}},
+)
 def read_state(
     deal_id: str,
+    if_none_match: str | None = Header(default=None),
     handler: GetDealStateHandler = Depends(provide_get_state_handler),
-) -> DealStateOut:
-    """Вернуть read-model сделки по идентификатору."""
+) -> Response:
+    """Вернуть read-model сделки; 304, если у клиента актуальная версия.
+
+    Тело пишется сразу в JSON-байты из доменной модели, минуя повторную
+    валидацию response_model; response_model остаётся для схемы OpenAPI.
+    """
+
+    query = GetDealStateQuery(deal_id=deal_id)
+    if if_none_match:
+        etag = entity_tag(handler.stamp(query))
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    result = handler.execute(query)
+    return Response(
+        content=deal_state_json(result),
+        media_type="application/json",
+        headers={"ETag": entity_tag(result.stamp)},
+    )
+
+
+@router.get("/{deal_id}/explain", response_model=DealExplainOut)
+def explain_state(
+    deal_id: str,
+    handler: ExplainDealStateHandler = Depends(provide_explain_handler),
+) -> DealExplainOut:
+    """Разобрать пересчёт: выбранные факты, «да» по чек-листам и не прошедшие ворота.
+
+    Шаги прогоняются по текущим фактам отдельно от обычного пересчёта:
+    read-model не сохраняется, метрики шагов не пишутся.
+    """
+
+    return DealExplainOut.from_domain(handler.execute(ExplainDealStateQuery(deal_id=deal_id)))
+
+
+def entity_tag(stamp: ReadModelStamp) -> str:
+    """Сильный ETag из версии и момента обновления read-model.
+
+    updated_at отличает состояния с одинаковой версией после удаления сделки.
+    """
+
+    micros = int(stamp.updated_at.timestamp() * 1_000_000) if stamp.updated_at else 0
+    return f'"{stamp.version}.{micros:x}"'
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Слабое сравнение If-None-Match (RFC 9110): W/ не учитывается, * совпадает всегда."""
 
-    result = handler.execute(GetDealStateQuery(deal_id=deal_id))
-    return DealStateOut.from_domain(result)
+    if header.strip() == "*":
+        return True
+    candidates = (item.strip().removeprefix("W/") for item in header.split(","))
+    return etag in candidates
 
 
+def _split(values: list[str]) -> list[str]:
+    items = (item.strip() for value in values for item in value.split(","))
+    return list(dict.fromkeys(item for item in items if item))
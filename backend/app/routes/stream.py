@@ -1,2 +1,59 @@
-# GET /stream/{deal_id} - Server-Sent Events для стриминга обновлений состояния сделки
+"""GET /stream/{deal_id} — Server-Sent Events с обновлениями состояния сделки."""
 
+from __future__ import annotations
+
+from typing import AsyncGenerator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from backend.adapters.sse.broadcaster import HEARTBEAT_FRAME, SSEBroadcaster, format_event
+from backend.adapters.sse.subscription import Subscription
+from backend.app.di import provide_broadcaster, provide_get_state_handler
+from backend.application.use_cases import GetDealStateHandler, GetDealStateQuery
+from backend.domain.entities import DealReadModel
+from backend.schemas.read_model import deal_state_json
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@router.get("/{deal_id}", response_class=StreamingResponse)
+async def stream_state(
+    deal_id: str,
+    broadcaster: SSEBroadcaster = Depends(provide_broadcaster),
+    handler: GetDealStateHandler = Depends(provide_get_state_handler),
+) -> StreamingResponse:
+    """Отдать текущее состояние сделки и дальше присылать каждое новое."""
+
+    # Подписываемся до чтения, чтобы не потерять обновление между ними.
+    subscription = broadcaster.subscribe(deal_id)
+    try:
+        initial = await run_in_threadpool(handler.execute, GetDealStateQuery(deal_id=deal_id))
+    except BaseException:
+        broadcaster.unsubscribe(subscription)
+        raise
+    frames = state_frames(broadcaster, subscription, initial)
+    return StreamingResponse(frames, media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+async def state_frames(
+    broadcaster: SSEBroadcaster,
+    subscription: Subscription,
+    initial: DealReadModel,
+) -> AsyncGenerator[str, None]:
+    """Кадры SSE для подписки; отписка при отключении клиента или отмене."""
+
+    try:
+        yield _frame(initial)
+        while True:
+            model = await subscription.next(broadcaster.heartbeat_seconds)
+            yield HEARTBEAT_FRAME if model is None else _frame(model)
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def _frame(model: DealReadModel) -> str:
+    return format_event(deal_state_json(model).decode(), event_id=str(model.version))
@@ -0,0 +1,74 @@
+"""Жизненный цикл процесса: схема БД, фоновый прогрев и корректное завершение."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from fastapi import FastAPI
+
+from backend.app.di import get_container, peek_container
+from backend.app.metrics import get_metrics
+from backend.config.frameworks import available_frameworks, get_frameworks
+from backend.config.settings import Settings, get_settings
+
+
+def warm_up(settings: Settings) -> None:
+    """Загрузить конфиги фреймворков, собрать контейнер и открыть соединения пула.
+
+    Каждый этап замеряется в startup_warmup_seconds{stage}; ошибка этапа
+    (например, БД ещё недоступна) учитывается в startup_warmup_failures_total
+    и не мешает старту — контейнер тогда соберётся на первом запросе.
+    """
+
+    from backend.app.database import warm_pool
+
+    stages: tuple[tuple[str, Callable[[], object]], ...] = (
+        ("frameworks", lambda: get_frameworks(available_frameworks())),
+        ("container", get_container),
+        ("pool", lambda: warm_pool(get_container().engine, settings.warmup_connections)),
+    )
+    metrics = get_metrics()
+    for stage, action in stages:
+        started = time.perf_counter()
+        try:
+            action()
+        except Exception:  # noqa: BLE001 - прогрев не должен ронять процесс
+            metrics.inc("startup_warmup_failures_total", stage=stage)
+            return
+        metrics.set_gauge("startup_warmup_seconds", time.perf_counter() - started, stage=stage)
+
+
+def create_schema(settings: Settings) -> None:
+    """Создать схему при старте процесса (DB_CREATE_SCHEMA, для разработки)."""
+
+    from backend.db.migrate import create_schema as create_tables
+
+    create_tables(get_container().engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Хуки старта и остановки приложения.
+
+    Импорт модуля и приём соединений не ждут SQLAlchemy: схема создаётся
+    только с DB_CREATE_SCHEMA, прогрев идёт в фоновом потоке. При остановке
+    очередь пересчёта дожимается, пул закрывается.
+    """
+
+    settings = get_settings()
+    if settings.create_schema:
+        await asyncio.to_thread(create_schema, settings)
+    warmup = None
+    if settings.startup_warmup:
+        warmup = asyncio.create_task(asyncio.to_thread(warm_up, settings))
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            await warmup
+        container = peek_container()
+        if container is not None:
+            await asyncio.to_thread(container.close)
@@ -0,0 +1,25 @@
+"""Повтор юзкейса, чья транзакция проиграла гонку за read-model сделки."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from backend.ports.repositories import ReadModelConflict
+
+T = TypeVar("T")
+
+
+def retry_on_conflict(action: Callable[[], T], attempts: int = 3) -> T:
+    """Выполнить action, повторяя его целиком при ReadModelConflict (до attempts раз).
+
+    action должен сам открывать UnitOfWork: повтор заново читает read-model
+    и строит обновление поверх версии, зафиксированной конкурентом.
+    """
+
+    for _ in range(attempts - 1):
+        try:
+            return action()
+        except ReadModelConflict:
+            continue
+    return action()
@@ -1,17 +1,39 @@
 """Use cases слоя приложения."""
 
+from backend.application.use_cases.explain_deal_state import (
+    ExplainDealStateHandler,
+    ExplainDealStateQuery,
+)
 from backend.application.use_cases.get_deal_state import (
     GetDealStateHandler,
     GetDealStateQuery,
 )
+from backend.application.use_cases.get_deal_states import (
+    GetDealStatesHandler,
+    GetDealStatesQuery,
+)
+from backend.application.use_cases.ingest_batch import (
+    BatchItemResult,
+    IngestBatchCommand,
+    IngestBatchHandler,
+    IngestBatchResult,
+)
 from backend.application.use_cases.ingest_event import (
     IngestEventCommand,
     IngestEventHandler,
 )
 
 __all__ = [
+    "BatchItemResult",
+    "ExplainDealStateHandler",
+    "ExplainDealStateQuery",
     "GetDealStateHandler",
     "GetDealStateQuery",
+    "GetDealStatesHandler",
+    "GetDealStatesQuery",
+    "IngestBatchCommand",
+    "IngestBatchHandler",
+    "IngestBatchResult",
     "IngestEventCommand",
     "IngestEventHandler",
 ]
@@ -0,0 +1,45 @@
+"""Use case: объяснить состояние сделки без сохранения пересчёта."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from backend.config.frameworks import available_frameworks, get_frameworks
+from backend.pipelines.recompute_context import RecomputeInput
+from backend.pipelines.recompute_explain import RecomputeExplanation, explain_recompute
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+@dataclass(frozen=True, slots=True)
+class ExplainDealStateQuery:
+    """Запрос на разбор пересчёта сделки."""
+
+    deal_id: str
+
+
+class ExplainDealStateHandler:
+    """Прогоняет шаги пересчёта по текущим фактам и возвращает их разбор.
+
+    Работает только на чтение: read-model не меняется, версия не растёт.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        framework_ids: Sequence[str] | None = None,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._framework_ids = tuple(framework_ids) if framework_ids else available_frameworks()
+
+    def execute(self, query: ExplainDealStateQuery) -> RecomputeExplanation:
+        """Собрать объяснение по фактам сделки."""
+
+        with self._uow_factory() as uow:
+            facts = list(uow.facts.list_for_deal(query.deal_id))
+        pipeline_input = RecomputeInput(
+            deal_id=query.deal_id,
+            facts=facts,
+            frameworks=list(get_frameworks(self._framework_ids)),
+        )
+        return explain_recompute(pipeline_input)
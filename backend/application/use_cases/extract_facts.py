@@ -0,0 +1,150 @@
+"""Use case: извлечь факты из события через LLM и сохранить их по буквам фреймворков."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+
+from backend.application.use_cases.run_arbiter import RunArbiterCommand, RunArbiterHandler
+from backend.config.frameworks import FrameworkConfig, available_frameworks, get_frameworks
+from backend.domain.conflicts import FacetKey
+from backend.domain.derivation import letters_covered_by_derivation
+from backend.domain.entities import Fact
+from backend.pipelines.arbiter_llm import candidates_from_facts, candidates_from_items
+from backend.pipelines.context_budget import ContextBudgeter
+from backend.pipelines.extract_llm import ExtractSource, extract_items
+from backend.pipelines.fact_builder import facts_from_items, letters_by_kind
+from backend.pipelines.fact_merge import merge_facts
+from backend.ports.clock import ClockPort
+from backend.ports.llm_client import LLMClientPort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+from backend.prompts.renderer import PromptRenderer
+from backend.schemas.facts import ExtractedFactItem
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractFactsCommand:
+    """Команда Extract; framework_ids выбирает фреймворки сделки (None — все)."""
+
+    deal_id: str
+    source: ExtractSource
+    framework_ids: tuple[str, ...] | None = None
+
+
+class ExtractFactsHandler:
+    """Вызывает Extract и атомарно сливает новые фасеты с сохранёнными фактами.
+
+    В multi-framework режиме все выбранные фреймворки обслуживаются одним вызовом
+    LLM: CRM, переписка и системный промпт отправляются один раз. Буквы, которые
+    производные факты (derive_from) уже закрывают до High, из промпта исключаются.
+    Если передан arbiter, кандидаты всех вызовов вместе с сохранёнными значениями
+    тех же фасетов разрешаются им одним пакетом; фасет, где Арбитр отверг всех
+    кандидатов (reject_all), удаляется и из сохранённого факта. budgeter
+    подрезает CRM и переписку под бюджет контекста модели.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        llm: LLMClientPort,
+        renderer: PromptRenderer,
+        clock: ClockPort,
+        multi_framework: bool = True,
+        skip_derived_letters: bool = True,
+        arbiter: RunArbiterHandler | None = None,
+        budgeter: ContextBudgeter | None = None,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._llm = budgeter.measuring(llm) if budgeter else llm
+        self._budgeter = budgeter
+        self._renderer = renderer
+        self._clock = clock
+        self._multi_framework = multi_framework
+        self._skip_derived_letters = skip_derived_letters
+        self._arbiter = arbiter
+
+    def execute(self, command: ExtractFactsCommand) -> list[Fact]:
+        """Извлечь факты, сохранить их и вернуть итоговые (слитые) факты."""
+
+        if self._budgeter is not None:
+            command = replace(command, source=self._budgeter.fit(command.source, "extract")[0])
+        frameworks = get_frameworks(command.framework_ids or available_frameworks())
+        if self._skip_derived_letters:
+            frameworks = self._without_derived_letters(command.deal_id, frameworks)
+        observed_at = self._clock.utcnow()
+        items: list[ExtractedFactItem] = []
+        rejected: set[FacetKey] = set()
+        for group in self._call_groups(frameworks):
+            items.extend(
+                extract_items(self._llm, self._renderer, group, command.source, command.deal_id)
+            )
+        if self._arbiter is not None and items:
+            with self._uow_factory() as uow:
+                stored = list(uow.facts.list_for_deal(command.deal_id))
+            items, rejected = _arbitrate(self._arbiter, command, items, stored, frameworks)
+        extracted = facts_from_items(items, frameworks, command.deal_id, observed_at)
+        return self._store(command.deal_id, extracted, frameworks, rejected)
+
+    def _without_derived_letters(
+        self, deal_id: str, frameworks: Sequence[FrameworkConfig]
+    ) -> tuple[FrameworkConfig, ...]:
+        if not any(framework.derivation for framework in frameworks):
+            return tuple(frameworks)
+        with self._uow_factory() as uow:
+            stored = list(uow.facts.list_for_deal(deal_id))
+        trimmed: list[FrameworkConfig] = []
+        for framework in frameworks:
+            covered = letters_covered_by_derivation(stored, framework)
+            letters = tuple(letter for letter in framework.letters if letter.key not in covered)
+            if letters:
+                trimmed.append(replace(framework, letters=letters))
+        return tuple(trimmed)
+
+    def _call_groups(
+        self, frameworks: Sequence[FrameworkConfig]
+    ) -> list[Sequence[FrameworkConfig]]:
+        if not frameworks:
+            return []
+        if self._multi_framework:
+            return [frameworks]
+        return [(framework,) for framework in frameworks]
+
+    def _store(
+        self,
+        deal_id: str,
+        extracted: Sequence[Fact],
+        frameworks: Sequence[FrameworkConfig],
+        rejected: set[FacetKey],
+    ) -> list[Fact]:
+        if not extracted and not rejected:
+            return []
+        with self._uow_factory() as uow:
+            stored = uow.facts.list_for_deal(deal_id)
+            merged = merge_facts(extracted, stored, letters_by_kind(frameworks), rejected)
+            for fact in merged:
+                uow.facts.upsert(fact)
+            uow.commit()
+        return merged
+
+
+def _arbitrate(
+    arbiter: RunArbiterHandler,
+    command: ExtractFactsCommand,
+    items: Sequence[ExtractedFactItem],
+    stored: Sequence[Fact],
+    frameworks: Sequence[FrameworkConfig],
+) -> tuple[list[ExtractedFactItem], set[FacetKey]]:
+    candidates = candidates_from_items(items)
+    facets = {candidate.key for candidate in candidates}
+    known = candidates_from_facts(stored, letters_by_kind(frameworks), facets)
+    outcome = arbiter.execute(
+        RunArbiterCommand(
+            deal_id=command.deal_id,
+            candidates=(*candidates, *known),
+            source=command.source,
+            framework=" + ".join(framework.name for framework in frameworks),
+        )
+    )
+    kept = {winner.id for winner in outcome.winners.values()}
+    rejected = {candidate.key for candidate in candidates} - set(outcome.winners)
+    return [item for candidate, item in zip(candidates, items) if candidate.id in kept], rejected
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from backend.domain.entities import DealReadModel
+from backend.domain.entities import DealReadModel, ReadModelStamp
 from backend.ports.unit_of_work import UnitOfWorkFactory
 
 
@@ -28,4 +28,11 @@ class GetDealStateHandler:
             model = uow.read_models.get(query.deal_id)
         return model or DealReadModel.empty(deal_id=query.deal_id)
 
+    def stamp(self, query: GetDealStateQuery) -> ReadModelStamp:
+        """Получить версию read-model для условного GET без загрузки содержимого."""
+
+        with self._uow_factory() as uow:
+            stamp = uow.read_models.get_stamp(query.deal_id)
+        return stamp or DealReadModel.empty(deal_id=query.deal_id).stamp
+
 
@@ -0,0 +1,31 @@
+"""Use case: получить read-model нескольких сделок одним запросом."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from backend.domain.entities import DealReadModel
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+@dataclass(frozen=True, slots=True)
+class GetDealStatesQuery:
+    """Запрос состояний списка сделок; порядок ответа совпадает с порядком ids."""
+
+    deal_ids: Sequence[str]
+
+
+class GetDealStatesHandler:
+    """Читает все read-model одним get_many; отсутствующие заменяет пустыми."""
+
+    def __init__(self, uow_factory: UnitOfWorkFactory) -> None:
+        self._uow_factory = uow_factory
+
+    def execute(self, query: GetDealStatesQuery) -> list[DealReadModel]:
+        """Вернуть состояния без дублей в порядке первого упоминания."""
+
+        deal_ids = list(dict.fromkeys(query.deal_ids))
+        with self._uow_factory() as uow:
+            found = uow.read_models.get_many(deal_ids)
+        return [found.get(deal_id) or DealReadModel.empty(deal_id=deal_id) for deal_id in deal_ids]
@@ -0,0 +1,149 @@
+"""Use case: пакетный приём событий — одна транзакция и один апдейт read-model на сделку."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Literal, Sequence
+
+from backend.application.services.retry import retry_on_conflict
+from backend.application.use_cases.ingest_event import IngestEventCommand
+from backend.domain.entities import DealReadModel, Event, IdempotencyRecord, Job
+from backend.ports.clock import ClockPort
+from backend.ports.notifier import NullNotifier, StateNotifierPort
+from backend.ports.recompute_queue import NullRecomputeQueue, RecomputeQueuePort
+from backend.ports.unit_of_work import UnitOfWork, UnitOfWorkFactory
+
+
+@dataclass(frozen=True, slots=True)
+class IngestBatchCommand:
+    """Пачка событий по разным сделкам в порядке поступления."""
+
+    events: Sequence[IngestEventCommand]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItemResult:
+    """Результат элемента пачки: accepted, duplicate (повтор ключа) или failed с ошибкой."""
+
+    index: int
+    deal_id: str
+    status: Literal["accepted", "duplicate", "failed"]
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class IngestBatchResult:
+    """Итог пачки: результаты по элементам и итоговые read-model затронутых сделок."""
+
+    items: list[BatchItemResult]
+    states: dict[str, DealReadModel]
+
+
+_ChunkResult = tuple[list[BatchItemResult], dict[str, DealReadModel]]
+
+
+class IngestBatchHandler:
+    """Записывает события чанками по chunk_size.
+
+    На чанк — один UnitOfWork: события идут одним multi-row INSERT, read-model
+    сделок читаются одним запросом и сохраняются по разу, задачи outbox_kinds —
+    по одной на сделку. Ошибка чанка помечает его элементы как failed.
+
+    Элементы с уже сохранённым idempotency_key (или повторённым внутри пачки)
+    получают статус duplicate и не пишутся. Ключи вставляются раньше событий:
+    чанк, чей ключ занял другой процесс, откатывается до записи событий и
+    повторяется заново, как и чанк, чью read-model обновила другая транзакция.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        clock: ClockPort,
+        chunk_size: int = 500,
+        notifier: StateNotifierPort | None = None,
+        recompute_queue: RecomputeQueuePort | None = None,
+        outbox_kinds: Sequence[str] = (),
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._clock = clock
+        self._chunk_size = chunk_size
+        self._notifier = notifier or NullNotifier()
+        self._recompute_queue = recompute_queue or NullRecomputeQueue()
+        self._outbox_kinds = tuple(outbox_kinds)
+
+    def execute(self, command: IngestBatchCommand) -> IngestBatchResult:
+        """Сохранить все события пачки и вернуть результаты по элементам."""
+
+        items: list[BatchItemResult] = []
+        states: dict[str, DealReadModel] = {}
+        for start in range(0, len(command.events), self._chunk_size):
+            chunk = command.events[start : start + self._chunk_size]
+            try:
+                chunk_items, updated = retry_on_conflict(partial(self._ingest_chunk, chunk, start))
+            except Exception as exc:  # noqa: BLE001 - результат отдаётся по элементам
+                error = f"{type(exc).__name__}: {exc}"
+                chunk_items = [
+                    BatchItemResult(start + offset, item.deal_id, "failed", error)
+                    for offset, item in enumerate(chunk)
+                ]
+            else:
+                states.update(updated)
+            items.extend(chunk_items)
+        return IngestBatchResult(items=items, states=states)
+
+    def _ingest_chunk(self, chunk: Sequence[IngestEventCommand], start: int) -> _ChunkResult:
+        for _ in range(2):
+            with self._uow_factory() as uow:
+                written = self._write_chunk(uow, chunk, start)
+                if written is None:
+                    uow.rollback()
+                    continue
+                uow.commit()
+            for model in written[1].values():
+                self._notifier.publish(model)
+                self._recompute_queue.enqueue(model.deal_id)
+            return written
+        raise RuntimeError("Ключи идемпотентности чанка заняты параллельным запросом")
+
+    def _write_chunk(
+        self, uow: UnitOfWork, chunk: Sequence[IngestEventCommand], start: int
+    ) -> _ChunkResult | None:
+        keys = [item.idempotency_key for item in chunk if item.idempotency_key is not None]
+        seen = set(uow.idempotency.get_many(keys)) if keys else set()
+        items: list[BatchItemResult] = []
+        fresh: list[IngestEventCommand] = []
+        for offset, item in enumerate(chunk):
+            key = item.idempotency_key
+            if key in seen:
+                items.append(BatchItemResult(start + offset, item.deal_id, "duplicate"))
+                continue
+            items.append(BatchItemResult(start + offset, item.deal_id, "accepted"))
+            fresh.append(item)
+            if key is not None:
+                seen.add(key)
+        updated = self._apply(uow, fresh)
+        return None if updated is None else (items, updated)
+
+    def _apply(
+        self, uow: UnitOfWork, fresh: Sequence[IngestEventCommand]
+    ) -> dict[str, DealReadModel] | None:
+        if not fresh:
+            return {}
+        now = self._clock.utcnow()
+        events = [Event(item.deal_id, item.kind, dict(item.payload), now) for item in fresh]
+        current = uow.read_models.get_many(list(dict.fromkeys(event.deal_id for event in events)))
+        updated: dict[str, DealReadModel] = {}
+        records: list[IdempotencyRecord] = []
+        for item, event in zip(fresh, events):
+            model = updated.get(event.deal_id) or current.get(event.deal_id)
+            model = (model or DealReadModel.empty(deal_id=event.deal_id)).with_event(event)
+            updated[event.deal_id] = model
+            if item.idempotency_key is not None:
+                records.append(IdempotencyRecord(item.idempotency_key, model.deal_id, model, now))
+        if records and len(uow.idempotency.add_many(records)) < len(records):
+            return None
+        uow.events.add_many(events)
+        uow.read_models.save_many(list(updated.values()))
+        uow.jobs.enqueue([Job(deal, kind, now) for deal in updated for kind in self._outbox_kinds])
+        return updated
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
-from backend.domain.entities import DealReadModel, Event
+from backend.application.services.retry import retry_on_conflict
+from backend.domain.entities import DealReadModel, Event, IdempotencyRecord, Job
 from backend.ports.clock import ClockPort
-from backend.ports.unit_of_work import UnitOfWorkFactory
+from backend.ports.notifier import NullNotifier, StateNotifierPort
+from backend.ports.recompute_queue import NullRecomputeQueue, RecomputeQueuePort
+from backend.ports.unit_of_work import UnitOfWork, UnitOfWorkFactory
 
 
 @dataclass(frozen=True, slots=True)
@@ -17,36 +20,73 @@ class IngestEventCommand:
     deal_id: str
     kind: str
     payload: Mapping[str, Any]
+    idempotency_key: str | None = None
 
 
 class IngestEventHandler:
-    """Детерминированно записывает событие и обновляет read-model."""
+    """Детерминированно записывает событие и обновляет read-model.
+
+    outbox_kinds — задачи, которые пишутся в outbox той же транзакцией, что и
+    событие (например, "recompute" для внешнего воркера).
+
+    С idempotency_key повтор команды возвращает ответ первого приёма и не
+    трогает события и read-model. Ключ вставляется той же транзакцией раньше
+    события: если его уже занял другой процесс или параллельный запрос,
+    транзакция откатывается, не записав ни события, ни read-model. Если
+    read-model сделки параллельно обновил пересчёт или другой приём,
+    транзакция повторяется поверх свежей версии (retry_on_conflict).
+    """
 
     def __init__(
         self,
         uow_factory: UnitOfWorkFactory,
         clock: ClockPort,
+        notifier: StateNotifierPort | None = None,
+        recompute_queue: RecomputeQueuePort | None = None,
+        outbox_kinds: Sequence[str] = (),
     ) -> None:
         self._uow_factory = uow_factory
         self._clock = clock
+        self._notifier = notifier or NullNotifier()
+        self._recompute_queue = recompute_queue or NullRecomputeQueue()
+        self._outbox_kinds = tuple(outbox_kinds)
 
     def execute(self, command: IngestEventCommand) -> DealReadModel:
         """Сохранить событие и вернуть обновлённое состояние сделки."""
 
-        event = Event(
-            deal_id=command.deal_id,
-            kind=command.kind,
-            payload=dict(command.payload),
-            created_at=self._clock.utcnow(),
-        )
+        updated, fresh = retry_on_conflict(lambda: self._write(command))
+        if fresh:
+            self._notifier.publish(updated)
+            self._recompute_queue.enqueue(updated.deal_id)
+        return updated
+
+    def _write(self, command: IngestEventCommand) -> tuple[DealReadModel, bool]:
+        key = command.idempotency_key
         with self._uow_factory() as uow:
-            uow.events.add(event)
-            current = uow.read_models.get(command.deal_id) or DealReadModel.empty(
+            stored = uow.idempotency.get_many([key]) if key is not None else {}
+            if key in stored:
+                return stored[key].response, False
+            event = Event(
                 deal_id=command.deal_id,
+                kind=command.kind,
+                payload=dict(command.payload),
+                created_at=self._clock.utcnow(),
             )
-            updated = current.with_event(event)
-            uow.read_models.save(updated)
+            current = uow.read_models.get(command.deal_id)
+            updated = (current or DealReadModel.empty(deal_id=command.deal_id)).with_event(event)
+            if key is not None and not uow.idempotency.add_many(
+                [IdempotencyRecord(key, updated.deal_id, updated, event.created_at)]
+            ):
+                uow.rollback()
+                return uow.idempotency.get_many([key])[key].response, False
+            self._store(uow, event, updated)
             uow.commit()
-            return updated
-
+        return updated, True
 
+    def _store(self, uow: UnitOfWork, event: Event, updated: DealReadModel) -> None:
+        uow.events.add(event)
+        uow.read_models.save(updated)
+        if self._outbox_kinds:
+            uow.jobs.enqueue(
+                [Job(event.deal_id, kind, event.created_at) for kind in self._outbox_kinds]
+            )
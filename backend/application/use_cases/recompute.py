@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Sequence
 
+from backend.application.services.retry import retry_on_conflict
 from backend.config.frameworks import available_frameworks, get_frameworks
 from backend.domain.entities import DealReadModel
 from backend.pipelines.recompute_steps import RecomputeInput, recompute_read_model
+from backend.ports.metrics import MetricsPort
+from backend.ports.notifier import NullNotifier, StateNotifierPort
 from backend.ports.unit_of_work import UnitOfWorkFactory
 
 
@@ -25,13 +28,26 @@ class RecomputeHandler:
         self,
         uow_factory: UnitOfWorkFactory,
         framework_ids: Sequence[str] | None = None,
+        notifier: StateNotifierPort | None = None,
+        metrics: MetricsPort | None = None,
     ) -> None:
         self._uow_factory = uow_factory
+        self._notifier = notifier or NullNotifier()
+        self._metrics = metrics
         self._framework_ids = tuple(framework_ids) if framework_ids else available_frameworks()
 
     def execute(self, command: RecomputeCommand) -> DealReadModel:
-        """Пересчитать состояние и записать результат атомарно."""
+        """Пересчитать состояние и записать результат атомарно.
 
+        Если read-model успел обновить приём события, пересчёт повторяется,
+        чтобы не затереть его last_event и не выдать ту же версию дважды.
+        """
+
+        updated = retry_on_conflict(lambda: self._write(command))
+        self._notifier.publish(updated)
+        return updated
+
+    def _write(self, command: RecomputeCommand) -> DealReadModel:
         frameworks = get_frameworks(self._framework_ids)
         with self._uow_factory() as uow:
             facts = list(uow.facts.list_for_deal(command.deal_id))
@@ -41,7 +57,7 @@ class RecomputeHandler:
                 facts=facts,
                 frameworks=list(frameworks),
             )
-            updated = recompute_read_model(pipeline_input)
+            updated = recompute_read_model(pipeline_input, self._metrics)
             if current and updated.last_event is None:
                 updated = DealReadModel(
                     deal_id=updated.deal_id,
@@ -51,7 +67,8 @@ class RecomputeHandler:
                     updated_at=updated.updated_at,
                     letters=updated.letters,
                 )
+            updated = replace(updated, version=(current.version if current else 0) + 1)
             uow.read_models.save(updated)
             uow.commit()
-            return updated
+        return updated
 
@@ -1,2 +1,108 @@
-# Use case: один вызов Арбитра для разрешения конкретного конфликта фактов
+"""Use case: один пакетный вызов Арбитра на все реальные конфликты фактов сделки."""
 
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from backend.domain.conflicts import (
+    DEFAULT_CONFIDENCE_GAP,
+    FacetCandidate,
+    FacetConflict,
+    FacetKey,
+    detect_conflicts,
+    pick_winners,
+)
+from backend.pipelines.arbiter_llm import build_arbiter_batch_request, parse_arbiter_batch_response
+from backend.pipelines.context_budget import ContextBudgeter
+from backend.pipelines.extract_llm import ExtractSource
+from backend.ports.llm_client import LLMClientPort
+from backend.prompts.renderer import PromptRenderer
+from backend.schemas.reasoner import ArbiterResolution
+
+
+@dataclass(frozen=True, slots=True)
+class RunArbiterCommand:
+    """Команда Arbiter: кандидаты фасетов сделки и контекст события для сверки evidence."""
+
+    deal_id: str
+    candidates: tuple[FacetCandidate, ...]
+    source: ExtractSource
+    framework: str
+
+
+@dataclass(frozen=True, slots=True)
+class ArbiterOutcome:
+    """Победитель на каждый фасет, вопросы для эскалации и число вызовов LLM (0 или 1)."""
+
+    winners: dict[FacetKey, FacetCandidate]
+    questions: tuple[str, ...]
+    llm_calls: int
+
+
+class RunArbiterHandler:
+    """Сначала детерминированно ищет конфликты, затем разрешает их одним вызовом LLM.
+
+    Дубликаты одного значения и кандидаты с большим разрывом уверенности решаются
+    без LLM. Фасеты, не упомянутые в ответе, сохраняют детерминированного победителя.
+    Ходы переписки, цитируемые кандидатами, budgeter сохраняет в первую очередь.
+    """
+
+    def __init__(
+        self,
+        llm: LLMClientPort,
+        renderer: PromptRenderer,
+        max_confidence_gap: float = DEFAULT_CONFIDENCE_GAP,
+        budgeter: ContextBudgeter | None = None,
+    ) -> None:
+        self._llm = budgeter.measuring(llm) if budgeter else llm
+        self._budgeter = budgeter
+        self._renderer = renderer
+        self._max_confidence_gap = max_confidence_gap
+
+    def execute(self, command: RunArbiterCommand) -> ArbiterOutcome:
+        """Выбрать победителей; LLM вызывается только при наличии реальных конфликтов."""
+
+        winners = pick_winners(command.candidates)
+        conflicts = detect_conflicts(command.candidates, self._max_confidence_gap)
+        if not conflicts:
+            return ArbiterOutcome(winners=winners, questions=(), llm_calls=0)
+        source = command.source
+        if self._budgeter is not None:
+            evidence = [item.evidence for conflict in conflicts for item in conflict.candidates]
+            source = self._budgeter.fit(source, "arbiter", evidence)[0]
+        request = build_arbiter_batch_request(
+            self._renderer,
+            conflicts,
+            source,
+            command.deal_id,
+            command.framework,
+        )
+        resolutions = parse_arbiter_batch_response(self._renderer, self._llm.complete(request).text)
+        questions = _apply_resolutions(winners, conflicts, resolutions)
+        return ArbiterOutcome(winners=winners, questions=questions, llm_calls=1)
+
+
+def _apply_resolutions(
+    winners: dict[FacetKey, FacetCandidate],
+    conflicts: Sequence[FacetConflict],
+    resolutions: Sequence[ArbiterResolution],
+) -> tuple[str, ...]:
+    by_key = {(conflict.letter, conflict.facet): conflict for conflict in conflicts}
+    questions: list[str] = []
+    for resolution in resolutions:
+        conflict = by_key.get((resolution.letter, resolution.facet))
+        if conflict is None:
+            continue
+        if resolution.question.ask and resolution.question.text:
+            questions.append(resolution.question.text)
+        if resolution.decision == "reject_all":
+            winners.pop((conflict.letter, conflict.facet), None)
+            continue
+        chosen = next(
+            (item for item in conflict.candidates if item.id == resolution.selected_id),
+            None,
+        )
+        if resolution.decision == "select" and chosen is not None:
+            winners[(conflict.letter, conflict.facet)] = chosen
+    return tuple(questions)
@@ -1,2 +1,120 @@
-# Use case: вызов Reasoner через LLM и сохранение результата рассуждения
+"""Use case: вызов Reasoner через LLM и сохранение результата рассуждения."""
 
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.domain.entities import DealReadModel, Fact, Reasoning
+from backend.domain.reasoning import (
+    ReasoningSnapshot,
+    diff_facets,
+    facet_entries,
+    primary_facts,
+    snapshot_inputs,
+)
+from backend.pipelines.context_budget import ContextBudgeter
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.reasoner_llm import (
+    ReasonerInput,
+    build_reasoner_delta_request,
+    build_reasoner_request,
+    parse_reasoner_response,
+)
+from backend.ports.clock import ClockPort
+from backend.ports.llm_client import LLMClientPort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+from backend.prompts.renderer import PromptRenderer
+
+
+@dataclass(frozen=True, slots=True)
+class RunReasonerCommand:
+    """Команда Reasoner; deal — атрибуты сделки для промпта (name, stage, ...)."""
+
+    deal_id: str
+    source: ExtractSource
+    deal: Mapping[str, Any] = field(default_factory=dict)
+    allow_manager_question: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ReasonerOutcome:
+    """Результат Reasoner и способ его получения: reused, delta или full."""
+
+    result: Mapping[str, Any]
+    mode: str
+
+
+class RunReasonerHandler:
+    """Переиспользует прошлое рассуждение, если входы не изменились.
+
+    Отпечаток строится по статусу, score и фасетам фактов основного фреймворка —
+    тех же, что видит полный промпт. При совпадении LLM не вызывается; иначе в
+    промпт уходит дифф фасетов и прошлые decision/why. Для полного промпта
+    budgeter оставляет прежде всего ходы, цитируемые в фактах.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        llm: LLMClientPort,
+        renderer: PromptRenderer,
+        clock: ClockPort,
+        incremental: bool = True,
+        budgeter: ContextBudgeter | None = None,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._llm = budgeter.measuring(llm) if budgeter else llm
+        self._budgeter = budgeter
+        self._renderer = renderer
+        self._clock = clock
+        self._incremental = incremental
+
+    def execute(self, command: RunReasonerCommand) -> ReasonerOutcome:
+        """Вернуть рассуждение по сделке, вызывая LLM только при изменении входов."""
+
+        with self._uow_factory() as uow:
+            model = uow.read_models.get(command.deal_id) or DealReadModel.empty(command.deal_id)
+            facts = primary_facts(model, uow.facts.list_for_deal(command.deal_id))
+            previous = uow.reasonings.get(command.deal_id)
+        snapshot = snapshot_inputs(model, facts)
+        if previous is not None and previous.fingerprint == snapshot.fingerprint:
+            return ReasonerOutcome(result=previous.result, mode="reused")
+        data = ReasonerInput(
+            model=model,
+            facts=facts,
+            source=self._fit(command.source, facts),
+            deal=command.deal,
+            allow_manager_question=command.allow_manager_question,
+        )
+        if previous is not None and self._incremental:
+            delta = diff_facets(previous.facet_digests, snapshot.facet_digests)
+            request = build_reasoner_delta_request(self._renderer, data, previous, delta)
+            mode = "delta"
+        else:
+            request = build_reasoner_request(self._renderer, data)
+            mode = "full"
+        result = parse_reasoner_response(self._renderer, self._llm.complete(request).text)
+        self._save(command.deal_id, snapshot, result)
+        return ReasonerOutcome(result=result, mode=mode)
+
+    def _fit(self, source: ExtractSource, facts: list[Fact]) -> ExtractSource:
+        if self._budgeter is None:
+            return source
+        evidence = [str(entry.get("evidence") or "") for entry in facet_entries(facts).values()]
+        return self._budgeter.fit(source, "reasoner", evidence)[0]
+
+    def _save(self, deal_id: str, snapshot: ReasoningSnapshot, result: Mapping[str, Any]) -> None:
+        reasoning = Reasoning(
+            deal_id=deal_id,
+            fingerprint=snapshot.fingerprint,
+            status=snapshot.status,
+            score=snapshot.score,
+            facet_digests=snapshot.facet_digests,
+            result=dict(result),
+            created_at=self._clock.utcnow(),
+        )
+        with self._uow_factory() as uow:
+            uow.reasonings.save(reasoning)
+            uow.commit()
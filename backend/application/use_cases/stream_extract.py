@@ -0,0 +1,83 @@
+"""Use case: потоковый Extract — факт сохраняется, как только модель закрыла его объект."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from backend.application.use_cases.extract_facts import ExtractFactsCommand
+from backend.application.use_cases.recompute import RecomputeCommand, RecomputeHandler
+from backend.config.frameworks import LetterConfig, available_frameworks, get_frameworks
+from backend.domain.entities import Fact
+from backend.pipelines.extract_llm import stream_extract_items
+from backend.pipelines.fact_builder import facts_from_items, letters_by_kind
+from backend.pipelines.fact_merge import merge_with_existing
+from backend.ports.clock import ClockPort
+from backend.ports.llm_client import LLMStreamingClientPort
+from backend.ports.metrics import MetricsPort, NullMetrics
+from backend.ports.unit_of_work import UnitOfWorkFactory
+from backend.prompts.renderer import PromptRenderer
+
+
+class StreamExtractFactsHandler:
+    """Разбирает поток ответа Extract и сохраняет каждый факт сразу после валидации.
+
+    После каждого факта (если задан recompute) пересчитывается read-model, так что
+    первые буквы видны клиентам до окончания генерации. Время до первого факта
+    пишется в метрику extract_time_to_first_fact_seconds. Arbiter в этом режиме
+    не участвует (ему нужны все кандидаты сразу), поэтому фасет перезаписывается
+    только более уверенным значением — повтор фасета позже в потоке или слабее
+    сохранённого не затирает лучшее, как и при буферизованном разборе ответа.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        llm: LLMStreamingClientPort,
+        renderer: PromptRenderer,
+        clock: ClockPort,
+        recompute: RecomputeHandler | None = None,
+        metrics: MetricsPort | None = None,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._llm = llm
+        self._renderer = renderer
+        self._clock = clock
+        self._recompute = recompute
+        self._metrics = metrics or NullMetrics()
+        self._timer = timer
+
+    def execute(self, command: ExtractFactsCommand) -> list[Fact]:
+        """Сохранять факты по мере поступления и вернуть итоговые факты по буквам."""
+
+        frameworks = get_frameworks(command.framework_ids or available_frameworks())
+        letters = letters_by_kind(frameworks)
+        observed_at = self._clock.utcnow()
+        started = self._timer()
+        stored: dict[str, Fact] = {}
+        items = stream_extract_items(
+            self._llm, self._renderer, frameworks, command.source, command.deal_id
+        )
+        for item in items:
+            for fact in facts_from_items([item], frameworks, command.deal_id, observed_at):
+                if not stored:
+                    elapsed = self._timer() - started
+                    self._metrics.observe("extract_time_to_first_fact_seconds", elapsed)
+                stored[fact.kind] = self._store(fact, letters[fact.kind])
+                self._metrics.inc("extract_stream_facts_total")
+                if self._recompute is not None:
+                    self._recompute.execute(RecomputeCommand(deal_id=command.deal_id))
+        self._metrics.observe("extract_stream_seconds", self._timer() - started)
+        return list(stored.values())
+
+    def _store(self, fact: Fact, letter: LetterConfig) -> Fact:
+        with self._uow_factory() as uow:
+            existing = next(
+                (item for item in uow.facts.list_for_deal(fact.deal_id) if item.kind == fact.kind),
+                None,
+            )
+            merged = merge_with_existing(fact, existing, letter, keep_best=True)
+            uow.facts.upsert(merged)
+            uow.commit()
+        return merged
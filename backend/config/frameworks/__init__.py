@@ -9,6 +9,9 @@ from typing import Any, Iterable
 
 import yaml
 
+from backend.config.frameworks.derivation import DerivationConfig, LetterIndex, build_derivation
+from backend.config.frameworks.parsing import GateConfig, LetterConfig, build_gate, build_letter
+
 _BASE_DIR = Path(__file__).resolve().parent
 _FRAMEWORK_FILES: dict[str, str] = {
     "bant": "bant.yaml",
@@ -16,22 +19,6 @@ _FRAMEWORK_FILES: dict[str, str] = {
 }
 
 
-@dataclass(frozen=True, slots=True)
-class LetterConfig:
-    key: str
-    title: str
-    fact_kind: str
-    weight: float
-    checklist: tuple[str, ...]
-
-
-@dataclass(frozen=True, slots=True)
-class GateConfig:
-    status: str
-    min_score: float | None
-    required_letters: tuple[tuple[str, float], ...]
-
-
 @dataclass(frozen=True, slots=True)
 class FrameworkConfig:
     id: str
@@ -39,6 +26,7 @@ class FrameworkConfig:
     priority: int
     letters: tuple[LetterConfig, ...]
     gates: tuple[GateConfig, ...]
+    derivation: DerivationConfig | None = None
 
     def letters_dict(self) -> dict[str, LetterConfig]:
         return {letter.key: letter for letter in self.letters}
@@ -72,8 +60,8 @@ def _build_framework(framework_id: str, raw: Any) -> FrameworkConfig:
         raise ValueError(f"Некорректный YAML для {framework_id}: ожидался mapping")
     letters_raw = raw.get("letters", [])
     gates_raw = raw.get("gates", [])
-    letters = tuple(_build_letter(item) for item in letters_raw)
-    gates = tuple(_build_gate(item) for item in gates_raw)
+    letters = tuple(build_letter(item) for item in letters_raw)
+    gates = tuple(build_gate(item) for item in gates_raw)
     if not letters:
         raise ValueError(f"В конфигурации {framework_id} нет букв")
     if not gates:
@@ -82,65 +70,30 @@ def _build_framework(framework_id: str, raw: Any) -> FrameworkConfig:
     priority = int(raw.get("priority", 100))
     total_weight = sum(letter.weight for letter in letters)
     if not 0.99 <= total_weight <= 1.01:
-        raise ValueError(f"Сумма весов букв для {framework_id} должна быть около 1.0, сейчас: {total_weight}")
+        raise ValueError(
+            f"Сумма весов букв для {framework_id} должна быть около 1.0, сейчас: {total_weight}"
+        )
+    derivation = build_derivation(raw.get("derive_from"), _letter_index(letters), _source_index)
     return FrameworkConfig(
         id=framework_id,
         name=name,
         priority=priority,
         letters=letters,
         gates=gates,
+        derivation=derivation,
     )
 
 
-def _build_letter(item: Any) -> LetterConfig:
-    if not isinstance(item, dict):
-        raise ValueError("Ожидался словарь с настройками буквы")
-    try:
-        key = str(item["key"])
-        title = str(item["title"])
-        fact_kind = str(item.get("fact_kind", key))
-        weight = float(item["weight"])
-    except KeyError as exc:
-        raise ValueError("В букве пропущено обязательное поле") from exc
-    checklist_raw = item.get("checklist", [])
-    checklist: tuple[str, ...] = tuple(str(check) for check in checklist_raw)
-    if not checklist:
-        raise ValueError(f"У буквы {key} отсутствует чек-лист")
-    return LetterConfig(
-        key=key,
-        title=title,
-        fact_kind=fact_kind,
-        weight=weight,
-        checklist=checklist,
-    )
+def _letter_index(letters: Iterable[LetterConfig]) -> LetterIndex:
+    return {letter.key: (letter.fact_kind, letter.checklist) for letter in letters}
 
 
-def _build_gate(item: Any) -> GateConfig:
-    if not isinstance(item, dict):
-        raise ValueError("Ожидался словарь с настройками ворот")
-    try:
-        status = str(item["status"])
-    except KeyError as exc:
-        raise ValueError("Для ворот необходимо поле status") from exc
-    min_score = item.get("min_score")
-    min_score_value = float(min_score) if min_score is not None else None
-    required = item.get("required_letters", {})
-    if isinstance(required, dict):
-        required_items = tuple(
-            (str(letter), float(value)) for letter, value in required.items()
-        )
-    elif isinstance(required, list):
-        required_items = tuple(
-            (str(pair["letter"]), float(pair["min"]))
-            for pair in required
-            if isinstance(pair, dict)
-        )
-    else:
-        required_items = tuple()
-    return GateConfig(status=status, min_score=min_score_value, required_letters=required_items)
+def _source_index(framework_id: str) -> LetterIndex:
+    return _letter_index(get_framework(framework_id).letters)
 
 
 __all__ = (
+    "DerivationConfig",
     "FrameworkConfig",
     "GateConfig",
     "LetterConfig",
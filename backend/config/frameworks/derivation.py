@@ -0,0 +1,79 @@
+"""Декларативная карта производных фактов между фреймворками (например, BANT → MED2IC3)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+# Буква → (fact_kind, чек-лист); так описываются обе стороны карты.
+LetterIndex = Mapping[str, tuple[str, tuple[str, ...]]]
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedCheck:
+    """Пункт чек-листа целевой буквы, заполняемый из пункта буквы-источника."""
+
+    target_letter: str
+    target_check: str
+    source_kind: str
+    source_check: str
+
+
+@dataclass(frozen=True, slots=True)
+class DerivationConfig:
+    """Секция derive_from: фреймворк-источник, понижающий коэффициент и пары пунктов."""
+
+    source_framework: str
+    confidence_factor: float
+    checks: tuple[DerivedCheck, ...]
+
+    def target_letters(self) -> tuple[str, ...]:
+        """Буквы целевого фреймворка, для которых есть хотя бы один производный пункт."""
+
+        return tuple(dict.fromkeys(check.target_letter for check in self.checks))
+
+
+def build_derivation(
+    raw: Any,
+    targets: LetterIndex,
+    load_source: Callable[[str], LetterIndex],
+) -> DerivationConfig | None:
+    """Разобрать derive_from, проверив обе стороны карты по конфигам фреймворков."""
+
+    if raw is None:
+        return None
+    if not isinstance(raw, dict) or not isinstance(raw.get("checks"), dict):
+        raise ValueError("derive_from: ожидался mapping с полями framework и checks")
+    source_id = str(raw.get("framework", ""))
+    factor = float(raw.get("confidence_factor", 0.7))
+    if not 0.0 < factor <= 1.0:
+        raise ValueError("derive_from.confidence_factor должен быть в (0, 1]")
+    sources = load_source(source_id)
+    checks = tuple(
+        _build_check(str(target), str(source), targets, sources)
+        for target, source in raw["checks"].items()
+    )
+    return DerivationConfig(source_framework=source_id, confidence_factor=factor, checks=checks)
+
+
+def _build_check(
+    target: str,
+    source: str,
+    targets: LetterIndex,
+    sources: LetterIndex,
+) -> DerivedCheck:
+    target_letter, target_check = _split_ref(target, targets)
+    source_letter, source_check = _split_ref(source, sources)
+    return DerivedCheck(
+        target_letter=target_letter,
+        target_check=target_check,
+        source_kind=sources[source_letter][0],
+        source_check=source_check,
+    )
+
+
+def _split_ref(ref: str, index: LetterIndex) -> tuple[str, str]:
+    letter, _, check = ref.partition(".")
+    if letter not in index or check not in index[letter][1]:
+        raise ValueError(f"derive_from: неизвестный пункт чек-листа {ref}")
+    return letter, check
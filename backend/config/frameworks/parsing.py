@@ -0,0 +1,74 @@
+"""Разбор букв и ворот фреймворка из YAML в неизменяемые конфиги."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class LetterConfig:
+    key: str
+    title: str
+    fact_kind: str
+    weight: float
+    checklist: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class GateConfig:
+    status: str
+    min_score: float | None
+    required_letters: tuple[tuple[str, float], ...]
+
+
+def build_letter(item: Any) -> LetterConfig:
+    """Разобрать описание буквы фреймворка из YAML."""
+
+    if not isinstance(item, dict):
+        raise ValueError("Ожидался словарь с настройками буквы")
+    try:
+        key = str(item["key"])
+        title = str(item["title"])
+        fact_kind = str(item.get("fact_kind", key))
+        weight = float(item["weight"])
+    except KeyError as exc:
+        raise ValueError("В букве пропущено обязательное поле") from exc
+    checklist_raw = item.get("checklist", [])
+    checklist: tuple[str, ...] = tuple(str(check) for check in checklist_raw)
+    if not checklist:
+        raise ValueError(f"У буквы {key} отсутствует чек-лист")
+    return LetterConfig(
+        key=key,
+        title=title,
+        fact_kind=fact_kind,
+        weight=weight,
+        checklist=checklist,
+    )
+
+
+def build_gate(item: Any) -> GateConfig:
+    """Разобрать описание ворот (порог score и минимумы по буквам) из YAML."""
+
+    if not isinstance(item, dict):
+        raise ValueError("Ожидался словарь с настройками ворот")
+    try:
+        status = str(item["status"])
+    except KeyError as exc:
+        raise ValueError("Для ворот необходимо поле status") from exc
+    min_score = item.get("min_score")
+    min_score_value = float(min_score) if min_score is not None else None
+    required = item.get("required_letters", {})
+    if isinstance(required, dict):
+        required_items = tuple(
+            (str(letter), float(value)) for letter, value in required.items()
+        )
+    elif isinstance(required, list):
+        required_items = tuple(
+            (str(pair["letter"]), float(pair["min"]))
+            for pair in required
+            if isinstance(pair, dict)
+        )
+    else:
+        required_items = tuple()
+    return GateConfig(status=status, min_score=min_score_value, required_letters=required_items)
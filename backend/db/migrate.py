@@ -0,0 +1,63 @@
+"""Создание и обновление схемы БД отдельным шагом: python -m backend.db.migrate.
+
+Запускается один раз перед стартом веб-воркеров и воркеров outbox, а не
+в каждом процессе: create_all проверяет каждую таблицу запросом к каталогу.
+create_all не меняет уже существующие таблицы, поэтому колонки, добавленные
+в них позже, перечислены в ADDED_COLUMNS и досоздаются ALTER TABLE.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
+
+from backend.adapters.persistence.orm_models import Base
+from backend.config.settings import get_settings
+
+# (таблица, колонка, DDL) — колонки, появившиеся в уже выпущенных таблицах.
+ADDED_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("deal_read_models", "version", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+
+def create_schema(engine: Engine) -> list[str]:
+    """Создать недостающие таблицы, индексы и колонки; вернуть имена таблиц схемы."""
+
+    Base.metadata.create_all(engine)
+    add_missing_columns(engine)
+    return sorted(Base.metadata.tables)
+
+
+def add_missing_columns(engine: Engine) -> list[str]:
+    """Добавить колонки ADDED_COLUMNS, которых нет в таблицах; вернуть table.column."""
+
+    added: list[str] = []
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table, column, ddl in ADDED_COLUMNS:
+            if column in {item["name"] for item in inspector.get_columns(table)}:
+                continue
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            added.append(f"{table}.{column}")
+    return added
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Создать схему в БД из DATABASE_URL (или --database-url)."""
+
+    parser = argparse.ArgumentParser(description="Создать схему БД Deal Qual Assistant")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url or get_settings().database_url, future=True)
+    try:
+        tables = create_schema(engine)
+    finally:
+        engine.dispose()
+    print(f"Схема готова: {', '.join(tables)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Доменное правило: детерминированное выявление реальных конфликтов значений фасетов."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+FacetKey = tuple[str, str]
+
+# Разрыв уверенности, начиная с которого более уверенный кандидат побеждает без Arbiter.
+DEFAULT_CONFIDENCE_GAP = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class FacetCandidate:
+    """Кандидат значения фасета (буква + фасет) из ответа Extract."""
+
+    id: str
+    letter: str
+    facet: str
+    value: Any
+    confidence: float
+    source: str
+    evidence: str
+    ts: str | None = None
+
+    @property
+    def key(self) -> FacetKey:
+        """Ключ фасета для группировки кандидатов."""
+
+        return self.letter, self.facet
+
+
+@dataclass(frozen=True, slots=True)
+class FacetConflict:
+    """Реальный конфликт: разные значения с близкой уверенностью."""
+
+    letter: str
+    facet: str
+    candidates: tuple[FacetCandidate, ...]
+    reason: str
+
+
+def pick_best(candidates: Sequence[FacetCandidate]) -> FacetCandidate:
+    """Выбрать кандидата по уверенности, при равенстве — по свежести ts."""
+
+    return max(candidates, key=lambda item: (item.confidence, item.ts or ""))
+
+
+def pick_winners(candidates: Sequence[FacetCandidate]) -> dict[FacetKey, FacetCandidate]:
+    """Детерминированный победитель на каждый фасет без участия Arbiter."""
+
+    return {key: pick_best(group) for key, group in group_by_facet(candidates).items()}
+
+
+def group_by_facet(
+    candidates: Sequence[FacetCandidate],
+) -> dict[FacetKey, list[FacetCandidate]]:
+    """Сгруппировать кандидатов по (letter, facet), сохраняя порядок."""
+
+    grouped: dict[FacetKey, list[FacetCandidate]] = {}
+    for candidate in candidates:
+        grouped.setdefault(candidate.key, []).append(candidate)
+    return grouped
+
+
+def detect_conflicts(
+    candidates: Sequence[FacetCandidate],
+    max_confidence_gap: float = DEFAULT_CONFIDENCE_GAP,
+) -> list[FacetConflict]:
+    """Найти фасеты, где значения расходятся, а разрыв уверенности меньше порога.
+
+    Дубликаты одного значения не считаются конфликтом; на каждое значение
+    остаётся самый уверенный кандидат. Детерминированно, без I/O.
+    """
+
+    conflicts: list[FacetConflict] = []
+    for (letter, facet), group in group_by_facet(candidates).items():
+        distinct = _best_per_value(group)
+        if len(distinct) < 2:
+            continue
+        top = distinct[0]
+        contenders = [
+            item for item in distinct[1:] if top.confidence - item.confidence < max_confidence_gap
+        ]
+        if contenders:
+            gap = top.confidence - contenders[0].confidence
+            conflicts.append(
+                FacetConflict(
+                    letter=letter,
+                    facet=facet,
+                    candidates=(top, *contenders),
+                    reason=f"{len(contenders) + 1} разных значения, разрыв уверенности {gap:.2f}",
+                )
+            )
+    return conflicts
+
+
+def _best_per_value(group: Sequence[FacetCandidate]) -> list[FacetCandidate]:
+    best: dict[str, FacetCandidate] = {}
+    for item in group:
+        marker = json.dumps(item.value, sort_keys=True, ensure_ascii=False, default=str)
+        current = best.get(marker)
+        if current is None or pick_best((current, item)) is item:
+            best[marker] = item
+    return sorted(best.values(), key=lambda item: (item.confidence, item.ts or ""), reverse=True)
@@ -0,0 +1,124 @@
+"""Доменное правило: производные факты фреймворка из фактов другого фреймворка без LLM."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
+from typing import Any
+
+from backend.config.frameworks import DerivationConfig, FrameworkConfig, LetterConfig
+from backend.domain.entities import Fact
+from backend.domain.rules import HIGH_YES_COUNT, resolve_conflicts
+
+DERIVED_SOURCE_PREFIX = "derived:"
+
+
+def is_derived(fact: Fact) -> bool:
+    """Признак производного факта (источник вида derived:<framework>)."""
+
+    return bool(fact.source and fact.source.startswith(DERIVED_SOURCE_PREFIX))
+
+
+def derive_facts(facts: Sequence[Fact], frameworks: Sequence[FrameworkConfig]) -> list[Fact]:
+    """Построить производные факты для фреймворков с картой derive_from.
+
+    Источник — лучший факт каждого вида (resolve_conflicts); уверенность умножается
+    на confidence_factor, поэтому реальный факт той же буквы обычно побеждает.
+    Детерминированно, без I/O.
+    """
+
+    best = resolve_conflicts([fact for fact in facts if not is_derived(fact)])
+    derived: list[Fact] = []
+    for framework in frameworks:
+        if framework.derivation is not None:
+            derived.extend(_derive(framework.derivation, framework.letters_dict(), best))
+    return derived
+
+
+def with_derived_facts(facts: Sequence[Fact], frameworks: Sequence[FrameworkConfig]) -> list[Fact]:
+    """Дополнить факты производными, не вытесняя реальные.
+
+    Если у вида уже есть реальный факт, производный факт не конкурирует с ним в
+    resolve: его пункты чек-листа лишь дописываются в лучший реальный факт там,
+    где реальный пункта не содержит. Вид без реального факта получает производный.
+    """
+
+    derived = {fact.kind: fact for fact in derive_facts(facts, frameworks)}
+    if not derived:
+        return list(facts)
+    best = resolve_conflicts([fact for fact in facts if not is_derived(fact)])
+    filled = [
+        _fill_checklist(fact, derived[fact.kind])
+        if fact.kind in derived and best.get(fact.kind) is fact
+        else fact
+        for fact in facts
+    ]
+    return [*filled, *(fact for kind, fact in derived.items() if kind not in best)]
+
+
+def letters_covered_by_derivation(
+    facts: Sequence[Fact],
+    framework: FrameworkConfig,
+) -> frozenset[str]:
+    """Буквы framework, которые производные факты уже закрывают до уровня High."""
+
+    covered = {
+        fact.kind
+        for fact in derive_facts(facts, (framework,))
+        if sum(1 for value in _checklist(fact).values() if value) >= HIGH_YES_COUNT
+    }
+    return frozenset(letter.key for letter in framework.letters if letter.fact_kind in covered)
+
+
+def _derive(
+    derivation: DerivationConfig,
+    letters: Mapping[str, LetterConfig],
+    best: Mapping[str, Fact],
+) -> list[Fact]:
+    checklists: dict[str, dict[str, bool]] = {}
+    sources: dict[str, list[Fact]] = {}
+    for check in derivation.checks:
+        source = best.get(check.source_kind)
+        value = _checklist(source).get(check.source_check) if source else None
+        if source is None or value is None:
+            continue
+        checklist = checklists.setdefault(check.target_letter, {})
+        checklist[check.target_check] = checklist.get(check.target_check, False) or bool(value)
+        sources.setdefault(check.target_letter, []).append(source)
+    return [
+        _build_derived(letters[key], checklist, sources[key], derivation)
+        for key, checklist in checklists.items()
+    ]
+
+
+def _build_derived(
+    letter: LetterConfig,
+    checklist: dict[str, bool],
+    sources: Sequence[Fact],
+    derivation: DerivationConfig,
+) -> Fact:
+    confidence = max(source.confidence or 0.0 for source in sources)
+    return Fact(
+        deal_id=sources[0].deal_id,
+        kind=letter.fact_kind,
+        payload={
+            "checklist": checklist,
+            "derived_from": sorted({source.kind for source in sources}),
+        },
+        confidence=round(confidence * derivation.confidence_factor, 4),
+        observed_at=max(source.observed_at for source in sources),
+        source=f"{DERIVED_SOURCE_PREFIX}{derivation.source_framework}",
+    )
+
+
+def _fill_checklist(real: Fact, derived: Fact) -> Fact:
+    checklist = dict(_checklist(real))
+    missing = {key: value for key, value in _checklist(derived).items() if key not in checklist}
+    if not missing:
+        return real
+    return replace(real, payload={**real.payload, "checklist": {**checklist, **missing}})
+
+
+def _checklist(fact: Fact | None) -> Mapping[str, Any]:
+    raw = fact.payload.get("checklist", {}) if fact else {}
+    return raw if isinstance(raw, Mapping) else {}
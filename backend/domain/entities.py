@@ -29,6 +29,14 @@ class Fact:
     source: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class ReadModelStamp:
+    """Версия и момент обновления read-model без самого содержимого."""
+
+    version: int
+    updated_at: datetime | None
+
+
 @dataclass(frozen=True, slots=True)
 class DealReadModel:
     """Компактное представление состояния сделки для отдачи во внешние слои."""
@@ -39,6 +47,7 @@ class DealReadModel:
     last_event: Mapping[str, Any] | None
     updated_at: datetime | None
     letters: Mapping[str, Any] = field(default_factory=dict)
+    version: int = 0
 
     @classmethod
     def empty(cls, deal_id: str) -> "DealReadModel":
@@ -53,6 +62,12 @@ class DealReadModel:
             letters={},
         )
 
+    @property
+    def stamp(self) -> ReadModelStamp:
+        """Вернуть версию и момент обновления этого состояния."""
+
+        return ReadModelStamp(version=self.version, updated_at=self.updated_at)
+
     def with_event(self, event: Event) -> "DealReadModel":
         """Вернуть новое состояние с учётом последнего события."""
 
@@ -68,6 +83,39 @@ class DealReadModel:
             last_event=event_snapshot,
             updated_at=event.created_at,
             letters=dict(self.letters),
+            version=self.version + 1,
         )
 
 
+@dataclass(frozen=True, slots=True)
+class Reasoning:
+    """Последний результат Reasoner и отпечаток входов, на которых он получен."""
+
+    deal_id: str
+    fingerprint: str
+    status: str
+    score: float | None
+    facet_digests: Mapping[str, str]
+    result: Mapping[str, Any]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """Фоновая задача по сделке из outbox: пересчёт read-model или Extract."""
+
+    deal_id: str
+    kind: str
+    available_at: datetime
+    attempts: int = 0
+    id: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Сохранённый ответ на принятое событие, выдаваемый повторам с тем же ключом."""
+
+    key: str
+    deal_id: str
+    response: DealReadModel
+    created_at: datetime
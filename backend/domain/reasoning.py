@@ -0,0 +1,91 @@
+"""Доменные правила инкрементального Reasoner: отпечаток входов и дифф фасетов."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from backend.config.frameworks import FrameworkConfig, available_frameworks, get_framework
+from backend.domain.entities import DealReadModel, Fact
+from backend.utils.hashing import stable_hash
+
+FACET_KEY_SEPARATOR = "/"
+
+
+@dataclass(frozen=True, slots=True)
+class ReasoningSnapshot:
+    """Входы Reasoner, от которых зависит ответ: статус, score и фасеты фактов."""
+
+    fingerprint: str
+    status: str
+    score: float | None
+    facet_digests: dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class FactsDelta:
+    """Изменения фасетов с прошлого рассуждения (ключи вида «bant.B/facet»)."""
+
+    added: tuple[str, ...]
+    changed: tuple[str, ...]
+    removed: tuple[str, ...]
+
+    def touched(self) -> tuple[str, ...]:
+        """Ключи фасетов, которые нужно отправить в промпт."""
+
+        return self.added + self.changed
+
+
+def facet_entries(facts: Sequence[Fact]) -> dict[str, Mapping[str, Any]]:
+    """Разложить факты на фасеты; факт без facets считается одним фасетом."""
+
+    entries: dict[str, Mapping[str, Any]] = {}
+    for fact in facts:
+        facets = fact.payload.get("facets")
+        if not isinstance(facets, Mapping):
+            entries[fact.kind] = dict(fact.payload)
+            continue
+        for name, entry in facets.items():
+            entries[f"{fact.kind}{FACET_KEY_SEPARATOR}{name}"] = entry
+    return entries
+
+
+def primary_framework(model: DealReadModel) -> FrameworkConfig:
+    """Фреймворк, по которому рассуждает Reasoner: первый посчитанный в read-model."""
+
+    known = available_frameworks()
+    selected = next((key for key in model.letters if key in known), known[0])
+    return get_framework(selected)
+
+
+def primary_facts(model: DealReadModel, facts: Sequence[Fact]) -> list[Fact]:
+    """Факты только основного фреймворка — те же, что попадают в полный промпт."""
+
+    prefix = f"{primary_framework(model).id}."
+    return [fact for fact in facts if fact.kind.startswith(prefix)]
+
+
+def snapshot_inputs(model: DealReadModel, facts: Sequence[Fact]) -> ReasoningSnapshot:
+    """Посчитать отпечаток входов Reasoner; порядок фактов на него не влияет."""
+
+    digests = {key: stable_hash(entry) for key, entry in facet_entries(facts).items()}
+    fingerprint = stable_hash(
+        {"status": model.status, "score": model.score, "facets": digests}
+    )
+    return ReasoningSnapshot(
+        fingerprint=fingerprint,
+        status=model.status,
+        score=model.score,
+        facet_digests=digests,
+    )
+
+
+def diff_facets(before: Mapping[str, str], after: Mapping[str, str]) -> FactsDelta:
+    """Сравнить дайджесты фасетов двух снимков."""
+
+    return FactsDelta(
+        added=tuple(sorted(key for key in after if key not in before)),
+        changed=tuple(sorted(key for key in after if key in before and before[key] != after[key])),
+        removed=tuple(sorted(key for key in before if key not in after)),
+    )
@@ -9,6 +9,9 @@ from backend.config.frameworks import FrameworkConfig
 from backend.domain.entities import Fact
 from backend.domain.value_objects import FrameworkCompleteness, GateDecision
 
+HIGH_YES_COUNT = 4
+MEDIUM_YES_COUNT = 2
+
 
 def resolve_conflicts(facts: Sequence[Fact]) -> dict[str, Fact]:
     """Выбрать по одному факту каждого вида по уверености и свежести."""
@@ -53,29 +56,38 @@ def apply_gates(
 ) -> GateDecision:
     """Определить статус сделки по воротам фреймворка."""
 
-    last_decision: GateDecision | None = None
+    decisions = evaluate_gates(completeness, framework)
+    return decisions[-1] if decisions else GateDecision(
+        framework_id=framework.id,
+        status="unknown",
+        checks={},
+    )
+
+
+def evaluate_gates(
+    completeness: FrameworkCompleteness,
+    framework: FrameworkConfig,
+) -> list[GateDecision]:
+    """Проверить ворота по порядку до первых пройденных включительно.
+
+    Последний элемент — итоговое решение: пройденные ворота, ворота без
+    условий (финальный fallback) или, если ничего не прошло, последние ворота.
+    """
+
+    decisions: list[GateDecision] = []
     for gate in framework.gates:
         checks: dict[str, bool] = {}
         if gate.min_score is not None:
             checks["score"] = completeness.score >= gate.min_score
         for letter, threshold in gate.required_letters:
             checks[letter] = completeness.per_letter.get(letter, 0.0) >= threshold
-        decision = GateDecision(
-            framework_id=framework.id,
-            status=gate.status,
-            checks=checks,
+        decisions.append(
+            GateDecision(framework_id=framework.id, status=gate.status, checks=checks)
         )
-        if checks and all(checks.values()):
-            return decision
-        if not checks:
-            # Если ворота без условий – это финальный fallback.
-            return decision
-        last_decision = decision
-    return last_decision or GateDecision(
-        framework_id=framework.id,
-        status="unknown",
-        checks={},
-    )
+        # Ворота без условий – это финальный fallback.
+        if not checks or all(checks.values()):
+            break
+    return decisions
 
 
 def _is_better_fact(candidate: Fact, current: Fact) -> bool:
@@ -99,9 +111,9 @@ def _count_yes(fact: Fact | None, checklist: tuple[str, ...]) -> int:
 
 
 def _discretize_yes(count: int) -> float:
-    if count >= 4:
+    if count >= HIGH_YES_COUNT:
         return 1.0
-    if count >= 2:
+    if count >= MEDIUM_YES_COUNT:
         return 0.5
     return 0.0
 
@@ -0,0 +1,115 @@
+"""Пайплайн Arbiter: все конфликты сделки → один пакетный промпт → решения по фасетам."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+
+from backend.config.frameworks import LetterConfig
+from backend.domain.conflicts import FacetCandidate, FacetConflict
+from backend.domain.entities import Fact
+from backend.pipelines.extract_llm import ExtractSource
+from backend.ports.llm_client import LLMRequest, LLMResponseInvalid
+from backend.prompts.renderer import PromptRenderer
+from backend.schemas.facts import ExtractedFactItem
+from backend.schemas.reasoner import ArbiterBatchResponse, ArbiterResolution
+
+
+def candidates_from_items(items: Sequence[ExtractedFactItem]) -> list[FacetCandidate]:
+    """Превратить элементы Extract в кандидатов; id — позиция элемента в ответе."""
+
+    return [
+        FacetCandidate(
+            id=f"c{index}",
+            letter=item.letter,
+            facet=item.facet,
+            value=item.value,
+            confidence=item.confidence,
+            source=item.source,
+            evidence=item.evidence,
+            ts=item.ts,
+        )
+        for index, item in enumerate(items)
+    ]
+
+
+def candidates_from_facts(
+    facts: Sequence[Fact],
+    letters: Mapping[str, LetterConfig],
+    facets: set[tuple[str, str]],
+) -> list[FacetCandidate]:
+    """Сохранённые фасеты (letter, facet) из facets как кандидаты с id вида s<n>.
+
+    Так новое значение фасета спорит с уже известным, а не молча его перезаписывает.
+    """
+
+    candidates: list[FacetCandidate] = []
+    for fact in facts:
+        letter = letters.get(fact.kind)
+        stored = fact.payload.get("facets", {})
+        if letter is None or not isinstance(stored, Mapping):
+            continue
+        for facet, entry in stored.items():
+            if (letter.key, facet) not in facets or not isinstance(entry, Mapping):
+                continue
+            candidates.append(
+                FacetCandidate(
+                    id=f"s{len(candidates)}",
+                    letter=letter.key,
+                    facet=facet,
+                    value=entry.get("value"),
+                    confidence=float(entry.get("confidence") or 0.0),
+                    source=str(entry.get("source") or fact.source),
+                    evidence=str(entry.get("evidence") or ""),
+                    ts=entry.get("ts"),
+                )
+            )
+    return candidates
+
+
+def build_arbiter_batch_request(
+    renderer: PromptRenderer,
+    conflicts: Sequence[FacetConflict],
+    source: ExtractSource,
+    deal_id: str,
+    framework: str,
+) -> LLMRequest:
+    """Отрендерить один промпт на все конфликты; контекст сделки передаётся один раз."""
+
+    prompt = renderer.render(
+        "arbiter_batch",
+        framework=framework,
+        conflicts=list(conflicts),
+        crm=dict(source.crm),
+        chat_list=[dict(turn) for turn in source.chat_list],
+        chat_map={},
+        free_text=source.free_text,
+    )
+    return LLMRequest(
+        task="arbiter",
+        system=prompt.system,
+        user=prompt.user,
+        deal_id=deal_id,
+        framework=framework,
+    )
+
+
+def parse_arbiter_batch_response(renderer: PromptRenderer, text: str) -> list[ArbiterResolution]:
+    """Разобрать JSON-ответ и провалидировать его по schema.arbiter_batch.json."""
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise LLMResponseInvalid(f"Ответ Arbiter не является JSON: {exc}") from exc
+    error = next(iter(renderer.validator("arbiter_batch").iter_errors(data)), None)
+    if error is not None:
+        raise LLMResponseInvalid(f"Ответ Arbiter не прошёл схему: {error.message}")
+    return ArbiterBatchResponse.model_validate(data).resolutions
+
+
+__all__ = [
+    "build_arbiter_batch_request",
+    "candidates_from_facts",
+    "candidates_from_items",
+    "parse_arbiter_batch_response",
+]
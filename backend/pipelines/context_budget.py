@@ -0,0 +1,149 @@
+"""Бюджет контекста промпта: детерминированный отбор чата/CRM и учёт размера промптов."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.token_estimator import TokenEstimator
+from backend.ports.llm_client import LLMClientPort, LLMRequest, LLMResponse
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+# Токены на CRM + переписку (без системного промпта и фактов) по имени модели.
+DEFAULT_CONTEXT_BUDGETS: dict[str, int] = {
+    "default": 3000,
+    "GigaChat": 6000,
+    "GigaChat-Pro": 12000,
+}
+MIN_RELEVANT_TERM_LENGTH = 8
+
+
+@dataclass(frozen=True, slots=True)
+class ContextBudgetReport:
+    """Итог отбора: сколько ходов чата и полей CRM осталось и их оценка в токенах."""
+
+    budget: int
+    chat_turns: tuple[int, int]
+    crm_fields: tuple[int, int]
+    tokens: int
+
+
+class ContextBudgeter:
+    """Подрезает CRM и переписку под бюджет модели и пишет размер промптов в метрики.
+
+    Отбор детерминирован: одинаковый вход даёт одинаковый промпт (кэш промптов
+    провайдера продолжает попадать). Последние recent_turns ходов берутся всегда,
+    затем — ходы, цитируемые в evidence, затем остальные от новых к старым.
+    Отобранные ходы идут в исходном хронологическом порядке.
+    """
+
+    def __init__(
+        self,
+        model: str = "default",
+        budgets: Mapping[str, int] = DEFAULT_CONTEXT_BUDGETS,
+        estimator: TokenEstimator | None = None,
+        metrics: MetricsPort | None = None,
+        crm_share: float = 0.3,
+        recent_turns: int = 4,
+    ) -> None:
+        self._model = model
+        self._budget = budgets.get(model, budgets["default"])
+        self._estimator = estimator or TokenEstimator()
+        self._metrics = metrics or NullMetrics()
+        self._crm_share = crm_share
+        self._recent_turns = recent_turns
+
+    def fit(
+        self,
+        source: ExtractSource,
+        task: str,
+        evidence: Sequence[str] = (),
+    ) -> tuple[ExtractSource, ContextBudgetReport]:
+        """Вернуть источник, умещающийся в бюджет модели, и отчёт об отборе."""
+
+        crm, crm_tokens = self._fit_crm(source.crm, int(self._budget * self._crm_share))
+        chat, chat_tokens = self._fit_chat(source.chat_list, self._budget - crm_tokens, evidence)
+        report = ContextBudgetReport(
+            budget=self._budget,
+            chat_turns=(len(chat), len(source.chat_list)),
+            crm_fields=(len(crm), len(source.crm)),
+            tokens=crm_tokens + chat_tokens,
+        )
+        dropped = len(source.chat_list) - len(chat)
+        if dropped:
+            self._metrics.inc("llm_context_chat_turns_dropped_total", dropped, task=task)
+        self._metrics.observe("llm_context_tokens", report.tokens, task=task, model=self._model)
+        return replace(source, crm=crm, chat_list=tuple(chat)), report
+
+    def measure(self, request: LLMRequest) -> int:
+        """Оценить размер отрендеренного промпта и записать его в метрику вызова."""
+
+        tokens = self._estimator.estimate(request.system) + self._estimator.estimate(request.user)
+        self._metrics.observe("llm_prompt_tokens", tokens, task=request.task, model=self._model)
+        return tokens
+
+    def measuring(self, client: LLMClientPort) -> LLMClientPort:
+        """Обернуть клиента так, чтобы размер каждого промпта попадал в метрики."""
+
+        return PromptSizeReporter(client, self)
+
+    def _fit_crm(self, crm: Mapping[str, Any], limit: int) -> tuple[dict[str, Any], int]:
+        kept: dict[str, Any] = {}
+        used = 0
+        for key, value in crm.items():
+            cost = self._estimator.estimate(f"{key}: {json.dumps(value, ensure_ascii=False)}")
+            if used + cost <= limit:
+                kept[key] = value
+                used += cost
+        return kept, used
+
+    def _fit_chat(
+        self,
+        turns: Sequence[Mapping[str, Any]],
+        limit: int,
+        evidence: Sequence[str],
+    ) -> tuple[list[Mapping[str, Any]], int]:
+        costs = [self._estimator.estimate(f"{t.get('role')}: {t.get('text')}") for t in turns]
+        terms = [term for term in evidence if len(term) >= MIN_RELEVANT_TERM_LENGTH]
+        newest_first = range(len(turns) - 1, -1, -1)
+        recent = set(newest_first[: self._recent_turns])
+
+        def priority(index: int) -> tuple[int, int]:
+            text = str(turns[index].get("text", ""))
+            relevant = any(term in text for term in terms)
+            return (0 if index in recent else 1 if relevant else 2), -index
+
+        chosen: set[int] = set()
+        used = 0
+        for index in sorted(newest_first, key=priority):
+            if used + costs[index] <= limit:
+                chosen.add(index)
+                used += costs[index]
+        return [turns[index] for index in sorted(chosen)], used
+
+
+class PromptSizeReporter(LLMClientPort):
+    """Декоратор LLM-клиента: перед вызовом оценивает промпт через ContextBudgeter."""
+
+    def __init__(self, client: LLMClientPort, budgeter: ContextBudgeter) -> None:
+        self._client = client
+        self._budgeter = budgeter
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Записать размер промпта и передать вызов клиенту."""
+
+        self._budgeter.measure(request)
+        return self._client.complete(request)
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Записать размер промпта и отдать поток клиента (или ответ целиком)."""
+
+        self._budgeter.measure(request)
+        stream = getattr(self._client, "stream", None)
+        if callable(stream):
+            yield from stream(request)
+        else:
+            yield self._client.complete(request).text
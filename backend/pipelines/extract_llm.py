@@ -1,2 +1,141 @@
-# Пайплайн извлечения: рендер промпта → вызов LLM.extract → валидация результата
+"""Пайплайн извлечения: рендер промпта → вызов LLM → валидация → факты по фреймворкам."""
 
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterator
+
+from backend.config.frameworks import FrameworkConfig
+from backend.domain.entities import Fact
+from backend.pipelines.fact_builder import facts_from_items
+from backend.pipelines.json_stream import iter_json_array
+from backend.ports.llm_client import (
+    LLMClientPort,
+    LLMRequest,
+    LLMResponseInvalid,
+    LLMStreamingClientPort,
+)
+from backend.prompts.renderer import PromptRenderer
+from backend.schemas.facts import ExtractedFactItem
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractSource:
+    """Входные данные события для Extract: CRM-снимок, переписка и свободный текст."""
+
+    crm: Mapping[str, Any]
+    chat_list: Sequence[Mapping[str, Any]] = field(default_factory=tuple)
+    free_text: str = ""
+
+
+def build_extract_request(
+    renderer: PromptRenderer,
+    frameworks: Sequence[FrameworkConfig],
+    source: ExtractSource,
+    deal_id: str,
+) -> LLMRequest:
+    """Отрендерить один промпт на объединение букв всех переданных фреймворков."""
+
+    letters = [
+        {
+            "framework": framework.id,
+            "key": letter.key,
+            "title": letter.title,
+            "checklist": list(letter.checklist),
+        }
+        for framework in frameworks
+        for letter in framework.letters
+    ]
+    prompt = renderer.render(
+        "extract",
+        framework=" + ".join(framework.name for framework in frameworks),
+        crm=dict(source.crm),
+        chat_list=[dict(turn) for turn in source.chat_list],
+        chat_map={},
+        free_text=source.free_text,
+        framework_letters=letters,
+        multi_framework=len(frameworks) > 1,
+    )
+    return LLMRequest(
+        task="extract",
+        system=prompt.system,
+        user=prompt.user,
+        deal_id=deal_id,
+        framework="+".join(framework.id for framework in frameworks),
+    )
+
+
+def parse_extract_response(renderer: PromptRenderer, text: str) -> list[ExtractedFactItem]:
+    """Разобрать JSON-массив ответа и провалидировать его по schema.extract.json."""
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise LLMResponseInvalid(f"Ответ Extract не является JSON: {exc}") from exc
+    error = next(iter(renderer.validator("extract").iter_errors(data)), None)
+    if error is not None:
+        raise LLMResponseInvalid(f"Ответ Extract не прошёл схему: {error.message}")
+    return [ExtractedFactItem.model_validate(item) for item in data]
+
+
+def extract_items(
+    llm: LLMClientPort,
+    renderer: PromptRenderer,
+    frameworks: Sequence[FrameworkConfig],
+    source: ExtractSource,
+    deal_id: str,
+) -> list[ExtractedFactItem]:
+    """Выполнить один вызов Extract и вернуть провалидированные элементы ответа."""
+
+    request = build_extract_request(renderer, frameworks, source, deal_id)
+    response = llm.complete(request)
+    return parse_extract_response(renderer, response.text)
+
+
+def stream_extract_items(
+    llm: LLMStreamingClientPort,
+    renderer: PromptRenderer,
+    frameworks: Sequence[FrameworkConfig],
+    source: ExtractSource,
+    deal_id: str,
+) -> Iterator[ExtractedFactItem]:
+    """Потоковый Extract: отдавать элементы по мере закрытия их JSON-объектов.
+
+    Каждый элемент валидируется схемой элемента отдельно; ошибка в элементе
+    прерывает поток, но уже отданные элементы остаются у вызывающего.
+    """
+
+    request = build_extract_request(renderer, frameworks, source, deal_id)
+    validator = renderer.item_validator("extract")
+    for data in iter_json_array(llm.stream(request)):
+        error = next(iter(validator.iter_errors(data)), None)
+        if error is not None:
+            raise LLMResponseInvalid(f"Элемент Extract не прошёл схему: {error.message}")
+        yield ExtractedFactItem.model_validate(data)
+
+
+def run_extract(
+    llm: LLMClientPort,
+    renderer: PromptRenderer,
+    frameworks: Sequence[FrameworkConfig],
+    source: ExtractSource,
+    deal_id: str,
+    observed_at: datetime,
+) -> list[Fact]:
+    """Выполнить один вызов Extract и вернуть факты, разложенные по фреймворкам."""
+
+    items = extract_items(llm, renderer, frameworks, source, deal_id)
+    return facts_from_items(items, frameworks, deal_id, observed_at)
+
+
+__all__ = [
+    "ExtractSource",
+    "build_extract_request",
+    "extract_items",
+    "parse_extract_response",
+    "run_extract",
+    "stream_extract_items",
+]
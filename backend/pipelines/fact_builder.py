@@ -0,0 +1,105 @@
+"""Сборка доменных фактов из элементов ответа Extract: один факт на букву фреймворка."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from backend.config.frameworks import FrameworkConfig, LetterConfig
+from backend.domain.entities import Fact
+from backend.schemas.facts import ExtractedFactItem
+
+EXTRACT_SOURCE = "extract"
+
+
+def facts_from_items(
+    items: Sequence[ExtractedFactItem],
+    frameworks: Sequence[FrameworkConfig],
+    deal_id: str,
+    observed_at: datetime,
+) -> list[Fact]:
+    """Разложить элементы по видам bant.*/med2ic3.* и собрать факты по буквам.
+
+    Фреймворк элемента берётся из поля framework, а при его отсутствии — по букве
+    (буквы BANT и MED2IC3 не пересекаются). Элементы чужих фреймворков отбрасываются.
+    Из нескольких значений одного фасета остаётся самое уверенное (как pick_best).
+    """
+
+    letters = _letter_index(frameworks)
+    owners: dict[str, str] = {}
+    for framework_id, letter_key in letters:
+        owners.setdefault(letter_key, framework_id)
+    best: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+    for item in items:
+        key = (item.framework or owners.get(item.letter, ""), item.letter)
+        if key not in letters:
+            continue
+        facets, entry = best.setdefault(key, {}), _facet_entry(item)
+        current = facets.get(item.facet)
+        if current is None or facet_rank(entry) > facet_rank(current):
+            facets[item.facet] = entry
+    return [
+        build_letter_fact(deal_id, letters[key], facets, observed_at)
+        for key, facets in best.items()
+    ]
+
+
+def build_letter_fact(
+    deal_id: str,
+    letter: LetterConfig,
+    facets: Mapping[str, Mapping[str, Any]],
+    observed_at: datetime,
+    source: str | None = EXTRACT_SOURCE,
+) -> Fact:
+    """Построить факт буквы: фасеты + чек-лист, уверенность — максимум по фасетам."""
+
+    checklist = {
+        key: _is_confirmed(facets[key].get("value")) for key in letter.checklist if key in facets
+    }
+    confidences = [float(entry.get("confidence") or 0.0) for entry in facets.values()]
+    facets_payload = {name: dict(entry) for name, entry in facets.items()}
+    return Fact(
+        deal_id=deal_id,
+        kind=letter.fact_kind,
+        payload={"facets": facets_payload, "checklist": checklist},
+        confidence=max(confidences) if confidences else None,
+        observed_at=observed_at,
+        source=source,
+    )
+
+
+def letters_by_kind(frameworks: Sequence[FrameworkConfig]) -> dict[str, LetterConfig]:
+    """Индекс конфигураций букв по fact_kind."""
+
+    return {letter.fact_kind: letter for framework in frameworks for letter in framework.letters}
+
+
+def facet_rank(entry: Mapping[str, Any]) -> tuple[float, str]:
+    """Порядок выбора значения фасета: уверенность, затем более поздний ts."""
+
+    return float(entry.get("confidence") or 0.0), str(entry.get("ts") or "")
+
+
+def _letter_index(
+    frameworks: Sequence[FrameworkConfig],
+) -> dict[tuple[str, str], LetterConfig]:
+    return {
+        (framework.id, letter.key): letter
+        for framework in frameworks
+        for letter in framework.letters
+    }
+
+
+def _facet_entry(item: ExtractedFactItem) -> dict[str, Any]:
+    return {
+        "value": item.value,
+        "confidence": item.confidence,
+        "source": item.source,
+        "evidence": item.evidence,
+        "ts": item.ts,
+    }
+
+
+def _is_confirmed(value: Any) -> bool:
+    return value not in (None, False, "", [], {})
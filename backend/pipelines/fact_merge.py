@@ -0,0 +1,61 @@
+"""Слияние новых фактов Extract с сохранёнными фактами тех же букв."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+from backend.config.frameworks import LetterConfig
+from backend.domain.entities import Fact
+from backend.pipelines.fact_builder import build_letter_fact, facet_rank
+
+
+def merge_with_existing(
+    new: Fact, existing: Fact | None, letter: LetterConfig, keep_best: bool = False
+) -> Fact:
+    """Объединить фасеты нового факта с ранее сохранённым фактом той же буквы.
+
+    Новый фасет заменяет сохранённый; с keep_best сохранённый остаётся, если он
+    увереннее (facet_rank — то же правило, что и внутри одного ответа Extract).
+    """
+
+    if existing is None:
+        return new
+    facets = dict(_facets_of(existing))
+    for name, entry in _facets_of(new).items():
+        if not keep_best or name not in facets or facet_rank(entry) > facet_rank(facets[name]):
+            facets[name] = entry
+    return build_letter_fact(new.deal_id, letter, facets, new.observed_at, new.source)
+
+
+def merge_facts(
+    extracted: Sequence[Fact],
+    stored: Sequence[Fact],
+    letters: Mapping[str, LetterConfig],
+    rejected: Collection[tuple[str, str]] = (),
+) -> list[Fact]:
+    """Слить новые факты с сохранёнными; фасеты rejected удаляются и из сохранённых.
+
+    rejected — (letter, facet), где Арбитр отверг всех кандидатов (reject_all).
+    """
+
+    existing = {fact.kind: fact for fact in stored if fact.kind in letters}
+    cleared: dict[str, Fact] = {}
+    for kind, fact in existing.items():
+        letter, facets = letters[kind], _facets_of(fact)
+        kept = {name: entry for name, entry in facets.items() if (letter.key, name) not in rejected}
+        if len(kept) < len(facets):
+            cleared[kind] = build_letter_fact(
+                fact.deal_id, letter, kept, fact.observed_at, fact.source
+            )
+    existing.update(cleared)
+    merged = {
+        fact.kind: merge_with_existing(fact, existing.get(fact.kind), letters[fact.kind])
+        for fact in extracted
+    }
+    return [*merged.values(), *(fact for kind, fact in cleared.items() if kind not in merged)]
+
+
+def _facets_of(fact: Fact) -> Mapping[str, Mapping[str, Any]]:
+    facets = fact.payload.get("facets", {})
+    return facets if isinstance(facets, Mapping) else {}
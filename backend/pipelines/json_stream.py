@@ -0,0 +1,111 @@
+"""Инкрементальный разбор JSON-массива объектов из потока фрагментов ответа LLM."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from backend.ports.llm_client import LLMResponseInvalid
+
+
+class JsonArrayStream:
+    """Отдаёт элементы верхнеуровневого массива, как только закрывается их объект.
+
+    Разбор посимвольный: учитываются вложенность и строки с экранированием, поэтому
+    скобки внутри значений не ломают границы элементов. Сам элемент декодируется
+    json.loads целиком, когда его фигурная скобка закрылась. Между элементами
+    ожидается ровно одна запятая: пропущенные, лишние и висячие запятые — ошибка.
+    """
+
+    def __init__(self) -> None:
+        self._element: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._closed = False
+        # first — сразу после «[», value — после запятой, comma — после элемента.
+        self._expect = "first"
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Принять очередной фрагмент и вернуть элементы, завершённые в нём."""
+
+        completed: list[Any] = []
+        for char in chunk:
+            if self._in_string:
+                self._string_char(char)
+            elif self._depth:
+                self._nested_char(char, completed)
+            else:
+                self._top_level_char(char)
+        return completed
+
+    def close(self) -> None:
+        """Проверить, что поток завершился закрытием массива."""
+
+        if not self._closed:
+            raise LLMResponseInvalid("Поток ответа оборвался до закрытия JSON-массива")
+
+    def _string_char(self, char: str) -> None:
+        self._element.append(char)
+        if self._escape:
+            self._escape = False
+        elif char == "\\":
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+
+    def _nested_char(self, char: str, completed: list[Any]) -> None:
+        self._element.append(char)
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if not self._depth:
+                completed.append(self._decode())
+                self._expect = "comma"
+
+    def _top_level_char(self, char: str) -> None:
+        if char.isspace():
+            return
+        if self._closed:
+            raise LLMResponseInvalid("Лишние данные после закрытия JSON-массива")
+        if not self._started:
+            if char != "[":
+                raise LLMResponseInvalid("Ответ не является JSON-массивом")
+            self._started = True
+        elif char == "]":
+            if self._expect == "value":
+                raise LLMResponseInvalid("Висячая запятая перед закрытием JSON-массива")
+            self._closed = True
+        elif char == "{":
+            if self._expect == "comma":
+                raise LLMResponseInvalid("Пропущена запятая между элементами JSON-массива")
+            self._element.append(char)
+            self._depth = 1
+        elif char == ",":
+            if self._expect != "comma":
+                raise LLMResponseInvalid("Лишняя запятая в JSON-массиве")
+            self._expect = "value"
+        else:
+            raise LLMResponseInvalid("Элементы JSON-массива должны быть объектами")
+
+    def _decode(self) -> Any:
+        text = "".join(self._element)
+        self._element.clear()
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise LLMResponseInvalid(f"Элемент потока не является JSON: {exc}") from exc
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Превратить поток фрагментов в поток элементов массива."""
+
+    parser = JsonArrayStream()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
@@ -1,2 +1,149 @@
-# Пайплайн рассуждения: вызовы reasoner/arbiter через LLM + валидация ответов
+"""Пайплайн рассуждения: полный или инкрементальный промпт Reasoner + валидация ответа."""
 
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from backend.config.frameworks import FrameworkConfig
+from backend.domain.entities import DealReadModel, Fact, Reasoning
+from backend.domain.reasoning import (
+    FACET_KEY_SEPARATOR,
+    FactsDelta,
+    facet_entries,
+    primary_framework,
+)
+from backend.pipelines.extract_llm import ExtractSource
+from backend.ports.llm_client import LLMRequest, LLMResponseInvalid
+from backend.prompts.renderer import PromptRenderer, RenderedPrompt
+
+
+@dataclass(frozen=True, slots=True)
+class ReasonerInput:
+    """Состояние сделки на входе Reasoner: read-model, факты и контекст события."""
+
+    model: DealReadModel
+    facts: Sequence[Fact]
+    source: ExtractSource
+    deal: Mapping[str, Any]
+    allow_manager_question: bool = False
+
+
+def build_reasoner_request(renderer: PromptRenderer, data: ReasonerInput) -> LLMRequest:
+    """Полный промпт: все факты выбранного фреймворка, CRM и переписка."""
+
+    framework = primary_framework(data.model)
+    summary = data.model.letters.get(framework.id, {})
+    prompt = renderer.render(
+        "reasoner",
+        framework=framework.name,
+        deal=dict(data.deal, id=data.model.deal_id),
+        decision=_decision(data.model, summary),
+        completeness={
+            "per_letter": summary.get("per_letter", {}),
+            "yes_counts": summary.get("yes_counts", {}),
+        },
+        letters=[{"key": letter.key, "title": letter.title} for letter in framework.letters],
+        facts_by_letter=_facts_by_letter(data.facts, framework),
+        crm=dict(data.source.crm),
+        chat_list=[dict(turn) for turn in data.source.chat_list],
+        chat_map={},
+        free_text=data.source.free_text,
+        allow_manager_question=data.allow_manager_question,
+    )
+    return _request(prompt, data.model.deal_id, framework.id)
+
+
+def build_reasoner_delta_request(
+    renderer: PromptRenderer,
+    data: ReasonerInput,
+    previous: Reasoning,
+    delta: FactsDelta,
+) -> LLMRequest:
+    """Компактный промпт: дифф фасетов, переход статуса и прошлые decision/why."""
+
+    framework = primary_framework(data.model)
+    entries = facet_entries(data.facts)
+    changed = {key: "new" for key in delta.added} | {key: "changed" for key in delta.changed}
+    prompt = renderer.render(
+        "reasoner_delta",
+        framework=framework.name,
+        deal={"id": data.model.deal_id},
+        transition={
+            "status_before": previous.status,
+            "status_after": data.model.status,
+            "score_before": _format_score(previous.score),
+            "score_after": _format_score(data.model.score),
+        },
+        previous=previous.result,
+        changed_facts=[
+            dict(_facet_view(key, entries[key]), change=change) for key, change in changed.items()
+        ],
+        removed_facets=list(delta.removed),
+        free_text=data.source.free_text,
+        allow_manager_question=data.allow_manager_question,
+    )
+    return _request(prompt, data.model.deal_id, framework.id)
+
+
+def parse_reasoner_response(renderer: PromptRenderer, text: str) -> dict[str, Any]:
+    """Разобрать JSON-ответ и провалидировать его по schema.reasoner.json."""
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise LLMResponseInvalid(f"Ответ Reasoner не является JSON: {exc}") from exc
+    error = next(iter(renderer.validator("reasoner").iter_errors(data)), None)
+    if error is not None:
+        raise LLMResponseInvalid(f"Ответ Reasoner не прошёл схему: {error.message}")
+    return data
+
+
+def _request(prompt: RenderedPrompt, deal_id: str, framework_id: str) -> LLMRequest:
+    return LLMRequest("reasoner", prompt.system, prompt.user, deal_id, framework_id)
+
+
+def _decision(model: DealReadModel, summary: Mapping[str, Any]) -> dict[str, Any]:
+    failed = [name for name, ok in summary.get("gate_checks", {}).items() if not ok]
+    reason = f"Не пройдены ворота: {', '.join(failed)}" if failed else "Ворота пройдены"
+    return {"status": model.status, "score": model.score or 0.0, "reason": reason}
+
+
+def _facts_by_letter(
+    facts: Sequence[Fact],
+    framework: FrameworkConfig,
+) -> dict[str, list[dict[str, Any]]]:
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    prefix = f"{framework.id}."
+    for key, entry in facet_entries(facts).items():
+        if key.startswith(prefix):
+            view = _facet_view(key, entry)
+            grouped.setdefault(view["letter"], []).append(view)
+    return grouped
+
+
+def _facet_view(key: str, entry: Mapping[str, Any]) -> dict[str, Any]:
+    kind, _, facet = key.partition(FACET_KEY_SEPARATOR)
+    return {
+        "letter": kind.rpartition(".")[2],
+        "facet": facet or kind,
+        "value": entry.get("value"),
+        "source": entry.get("source"),
+        "evidence": entry.get("evidence"),
+        "confidence": float(entry.get("confidence") or 0.0),
+        "ts": entry.get("ts"),
+    }
+
+
+def _format_score(score: float | None) -> str:
+    return "n/a" if score is None else f"{score:.3f}"
+
+
+__all__ = [
+    "ReasonerInput",
+    "build_reasoner_delta_request",
+    "build_reasoner_request",
+    "parse_reasoner_response",
+]
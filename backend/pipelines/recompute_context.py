@@ -0,0 +1,37 @@
+"""Типизированные контексты шагов пересчёта read-model."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+from backend.config.frameworks import FrameworkConfig
+from backend.domain.entities import Fact
+from backend.domain.value_objects import FrameworkCompleteness, GateDecision
+
+
+class RecomputeInput(BaseModel):
+    """Входные данные пайплайна пересчёта."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    deal_id: str
+    facts: list[Fact]
+    frameworks: list[FrameworkConfig]
+
+
+class ResolveContext(RecomputeInput):
+    """Контекст после шага resolve."""
+
+    resolved: dict[str, Fact]
+
+
+class CompletenessContext(ResolveContext):
+    """Контекст после вычисления completeness."""
+
+    completeness: dict[str, FrameworkCompleteness]
+
+
+class GatesContext(CompletenessContext):
+    """Контекст после применения ворот."""
+
+    gates: dict[str, GateDecision]
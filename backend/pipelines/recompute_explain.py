@@ -0,0 +1,99 @@
+"""Режим explain: почему пересчёт дал такой статус по каждому фреймворку."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from backend.domain.entities import Fact
+from backend.domain.rules import evaluate_gates
+from backend.pipelines.recompute_context import GatesContext, RecomputeInput
+from backend.pipelines.recompute_steps import RECOMPUTE_STEPS
+from backend.pipelines.step_registry import StepTiming
+
+
+@dataclass(frozen=True, slots=True)
+class LetterExplanation:
+    """Буква фреймворка: выбранный resolve факт и число «да» по его чек-листу."""
+
+    letter: str
+    fact_kind: str
+    fact: Fact | None
+    yes_count: int
+    completeness: float
+
+
+@dataclass(frozen=True, slots=True)
+class GateExplanation:
+    """Проверенные ворота: пройдены ли и какие проверки не выполнены."""
+
+    status: str
+    passed: bool
+    failed_checks: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FrameworkExplanation:
+    """Итог фреймворка, буквы и ворота в порядке проверки (последние — итоговые)."""
+
+    framework_id: str
+    name: str
+    status: str
+    score: float
+    letters: tuple[LetterExplanation, ...]
+    gates: tuple[GateExplanation, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RecomputeExplanation:
+    """Разбор пересчёта сделки по фреймворкам с замерами шагов."""
+
+    deal_id: str
+    frameworks: tuple[FrameworkExplanation, ...]
+    steps: tuple[StepTiming, ...]
+
+
+def explain_recompute(ctx: RecomputeInput) -> RecomputeExplanation:
+    """Прогнать шаги до gates включительно и собрать объяснение.
+
+    Метрики шагов не пишутся, чтобы запросы explain не смешивались с
+    реальными пересчётами; сама read-model не собирается и не сохраняется.
+    """
+
+    trace: list[StepTiming] = []
+    gates_ctx: GatesContext = RECOMPUTE_STEPS.run(ctx, stop_after="gates", trace=trace)
+    frameworks = tuple(
+        _explain_framework(gates_ctx, framework.id)
+        for framework in sorted(gates_ctx.frameworks, key=lambda item: item.priority)
+    )
+    return RecomputeExplanation(deal_id=ctx.deal_id, frameworks=frameworks, steps=tuple(trace))
+
+
+def _explain_framework(ctx: GatesContext, framework_id: str) -> FrameworkExplanation:
+    framework = next(item for item in ctx.frameworks if item.id == framework_id)
+    completeness = ctx.completeness[framework_id]
+    decision = ctx.gates[framework_id]
+    letters = tuple(
+        LetterExplanation(
+            letter=letter.key,
+            fact_kind=letter.fact_kind,
+            fact=ctx.resolved.get(letter.fact_kind),
+            yes_count=completeness.yes_counts.get(letter.key, 0),
+            completeness=completeness.per_letter.get(letter.key, 0.0),
+        )
+        for letter in framework.letters
+    )
+    return FrameworkExplanation(
+        framework_id=framework.id,
+        name=framework.name,
+        status=decision.status,
+        score=completeness.score,
+        letters=letters,
+        gates=tuple(
+            GateExplanation(
+                status=gate.status,
+                passed=all(gate.checks.values()),
+                failed_checks=tuple(check for check, ok in gate.checks.items() if not ok),
+            )
+            for gate in evaluate_gates(completeness, framework)
+        ),
+    )
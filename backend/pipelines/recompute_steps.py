@@ -5,40 +5,24 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Iterable
 
-from pydantic import BaseModel, ConfigDict
-
-from backend.config.frameworks import FrameworkConfig
+from backend.domain.derivation import with_derived_facts
 from backend.domain.entities import DealReadModel, Fact
 from backend.domain.rules import apply_gates, calc_completeness, resolve_conflicts
-from backend.domain.value_objects import FrameworkCompleteness, GateDecision
-
-
-class RecomputeInput(BaseModel):
-    """Входные данные пайплайна пересчёта."""
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    deal_id: str
-    facts: list[Fact]
-    frameworks: list[FrameworkConfig]
-
-
-class ResolveContext(RecomputeInput):
-    """Контекст после шага resolve."""
+from backend.pipelines.recompute_context import (
+    CompletenessContext,
+    GatesContext,
+    RecomputeInput,
+    ResolveContext,
+)
+from backend.pipelines.step_registry import StepRegistry
+from backend.ports.metrics import MetricsPort
 
-    resolved: dict[str, Fact]
 
+def derive_step(ctx: RecomputeInput) -> RecomputeInput:
+    """Дополнить факты производными (карта derive_from) перед resolve."""
 
-class CompletenessContext(ResolveContext):
-    """Контекст после вычисления completeness."""
-
-    completeness: dict[str, FrameworkCompleteness]
-
-
-class GatesContext(CompletenessContext):
-    """Контекст после применения ворот."""
-
-    gates: dict[str, GateDecision]
+    facts = with_derived_facts(ctx.facts, ctx.frameworks)
+    return RecomputeInput(deal_id=ctx.deal_id, facts=facts, frameworks=ctx.frameworks)
 
 
 def resolve_step(ctx: RecomputeInput) -> ResolveContext:
@@ -116,13 +100,21 @@ def assemble_read_model_step(ctx: GatesContext) -> DealReadModel:
     )
 
 
-def recompute_read_model(ctx: RecomputeInput) -> DealReadModel:
-    """Полностью выполнить пайплайн пересчёта."""
+RECOMPUTE_STEPS = StepRegistry("recompute")
+RECOMPUTE_STEPS.register("derive", derive_step)
+RECOMPUTE_STEPS.register("resolve", resolve_step)
+RECOMPUTE_STEPS.register("completeness", completeness_step)
+RECOMPUTE_STEPS.register("gates", gates_step)
+RECOMPUTE_STEPS.register("assemble", assemble_read_model_step)
+
+
+def recompute_read_model(
+    ctx: RecomputeInput,
+    metrics: MetricsPort | None = None,
+) -> DealReadModel:
+    """Полностью выполнить пайплайн пересчёта, замеряя каждый шаг (recompute_step_*)."""
 
-    resolved_ctx = resolve_step(ctx)
-    completeness_ctx = completeness_step(resolved_ctx)
-    gates_ctx = gates_step(completeness_ctx)
-    return assemble_read_model_step(gates_ctx)
+    return RECOMPUTE_STEPS.run(ctx, metrics)
 
 
 def _max_observed(facts: Iterable[Fact]) -> datetime | None:
@@ -131,7 +123,9 @@ def _max_observed(facts: Iterable[Fact]) -> datetime | None:
 
 
 __all__ = [
+    "RECOMPUTE_STEPS",
     "RecomputeInput",
+    "derive_step",
     "resolve_step",
     "completeness_step",
     "gates_step",
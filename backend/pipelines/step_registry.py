@@ -0,0 +1,77 @@
+"""Реестр шагов пайплайна: замер времени и аллокаций каждого шага."""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from backend.ports.metrics import MetricsPort, NullMetrics
+
+Step = Callable[[Any], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class StepTiming:
+    """Замер одного выполнения шага."""
+
+    step: str
+    seconds: float
+    allocated_blocks: int
+
+
+class StepRegistry:
+    """Упорядоченный набор именованных шагов; выход шага — вход следующего.
+
+    Каждый шаг оборачивается замером: {prefix}_step_seconds{step} (гистограмма)
+    и {prefix}_step_allocated_blocks_total{step} — прирост числа живых блоков
+    аллокатора за шаг (sys.getallocatedblocks, ~0.3 мкс), т.е. сколько объектов
+    шаг оставил после себя. tracemalloc не используется: он замедляет весь процесс.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._steps: list[tuple[str, Step]] = []
+
+    def register(self, name: str, step: Step) -> Step:
+        """Добавить шаг в конец пайплайна."""
+
+        if name in self.names:
+            raise ValueError(f"Шаг {name} уже зарегистрирован")
+        self._steps.append((name, step))
+        return step
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Имена шагов в порядке выполнения."""
+
+        return tuple(name for name, _ in self._steps)
+
+    def run(
+        self,
+        ctx: Any,
+        metrics: MetricsPort | None = None,
+        stop_after: str | None = None,
+        trace: list[StepTiming] | None = None,
+    ) -> Any:
+        """Выполнить шаги по порядку (до stop_after включительно), замеряя каждый.
+
+        Если передан trace, замеры шагов дописываются и в него.
+        """
+
+        if stop_after is not None and stop_after not in self.names:
+            raise KeyError(f"Неизвестный шаг: {stop_after}")
+        metrics = metrics or NullMetrics()
+        for name, step in self._steps:
+            blocks, started = sys.getallocatedblocks(), time.perf_counter()
+            ctx = step(ctx)
+            seconds = time.perf_counter() - started
+            allocated = max(sys.getallocatedblocks() - blocks, 0)
+            metrics.observe(f"{self._prefix}_step_seconds", seconds, step=name)
+            metrics.inc(f"{self._prefix}_step_allocated_blocks_total", allocated, step=name)
+            if trace is not None:
+                trace.append(StepTiming(step=name, seconds=seconds, allocated_blocks=allocated))
+            if name == stop_after:
+                break
+        return ctx
@@ -0,0 +1,48 @@
+"""Оценка числа токенов текста с кэшем по хэшу содержимого."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+
+
+def approx_tokens(text: str) -> int:
+    """Грубая оценка токенов без токенайзера: ~4 символа на токен."""
+
+    return (len(text) + 3) // 4
+
+
+class TokenEstimator:
+    """Оценивает токены текста и кэширует результат по sha1 содержимого (LRU)."""
+
+    def __init__(
+        self,
+        tokenizer: Callable[[str], int] = approx_tokens,
+        max_entries: int = 4096,
+    ) -> None:
+        self._tokenizer = tokenizer
+        self._max_entries = max_entries
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def estimate(self, text: str) -> int:
+        """Вернуть число токенов текста; повторные тексты не токенизируются заново."""
+
+        key = hashlib.sha1(text.encode("utf-8")).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+        tokens = self._tokenizer(text)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = tokens
+            if len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        return tokens
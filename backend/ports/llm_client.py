@@ -1,2 +1,54 @@
-# Интерфейс LLM-клиента: стратегии extract (извлечение фактов), reason (рассуждение), arbitrate (арбитраж)
+"""Порт LLM-клиента: единый вызов для задач extract, reason и arbitrate."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class LLMRequest:
+    """Отрендеренный промпт и метаданные вызова (задача, сделка, фреймворк)."""
+
+    task: str
+    system: str
+    user: str
+    deal_id: str | None = None
+    framework: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResponse:
+    """Сырой текст ответа модели и учёт токенов (cached_tokens — попадания в кэш промпта)."""
+
+    text: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+
+
+class LLMError(RuntimeError):
+    """Базовая ошибка вызова LLM."""
+
+
+class LLMResponseInvalid(LLMError):
+    """Ответ модели не разобран как JSON или не прошёл JSON-схему."""
+
+
+class LLMDeadlineExceeded(LLMError):
+    """Запрос устарел в очереди и был отброшен планировщиком."""
+
+
+class LLMClientPort(Protocol):
+    """Минимальный контракт провайдера: один синхронный вызов completion."""
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Выполнить запрос к модели и вернуть ответ без пост-обработки."""
+
+
+class LLMStreamingClientPort(LLMClientPort, Protocol):
+    """Провайдер с потоковой выдачей: текст ответа приходит фрагментами по мере генерации."""
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Выполнить запрос и отдавать фрагменты текста ответа по мере поступления."""
@@ -0,0 +1,34 @@
+"""Порт метрик: счётчики, гистограммы и gauge с метками."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class MetricsPort(ABC):
+    """Абстракция сбора метрик без привязки к системе экспорта."""
+
+    @abstractmethod
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Увеличить счётчик на value."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Записать наблюдение в гистограмму (латентность, размеры)."""
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Установить текущее значение gauge (глубина очереди и т.п.)."""
+
+
+class NullMetrics(MetricsPort):
+    """Пустая реализация по умолчанию: компоненты не проверяют наличие метрик."""
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        return None
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        return None
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        return None
@@ -0,0 +1,33 @@
+"""Порт уведомлений об изменении read-model после успешного коммита."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from backend.domain.entities import DealReadModel
+
+
+class StateNotifierPort(ABC):
+    """Получатель новых состояний сделок: SSE-подписки, кэши, фоновые задачи."""
+
+    @abstractmethod
+    def publish(self, model: DealReadModel) -> None:
+        """Сообщить о новом состоянии; вызывается из любого потока после commit."""
+
+
+class NullNotifier(StateNotifierPort):
+    """Реализация по умолчанию: уведомления никому не нужны."""
+
+    def publish(self, model: DealReadModel) -> None:
+        return None
+
+
+class CompositeNotifier(StateNotifierPort):
+    """Рассылает состояние нескольким получателям по порядку."""
+
+    def __init__(self, *notifiers: StateNotifierPort) -> None:
+        self._notifiers = notifiers
+
+    def publish(self, model: DealReadModel) -> None:
+        for notifier in self._notifiers:
+            notifier.publish(model)
@@ -0,0 +1,30 @@
+"""Порт очереди фонового пересчёта read-model."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class RecomputeQueuePort(ABC):
+    """Принимает сделки, которым нужен пересчёт; сам пересчёт идёт вне запроса."""
+
+    @abstractmethod
+    def enqueue(self, deal_id: str) -> None:
+        """Запланировать пересчёт сделки; повторы до запуска схлопываются."""
+
+    def depth(self) -> int:
+        """Число сделок, ожидающих пересчёта; 0, если очередь его не отслеживает."""
+
+        return 0
+
+    def shutdown(self, drain: bool = True) -> None:
+        """Остановить очередь при завершении процесса; по умолчанию ничего не делает."""
+
+        return None
+
+
+class NullRecomputeQueue(RecomputeQueuePort):
+    """Реализация по умолчанию: автоматический пересчёт выключен."""
+
+    def enqueue(self, deal_id: str) -> None:
+        return None
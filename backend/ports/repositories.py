@@ -1,10 +1,23 @@
-"""Порты репозиториев для событий и read-model сделок."""
+"""Порты репозиториев событий, фактов, read-model, рассуждений, задач и ключей идемпотентности."""
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol, Sequence
 
-from backend.domain.entities import DealReadModel, Event, Fact
+from backend.domain.entities import (
+    DealReadModel,
+    Event,
+    Fact,
+    IdempotencyRecord,
+    Job,
+    ReadModelStamp,
+    Reasoning,
+)
+
+
+class ReadModelConflict(RuntimeError):
+    """Read-model сделки изменила параллельная транзакция: юзкейс нужно повторить."""
 
 
 class EventRepository(Protocol):
@@ -13,6 +26,9 @@ class EventRepository(Protocol):
     def add(self, event: Event) -> None:
         """Сохранить событие для сделки."""
 
+    def add_many(self, events: Sequence[Event]) -> None:
+        """Сохранить пачку событий одной вставкой."""
+
     def list_for_deal(self, deal_id: str) -> Sequence[Event]:
         """Вернуть все события конкретной сделки в порядке записи."""
 
@@ -39,10 +55,66 @@ class ReadModelRepository(Protocol):
     def get(self, deal_id: str) -> DealReadModel | None:
         """Получить read-model по идентификатору сделки."""
 
+    def get_stamp(self, deal_id: str) -> ReadModelStamp | None:
+        """Получить только версию и updated_at, не загружая содержимое read-model."""
+
+    def get_many(self, deal_ids: Sequence[str]) -> dict[str, DealReadModel]:
+        """Получить read-model нескольких сделок одним запросом (отсутствующих нет в ответе)."""
+
     def save(self, model: DealReadModel) -> None:
-        """Сохранить read-model, делая операцию идемпотентной."""
+        """Сохранить read-model, прочитанную в этой транзакции.
+
+        Если строку после чтения изменила (или создала) другая транзакция,
+        бросает ReadModelConflict вместо перезаписи чужого обновления.
+        """
+
+    def save_many(self, models: Sequence[DealReadModel]) -> None:
+        """Сохранить несколько read-model с той же проверкой, что и save."""
 
     def delete(self, deal_id: str) -> None:
         """Удалить read-model сделки, если она есть."""
 
 
+class ReasoningRepository(Protocol):
+    """Контракт хранения последнего результата Reasoner по сделке."""
+
+    def get(self, deal_id: str) -> Reasoning | None:
+        """Вернуть последнее рассуждение сделки или None."""
+
+    def save(self, reasoning: Reasoning) -> None:
+        """Сохранить рассуждение, заменив предыдущее."""
+
+    def delete(self, deal_id: str) -> None:
+        """Удалить рассуждение сделки, если оно есть."""
+
+
+class JobRepository(Protocol):
+    """Контракт outbox фоновых задач по сделкам."""
+
+    def enqueue(self, jobs: Sequence[Job]) -> None:
+        """Добавить задачи в текущую транзакцию."""
+
+    def claim(self, limit: int, now: datetime, lease_until: datetime) -> Sequence[Job]:
+        """Захватить до limit готовых задач и все готовые задачи тех же сделок до lease_until."""
+
+    def complete(self, job_ids: Sequence[int]) -> None:
+        """Удалить выполненные задачи."""
+
+    def retry(self, job_ids: Sequence[int], available_at: datetime, error: str) -> None:
+        """Снять захват и отложить задачи до available_at."""
+
+    def count_pending(self) -> int:
+        """Число задач, ещё не выполненных и не похороненных (глубина outbox)."""
+
+    def bury(self, job_ids: Sequence[int], error: str) -> None:
+        """Пометить задачи как окончательно упавшие (status=dead)."""
+
+
+class IdempotencyRepository(Protocol):
+    """Контракт хранения ключей идемпотентности приёма событий с ответами."""
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, IdempotencyRecord]:
+        """Вернуть сохранённые записи по ключам (отсутствующих нет в ответе)."""
+
+    def add_many(self, records: Sequence[IdempotencyRecord]) -> set[str]:
+        """Вставить записи, пропуская занятые ключи; вернуть реально вставленные ключи."""
@@ -4,7 +4,14 @@ from __future__ import annotations
 
 from typing import Callable, Protocol, TypeVar
 
-from backend.ports.repositories import EventRepository, FactRepository, ReadModelRepository
+from backend.ports.repositories import (
+    EventRepository,
+    FactRepository,
+    IdempotencyRepository,
+    JobRepository,
+    ReadModelRepository,
+    ReasoningRepository,
+)
 
 TUnitOfWork = TypeVar("TUnitOfWork", bound="UnitOfWork")
 
@@ -24,6 +31,18 @@ class UnitOfWork(Protocol):
     def read_models(self) -> ReadModelRepository:
         """Вернуть репозиторий read-model на текущей сессии."""
 
+    @property
+    def reasonings(self) -> ReasoningRepository:
+        """Вернуть репозиторий рассуждений Reasoner на текущей сессии."""
+
+    @property
+    def jobs(self) -> JobRepository:
+        """Вернуть outbox фоновых задач на текущей сессии."""
+
+    @property
+    def idempotency(self) -> IdempotencyRepository:
+        """Вернуть хранилище ключей идемпотентности на текущей сессии."""
+
     def commit(self) -> None:
         """Зафиксировать изменения в хранилище."""
 
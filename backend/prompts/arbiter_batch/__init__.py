@@ -0,0 +1 @@
+# Промпты для пакетного арбитража конфликтов (один вызов на сделку)
@@ -0,0 +1 @@
+# Промпты для инкрементального рассуждения (Reasoner по диффу входов)
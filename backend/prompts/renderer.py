@@ -0,0 +1,132 @@
+"""PromptRenderer: рендер Jinja-шаблонов промптов и загрузка JSON-схем ответов."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader
+from jsonschema import Draft202012Validator
+
+_PROMPTS_DIR = Path(__file__).resolve().parent
+_PREPROMPT_PATH = _PROMPTS_DIR.parents[1] / "preprompt.txt"
+_SCHEMA_FILES: dict[str, str] = {
+    "extract": "extract/schema.extract.json",
+    "reasoner": "reasoner/schema.reasoner.json",
+    "reasoner_delta": "reasoner/schema.reasoner.json",
+    "arbiter": "arbiter/schema.arbiter.json",
+    "arbiter_batch": "arbiter_batch/schema.arbiter_batch.json",
+}
+_REQUIRED_KEYS: dict[str, tuple[str, ...]] = {
+    "extract": ("framework", "crm", "chat_list", "chat_map", "free_text"),
+    "reasoner": (
+        "framework",
+        "deal",
+        "decision",
+        "completeness",
+        "letters",
+        "facts_by_letter",
+        "crm",
+        "chat_list",
+        "chat_map",
+        "free_text",
+        "allow_manager_question",
+    ),
+    "reasoner_delta": (
+        "framework",
+        "deal",
+        "transition",
+        "previous",
+        "changed_facts",
+        "removed_facets",
+        "free_text",
+        "allow_manager_question",
+    ),
+    "arbiter": (
+        "framework",
+        "facet",
+        "conflict_reason",
+        "current_fact",
+        "candidates",
+        "crm",
+        "chat_list",
+        "chat_map",
+        "free_text",
+    ),
+    "arbiter_batch": ("framework", "conflicts", "crm", "chat_list", "chat_map", "free_text"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPrompt:
+    """Пара system/user промптов, готовая к отправке в LLM-порт."""
+
+    system: str
+    user: str
+
+
+class PromptRenderer:
+    """Рендерит prompts/{kind}/{system,user}.jinja с проверкой ключей контекста."""
+
+    def __init__(self, prompts_dir: Path = _PROMPTS_DIR, preprompt: str | None = None) -> None:
+        self._env = Environment(
+            loader=FileSystemLoader(str(prompts_dir)),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+        )
+        self._prompts_dir = prompts_dir
+        self._preprompt = _load_preprompt() if preprompt is None else preprompt
+
+    def render(self, kind: str, **ctx: Any) -> RenderedPrompt:
+        """Отрендерить промпт kind; при нехватке ключей контекста — ValueError."""
+
+        missing = [key for key in _REQUIRED_KEYS.get(kind, ()) if key not in ctx]
+        if missing:
+            raise ValueError(f"Для промпта {kind} не хватает ключей: {', '.join(missing)}")
+        system = self._env.get_template(f"{kind}/system.jinja").render(
+            preprompt=self._preprompt,
+            **ctx,
+        )
+        user = self._env.get_template(f"{kind}/user.jinja").render(**ctx)
+        return RenderedPrompt(system=system, user=user)
+
+    def schema(self, kind: str) -> dict[str, Any]:
+        """Вернуть JSON-схему ответа для kind."""
+
+        return _load_schema(str(self._prompts_dir / _SCHEMA_FILES[kind]))
+
+    def validator(self, kind: str) -> Draft202012Validator:
+        """Вернуть скомпилированный валидатор схемы kind (кэшируется на процесс)."""
+
+        return _load_validator(str(self._prompts_dir / _SCHEMA_FILES[kind]))
+
+    def item_validator(self, kind: str) -> Draft202012Validator:
+        """Валидатор одного элемента массива-ответа kind (для потокового разбора)."""
+
+        return _load_item_validator(str(self._prompts_dir / _SCHEMA_FILES[kind]))
+
+
+@lru_cache(maxsize=1)
+def _load_preprompt() -> str:
+    if not _PREPROMPT_PATH.exists():
+        return ""
+    return _PREPROMPT_PATH.read_text(encoding="utf-8").rstrip()
+
+
+@lru_cache(maxsize=len(_SCHEMA_FILES) * 2)
+def _load_schema(path: str) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=len(_SCHEMA_FILES) * 2)
+def _load_validator(path: str) -> Draft202012Validator:
+    return Draft202012Validator(_load_schema(path))
+
+
+@lru_cache(maxsize=len(_SCHEMA_FILES) * 2)
+def _load_item_validator(path: str) -> Draft202012Validator:
+    return Draft202012Validator(_load_schema(path)["items"])
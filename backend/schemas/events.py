@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,3 +20,26 @@ class EventIn(BaseModel):
     )
 
 
+class EventBatchItemOut(BaseModel):
+    """Результат одного элемента пакетного приёма событий."""
+
+    index: int = Field(..., description="Позиция элемента во входном массиве/NDJSON")
+    deal_id: str | None = Field(default=None, description="Идентификатор сделки элемента")
+    status: Literal["accepted", "duplicate", "rejected", "failed"] = Field(
+        ...,
+        description=(
+            "accepted — записан; duplicate — повтор ключа идемпотентности, не записан; "
+            "rejected — не прошёл валидацию; failed — ошибка записи"
+        ),
+    )
+    error: str | None = Field(default=None, description="Причина отказа")
+
+
+class EventBatchOut(BaseModel):
+    """Ответ POST /events:batch: счётчики и результаты по элементам."""
+
+    accepted: int
+    duplicates: int = 0
+    rejected: int = Field(..., description="Не прошли валидацию")
+    failed: int = Field(default=0, description="Прошли валидацию, но не записаны")
+    items: list[EventBatchItemOut]
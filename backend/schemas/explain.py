@@ -0,0 +1,123 @@
+"""Pydantic-схемы разбора пересчёта сделки (GET /state/{deal_id}/explain)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from backend.pipelines.recompute_explain import (
+    FrameworkExplanation,
+    LetterExplanation,
+    RecomputeExplanation,
+)
+
+
+class ChosenFactOut(BaseModel):
+    """Факт, выбранный resolve для буквы."""
+
+    kind: str
+    confidence: float | None
+    observed_at: datetime
+    source: str | None
+    payload: dict[str, Any]
+
+
+class LetterExplainOut(BaseModel):
+    """Буква фреймворка: выбранный факт и число «да» по чек-листу."""
+
+    letter: str
+    fact_kind: str
+    fact: ChosenFactOut | None = Field(default=None, description="None — факта такого вида нет")
+    yes_count: int
+    completeness: float
+
+
+class GateExplainOut(BaseModel):
+    """Проверенные ворота фреймворка."""
+
+    status: str = Field(..., description="Статус, который дают ворота")
+    passed: bool
+    failed_checks: list[str] = Field(
+        default_factory=list,
+        description="Невыполненные проверки: score или ключи букв",
+    )
+
+
+class FrameworkExplainOut(BaseModel):
+    """Статус фреймворка, буквы и ворота в порядке проверки."""
+
+    framework_id: str
+    name: str
+    status: str
+    score: float
+    letters: list[LetterExplainOut]
+    gates: list[GateExplainOut] = Field(
+        default_factory=list,
+        description="Ворота до первых пройденных включительно; последние определили статус",
+    )
+
+
+class StepTimingOut(BaseModel):
+    """Замер шага пересчёта."""
+
+    step: str
+    seconds: float
+    allocated_blocks: int
+
+
+class DealExplainOut(BaseModel):
+    """Разбор пересчёта сделки по фреймворкам."""
+
+    deal_id: str
+    frameworks: list[FrameworkExplainOut]
+    steps: list[StepTimingOut]
+
+    @classmethod
+    def from_domain(cls, explanation: RecomputeExplanation) -> "DealExplainOut":
+        """Сконвертировать объяснение пайплайна в DTO."""
+
+        return cls(
+            deal_id=explanation.deal_id,
+            frameworks=[_framework(item) for item in explanation.frameworks],
+            steps=[
+                StepTimingOut(step=t.step, seconds=t.seconds, allocated_blocks=t.allocated_blocks)
+                for t in explanation.steps
+            ],
+        )
+
+
+def _framework(item: FrameworkExplanation) -> FrameworkExplainOut:
+    return FrameworkExplainOut(
+        framework_id=item.framework_id,
+        name=item.name,
+        status=item.status,
+        score=item.score,
+        letters=[_letter(letter) for letter in item.letters],
+        gates=[
+            GateExplainOut(
+                status=gate.status, passed=gate.passed, failed_checks=list(gate.failed_checks)
+            )
+            for gate in item.gates
+        ],
+    )
+
+
+def _letter(item: LetterExplanation) -> LetterExplainOut:
+    fact = item.fact
+    return LetterExplainOut(
+        letter=item.letter,
+        fact_kind=item.fact_kind,
+        fact=None
+        if fact is None
+        else ChosenFactOut(
+            kind=fact.kind,
+            confidence=fact.confidence,
+            observed_at=fact.observed_at,
+            source=fact.source,
+            payload=dict(fact.payload),
+        ),
+        yes_count=item.yes_count,
+        completeness=item.completeness,
+    )
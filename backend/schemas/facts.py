@@ -1,2 +1,25 @@
-# Pydantic-схемы для фактов - результат работы Extract
+"""Pydantic-схемы для фактов — результат работы Extract."""
 
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ExtractedFactItem(BaseModel):
+    """Один элемент ответа экстрактора (см. prompts/extract/schema.extract.json)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    framework: str | None = Field(
+        default=None,
+        description="bant|med2ic3; None в однофреймворковом режиме",
+    )
+    letter: str = Field(..., description="Буква фреймворка (B, A, ..., C3)")
+    facet: str = Field(..., description="Фасет — ключ чек-листа или имя атрибута")
+    value: Any = Field(default=None, description="Нормализованное значение")
+    confidence: float = Field(..., ge=0.0, le=1.0)
+    source: Literal["crm", "chat", "text"]
+    evidence: str
+    ts: str | None = None
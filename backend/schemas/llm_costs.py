@@ -0,0 +1,18 @@
+"""Pydantic-схемы расходов на LLM по сделкам для административных маршрутов."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class DealCostOut(BaseModel):
+    """Накопленные расходы сделки на вызовы LLM с начала работы процесса."""
+
+    deal_id: str
+    calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    cost: float = Field(..., description="Стоимость в рублях по ценам моделей")
+    by_task: dict[str, float] = Field(
+        default_factory=dict, description="Стоимость в разрезе use case"
+    )
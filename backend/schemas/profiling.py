@@ -0,0 +1,37 @@
+"""Pydantic-схемы профилей запросов для административных маршрутов."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class StackOut(BaseModel):
+    """Свёрнутый стек и число сэмплов, в которых он встретился."""
+
+    stack: str = Field(..., description="Кадры от корня к листу через «;» (файл:функция)")
+    samples: int
+
+
+class ProfileSummaryOut(BaseModel):
+    """Краткие сведения о профиле для списка."""
+
+    id: int
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    duration: float = Field(..., description="Длительность запроса, секунды")
+    samples: int = Field(..., description="Число сэмплов стеков за время запроса")
+
+
+class ProfileOut(ProfileSummaryOut):
+    """Профиль запроса: время по слоям и самые частые стеки."""
+
+    breakdown: dict[str, float] = Field(
+        default_factory=dict,
+        description="Оценка секунд по слоям: routing, di, uow, sql, serialization, app, other",
+    )
+    top_stacks: list[StackOut] = Field(default_factory=list)
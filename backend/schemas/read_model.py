@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Collection, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from backend.domain.entities import DealReadModel
 
@@ -33,6 +33,10 @@ class DealStateOut(BaseModel):
         default_factory=dict,
         description="Дополнительные агрегаты по буквам MED2IC3",
     )
+    version: int = Field(
+        default=0,
+        description="Монотонная версия read-model, растёт с каждым сохранением",
+    )
 
     @classmethod
     def from_domain(cls, model: DealReadModel) -> "DealStateOut":
@@ -41,3 +45,23 @@ class DealStateOut(BaseModel):
         return cls.model_validate(model, from_attributes=True)
 
 
+# Сериализатор строится один раз: dataclass пишется в JSON без промежуточной
+# Pydantic-модели и повторной валидации. Порядок и формат полей совпадают с DealStateOut.
+_DEAL_STATE_JSON = TypeAdapter(DealReadModel)
+_DEAL_STATES_JSON = TypeAdapter(list[DealReadModel])
+
+
+def deal_state_json(model: DealReadModel) -> bytes:
+    """Сериализовать read-model в JSON-байты в формате DealStateOut."""
+
+    return _DEAL_STATE_JSON.dump_json(model)
+
+
+def deal_states_json(
+    models: Sequence[DealReadModel],
+    fields: Collection[str] | None = None,
+) -> bytes:
+    """Сериализовать список read-model; fields оставляет только перечисленные поля."""
+
+    include = {"__all__": set(fields)} if fields else None
+    return _DEAL_STATES_JSON.dump_json(list(models), include=include)
@@ -1,2 +1,51 @@
-# Pydantic-схемы для результатов работы Reasoner и Arbiter
+"""Pydantic-схемы для результатов работы Reasoner и Arbiter."""
 
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ArbiterComparison(BaseModel):
+    """Оценка одного кандидата в конфликте."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    candidate_id: str
+    verdict: Literal["accept", "reject", "inconclusive"]
+    reason: str
+    evidence: str
+    confidence: float = Field(..., ge=0.0, le=1.0)
+
+
+class ArbiterQuestion(BaseModel):
+    """Вопрос менеджеру, если Arbiter требует эскалации."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    ask: bool
+    text: str | None = None
+    reason: str | None = None
+
+
+class ArbiterResolution(BaseModel):
+    """Решение Arbiter по одному фасету (см. prompts/arbiter/schema.arbiter.json)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    facet: str
+    letter: str
+    decision: Literal["select", "reject_all", "needs_human"]
+    selected_id: str | None = None
+    rationale: str
+    comparisons: list[ArbiterComparison]
+    question: ArbiterQuestion
+
+
+class ArbiterBatchResponse(BaseModel):
+    """Пакетный ответ Arbiter: по решению на каждый конфликтный фасет сделки."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    resolutions: list[ArbiterResolution]
@@ -0,0 +1,146 @@
+"""Проверка контроля допуска записи: корзины клиентов, общие лимиты и ответ 429."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.admission import OutboxDepth, pool_headroom
+from backend.app.di import provide_admission, provide_ingest_event_handler
+from backend.app.main import app
+from backend.application.use_cases import IngestEventCommand, IngestEventHandler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_limits_each_client_separately() -> None:
+    clock = _Clock()
+    controller = AdmissionController(rate_per_second=2.0, burst=2, clock=clock)
+
+    results = [controller.admit("crm").admitted for _ in range(3)]
+    rejected = controller.admit("crm")
+    other = controller.admit("web")
+    clock.now += 0.5
+
+    assert results == [True, True, False]
+    assert (rejected.reason, rejected.retry_after) == ("rate", 0.5)
+    assert other.admitted
+    assert controller.admit("crm").admitted
+
+
+def test_shared_limits_shed_load_without_spending_tokens() -> None:
+    depth, headroom = [0], [5]
+    controller = AdmissionController(
+        max_in_flight=1,
+        rate_per_second=1.0,
+        burst=2,
+        pool_headroom=lambda: headroom[0],
+        reserved_connections=2,
+        queue_depth=lambda: depth[0],
+        max_queue_depth=100,
+    )
+
+    assert controller.admit("crm").admitted
+    assert controller.admit("crm").reason == "concurrency"
+    controller.release()
+    headroom[0] = 2
+    assert controller.admit("crm").reason == "pool"
+    depth[0] = 100
+    assert controller.admit("crm").reason == "pool"
+    headroom[0] = 5
+    assert controller.admit("crm").reason == "queue"
+    depth[0] = 0
+    assert controller.admit("crm").admitted
+    assert controller.in_flight == 1
+
+
+def test_route_answers_429_with_retry_after_and_counts_results() -> None:
+    metrics = InMemoryMetrics()
+    controller = AdmissionController(rate_per_second=0.1, burst=1, metrics=metrics)
+    uow = InMemoryUnitOfWork()
+    app.dependency_overrides[provide_admission] = lambda: controller
+    app.dependency_overrides[provide_ingest_event_handler] = lambda: IngestEventHandler(
+        lambda: uow, SystemClock()
+    )
+    client = TestClient(app)
+    try:
+        responses = [
+            client.post("/events", json={"deal_id": "d1", "kind": str(n)}) for n in range(2)
+        ]
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [201, 429]
+    assert responses[1].headers["Retry-After"] == "10"
+    assert controller.in_flight == 0
+    assert metrics.counter("admission_requests_total", result="admitted") == 1
+    assert metrics.counter("admission_requests_total", result="rate") == 1
+
+
+def test_pool_headroom_follows_checked_out_connections(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=2, max_overflow=1
+    )
+    headroom = pool_headroom(engine, max_overflow=1)
+
+    before = headroom()
+    with engine.connect():
+        during = headroom()
+    engine.dispose()
+
+    assert (before, during) == (3, 2)
+
+
+def test_pool_headroom_is_unlimited_with_unbounded_overflow(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=2, max_overflow=-1
+    )
+
+    assert pool_headroom(engine, max_overflow=-1)() is None
+
+
+def test_outbox_depth_counts_pending_jobs_at_most_once_per_ttl() -> None:
+    uow, clock = InMemoryUnitOfWork(), _Clock()
+    ingest = IngestEventHandler(lambda: uow, SystemClock(), outbox_kinds=("recompute",))
+    depth = OutboxDepth(lambda: uow, ttl_seconds=1.0, clock=clock)
+
+    ingest.execute(IngestEventCommand("deal-1", "note", {}))
+    first = depth()
+    ingest.execute(IngestEventCommand("deal-2", "note", {}))
+    cached = depth()
+    clock.now += 1.0
+
+    assert (first, cached, depth()) == (1, 1, 2)
+
+
+def test_outbox_depth_does_not_wait_for_a_count_in_progress() -> None:
+    uow, counting, release = InMemoryUnitOfWork(), threading.Event(), threading.Event()
+
+    def slow_uow() -> InMemoryUnitOfWork:
+        counting.set()
+        release.wait(timeout=5)
+        return uow
+
+    depth = OutboxDepth(slow_uow, ttl_seconds=0.0)
+    worker = threading.Thread(target=depth)
+    worker.start()
+    counting.wait(timeout=5)
+    cached = depth()
+    release.set()
+    worker.join(timeout=5)
+
+    assert cached == 0
@@ -0,0 +1,57 @@
+"""Проверка GET /state?ids=...: один запрос к хранилищу, пустые заготовки и проекция полей."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.di import provide_get_states_handler
+from backend.app.main import app
+from backend.application.use_cases import (
+    GetDealStatesHandler,
+    GetDealStatesQuery,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+def test_handler_keeps_order_and_fills_missing(sql_uow_factory: UnitOfWorkFactory) -> None:
+    ingest = IngestEventHandler(sql_uow_factory, SystemClock())
+    for deal_id in ("deal-1", "deal-3"):
+        ingest.execute(IngestEventCommand(deal_id, "note", {}))
+
+    states = GetDealStatesHandler(sql_uow_factory).execute(
+        GetDealStatesQuery(["deal-3", "deal-2", "deal-1", "deal-3"])
+    )
+
+    assert [(state.deal_id, state.version) for state in states] == [
+        ("deal-3", 1),
+        ("deal-2", 0),
+        ("deal-1", 1),
+    ]
+
+
+def test_route_supports_comma_ids_and_projection(sql_uow_factory: UnitOfWorkFactory) -> None:
+    IngestEventHandler(sql_uow_factory, SystemClock()).execute(
+        IngestEventCommand("deal-1", "note", {})
+    )
+    app.dependency_overrides[provide_get_states_handler] = lambda: GetDealStatesHandler(
+        sql_uow_factory
+    )
+    client = TestClient(app)
+    try:
+        full = client.get("/state", params={"ids": "deal-1,deal-2"})
+        projected = client.get("/state?ids=deal-1&ids=deal-2&fields=status,version")
+        unknown = client.get("/state?ids=deal-1&fields=secret")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert full.status_code == 200
+    assert [item["status"] for item in full.json()] == ["pending", "unknown"]
+    assert "letters" in full.json()[0]
+    assert projected.json() == [
+        {"deal_id": "deal-1", "status": "pending", "version": 1},
+        {"deal_id": "deal-2", "status": "unknown", "version": 0},
+    ]
+    assert unknown.status_code == 422
@@ -0,0 +1,86 @@
+"""Проверка пула соединений: размер на воркер, метрики событий и пинг после простоя."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.pool_events import PoolListener, TimedQueuePool
+from backend.app.database import build_engine, pool_sizing
+from backend.config.settings import Settings
+
+
+def _settings(**values: object) -> Settings:
+    return Settings.model_validate(values)
+
+
+def test_pool_is_sized_from_connection_budget_per_worker() -> None:
+    assert pool_sizing(_settings(WEB_CONCURRENCY=4, DB_MAX_CONNECTIONS=40)) == (5, 5)
+    assert pool_sizing(_settings(WEB_CONCURRENCY=8, DB_MAX_CONNECTIONS=20)) == (1, 1)
+    assert pool_sizing(_settings(DB_POOL_SIZE=3, DB_MAX_OVERFLOW=0)) == (3, 0)
+
+
+def test_engine_reports_wait_checkout_and_timeouts(tmp_path: Path) -> None:
+    metrics = InMemoryMetrics()
+    settings = _settings(
+        DATABASE_URL=f"sqlite:///{tmp_path / 'pool.db'}",
+        DB_POOL_SIZE=1,
+        DB_MAX_OVERFLOW=0,
+        DB_POOL_TIMEOUT=0.01,
+    )
+    engine = build_engine(settings, metrics)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    assert isinstance(engine.pool, TimedQueuePool) and engine.pool.size() == 1
+    assert metrics.histogram("db_pool_wait_seconds", pool="primary").count == 2
+    assert metrics.histogram("db_pool_checkout_seconds", pool="primary").count == 1
+    assert metrics.counter("db_pool_timeouts_total", pool="primary") == 1
+    assert metrics.counter("db_pool_connects_total", pool="primary") == 1
+    engine.dispose()
+    assert engine.pool.size() == 1
+    with engine.connect():
+        pass
+    assert metrics.histogram("db_pool_wait_seconds", pool="primary").count == 3
+
+
+def test_ping_only_after_idle_and_dead_connection_is_replaced(tmp_path: Path) -> None:
+    metrics, now = InMemoryMetrics(), [0.0]
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'ping.db'}", poolclass=TimedQueuePool, pool_reset_on_return=None
+    )
+    PoolListener(metrics, "primary", ping_idle_seconds=10, clock=lambda: now[0]).attach(engine)
+
+    with engine.connect():
+        pass
+    now[0] = 5.0
+    with engine.connect():
+        pass
+    assert metrics.counter("db_pool_pings_total", pool="primary", result="ok") == 0
+
+    now[0] = 30.0
+    with engine.connect() as connection:
+        dbapi_connection = connection.connection.dbapi_connection
+        assert dbapi_connection is not None
+        dbapi_connection.close()
+    now[0] = 60.0
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    assert metrics.counter("db_pool_pings_total", pool="primary", result="ok") == 1
+    assert metrics.counter("db_pool_pings_total", pool="primary", result="failed") == 1
+    assert metrics.counter("db_pool_invalidations_total", pool="primary", kind="hard") == 1
+    assert metrics.counter("db_pool_connects_total", pool="primary") == 2
+
+
+def test_zero_idle_threshold_falls_back_to_pre_ping_on_every_checkout(tmp_path: Path) -> None:
+    settings = _settings(DATABASE_URL=f"sqlite:///{tmp_path / 'pre.db'}", DB_PING_IDLE_SECONDS=0)
+
+    assert build_engine(settings).pool._pre_ping
+    assert not build_engine(_settings(DATABASE_URL="sqlite://")).pool._pre_ping
@@ -0,0 +1,63 @@
+"""Проверка бюджета контекста: кэш оценок токенов и детерминированный отбор переписки."""
+
+from __future__ import annotations
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases.extract_facts import ExtractFactsCommand, ExtractFactsHandler
+from backend.pipelines.context_budget import ContextBudgeter
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.token_estimator import TokenEstimator
+from backend.prompts.renderer import PromptRenderer
+
+
+def _source(turns: int) -> ExtractSource:
+    chat = [{"role": "client", "text": f"Сообщение номер {index} " * 10} for index in range(turns)]
+    return ExtractSource(crm={"Этап": "Решение", "Комментарий": "x" * 4000}, chat_list=chat)
+
+
+def test_token_estimates_are_cached_by_content() -> None:
+    calls: list[str] = []
+
+    def tokenizer(text: str) -> int:
+        calls.append(text)
+        return len(text)
+
+    estimator = TokenEstimator(tokenizer=tokenizer)
+
+    assert estimator.estimate("привет") == estimator.estimate("привет") == 6
+    assert (estimator.hits, estimator.misses, len(calls)) == (1, 1, 1)
+
+
+def test_chat_selection_fits_budget_and_is_deterministic() -> None:
+    budgeter = ContextBudgeter(budgets={"default": 800}, recent_turns=2)
+    evidence = ["Сообщение номер 7 Сообщение"]
+    first, report = budgeter.fit(_source(100), "reasoner", evidence)
+    second, _ = budgeter.fit(_source(100), "reasoner", evidence)
+
+    texts = [turn["text"] for turn in first.chat_list]
+    assert first == second
+    assert report.tokens <= 800 and report.chat_turns[0] < 100
+    assert texts[0].startswith("Сообщение номер 7 ")
+    assert texts[-2:] == [_source(100).chat_list[i]["text"] for i in (98, 99)]
+    assert "Комментарий" not in first.crm and report.crm_fields == (1, 2)
+
+
+def test_extract_reports_prompt_size_per_call() -> None:
+    metrics = InMemoryMetrics()
+    llm = FakeLLMClient("[]")
+    handler = ExtractFactsHandler(
+        uow_factory=InMemoryUnitOfWork,
+        llm=llm,
+        renderer=PromptRenderer(),
+        clock=SystemClock(),
+        budgeter=ContextBudgeter(budgets={"default": 500}, metrics=metrics),
+    )
+    handler.execute(ExtractFactsCommand("deal-1", _source(200), framework_ids=("bant",)))
+
+    assert metrics.histogram("llm_prompt_tokens", task="extract", model="default").count == 1
+    assert metrics.counter("llm_context_chat_turns_dropped_total", task="extract") > 150
+    assert "Сообщение номер 199" in llm.calls[0].user
+    assert "Сообщение номер 0 " not in llm.calls[0].user
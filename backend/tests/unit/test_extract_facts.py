@@ -0,0 +1,130 @@
+"""Проверка multi-framework Extract: один вызов LLM на все фреймворки сделки."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.application.use_cases.extract_facts import ExtractFactsCommand, ExtractFactsHandler
+from backend.config.frameworks import get_frameworks
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.fact_builder import facts_from_items
+from backend.ports.clock import ClockPort
+from backend.ports.llm_client import LLMRequest, LLMResponseInvalid
+from backend.prompts.renderer import PromptRenderer
+from backend.schemas.facts import ExtractedFactItem
+
+_ITEMS: list[dict[str, Any]] = [
+    {
+        "framework": "bant",
+        "letter": "B",
+        "facet": "budget_confirmed",
+        "value": {"amount": 12500000, "currency": "RUB"},
+        "confidence": 0.9,
+        "source": "crm",
+        "evidence": "Ожидаемая выручка с НДС: 12500000",
+        "ts": "2025-01-12",
+    },
+    {
+        "letter": "C3",
+        "facet": "deadline_documented",
+        "value": "2025-03-05",
+        "confidence": 0.8,
+        "source": "chat",
+        "evidence": "Нужно успеть к аудиту 5 марта.",
+        "ts": None,
+    },
+]
+
+
+class _FixedClock(ClockPort):
+    def utcnow(self) -> datetime:
+        return datetime(2025, 1, 20, tzinfo=timezone.utc)
+
+
+def _responder(request: LLMRequest) -> str:
+    allowed = set((request.framework or "").split("+"))
+    by_letter = {"B": "bant", "C3": "med2ic3"}
+    return json.dumps([item for item in _ITEMS if by_letter[item["letter"]] in allowed])
+
+
+def _source() -> ExtractSource:
+    return ExtractSource(
+        crm={"Ожидаемая выручка с НДС": 12500000, "Этап": "Решение"},
+        chat_list=[{"role": "manager", "text": "Нужно успеть к аудиту 5 марта."}],
+        free_text="Бюджет подтверждён.",
+    )
+
+
+def _handler(llm: FakeLLMClient, uow: InMemoryUnitOfWork, multi: bool) -> ExtractFactsHandler:
+    return ExtractFactsHandler(
+        uow_factory=lambda: uow,
+        llm=llm,
+        renderer=PromptRenderer(),
+        clock=_FixedClock(),
+        multi_framework=multi,
+    )
+
+
+def test_multi_framework_extract_makes_single_call_and_splits_kinds() -> None:
+    llm = FakeLLMClient(_responder)
+    uow = InMemoryUnitOfWork()
+    facts = _handler(llm, uow, multi=True).execute(ExtractFactsCommand("deal-1", _source()))
+
+    assert len(llm.calls) == 1
+    assert "поле \"framework\"" in llm.calls[0].system
+    assert {fact.kind for fact in facts} == {"bant.B", "med2ic3.C3"}
+    stored = {fact.kind: fact for fact in uow.facts.list_for_deal("deal-1")}
+    assert stored["bant.B"].payload["checklist"] == {"budget_confirmed": True}
+    assert stored["med2ic3.C3"].confidence == pytest.approx(0.8)
+
+
+def test_multi_framework_extract_roughly_halves_prompt_tokens() -> None:
+    multi_llm = FakeLLMClient(_responder)
+    split_llm = FakeLLMClient(_responder)
+    command = ExtractFactsCommand("deal-1", _source())
+    _handler(multi_llm, InMemoryUnitOfWork(), multi=True).execute(command)
+    _handler(split_llm, InMemoryUnitOfWork(), multi=False).execute(command)
+
+    def prompt_tokens(llm: FakeLLMClient) -> int:
+        return sum(len(call.system) + len(call.user) for call in llm.calls)
+
+    assert len(split_llm.calls) == 2
+    assert prompt_tokens(multi_llm) < 0.6 * prompt_tokens(split_llm)
+
+
+def test_extract_respects_per_deal_framework_selection() -> None:
+    llm = FakeLLMClient(_responder)
+    uow = InMemoryUnitOfWork()
+    command = ExtractFactsCommand("deal-1", _source(), framework_ids=("bant",))
+    facts = _handler(llm, uow, multi=True).execute(command)
+
+    assert llm.calls[0].framework == "bant"
+    assert [fact.kind for fact in facts] == ["bant.B"]
+
+
+def test_extract_rejects_response_outside_schema() -> None:
+    llm = FakeLLMClient(json.dumps([{"letter": "B"}]))
+    with pytest.raises(LLMResponseInvalid):
+        _handler(llm, InMemoryUnitOfWork(), multi=True).execute(
+            ExtractFactsCommand("deal-1", _source())
+        )
+
+
+def test_facts_from_items_keeps_most_confident_value_of_a_facet() -> None:
+    confident = ExtractedFactItem.model_validate({**_ITEMS[0], "confidence": 0.9})
+    weaker = ExtractedFactItem.model_validate(
+        {**_ITEMS[0], "value": {"amount": 5000000, "currency": "RUB"}, "confidence": 0.4}
+    )
+    observed_at = datetime(2025, 1, 20, tzinfo=timezone.utc)
+
+    for items in ([confident, weaker], [weaker, confident]):
+        (fact,) = facts_from_items(items, get_frameworks(("bant",)), "deal-1", observed_at)
+        facet = fact.payload["facets"]["budget_confirmed"]
+        assert facet["value"] == {"amount": 12500000, "currency": "RUB"}
+        assert facet["confidence"] == pytest.approx(0.9)
@@ -0,0 +1,108 @@
+"""Проверка производных фактов MED2IC3 из фактов BANT (карта derive_from)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases.extract_facts import ExtractFactsCommand, ExtractFactsHandler
+from backend.config.frameworks import get_frameworks
+from backend.domain.derivation import derive_facts, with_derived_facts
+from backend.domain.entities import Fact
+from backend.domain.rules import resolve_conflicts
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.recompute_steps import RecomputeInput, recompute_read_model
+from backend.prompts.renderer import PromptRenderer
+
+
+def _fact(kind: str, checks: dict[str, bool], confidence: float = 0.9) -> Fact:
+    return Fact(
+        deal_id="deal-1",
+        kind=kind,
+        payload={"checklist": checks},
+        confidence=confidence,
+        observed_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        source="extract",
+    )
+
+
+def _bant_facts() -> list[Fact]:
+    return [
+        _fact("bant.B", {"budget_owner_identified": True, "procurement_process_known": True}),
+        _fact(
+            "bant.A",
+            {"approval_chain_clear": True, "legal_contact_known": True},
+            confidence=0.8,
+        ),
+        _fact("bant.T", {"target_go_live_set": True, "buying_window_confirmed": True}),
+    ]
+
+
+def test_derive_facts_maps_bant_checks_with_reduced_confidence() -> None:
+    derived = {fact.kind: fact for fact in derive_facts(_bant_facts(), get_frameworks(["med2ic3"]))}
+
+    c3 = derived["med2ic3.C3"]
+    assert c3.payload["checklist"] == {"deadline_documented": True, "trigger_confirmed": True}
+    assert c3.confidence == pytest.approx(0.9 * 0.7)
+    assert c3.source == "derived:bant"
+    assert derived["med2ic3.D2"].payload["derived_from"] == ["bant.A", "bant.B"]
+
+
+def test_derived_checks_fill_gaps_of_weaker_real_fact_without_replacing_it() -> None:
+    real_d2 = Fact(
+        deal_id="deal-1",
+        kind="med2ic3.D2",
+        payload={
+            "facets": {"stakeholders_timed": {"value": "Q2", "confidence": 0.5}},
+            "checklist": {"stakeholders_timed": True, "legal_review_planned": False},
+        },
+        confidence=0.5,
+        observed_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        source="extract",
+    )
+    facts = with_derived_facts([*_bant_facts(), real_d2], get_frameworks(["med2ic3"]))
+    d2 = resolve_conflicts(facts)["med2ic3.D2"]
+
+    assert d2.source == "extract"
+    assert d2.confidence == pytest.approx(0.5)
+    assert d2.payload["facets"] == real_d2.payload["facets"]
+    assert d2.payload["checklist"] == {
+        "stakeholders_timed": True,
+        "legal_review_planned": False,
+        "process_steps_known": True,
+        "procurement_entry_defined": True,
+        "signoff_sequence_approved": True,
+    }
+    assert resolve_conflicts(facts)["med2ic3.C3"].source == "derived:bant"
+
+
+def test_recompute_fills_med2ic3_from_bant_but_prefers_real_facts() -> None:
+    real_c3 = _fact("med2ic3.C3", {"deadline_documented": False}, confidence=0.95)
+    read_model = recompute_read_model(
+        RecomputeInput(
+            deal_id="deal-1",
+            facts=[*_bant_facts(), real_c3],
+            frameworks=list(get_frameworks(["bant", "med2ic3"])),
+        )
+    )
+    yes_counts = read_model.letters["med2ic3"]["yes_counts"]
+
+    assert yes_counts["D2"] == 4
+    assert yes_counts["C3"] == 1
+
+
+def test_extract_skips_letters_already_high_from_derivation() -> None:
+    uow = InMemoryUnitOfWork()
+    for fact in _bant_facts():
+        uow.facts.upsert(fact)
+    llm = FakeLLMClient("[]")
+    handler = ExtractFactsHandler(lambda: uow, llm, PromptRenderer(), SystemClock())
+    handler.execute(ExtractFactsCommand("deal-1", ExtractSource(crm={})))
+
+    user_prompt = llm.calls[0].user
+    assert "med2ic3 D2 — Decision Process" not in user_prompt
+    assert "med2ic3 C3 — Compelling Event" in user_prompt
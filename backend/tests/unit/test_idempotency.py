@@ -0,0 +1,141 @@
+"""Проверка идемпотентного приёма: повтор ключа отдаёт сохранённый ответ и ничего не пишет."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.idempotency_index import BloomFilter, IdempotencyIndex
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.di import (
+    provide_admission,
+    provide_ingest_batch_handler,
+    provide_ingest_event_handler,
+)
+from backend.app.main import app
+from backend.application.use_cases import (
+    IngestBatchCommand,
+    IngestBatchHandler,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+def _events(sql_uow_factory: UnitOfWorkFactory, deal_id: str) -> int:
+    with sql_uow_factory() as uow:
+        return len(uow.events.list_for_deal(deal_id))
+
+
+def test_route_replays_stored_response_for_header_and_payload_keys(
+    sql_session_factory: sessionmaker[Session], sql_uow_factory: UnitOfWorkFactory
+) -> None:
+    index = IdempotencyIndex(capacity=1_000)
+    app.dependency_overrides[provide_ingest_event_handler] = lambda: IngestEventHandler(
+        lambda: SqlAlchemyUnitOfWork(sql_session_factory, idempotency_index=index), SystemClock()
+    )
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    client = TestClient(app)
+    try:
+        keyed = [
+            client.post(
+                "/events",
+                json={"deal_id": "d1", "kind": "paid", "payload": {"n": n}},
+                headers={"Idempotency-Key": "webhook-1"},
+            )
+            for n in (1, 2)
+        ]
+        plain = [client.post("/events", json={"deal_id": "d2", "kind": "note"}) for _ in "ab"]
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in keyed] == [201, 201]
+    assert keyed[0].json() == keyed[1].json()
+    assert keyed[1].json()["last_event"]["payload"] == {"n": 1}
+    assert plain[0].json() == plain[1].json()
+    assert (_events(sql_uow_factory, "d1"), _events(sql_uow_factory, "d2")) == (1, 1)
+
+
+def test_cold_process_falls_back_to_unique_key(
+    sql_session_factory: sessionmaker[Session], sql_uow_factory: Any
+) -> None:
+    metrics = InMemoryMetrics()
+
+    def handler(index: IdempotencyIndex) -> IngestEventHandler:
+        return IngestEventHandler(
+            lambda: SqlAlchemyUnitOfWork(sql_session_factory, idempotency_index=index),
+            SystemClock(),
+        )
+
+    command = IngestEventCommand("d1", "paid", {"n": 1}, idempotency_key="h:k")
+    first = handler(IdempotencyIndex(capacity=1_000)).execute(command)
+    warm = IdempotencyIndex(capacity=1_000, metrics=metrics)
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    engine = sql_session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", record)
+    replays = [handler(warm).execute(command) for _ in range(3)]
+    event.remove(engine, "before_cursor_execute", record)
+
+    assert replays == [first] * 3
+    assert _events(sql_uow_factory, "d1") == 1
+    written = [sql for sql in statements if sql.startswith(("INSERT", "UPDATE"))]
+    assert written and all("idempotency_keys" in sql for sql in written)
+    assert metrics.counter("idempotency_bloom_total", result="absent") == 1
+    assert metrics.counter("idempotency_lru_total", result="hit") == 2
+
+
+def test_batch_marks_repeated_items_as_duplicates(sql_uow_factory: UnitOfWorkFactory) -> None:
+    app.dependency_overrides[provide_ingest_batch_handler] = lambda: IngestBatchHandler(
+        sql_uow_factory, SystemClock(), chunk_size=2
+    )
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    client = TestClient(app)
+    items = [{"deal_id": "d1", "kind": "note", "payload": {"n": n}} for n in (1, 2, 1)]
+    try:
+        first = client.post("/events:batch", json=items).json()
+        again = client.post("/events:batch", json=items[:2]).json()
+        keyed = [
+            client.post("/events:batch", json=items[:1], headers={"Idempotency-Key": "b-1"})
+            for _ in "ab"
+        ]
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [item["status"] for item in first["items"]] == ["accepted", "accepted", "duplicate"]
+    assert (first["accepted"], first["duplicates"], first["rejected"]) == (2, 1, 0)
+    assert again["duplicates"] == 2
+    assert [response.json()["accepted"] for response in keyed] == [1, 0]
+    assert _events(sql_uow_factory, "d1") == 3
+
+
+def test_batch_handler_skips_stored_keys_without_writing(
+    sql_uow_factory: UnitOfWorkFactory
+) -> None:
+    handler = IngestBatchHandler(sql_uow_factory, SystemClock())
+    commands = [IngestEventCommand("d1", "note", {}, idempotency_key=f"k{n}") for n in range(3)]
+    handler.execute(IngestBatchCommand(commands[:2]))
+
+    result = handler.execute(IngestBatchCommand(commands))
+
+    assert [item.status for item in result.items] == ["duplicate", "duplicate", "accepted"]
+    assert result.states["d1"].version == 3
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for number in range(10_000):
+        bloom.add(f"key-{number}")
+
+    assert all(f"key-{number}" in bloom for number in range(10_000))
+    false_positives = sum(f"other-{number}" in bloom for number in range(10_000))
+    assert false_positives < 300
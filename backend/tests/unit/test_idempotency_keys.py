@@ -0,0 +1,40 @@
+"""Проверка ключей идемпотентности: окно ключей из содержимого и вставка без ON CONFLICT."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from backend.adapters.persistence import sql_idempotency_repo
+from backend.domain.entities import DealReadModel, IdempotencyRecord
+from backend.utils.idempotency import key_from_event
+
+
+def test_payload_keys_repeat_only_within_their_window() -> None:
+    at = datetime(2025, 1, 20, 10, 0, tzinfo=timezone.utc)
+
+    def key(moment: datetime, window: float = 3600) -> str:
+        return key_from_event("d1", "note", {"n": 1}, window, now=moment)
+
+    assert key(at) == key(at + timedelta(minutes=59))
+    assert key(at) != key(at + timedelta(hours=1))
+    assert key(at, window=0) == key(at + timedelta(days=30), window=0)
+
+
+def test_add_many_uses_savepoints_without_on_conflict(
+    sql_uow_factory: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sql_idempotency_repo, "_INSERTS", {})
+    now = datetime(2025, 1, 20, tzinfo=timezone.utc)
+
+    def record(key: str) -> IdempotencyRecord:
+        return IdempotencyRecord(key, "d1", DealReadModel.empty("d1"), now)
+
+    with sql_uow_factory() as uow:
+        assert uow.idempotency.add_many([record("a")]) == {"a"}
+        assert uow.idempotency.add_many([record("a"), record("b")]) == {"b"}
+        uow.commit()
+    with sql_uow_factory() as uow:
+        assert set(uow.idempotency.get_many(["a", "b"])) == {"a", "b"}
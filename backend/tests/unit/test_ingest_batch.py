@@ -0,0 +1,134 @@
+"""Проверка пакетного приёма событий: чанки, multi-row запись и ответ по элементам."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork, SqlAlchemyUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.di import provide_admission, provide_ingest_batch_handler
+from backend.app.main import app
+from backend.application.use_cases import (
+    IngestBatchCommand,
+    IngestBatchHandler,
+    IngestEventCommand,
+)
+from backend.config.settings import get_settings
+
+
+def _commands(count: int, deals: int) -> list[IngestEventCommand]:
+    return [
+        IngestEventCommand(f"deal-{index % deals}", "note", {"n": index}) for index in range(count)
+    ]
+
+
+def test_batch_updates_each_read_model_once_per_chunk(
+    sql_uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+) -> None:
+    opened: list[int] = []
+
+    def factory() -> SqlAlchemyUnitOfWork:
+        opened.append(1)
+        return sql_uow_factory()
+
+    handler = IngestBatchHandler(factory, SystemClock(), chunk_size=100)
+    result = handler.execute(IngestBatchCommand(_commands(250, deals=7)))
+
+    assert len(opened) == 3
+    assert [item.status for item in result.items] == ["accepted"] * 250
+    with sql_uow_factory() as uow:
+        assert len(uow.events.list_for_deal("deal-3")) == 36
+        stored = uow.read_models.get_many(["deal-3", "deal-missing"])
+    assert list(stored) == ["deal-3"]
+    last_event = stored["deal-3"].last_event
+    assert last_event is not None and last_event["payload"] == {"n": 248}
+    assert result.states["deal-3"] == stored["deal-3"]
+
+
+class _FailingUoW(InMemoryUnitOfWork):
+    def commit(self) -> None:
+        raise RuntimeError("db down")
+
+
+def test_failed_chunk_does_not_block_others() -> None:
+    factories = iter([InMemoryUnitOfWork, _FailingUoW])
+    handler = IngestBatchHandler(lambda: next(factories)(), SystemClock(), chunk_size=2)
+    result = handler.execute(IngestBatchCommand(_commands(4, deals=2)))
+
+    assert [item.status for item in result.items] == ["accepted"] * 2 + ["failed"] * 2
+    assert result.items[3].error == "RuntimeError: db down"
+
+
+def test_route_accepts_json_array_and_ndjson() -> None:
+    uow = InMemoryUnitOfWork()
+    app.dependency_overrides[provide_ingest_batch_handler] = lambda: IngestBatchHandler(
+        lambda: uow, SystemClock()
+    )
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    client = TestClient(app)
+    try:
+        array = client.post(
+            "/events:batch",
+            json=[{"deal_id": "d1", "kind": "a"}, {"kind": "b"}, {"deal_id": "d2", "kind": "c"}],
+        )
+        lines = [json.dumps({"deal_id": "d1", "kind": "x"}), "{oops", ""]
+        ndjson = client.post(
+            "/events:batch",
+            content="\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    body = array.json()
+    assert array.status_code == 200
+    assert (body["accepted"], body["rejected"]) == (2, 1)
+    assert [item["status"] for item in body["items"]] == ["accepted", "rejected", "accepted"]
+    assert body["items"][1]["error"].startswith("deal_id:")
+    assert [item["status"] for item in ndjson.json()["items"]] == ["accepted", "rejected"]
+    assert len(uow.events.list_for_deal("d1")) == 2
+
+
+def test_route_counts_write_failures_apart_from_validation_rejects() -> None:
+    factories = iter([InMemoryUnitOfWork, _FailingUoW])
+    app.dependency_overrides[provide_ingest_batch_handler] = lambda: IngestBatchHandler(
+        lambda: next(factories)(), SystemClock(), chunk_size=1
+    )
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    try:
+        response = TestClient(app).post(
+            "/events:batch",
+            json=[{"deal_id": "d1", "kind": "a"}, {"kind": "b"}, {"deal_id": "d2", "kind": "c"}],
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    body = response.json()
+    assert (body["accepted"], body["rejected"], body["failed"]) == (1, 1, 1)
+    assert [item["status"] for item in body["items"]] == ["accepted", "rejected", "failed"]
+
+
+def test_route_rejects_undecodable_and_oversized_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INGEST_MAX_BATCH_BYTES", "64")
+    get_settings.cache_clear()
+    app.dependency_overrides[provide_ingest_batch_handler] = lambda: IngestBatchHandler(
+        InMemoryUnitOfWork, SystemClock()
+    )
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    client = TestClient(app)
+    ndjson = {"Content-Type": "application/x-ndjson"}
+    try:
+        broken = client.post("/events:batch", content=b"\xff\xfe{}", headers=ndjson)
+        broken_json = client.post("/events:batch", content=b"[\xff]")
+        oversized = client.post("/events:batch", content=b" " * 65, headers=ndjson)
+    finally:
+        app.dependency_overrides.clear()
+        get_settings.cache_clear()
+
+    assert (broken.status_code, broken_json.status_code) == (400, 400)
+    assert oversized.status_code == 413
@@ -0,0 +1,111 @@
+"""Проверка инструментирования LLM: метрики по use case, ретраи по схеме и журнал стоимости."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.adapters.llm.cost_ledger import CostLedger, ModelPrice
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.llm.instrumented import InstrumentedLLMClient
+from backend.adapters.llm.response_schema import schema_validator
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.app.di import provide_cost_ledger
+from backend.app.llm import build_llm
+from backend.app.profiling import ProfilingRuntime, get_profiling
+from backend.app.routes import admin
+from backend.ports.llm_client import LLMError, LLMRequest, LLMResponse
+from backend.prompts.renderer import PromptRenderer
+
+
+class _FlakyClient:
+    def __init__(self, failures: int) -> None:
+        self._failures = failures
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        if self._failures:
+            self._failures -= 1
+            raise LLMError("503")
+        return LLMResponse("[]", "GigaChat", prompt_tokens=1000, completion_tokens=500)
+
+
+def _request(deal_id: str = "deal-1") -> LLMRequest:
+    return LLMRequest("extract", "system", "user", deal_id=deal_id, framework="bant")
+
+
+def test_calls_are_recorded_per_use_case_and_priced_per_deal() -> None:
+    metrics = InMemoryMetrics()
+    ledger = CostLedger({"GigaChat": ModelPrice(prompt_per_1k=1.0, completion_per_1k=2.0)})
+    client = InstrumentedLLMClient(_FlakyClient(failures=1), metrics, ledger, max_retries=2)
+    client.complete(_request())
+    client.complete(_request("deal-2"))
+
+    labels = {"use_case": "extract", "framework": "bant"}
+    assert metrics.counter("llm_errors_total", **labels) == 1
+    assert metrics.counter("llm_retries_total", **labels) == 1
+    assert metrics.counter("llm_prompt_tokens_total", model="GigaChat", **labels) == 2000
+    assert metrics.histogram("llm_latency_seconds", model="GigaChat", **labels).count == 2
+    assert ledger.for_deal("deal-1").cost == pytest.approx(2.0)
+    assert ledger.for_deal("deal-1").by_task == {"extract": pytest.approx(2.0)}
+    assert [entry.deal_id for entry in ledger.top(1)] == ["deal-1"]
+
+
+def test_schema_failures_are_counted_and_retried() -> None:
+    answers = iter(['[{"letter": "B"}]', "[]"])
+    metrics = InMemoryMetrics()
+    client = InstrumentedLLMClient(
+        FakeLLMClient(lambda request: next(answers)),
+        metrics,
+        validator=schema_validator(PromptRenderer()),
+    )
+
+    assert client.complete(_request()).text == "[]"
+    labels = {"use_case": "extract", "framework": "bant", "model": "fake"}
+    assert metrics.counter("llm_schema_failures_total", **labels) == 1
+    assert metrics.counter("llm_calls_total", **labels) == 2
+
+
+def test_streamed_calls_are_priced_and_listed_in_admin() -> None:
+    metrics = InMemoryMetrics()
+    provider = FakeLLMClient("[]" + " " * 398, model="GigaChat", chunk_size=100)
+    client, ledger = build_llm(metrics, provider)
+    assert client is not None and ledger is not None
+    request = LLMRequest("extract", "s" * 2000, "u" * 2000, deal_id="deal-1", framework="bant")
+
+    assert "".join(client.stream(request)).strip() == "[]"
+    labels = {"use_case": "extract", "framework": "bant", "model": "GigaChat"}
+    assert metrics.counter("llm_prompt_tokens_total", **labels) == 1000
+    assert metrics.counter("llm_completion_tokens_total", **labels) == 100
+    assert ledger.for_deal("deal-1").cost == pytest.approx(0.22)
+
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_profiling] = lambda: ProfilingRuntime(token="secret")
+    app.dependency_overrides[provide_cost_ledger] = lambda: ledger
+    response = TestClient(app).get("/admin/llm-costs", headers={"X-Profile-Token": "secret"})
+    assert response.status_code == 200
+    assert response.json()[0]["deal_id"] == "deal-1"
+    assert response.json()[0]["by_task"] == {"extract": pytest.approx(0.22)}
+
+
+def test_ledger_evicts_old_deals_but_keeps_process_totals() -> None:
+    ledger = CostLedger({"GigaChat": ModelPrice(prompt_per_1k=1.0, completion_per_1k=0.0)}, 2)
+    for deal_id in ("deal-1", "deal-2", "deal-1", "deal-3"):
+        ledger.record(deal_id, "extract", "GigaChat", 1000, 0)
+
+    assert sorted(entry.deal_id for entry in ledger.top(10)) == ["deal-1", "deal-3"]
+    assert ledger.for_deal("deal-2").calls == 0
+    assert ledger.totals().calls == 4
+    assert ledger.totals().cost == pytest.approx(4.0)
+
+
+def test_llm_is_disabled_without_provider() -> None:
+    assert build_llm(InMemoryMetrics(), None) == (None, None)
+
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_profiling] = lambda: ProfilingRuntime(token="secret")
+    app.dependency_overrides[provide_cost_ledger] = lambda: None
+    response = TestClient(app).get("/admin/llm-costs", headers={"X-Profile-Token": "secret"})
+    assert response.status_code == 404
@@ -0,0 +1,90 @@
+"""Проверка планировщика LLM: WFQ, лимиты полос, дедлайны и изоляция backfill."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from threading import Event
+
+import pytest
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.llm.lanes import FairQueue, LaneConfig, QueuedJob
+from backend.adapters.llm.scheduler import LLMScheduler
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.ports.llm_client import LLMDeadlineExceeded, LLMRequest
+
+
+def _request(deal_id: str = "deal-1", task: str = "extract") -> LLMRequest:
+    return LLMRequest(task=task, system="system", user="user", deal_id=deal_id)
+
+
+def _job(deadline: float | None = None) -> QueuedJob:
+    return QueuedJob(request=_request(), future=Future(), enqueued_at=0.0, deadline=deadline)
+
+
+def test_fair_queue_respects_lane_weights() -> None:
+    queue = FairQueue(
+        [
+            LaneConfig("interactive", weight=3.0, max_concurrency=100),
+            LaneConfig("backfill", weight=1.0, max_concurrency=100),
+        ]
+    )
+    for _ in range(12):
+        queue.push(_job(), "interactive")
+        queue.push(_job(), "backfill")
+    jobs = [queue.pop_ready(0.0, []) for _ in range(8)]
+    picked = [job.lane for job in jobs if job is not None]
+
+    assert picked.count("interactive") == 6
+    assert picked.count("backfill") == 2
+
+
+def test_fair_queue_drops_and_demotes_stale_jobs() -> None:
+    queue = FairQueue(
+        [
+            LaneConfig("nrt", 2.0, 1, on_deadline="demote", demote_to="backfill"),
+            LaneConfig("backfill", 1.0, 1, on_deadline="drop"),
+        ]
+    )
+    queue.push(_job(deadline=1.0), "backfill")
+    queue.push(_job(deadline=1.0), "nrt")
+    expired: list[tuple[QueuedJob, str]] = []
+    job = queue.pop_ready(5.0, expired)
+
+    assert [action for _, action in expired] == ["demote", "drop"]
+    assert job is not None and job.lane == "backfill" and job.deadline is None
+
+
+def test_scheduler_drops_stale_backfill_with_error() -> None:
+    metrics = InMemoryMetrics()
+    scheduler = LLMScheduler(FakeLLMClient("[]"), workers=1, metrics=metrics)
+    future = scheduler.submit(_request(), lane="backfill", timeout=-1.0)
+
+    with pytest.raises(LLMDeadlineExceeded):
+        future.result(timeout=5)
+    scheduler.shutdown()
+    assert metrics.counter("llm_jobs_dropped_total", lane="backfill") == 1.0
+
+
+def test_interactive_is_served_while_backfill_is_saturated() -> None:
+    release = Event()
+
+    def responder(request: LLMRequest) -> str:
+        if request.task == "backfill":
+            release.wait(timeout=10)
+        return "[]"
+
+    client = FakeLLMClient(responder)
+    scheduler = LLMScheduler(client, workers=2)
+    backfill = [
+        scheduler.submit(_request(f"deal-{idx}", "backfill"), lane="backfill")
+        for idx in range(100_000)
+    ]
+    interactive = scheduler.lane("interactive")
+    responses = [interactive.complete(_request("hot-deal")) for _ in range(20)]
+
+    assert all(response.text == "[]" for response in responses)
+    assert scheduler.depth("backfill") >= 100_000 - 1
+    release.set()
+    scheduler.shutdown(cancel_pending=True)
+    assert backfill[0].result(timeout=5).text == "[]"
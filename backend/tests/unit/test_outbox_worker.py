@@ -0,0 +1,150 @@
+"""Проверка outbox задач: запись с событием, дедупликация, ретраи и конкурентные воркеры."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.orm_models import Base
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork, SqlAlchemyUnitOfWork
+from backend.adapters.recompute.outbox_worker import OutboxWorker
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases import (
+    IngestBatchCommand,
+    IngestBatchHandler,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.ports.clock import ClockPort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+class _ManualClock(ClockPort):
+    def __init__(self) -> None:
+        self.now = datetime(2025, 1, 20, tzinfo=timezone.utc)
+
+    def utcnow(self) -> datetime:
+        return self.now
+
+
+def test_jobs_are_written_with_events_deduped_by_deal(sql_uow_factory: UnitOfWorkFactory) -> None:
+    ingest = IngestEventHandler(sql_uow_factory, SystemClock(), outbox_kinds=("recompute",))
+    for deal_id in ["deal-1"] * 5 + ["deal-2"] * 2:
+        ingest.execute(IngestEventCommand(deal_id, "note", {}))
+    calls: Counter[str] = Counter()
+    worker = OutboxWorker(
+        sql_uow_factory, {"recompute": lambda deal_id: calls.update([deal_id])}, SystemClock()
+    )
+
+    assert worker.run_once() == 2
+    assert calls == {"deal-1": 1, "deal-2": 1}
+    assert worker.run_once() == 0
+
+
+def test_failures_back_off_and_are_buried_after_max_attempts() -> None:
+    uow, clock, metrics = InMemoryUnitOfWork(), _ManualClock(), InMemoryMetrics()
+    IngestEventHandler(lambda: uow, clock, outbox_kinds=("recompute",)).execute(
+        IngestEventCommand("deal-1", "note", {})
+    )
+
+    def boom(deal_id: str) -> None:
+        raise RuntimeError("llm down")
+
+    worker = OutboxWorker(
+        lambda: uow, {"recompute": boom}, clock, backoff_seconds=10, max_attempts=2, metrics=metrics
+    )
+    assert worker.run_once() == 1
+    clock.now += timedelta(seconds=9)
+    assert worker.run_once() == 0
+    clock.now += timedelta(seconds=1)
+    assert worker.run_once() == 1
+
+    assert uow.jobs.count_pending() == 0
+    assert metrics.counter("outbox_jobs_retried_total", kind="recompute") == 1
+    assert metrics.counter("outbox_jobs_dead_total", kind="recompute") == 1
+
+
+def test_concurrent_workers_share_queue_without_double_processing(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"timeout": 30}, future=True
+    )
+    Base.metadata.create_all(engine)
+    sessions = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    factory = lambda: SqlAlchemyUnitOfWork(sessions)  # noqa: E731
+    commands = [IngestEventCommand(f"deal-{index % 50}", "note", {}) for index in range(200)]
+    batch = IngestBatchHandler(factory, SystemClock(), chunk_size=20, outbox_kinds=("recompute",))
+    batch.execute(IngestBatchCommand(commands))
+    calls: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def handle(deal_id: str) -> None:
+        with lock:
+            calls.update([deal_id])
+
+    workers = [
+        OutboxWorker(factory, {"recompute": handle}, SystemClock(), batch_size=5) for _ in range(4)
+    ]
+    threads = [threading.Thread(target=_drain, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    assert set(calls) == {f"deal-{index}" for index in range(50)}
+    assert set(calls.values()) == {1}
+
+
+class _FlakyUnitOfWork(InMemoryUnitOfWork):
+    """Первые failures открытий падают, как при недоступной БД."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    def __enter__(self) -> _FlakyUnitOfWork:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database is down")
+        super().__enter__()
+        return self
+
+
+class _RecordingStop(threading.Event):
+    """Событие остановки, которое запоминает паузы и срабатывает после limit пауз."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.waits: list[float] = []
+        self._limit = limit
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout or 0.0)
+        if len(self.waits) >= self._limit:
+            self.set()
+        return self.is_set()
+
+
+def test_run_forever_survives_claim_errors_with_backoff() -> None:
+    uow, metrics = _FlakyUnitOfWork(failures=3), InMemoryMetrics()
+    calls: list[str] = []
+    worker = OutboxWorker(
+        lambda: uow, {"recompute": calls.append}, _ManualClock(), backoff_seconds=2, metrics=metrics
+    )
+    stop = _RecordingStop(limit=4)
+
+    worker.run_forever(stop, idle_seconds=5)
+
+    assert stop.waits == [2, 4, 8, 5]
+    assert metrics.counter("outbox_worker_errors_total") == 3
+
+
+def _drain(worker: OutboxWorker) -> None:
+    while worker.run_once():
+        pass
@@ -0,0 +1,136 @@
+"""Проверка реестра метрик: шарды потоков, формат экспозиции, слияние воркеров и /metrics."""
+
+from __future__ import annotations
+
+import gc
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from backend.adapters.metrics.exposition import render
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.metrics.multiprocess import SnapshotDirectory
+from backend.adapters.metrics.prometheus_metrics import PrometheusMetrics
+from backend.adapters.persistence.instrumented_unit_of_work import InstrumentedUnitOfWork
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.app.main import app
+from backend.app.metrics import watch_pool
+
+
+def test_thread_shards_are_summed_into_cumulative_histogram() -> None:
+    metrics = PrometheusMetrics(buckets=(0.1, 1.0))
+
+    def work() -> None:
+        for _ in range(1_000):
+            metrics.inc("jobs_total", kind="a")
+            metrics.observe("job_seconds", 0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics.observe("job_seconds", 0.05)
+    metrics.set_gauge("depth", 3, queue='re"compute')
+    text = render(metrics.snapshot())
+
+    assert 'jobs_total{kind="a"} 4000' in text
+    assert 'job_seconds_bucket{le="0.1"} 1' in text
+    assert 'job_seconds_bucket{le="1"} 4001' in text
+    assert 'job_seconds_bucket{le="+Inf"} 4001' in text
+    assert "job_seconds_count 4001" in text
+    assert 'depth{queue="re\\"compute"} 3' in text
+
+
+def test_worker_snapshots_merge_counters_and_label_gauges_by_pid(tmp_path: Path) -> None:
+    first, second = PrometheusMetrics(), PrometheusMetrics()
+    for metrics in (first, second):
+        metrics.inc("requests_total", 2)
+        metrics.set_gauge("in_flight", 1)
+    SnapshotDirectory(tmp_path, pid=2).write(second.snapshot())
+
+    directory = SnapshotDirectory(tmp_path, pid=1, is_alive=lambda pid: True)
+    text = render(directory.merged(first.snapshot()))
+
+    assert "requests_total 4" in text
+    assert 'in_flight{pid="1"} 1' in text and 'in_flight{pid="2"} 1' in text
+
+
+def test_dead_worker_keeps_counters_but_loses_gauges_and_file_on_startup(
+    tmp_path: Path,
+) -> None:
+    dead = PrometheusMetrics()
+    dead.inc("requests_total", 3)
+    dead.observe("request_seconds", 0.2)
+    dead.set_gauge("in_flight", 5)
+    SnapshotDirectory(tmp_path, pid=7).write(dead.snapshot())
+    own = PrometheusMetrics()
+    own.inc("requests_total")
+    directory = SnapshotDirectory(tmp_path, pid=1, is_alive=lambda pid: pid != 7)
+
+    before = render(directory.merged(own.snapshot()))
+    retired = directory.retire_dead()
+    after = render(directory.merged(own.snapshot()))
+
+    assert before == after
+    assert "requests_total 4" in after and "request_seconds_count 1" in after
+    assert 'pid="7"' not in after and "in_flight" not in after
+    assert retired == 1 and not (tmp_path / "7.json").exists()
+    assert directory.retire_dead() == 0
+    assert "requests_total 4" in render(directory.merged(own.snapshot()))
+
+
+def test_shards_of_finished_threads_are_folded_into_the_base() -> None:
+    metrics = PrometheusMetrics(buckets=(1.0,))
+    threads = [
+        threading.Thread(target=lambda: metrics.observe("job_seconds", 0.5)) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    del threads, thread
+    gc.collect()
+    metrics.inc("jobs_total")
+
+    assert len(metrics._shards) == 1
+    assert metrics.snapshot().histograms[("job_seconds", ())] == [3.0, 0.0, 1.5]
+
+
+def test_metrics_route_exposes_route_latency_by_template() -> None:
+    client = TestClient(app)
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_seconds_count{method="GET",route="/health",status="200"}' in response.text
+
+
+def test_unit_of_work_duration_and_commits_are_recorded() -> None:
+    metrics = InMemoryMetrics()
+    with InstrumentedUnitOfWork(InMemoryUnitOfWork(), metrics) as uow:
+        uow.commit()
+    with pytest.raises(RuntimeError):
+        with InstrumentedUnitOfWork(InMemoryUnitOfWork(), metrics, "read"):
+            raise RuntimeError("boom")
+
+    assert metrics.counter("uow_commits_total", uow="write") == 1
+    assert metrics.histogram("uow_seconds", uow="write", outcome="commit").count == 1
+    assert metrics.histogram("uow_seconds", uow="read", outcome="error").count == 1
+
+
+def test_pool_gauges_are_collected_on_snapshot(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=3)
+    metrics = PrometheusMetrics()
+    watch_pool(metrics, engine)
+
+    with engine.connect():
+        gauges = metrics.snapshot().gauges
+    engine.dispose()
+
+    assert gauges[("db_pool_checked_out", (("pool", "primary"),))] == 1
+    assert gauges[("db_pool_size", (("pool", "primary"),))] == 3
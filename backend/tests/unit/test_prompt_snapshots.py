@@ -210,6 +210,7 @@ def test_arbiter_prompts_snapshot(framework_id: str) -> None:
         "extract/schema.extract.json",
         "reasoner/schema.reasoner.json",
         "arbiter/schema.arbiter.json",
+        "arbiter_batch/schema.arbiter_batch.json",
     ],
 )
 def test_json_schemas_are_valid(schema_name: str) -> None:
@@ -0,0 +1,110 @@
+"""Проверка кэша read-model: LRU+TTL, write-through после commit и инвалидация по версии."""
+
+from __future__ import annotations
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork, SqlAlchemyUnitOfWork
+from backend.adapters.sse.backends import InProcessBackend, InProcessHub
+from backend.adapters.sse.broadcaster import SSEBroadcaster
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.notifications import build_notifier, build_read_model_cache
+from backend.application.use_cases import (
+    GetDealStateHandler,
+    GetDealStateQuery,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.config.settings import Settings
+from backend.domain.entities import DealReadModel
+
+
+def _model(deal_id: str, version: int) -> DealReadModel:
+    return DealReadModel(deal_id, "pending", None, None, None, version=version)
+
+
+def test_lru_and_ttl_evictions_are_counted() -> None:
+    now = [0.0]
+    metrics = InMemoryMetrics()
+    cache = ReadModelCache(max_entries=2, ttl_seconds=10.0, metrics=metrics, clock=lambda: now[0])
+    for deal_id in ("a", "b"):
+        cache.put(_model(deal_id, 1))
+    cache.get("a")
+    cache.put(_model("c", 1))
+    now[0] = 11.0
+
+    assert cache.get("b") is None
+    assert cache.get("a") is None
+    assert metrics.counter("read_model_cache_evictions_total", reason="size") == 1
+    assert metrics.counter("read_model_cache_evictions_total", reason="ttl") == 1
+    assert metrics.counter("read_model_cache_hits_total") == 1
+    assert metrics.counter("read_model_cache_misses_total") == 2
+
+
+def test_versions_never_go_backwards() -> None:
+    cache = ReadModelCache()
+    cache.put(_model("a", 5))
+    cache.put(_model("a", 4))
+    cache.invalidate("a", below_version=5)
+
+    cached = cache.get("a")
+    assert cached is not None and cached.version == 5
+    cache.invalidate("a", below_version=6)
+    assert cache.get("a") is None
+
+
+def test_hot_reads_are_served_from_cache_and_updated_on_commit(
+    sql_session_factory: sessionmaker[Session],
+) -> None:
+    cache = ReadModelCache()
+    write_factory = lambda: SqlAlchemyUnitOfWork(sql_session_factory)  # noqa: E731
+    read = GetDealStateHandler(lambda: SqlAlchemyUnitOfWork(sql_session_factory, cache))
+    ingest = IngestEventHandler(write_factory, SystemClock(), notifier=cache)
+    ingest.execute(IngestEventCommand("deal-1", "note", {"n": 1}))
+    cache.clear()
+
+    assert read.execute(GetDealStateQuery("deal-1")).version == 1
+    with write_factory() as uow:
+        uow.read_models.delete("deal-1")
+        uow.commit()
+    assert read.execute(GetDealStateQuery("deal-1")).version == 1
+    assert read.stamp(GetDealStateQuery("deal-1")).version == 1
+
+    ingest.execute(IngestEventCommand("deal-1", "note", {"n": 2}))
+    last_event = read.execute(GetDealStateQuery("deal-1")).last_event
+    assert last_event is not None and last_event["payload"] == {"n": 2}
+
+
+def test_other_workers_drop_cached_state_without_sse_fanout() -> None:
+    settings = Settings(SSE_BACKEND="memory")
+    hub, engine = InProcessHub(), create_engine("sqlite://")
+    caches = [ReadModelCache(), ReadModelCache()]
+    notifiers = [
+        build_notifier(
+            settings,
+            engine,
+            SSEBroadcaster(),
+            GetDealStateHandler(InMemoryUnitOfWork),
+            cache,
+            backend=InProcessBackend(hub),
+        )
+        for cache in caches
+    ]
+    caches[1].put(_model("deal-1", 1))
+
+    notifiers[0].publish(_model("deal-1", 2))
+
+    assert caches[0].get("deal-1") == _model("deal-1", 2)
+    assert caches[1].get("deal-1") is None
+
+
+def test_cache_needs_a_cross_process_channel_when_shared() -> None:
+    sqlite, postgres = "sqlite:///deals.db", "postgresql+psycopg://deal@db/deals"
+
+    assert build_read_model_cache(Settings(DATABASE_URL=sqlite)) is not None
+    assert build_read_model_cache(Settings(DATABASE_URL=sqlite, WEB_CONCURRENCY=2)) is None
+    assert build_read_model_cache(Settings(DATABASE_URL=sqlite, RECOMPUTE_MODE="outbox")) is None
+    assert build_read_model_cache(Settings(DATABASE_URL=postgres, WEB_CONCURRENCY=2)) is not None
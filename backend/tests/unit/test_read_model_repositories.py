@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
 
-from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.persistence.sql_read_model_repo import SqlReadModelRepository
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork, SqlAlchemyUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases import IngestEventCommand, IngestEventHandler
+from backend.application.use_cases.recompute import RecomputeCommand, RecomputeHandler
 from backend.domain.entities import DealReadModel
+from backend.ports.repositories import ReadModelConflict
+
+SqlUowFactory = Callable[[], SqlAlchemyUnitOfWork]
 
 
 def _make_read_model(status: str = "pending") -> DealReadModel:
@@ -55,3 +64,46 @@ def test_sql_read_model_repo_crud(sql_uow_factory) -> None:
         assert uow.read_models.get("deal-1") is None
 
 
+def test_sql_read_model_save_rejects_row_changed_after_read(sql_uow_factory: SqlUowFactory) -> None:
+    with sql_uow_factory() as uow:
+        uow.read_models.save(replace(_make_read_model(), version=1))
+        uow.commit()
+    with sql_uow_factory() as stale:
+        read = stale.read_models.get("deal-1")
+        assert read is not None
+        with sql_uow_factory() as other:
+            current = other.read_models.get("deal-1")
+            assert current is not None
+            other.read_models.save(replace(current, status="go", version=2))
+            other.commit()
+        with pytest.raises(ReadModelConflict):
+            stale.read_models.save(replace(read, status="stop", version=2))
+        stale.rollback()
+    with sql_uow_factory() as uow:
+        stored = uow.read_models.get("deal-1")
+        assert stored is not None
+        assert (stored.status, stored.version) == ("go", 2)
+
+
+def test_recompute_retries_on_top_of_concurrent_ingest(
+    sql_uow_factory: SqlUowFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ingest = IngestEventHandler(sql_uow_factory, SystemClock())
+    ingest.execute(IngestEventCommand("deal-1", "call", {"n": 1}))
+    original_get = SqlReadModelRepository.get
+    raced: list[bool] = []
+
+    def get_then_ingest(self: SqlReadModelRepository, deal_id: str) -> DealReadModel | None:
+        model = original_get(self, deal_id)
+        if not raced:
+            raced.append(True)
+            ingest.execute(IngestEventCommand("deal-1", "call", {"n": 2}))
+        return model
+
+    monkeypatch.setattr(SqlReadModelRepository, "get", get_then_ingest)
+    handler = RecomputeHandler(sql_uow_factory, framework_ids=("bant",))
+    updated = handler.execute(RecomputeCommand("deal-1"))
+
+    assert updated.version == 3
+    assert updated.last_event is not None
+    assert updated.last_event["payload"] == {"n": 2}
@@ -0,0 +1,149 @@
+"""Проверка чтения с реплик: READ ONLY UnitOfWork и read-your-writes (два файла SQLite)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.admission.controller import AdmissionController
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.read_model_cache import ReadModelCache
+from backend.adapters.persistence.read_routing import (
+    ReadSession,
+    current_reads,
+    reading_from_primary,
+)
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.database import build_engines, build_uow_factories
+from backend.app.di import (
+    provide_admission,
+    provide_get_state_handler,
+    provide_ingest_event_handler,
+)
+from backend.app.main import app
+from backend.app.read_your_writes import READ_YOUR_WRITES_HEADER
+from backend.application.use_cases import (
+    GetDealStateHandler,
+    GetDealStateQuery,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.config.settings import Settings
+from backend.db.migrate import create_schema
+from backend.domain.entities import DealReadModel
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+Factories = tuple[UnitOfWorkFactory, UnitOfWorkFactory, InMemoryMetrics]
+
+
+def _settings(tmp_path: Path) -> Settings:
+    return Settings.model_validate(
+        {
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'primary.db'}",
+            "DATABASE_REPLICA_URLS": f"sqlite:///{tmp_path / 'replica.db'}",
+            "READ_YOUR_WRITES_SECONDS": 60,
+        }
+    )
+
+
+@pytest.fixture()
+def engines(tmp_path: Path) -> Iterator[list[Engine]]:
+    built = build_engines(_settings(tmp_path))
+    for engine in built.values():
+        create_schema(engine)
+    yield list(built.values())
+    for engine in built.values():
+        engine.dispose()
+
+
+@pytest.fixture()
+def factories(tmp_path: Path, engines: list[Engine]) -> Factories:
+    metrics = InMemoryMetrics()
+    primary, *replicas = engines
+    write, read = build_uow_factories(_settings(tmp_path), primary, metrics, None, replicas)
+    return write, read, metrics
+
+
+def test_reads_go_to_replica_except_for_recent_writer(factories: Factories) -> None:
+    write, read, metrics = factories
+    state = GetDealStateHandler(read)
+    session = ReadSession()
+    token = current_reads.set(session)
+    try:
+        IngestEventHandler(write, SystemClock()).execute(IngestEventCommand("deal-1", "note", {}))
+        own = state.execute(GetDealStateQuery("deal-1"))
+    finally:
+        current_reads.reset(token)
+    # Реплика (отдельный файл) ничего не получила — так выглядит отставание.
+    other = state.execute(GetDealStateQuery("deal-1"))
+    with reading_from_primary():
+        forced = state.execute(GetDealStateQuery("deal-1"))
+
+    assert session.wrote and own.version == forced.version == 1
+    assert other.version == 0
+    assert metrics.histogram("uow_seconds", uow="replica", outcome="closed").count == 1
+    assert metrics.histogram("uow_seconds", uow="read", outcome="closed").count == 2
+
+
+def test_read_unit_of_work_is_read_only(factories: Factories) -> None:
+    _, read, _ = factories
+
+    with read() as uow:
+        with pytest.raises(RuntimeError):
+            uow.commit()
+    with pytest.raises(OperationalError):
+        with read() as uow:
+            uow.read_models.delete("deal-1")
+    with read() as uow:
+        assert uow.read_models.get("deal-1") is None
+
+
+def test_write_deadline_travels_with_the_client(factories: Factories) -> None:
+    write, read, _ = factories
+    app.dependency_overrides[provide_admission] = lambda: AdmissionController()
+    app.dependency_overrides[provide_get_state_handler] = lambda: GetDealStateHandler(read)
+    app.dependency_overrides[provide_ingest_event_handler] = lambda: IngestEventHandler(
+        write, SystemClock()
+    )
+    writer = TestClient(app)
+    try:
+        created = writer.post("/events", json={"deal_id": "d1", "kind": "note"})
+        deadline = created.headers[READ_YOUR_WRITES_HEADER]
+        with_cookie = writer.get("/state/d1")
+        with_header = TestClient(app).get(
+            "/state/d1", headers={READ_YOUR_WRITES_HEADER: deadline}
+        )
+        stranger = TestClient(app).get("/state/d1")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert created.status_code == 201 and "rw_until" in writer.cookies
+    assert with_cookie.json()["version"] == with_header.json()["version"] == 1
+    assert stranger.json()["version"] == 0
+
+
+def test_replica_reads_do_not_fill_read_model_cache(
+    tmp_path: Path, engines: list[Engine]
+) -> None:
+    primary, replica = engines
+    for engine, version in ((primary, 2), (replica, 1)):
+        with SqlAlchemyUnitOfWork(sessionmaker(bind=engine)) as uow:
+            uow.read_models.save(replace(DealReadModel.empty("deal-1"), version=version))
+    cache = ReadModelCache()
+    _, read = build_uow_factories(_settings(tmp_path), primary, InMemoryMetrics(), cache, [replica])
+    state = GetDealStateHandler(read)
+
+    lagging = state.execute(GetDealStateQuery("deal-1"))
+    assert lagging.version == 1 and cache.get("deal-1") is None
+    with reading_from_primary():
+        assert state.execute(GetDealStateQuery("deal-1")).version == 2
+    cached = cache.get("deal-1")
+    assert cached is not None and cached.version == 2
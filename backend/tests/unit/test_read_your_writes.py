@@ -0,0 +1,55 @@
+"""Проверка read-your-writes на стороне клиента: срок в cookie/заголовке и его урезание."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.adapters.persistence.read_routing import ReadYourWrites, current_reads
+from backend.app.read_your_writes import (
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    ReadYourWritesMiddleware,
+)
+
+
+def _client(policy: ReadYourWrites) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, policy=lambda: policy)
+
+    @app.post("/write")
+    def write() -> dict[str, bool]:
+        policy.note_write()
+        return {"sticky": policy.is_sticky()}
+
+    @app.get("/read")
+    def read() -> dict[str, bool]:
+        return {"sticky": policy.is_sticky(), "in_request": current_reads.get() is not None}
+
+    return TestClient(app)
+
+
+def test_only_writes_hand_the_deadline_back_to_the_client() -> None:
+    policy = ReadYourWrites(30.0)
+    client = _client(policy)
+
+    before = client.get("/read")
+    written = client.post("/write")
+    after = client.get("/read")
+
+    assert before.json() == {"sticky": False, "in_request": True}
+    assert READ_YOUR_WRITES_HEADER.lower() not in before.headers
+    assert written.json() == {"sticky": True}
+    assert float(written.headers[READ_YOUR_WRITES_HEADER]) > 0
+    assert "Max-Age=30" in written.headers["set-cookie"]
+    assert READ_YOUR_WRITES_COOKIE in client.cookies and after.json()["sticky"]
+    assert READ_YOUR_WRITES_HEADER.lower() not in after.headers
+
+
+def test_client_deadline_is_capped_by_window_and_garbage_is_ignored() -> None:
+    policy = ReadYourWrites(5.0, clock=lambda: 100.0)
+
+    assert policy.session("1e12").primary_until == 105.0
+    assert policy.session("soon", "102.5").primary_until == 102.5
+    assert policy.session(None).primary_until == 0.0
+    assert not policy.is_sticky()
@@ -0,0 +1,73 @@
+"""Проверка фонового пересчёта: дебаунс серии событий и независимость приёма от пересчёта."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.recompute.dispatcher import RecomputeDispatcher
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases import IngestEventCommand, IngestEventHandler
+from backend.application.use_cases.recompute import RecomputeCommand, RecomputeHandler
+
+
+def test_bursts_are_coalesced_per_deal() -> None:
+    runs: Counter[str] = Counter()
+    metrics = InMemoryMetrics()
+    dispatcher = RecomputeDispatcher(
+        lambda deal_id: runs.update([deal_id]), debounce_seconds=0.05, metrics=metrics
+    )
+    for _ in range(10):
+        dispatcher.enqueue("deal-1")
+    dispatcher.enqueue("deal-2")
+
+    assert dispatcher.depth() == 2
+    dispatcher.shutdown(drain=True)
+    assert runs == {"deal-1": 1, "deal-2": 1}
+    assert metrics.counter("recompute_coalesced_total") == 9
+    assert metrics.histogram("recompute_lag_seconds").count == 2
+    assert metrics.gauge("recompute_queue_depth") == 0
+
+
+def test_enqueue_during_run_schedules_one_more_pass() -> None:
+    started, release = threading.Event(), threading.Event()
+    runs: list[str] = []
+
+    def run(deal_id: str) -> None:
+        runs.append(deal_id)
+        started.set()
+        release.wait(1.0)
+
+    dispatcher = RecomputeDispatcher(run, debounce_seconds=0.0)
+    dispatcher.enqueue("deal-1")
+    assert started.wait(1.0)
+    dispatcher.enqueue("deal-1")
+    dispatcher.enqueue("deal-1")
+    release.set()
+    dispatcher.shutdown(drain=True)
+
+    assert runs == ["deal-1", "deal-1"]
+
+
+def test_ingest_does_not_wait_for_recompute() -> None:
+    uow = InMemoryUnitOfWork()
+    recompute = RecomputeHandler(lambda: uow)
+
+    def slow_recompute(deal_id: str) -> None:
+        time.sleep(0.2)
+        recompute.execute(RecomputeCommand(deal_id))
+
+    dispatcher = RecomputeDispatcher(slow_recompute, debounce_seconds=0.05)
+    ingest = IngestEventHandler(lambda: uow, SystemClock(), recompute_queue=dispatcher)
+    started = time.perf_counter()
+    for _ in range(5):
+        ingest.execute(IngestEventCommand("deal-1", "note", {}))
+    elapsed = time.perf_counter() - started
+    dispatcher.shutdown(drain=True)
+
+    assert elapsed < 0.1
+    stored = uow.read_models.get("deal-1")
+    assert stored is not None and stored.version == 6
@@ -0,0 +1,78 @@
+"""Проверка реестра шагов пересчёта и режима explain (GET /state/{deal_id}/explain)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.app.di import provide_explain_handler
+from backend.app.main import app
+from backend.application.use_cases import ExplainDealStateHandler
+from backend.config.frameworks import get_frameworks
+from backend.domain.entities import Fact
+from backend.pipelines.recompute_steps import RECOMPUTE_STEPS, RecomputeInput
+from backend.pipelines.step_registry import StepRegistry
+
+
+def _fact(kind: str, checks: dict[str, bool]) -> Fact:
+    return Fact(
+        deal_id="deal-1",
+        kind=kind,
+        payload={"checklist": checks},
+        confidence=0.9,
+        observed_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        source="extract",
+    )
+
+
+def test_registry_times_every_step_and_stops_after_named_step() -> None:
+    metrics = InMemoryMetrics()
+    ctx = RecomputeInput(deal_id="deal-1", facts=[], frameworks=list(get_frameworks(["bant"])))
+
+    read_model = RECOMPUTE_STEPS.run(ctx, metrics)
+    trace: list = []
+    gates_ctx = RECOMPUTE_STEPS.run(ctx, stop_after="gates", trace=trace)
+
+    assert read_model.deal_id == "deal-1" and gates_ctx.gates["bant"].status
+    assert RECOMPUTE_STEPS.names == ("derive", "resolve", "completeness", "gates", "assemble")
+    for step in RECOMPUTE_STEPS.names:
+        assert metrics.histogram("recompute_step_seconds", step=step).count == 1
+    assert [timing.step for timing in trace] == list(RECOMPUTE_STEPS.names[:-1])
+
+
+def test_registry_rejects_duplicate_and_unknown_steps() -> None:
+    registry = StepRegistry("demo")
+    registry.register("double", lambda value: value * 2)
+
+    assert registry.run(3) == 6
+    with pytest.raises(ValueError):
+        registry.register("double", lambda value: value)
+    with pytest.raises(KeyError):
+        registry.run(3, stop_after="missing")
+
+
+def test_explain_route_shows_chosen_facts_yes_counts_and_failed_checks() -> None:
+    uow = InMemoryUnitOfWork()
+    budget = {"budget_size_known": True, "budget_owner_identified": True}
+    uow.facts.upsert(_fact("bant.B", budget))
+    handler = ExplainDealStateHandler(lambda: uow, framework_ids=["bant"])
+    app.dependency_overrides[provide_explain_handler] = lambda: handler
+    try:
+        response = TestClient(app).get("/state/deal-1/explain")
+    finally:
+        app.dependency_overrides.clear()
+
+    body = response.json()
+    [bant] = body["frameworks"]
+    letters = {letter["letter"]: letter for letter in bant["letters"]}
+    assert response.status_code == 200
+    assert letters["B"]["yes_count"] == 2 and letters["B"]["fact"]["kind"] == "bant.B"
+    assert letters["A"]["fact"] is None and letters["A"]["yes_count"] == 0
+    assert bant["status"] == bant["gates"][-1]["status"]
+    assert not bant["gates"][0]["passed"] and "score" in bant["gates"][0]["failed_checks"]
+    assert [step["step"] for step in body["steps"]][-1] == "gates"
+    assert uow.read_models.get("deal-1") is None
@@ -0,0 +1,132 @@
+"""Проверка профилирования по требованию: триггер, разбивка по слоям, буфер и /admin."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.adapters.profiling.buffer import ProfileBuffer, RequestProfile
+from backend.adapters.profiling.sampler import StackSampler, layer_of
+from backend.app.profiling import ProfilingMiddleware, ProfilingRuntime, get_profiling
+from backend.app.routes import admin
+
+TOKEN = "s3cret"
+
+
+def _client(runtime: ProfilingRuntime) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, runtime=lambda: runtime)
+    app.include_router(admin.router)
+    app.dependency_overrides[get_profiling] = lambda: runtime
+
+    @app.get("/busy/{n}")
+    def busy(n: int) -> dict[str, int]:
+        deadline, spins = time.perf_counter() + 0.05, 0
+        while time.perf_counter() < deadline:
+            spins += n
+        return {"spins": spins}
+
+    return TestClient(app)
+
+
+def test_only_triggered_requests_are_profiled_with_layer_breakdown() -> None:
+    runtime = ProfilingRuntime(token=TOKEN)
+    client = _client(runtime)
+
+    plain = client.get("/busy/1")
+    wrong = client.get("/busy/1", headers={"X-Profile-Token": "nope"})
+    profiled = client.get("/busy/1", headers={"X-Profile-Token": TOKEN})
+
+    assert "x-profile-id" not in plain.headers and "x-profile-id" not in wrong.headers
+    [profile] = runtime.buffer.recent()
+    assert profiled.headers["x-profile-id"] == str(profile.id)
+    assert profile.route == "/busy/{n}" and profile.status == 200
+    assert profile.samples > 0 and profile.breakdown["app"] > 0
+    assert sum(profile.breakdown.values()) <= profile.duration + 1e-9
+    assert any("busy" in stack for stack, _ in profile.top_stacks)
+
+
+def test_sample_rate_profiles_without_header() -> None:
+    runtime = ProfilingRuntime(sample_rate=1.0)
+    _client(runtime).get("/busy/2")
+
+    assert len(runtime.buffer.recent()) == 1
+
+
+def test_sample_rate_skips_streaming_requests() -> None:
+    runtime = ProfilingRuntime(sample_rate=1.0)
+    client = _client(runtime)
+    client.get("/stream/deal-1")
+    client.get("/busy/1", headers={"Accept": "text/event-stream"})
+
+    assert runtime.buffer.recent() == []
+
+
+def test_sampler_stops_itself_after_max_seconds() -> None:
+    sampler = StackSampler(lambda ident, name: True, interval=0.001, max_seconds=0.02)
+    sampler.start()
+    time.sleep(0.2)
+    assert not sampler._thread.is_alive()
+    sampler.stop()
+
+    assert 0.02 <= sampler.sampled_seconds < 0.2
+
+
+def test_admin_profiles_require_configured_token() -> None:
+    runtime = ProfilingRuntime(token=TOKEN)
+    client = _client(runtime)
+    profile_id = client.get("/busy/1", headers={"X-Profile-Token": TOKEN}).headers["x-profile-id"]
+
+    assert client.get("/admin/profiles").status_code == 403
+    listed = client.get("/admin/profiles", headers={"X-Profile-Token": TOKEN}).json()
+    detail = client.get(f"/admin/profiles/{profile_id}", headers={"X-Profile-Token": TOKEN})
+    assert [item["id"] for item in listed] == [int(profile_id)]
+    assert detail.json()["breakdown"] and detail.json()["top_stacks"]
+    assert _client(ProfilingRuntime()).get("/admin/profiles").status_code == 404
+
+
+def test_buffer_keeps_only_latest_profiles() -> None:
+    buffer = ProfileBuffer(capacity=2)
+    for _ in range(3):
+        buffer.add(
+            RequestProfile(
+                id=buffer.next_id(),
+                method="GET",
+                path="/",
+                route="/",
+                status=200,
+                started_at=datetime.now(timezone.utc),
+                duration=0.0,
+                samples=0,
+            )
+        )
+
+    assert [profile.id for profile in buffer.recent()] == [3, 2]
+    assert buffer.get(1) is None
+
+
+def test_layers_classify_frames_and_skip_idle_ones() -> None:
+    assert layer_of("/site-packages/sqlalchemy/engine/base.py") == "sql"
+    assert layer_of("/site-packages/pydantic/main.py") == "serialization"
+    assert layer_of("/repo/backend/app/di.py") == "di"
+    assert layer_of("/usr/lib/python3.11/selectors.py") is None
+
+
+def test_only_one_sampler_runs_per_process() -> None:
+    runtime = ProfilingRuntime(token=TOKEN)
+    running = StackSampler(lambda ident, name: False)
+    assert running.start()
+    try:
+        skipped = _client(runtime).get("/busy/1", headers={"X-Profile-Token": TOKEN})
+        assert not StackSampler(lambda ident, name: False).start()
+    finally:
+        running.stop()
+
+    assert skipped.status_code == 200 and "x-profile-id" not in skipped.headers
+    assert runtime.buffer.recent() == []
+    assert _client(runtime).get("/busy/1", headers={"X-Profile-Token": TOKEN}).headers.get(
+        "x-profile-id"
+    )
@@ -0,0 +1,150 @@
+"""Проверка Arbiter: детерминированный поиск конфликтов и один пакетный вызов LLM."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases.extract_facts import ExtractFactsCommand, ExtractFactsHandler
+from backend.application.use_cases.run_arbiter import (
+    ArbiterOutcome,
+    RunArbiterCommand,
+    RunArbiterHandler,
+)
+from backend.domain.conflicts import FacetCandidate, detect_conflicts
+from backend.domain.entities import Fact
+from backend.pipelines.extract_llm import ExtractSource
+from backend.ports.llm_client import LLMRequest
+from backend.prompts.renderer import PromptRenderer
+
+
+def _candidate(cid: str, facet: str, value: object, confidence: float) -> FacetCandidate:
+    return FacetCandidate(
+        id=cid,
+        letter="B",
+        facet=facet,
+        value=value,
+        confidence=confidence,
+        source="chat",
+        evidence=f"цитата {cid}",
+    )
+
+
+def _select_last(request: LLMRequest, decision: str = "select") -> str:
+    resolutions = []
+    for block in request.user.split("## Facet: ")[1:]:
+        facet = block.splitlines()[0].strip()
+        ids = [line.split("id: ")[1] for line in block.splitlines() if "- id: " in line]
+        resolutions.append(
+            {
+                "facet": facet,
+                "letter": "B",
+                "decision": decision,
+                "selected_id": ids[-1] if decision == "select" else None,
+                "rationale": "свежее подтверждение",
+                "comparisons": [
+                    {
+                        "candidate_id": cid,
+                        "verdict": "accept" if cid == ids[-1] else "reject",
+                        "reason": "сравнение evidence",
+                        "evidence": f"цитата {cid}",
+                        "confidence": 0.8,
+                    }
+                    for cid in ids
+                ],
+                "question": {"ask": False, "text": None, "reason": None},
+            }
+        )
+    return json.dumps({"resolutions": resolutions}, ensure_ascii=False)
+
+
+def _run(candidates: list[FacetCandidate], llm: FakeLLMClient) -> ArbiterOutcome:
+    handler = RunArbiterHandler(llm=llm, renderer=PromptRenderer())
+    command = RunArbiterCommand(
+        deal_id="deal-1",
+        candidates=tuple(candidates),
+        source=ExtractSource(crm={"Этап": "Решение"}),
+        framework="BANT",
+    )
+    return handler.execute(command)
+
+
+def test_duplicates_and_large_gaps_are_not_conflicts() -> None:
+    candidates = [
+        _candidate("c0", "budget_confirmed", True, 0.9),
+        _candidate("c1", "budget_confirmed", True, 0.7),
+        _candidate("c2", "budget_amount", 100, 0.95),
+        _candidate("c3", "budget_amount", 200, 0.4),
+    ]
+    llm = FakeLLMClient(_select_last)
+    outcome = _run(candidates, llm)
+
+    assert detect_conflicts(candidates, 0.2) == []
+    assert outcome.llm_calls == 0 and llm.calls == []
+    assert outcome.winners[("B", "budget_amount")].id == "c2"
+
+
+def test_all_conflicts_of_a_deal_are_resolved_in_one_call() -> None:
+    candidates = [
+        candidate
+        for index, facet in enumerate(["f1", "f2", "f3", "f4", "f5"])
+        for candidate in (
+            _candidate(f"a{index}", facet, "старое", 0.8),
+            _candidate(f"b{index}", facet, "новое", 0.75),
+        )
+    ]
+    llm = FakeLLMClient(_select_last)
+    outcome = _run(candidates, llm)
+
+    assert outcome.llm_calls == 1 and len(llm.calls) == 1
+    assert llm.calls[0].user.count("## Facet: ") == 5
+    assert {winner.id for winner in outcome.winners.values()} == {f"b{i}" for i in range(5)}
+
+
+@pytest.mark.parametrize("decision", ["select", "reject_all"])
+def test_new_value_conflicting_with_stored_fact_goes_to_arbiter(decision: str) -> None:
+    stored_entry = {
+        "value": 9000000,
+        "confidence": 0.85,
+        "source": "crm",
+        "evidence": "Бюджет 9 млн",
+        "ts": "2025-01-05",
+    }
+    uow = InMemoryUnitOfWork()
+    uow.facts.upsert(
+        Fact(
+            deal_id="deal-1",
+            kind="bant.B",
+            payload={"facets": {"budget_amount": stored_entry}, "checklist": {}},
+            confidence=0.85,
+            observed_at=datetime(2025, 1, 5, tzinfo=timezone.utc),
+            source="extract",
+        )
+    )
+    new_item = {**stored_entry, "letter": "B", "facet": "budget_amount", "value": 12500000}
+    new_item.update(confidence=0.9, source="chat", evidence="Бюджет 12.5 млн", ts="2025-01-12")
+
+    def respond(request: LLMRequest) -> str:
+        if request.task == "arbiter":
+            return _select_last(request, decision)
+        return json.dumps([new_item])
+
+    llm = FakeLLMClient(respond)
+    renderer = PromptRenderer()
+    handler = ExtractFactsHandler(
+        lambda: uow, llm, renderer, SystemClock(), arbiter=RunArbiterHandler(llm, renderer)
+    )
+    command = ExtractFactsCommand("deal-1", ExtractSource(crm={}), framework_ids=("bant",))
+
+    written = handler.execute(command)
+    arbiter_calls = [call for call in llm.calls if call.task == "arbiter"]
+    assert len(arbiter_calls) == 1
+    assert "value: 9000000" in arbiter_calls[0].user
+    (fact,) = uow.facts.list_for_deal("deal-1")
+    assert written == ([] if decision == "select" else [fact])
+    assert fact.payload["facets"] == ({"budget_amount": stored_entry} if written == [] else {})
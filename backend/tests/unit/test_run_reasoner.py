@@ -0,0 +1,125 @@
+"""Проверка инкрементального Reasoner: пропуск без изменений и дифф вместо полного промпта."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.application.use_cases.run_reasoner import RunReasonerCommand, RunReasonerHandler
+from backend.domain.entities import DealReadModel, Fact, Reasoning
+from backend.pipelines.extract_llm import ExtractSource
+from backend.ports.clock import ClockPort
+from backend.ports.unit_of_work import UnitOfWorkFactory
+from backend.prompts.renderer import PromptRenderer
+
+_NOW = datetime(2025, 1, 20, tzinfo=timezone.utc)
+_RESPONSE = {
+    "decision": {"status": "hold", "score": 0.5, "confidence": 0.6, "explanation": "Нет бюджета"},
+    "why": [
+        {
+            "letter": "N",
+            "facet": "pain_confirmed",
+            "status": "ok",
+            "signal": "Боль подтверждена",
+            "evidence": "Отчёты собираются вручную",
+            "source": "facts",
+            "confidence": 0.8,
+        }
+    ],
+    "risks": [],
+    "next_step": {
+        "summary": "Уточнить бюджет",
+        "owner": "manager",
+        "due": None,
+        "reason": "Бюджет не подтверждён",
+        "confidence": 0.7,
+    },
+    "question": {"ask": False, "text": None, "reason": None},
+}
+
+
+class _FixedClock(ClockPort):
+    def utcnow(self) -> datetime:
+        return _NOW
+
+
+def _fact(letter: str, facet: str, value: object, framework: str = "bant") -> Fact:
+    entry = {"value": value, "confidence": 0.8, "source": "chat", "evidence": "цитата", "ts": None}
+    return Fact(
+        deal_id="deal-1",
+        kind=f"{framework}.{letter}",
+        payload={"facets": {facet: entry}, "checklist": {facet: bool(value)}},
+        confidence=0.8,
+        observed_at=_NOW,
+    )
+
+
+def _seed(uow: InMemoryUnitOfWork, status: str, budget: object) -> None:
+    uow.facts.upsert(_fact("N", "pain_confirmed", "Отчёты собираются вручную " * 20))
+    uow.facts.upsert(_fact("B", "budget_confirmed", budget))
+    letters = {"bant": {"per_letter": {"B": 0.5}, "yes_counts": {"B": 1}, "gate_checks": {}}}
+    uow.read_models.save(DealReadModel("deal-1", status, 0.5, None, _NOW, letters))
+
+
+def _handler(llm: FakeLLMClient, uow: InMemoryUnitOfWork) -> RunReasonerHandler:
+    return RunReasonerHandler(lambda: uow, llm, PromptRenderer(), _FixedClock())
+
+
+def _command() -> RunReasonerCommand:
+    chat = [{"role": "client", "text": "Отчёты собираются вручную, это долго."}] * 30
+    return RunReasonerCommand("deal-1", ExtractSource(crm={"Этап": "Решение"}, chat_list=chat))
+
+
+def test_reasoner_skips_llm_when_inputs_are_unchanged() -> None:
+    llm = FakeLLMClient(json.dumps(_RESPONSE, ensure_ascii=False))
+    uow = InMemoryUnitOfWork()
+    _seed(uow, "hold", None)
+    first = _handler(llm, uow).execute(_command())
+    second = _handler(llm, uow).execute(_command())
+
+    assert (first.mode, second.mode) == ("full", "reused")
+    assert len(llm.calls) == 1
+    assert second.result == first.result
+
+
+def test_reasoner_sends_only_delta_with_previous_decision() -> None:
+    llm = FakeLLMClient(json.dumps(_RESPONSE, ensure_ascii=False))
+    uow = InMemoryUnitOfWork()
+    _seed(uow, "hold", None)
+    _handler(llm, uow).execute(_command())
+    _seed(uow, "go", {"amount": 100})
+    outcome = _handler(llm, uow).execute(_command())
+
+    full, delta = llm.calls
+    assert outcome.mode == "delta"
+    assert "budget_confirmed" in delta.user and "N / pain_confirmed [ok]" in delta.user
+    assert "Отчёты собираются вручную Отчёты" not in delta.user
+    assert "Переход статуса: hold → go" in delta.user
+    assert len(delta.user) < len(full.user) / 3
+    stored = uow.reasonings.get("deal-1")
+    assert stored is not None and stored.status == "go"
+
+
+def test_other_framework_facts_neither_trigger_nor_enter_the_delta() -> None:
+    llm = FakeLLMClient(json.dumps(_RESPONSE, ensure_ascii=False))
+    uow = InMemoryUnitOfWork()
+    _seed(uow, "hold", None)
+    _handler(llm, uow).execute(_command())
+    uow.facts.upsert(_fact("C3", "deadline_documented", "2025-03-05", framework="med2ic3"))
+    reused = _handler(llm, uow).execute(_command())
+    _seed(uow, "go", {"amount": 100})
+    _handler(llm, uow).execute(_command())
+
+    assert reused.mode == "reused" and len(llm.calls) == 2
+    assert "deadline_documented" not in llm.calls[1].user
+
+
+def test_sql_reasoning_repo_roundtrip(sql_uow_factory: UnitOfWorkFactory) -> None:
+    reasoning = Reasoning("deal-1", "abc", "hold", 0.5, {"bant.B/x": "h"}, _RESPONSE, _NOW)
+    with sql_uow_factory() as uow:
+        uow.reasonings.save(reasoning)
+        uow.commit()
+    with sql_uow_factory() as uow:
+        assert uow.reasonings.get("deal-1") == reasoning
@@ -0,0 +1,75 @@
+"""Проверка SSE broadcaster: fan-out по сделкам, схлопывание очередей и отписка."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.sse.broadcaster import HEARTBEAT_FRAME, SSEBroadcaster
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.routes.stream import state_frames
+from backend.application.use_cases import IngestEventCommand, IngestEventHandler
+from backend.domain.entities import DealReadModel
+
+
+def _state(deal_id: str, score: float) -> DealReadModel:
+    return DealReadModel(deal_id, "pending", score, None, None)
+
+
+def test_slow_consumer_gets_only_latest_state() -> None:
+    async def scenario() -> tuple[float | None, int, float]:
+        metrics = InMemoryMetrics()
+        broadcaster = SSEBroadcaster(metrics, queue_size=2)
+        subscription = broadcaster.subscribe("deal-1")
+        for score in range(5):
+            broadcaster.publish(_state("deal-1", float(score)))
+        latest = await subscription.next(timeout=0.1)
+        assert latest is not None
+        return latest.score, len(subscription), metrics.counter("sse_dropped_total")
+
+    assert asyncio.run(scenario()) == (4.0, 0, 4.0)
+
+
+def test_ten_thousand_subscribers_receive_updates_from_worker_threads() -> None:
+    async def scenario() -> tuple[int, int, float]:
+        metrics = InMemoryMetrics()
+        broadcaster = SSEBroadcaster(metrics, queue_size=1)
+        subscriptions = [broadcaster.subscribe(f"deal-{index % 100}") for index in range(10_000)]
+        handler = IngestEventHandler(InMemoryUnitOfWork, SystemClock(), notifier=broadcaster)
+        started = time.perf_counter()
+        for round_ in range(3):
+            for deal in range(100):
+                command = IngestEventCommand(f"deal-{deal}", "note", {"round": round_})
+                await asyncio.to_thread(handler.execute, command)
+        states = await asyncio.gather(*(sub.next(timeout=5.0) for sub in subscriptions))
+        elapsed = time.perf_counter() - started
+        events = [state.last_event for state in states if state is not None]
+        rounds = {event["payload"]["round"] for event in events if event is not None}
+        for subscription in subscriptions:
+            broadcaster.unsubscribe(subscription)
+        assert metrics.gauge("sse_subscribers") == 0
+        return len(states), len(rounds), elapsed
+
+    received, rounds, elapsed = asyncio.run(scenario())
+    assert (received, rounds) == (10_000, 1)
+    assert elapsed < 10.0
+
+
+def test_frames_send_heartbeats_and_unsubscribe_on_close() -> None:
+    async def scenario() -> list[str]:
+        broadcaster = SSEBroadcaster(heartbeat_seconds=0.01)
+        subscription = broadcaster.subscribe("deal-1")
+        frames = state_frames(broadcaster, subscription, DealReadModel.empty("deal-1"))
+        collected = [await anext(frames), await anext(frames)]
+        broadcaster.publish(_state("deal-1", 0.5))
+        collected.append(await anext(frames))
+        await frames.aclose()
+        assert broadcaster.subscribers == 0
+        return collected
+
+    initial, heartbeat, update = asyncio.run(scenario())
+    assert initial.startswith("event: state\nid: 0\ndata: {") and '"status":"unknown"' in initial
+    assert heartbeat == HEARTBEAT_FRAME
+    assert '"score":0.5' in update and update.endswith("\n\n")
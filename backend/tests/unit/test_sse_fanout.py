@@ -0,0 +1,81 @@
+"""Проверка межпроцессной рассылки SSE: уведомления без состояния и ленивое дочитывание."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from sqlalchemy import create_engine
+
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.in_memory_read_model_repo import InMemoryReadModelRepository
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.sse.backends import InProcessBackend, InProcessHub, StateChange
+from backend.adapters.sse.broadcaster import SSEBroadcaster
+from backend.adapters.sse.fanout import FanoutNotifier, StateRelay
+from backend.adapters.sse.postgres_backend import PostgresNotifyBackend
+from backend.adapters.time.system_clock import SystemClock
+from backend.application.use_cases import (
+    GetDealStateHandler,
+    GetDealStateQuery,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.domain.entities import DealReadModel
+
+
+class _Worker:
+    def __init__(self, hub: InProcessHub, store: InMemoryReadModelRepository) -> None:
+        self.metrics = InMemoryMetrics()
+        self.loads: list[str] = []
+        self.broadcaster = SSEBroadcaster(self.metrics)
+        factory = lambda: InMemoryUnitOfWork(read_model_repo=store)  # noqa: E731
+        get_state = GetDealStateHandler(factory)
+        backend = InProcessBackend(hub)
+        backend.start(StateRelay(self.broadcaster, self._loader(get_state), self.metrics))
+        notifier = FanoutNotifier(self.broadcaster, backend)
+        self.ingest = IngestEventHandler(factory, SystemClock(), notifier=notifier)
+
+    def _loader(self, get_state: GetDealStateHandler) -> Callable[[str], DealReadModel]:
+        def load(deal_id: str) -> DealReadModel:
+            self.loads.append(deal_id)
+            return get_state.execute(GetDealStateQuery(deal_id))
+
+        return load
+
+
+def test_payload_carries_only_deal_id_and_version() -> None:
+    change = StateChange("deal-1", 7, 1.5)
+
+    assert StateChange.from_payload(change.to_payload()) == change
+    assert len(change.to_payload()) < 64
+
+
+def test_update_on_one_worker_reaches_subscribers_of_another() -> None:
+    async def scenario() -> tuple[_Worker, _Worker, list]:
+        hub, store = InProcessHub(), InMemoryReadModelRepository()
+        worker_a, worker_b = _Worker(hub, store), _Worker(hub, store)
+        subscription = worker_b.broadcaster.subscribe("deal-1")
+        await asyncio.to_thread(worker_a.ingest.execute, IngestEventCommand("deal-1", "note", {}))
+        await asyncio.to_thread(worker_a.ingest.execute, IngestEventCommand("deal-2", "note", {}))
+        received = [await subscription.next(timeout=1.0), await subscription.next(timeout=0.05)]
+        return worker_a, worker_b, received
+
+    worker_a, worker_b, received = asyncio.run(scenario())
+    assert received[0].version == 1 and received[1] is None
+    assert worker_b.loads == ["deal-1"]
+    assert worker_a.loads == []
+    assert worker_b.metrics.histogram("sse_delivery_latency_seconds").count == 1
+    assert worker_a.metrics.counter("sse_relay_skipped_total") == 2
+
+
+def test_failed_notify_is_counted_and_does_not_fail_the_ingest() -> None:
+    metrics, uow = InMemoryMetrics(), InMemoryUnitOfWork()
+    # В SQLite нет pg_notify: NOTIFY падает так же, как при недоступной БД.
+    backend = PostgresNotifyBackend(create_engine("sqlite://"), metrics=metrics)
+    notifier = FanoutNotifier(SSEBroadcaster(metrics), backend)
+    handler = IngestEventHandler(lambda: uow, SystemClock(), notifier=notifier)
+
+    assert handler.execute(IngestEventCommand("deal-1", "note", {})).version == 1
+    assert metrics.counter("sse_notify_errors_total") == 1
+    assert metrics.counter("sse_notify_total") == 0
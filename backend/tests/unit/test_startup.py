@@ -0,0 +1,115 @@
+"""Проверка холодного старта: бюджет импорта, lifespan-прогрев и CLI создания схемы."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.app import di
+from backend.app.main import app
+from backend.app.metrics import get_metrics_runtime
+from backend.config.settings import get_settings
+from backend.db.migrate import main as migrate
+from backend.domain.entities import DealReadModel
+
+# deal_read_models до появления version: такие таблицы есть в уже развёрнутых БД.
+_PRE_VERSION_READ_MODELS = """
+CREATE TABLE deal_read_models (
+    deal_id VARCHAR(64) PRIMARY KEY,
+    status VARCHAR(32) NOT NULL,
+    score NUMERIC(10, 4),
+    last_event JSON,
+    updated_at DATETIME,
+    letters JSON NOT NULL
+)
+"""
+# Импорт backend.app.main без самих fastapi/pydantic/yaml; сейчас ~0.2 с, до ленивого DI ~0.7 с.
+IMPORT_BUDGET_SECONDS = 0.5
+HEAVY_MODULES = ("sqlalchemy", "psycopg", "backend.app.container")
+_PROBE = """
+import json, sys, time
+import fastapi, fastapi.openapi.models, fastapi.routing, pydantic, yaml
+started = time.perf_counter()
+import backend.app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def test_app_import_stays_within_cold_start_budget() -> None:
+    runs = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", _PROBE % (HEAVY_MODULES,)],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+
+    assert all(not run["loaded"] for run in runs), runs
+    assert min(run["seconds"] for run in runs) < IMPORT_BUDGET_SECONDS, runs
+
+
+def test_lifespan_creates_schema_warms_pool_and_closes_container(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database_url = f"sqlite:///{tmp_path / 'startup.db'}"
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setenv("DB_CREATE_SCHEMA", "true")
+    monkeypatch.setattr(di, "_container", None)
+    get_settings.cache_clear()
+    try:
+        with TestClient(app) as client:
+            assert client.get("/").status_code == 200
+        container = di.peek_container()
+    finally:
+        get_settings.cache_clear()
+
+    gauges = get_metrics_runtime().registry.snapshot().gauges
+    assert container is not None
+    assert ("startup_warmup_seconds", (("stage", "pool"),)) in gauges
+    assert "events" in inspect(create_engine(database_url)).get_table_names()
+
+
+def test_migrate_cli_creates_schema_once_for_all_workers(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    database_url = f"sqlite:///{tmp_path / 'migrate.db'}"
+
+    migrate(["--database-url", database_url])
+    migrate(["--database-url", database_url])
+
+    tables = inspect(create_engine(database_url)).get_table_names()
+    assert {"deal_jobs", "idempotency_keys"} <= set(tables)
+    assert capsys.readouterr().out.count("Схема готова") == 2
+
+
+def test_migrate_adds_version_to_existing_read_model_table(tmp_path: Path) -> None:
+    database_url = f"sqlite:///{tmp_path / 'upgrade.db'}"
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        connection.execute(text(_PRE_VERSION_READ_MODELS))
+        connection.execute(
+            text("INSERT INTO deal_read_models VALUES ('deal-1', 'go', 0.5, NULL, NULL, '{}')")
+        )
+
+    migrate(["--database-url", database_url])
+
+    with SqlAlchemyUnitOfWork(sessionmaker(bind=engine)) as uow:
+        stored = uow.read_models.get("deal-1")
+        assert stored is not None and stored.version == 0
+        uow.read_models.save(DealReadModel.empty("deal-2"))
+        uow.commit()
+    with SqlAlchemyUnitOfWork(sessionmaker(bind=engine)) as uow:
+        assert uow.read_models.get("deal-2") is not None
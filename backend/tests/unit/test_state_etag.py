@@ -0,0 +1,67 @@
+"""Проверка условного GET /state/{deal_id}: ETag по версии и 304 без чтения содержимого."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from backend.adapters.persistence.in_memory_read_model_repo import InMemoryReadModelRepository
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.di import provide_get_state_handler
+from backend.app.main import app
+from backend.application.use_cases import (
+    GetDealStateHandler,
+    IngestEventCommand,
+    IngestEventHandler,
+)
+from backend.domain.entities import DealReadModel
+from backend.ports.unit_of_work import UnitOfWorkFactory
+
+
+class _CountingRepo(InMemoryReadModelRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.full_reads = 0
+
+    def get(self, deal_id: str) -> DealReadModel | None:
+        self.full_reads += 1
+        return super().get(deal_id)
+
+
+def test_current_client_gets_304_without_loading_read_model() -> None:
+    repo = _CountingRepo()
+    factory = lambda: InMemoryUnitOfWork(read_model_repo=repo)  # noqa: E731
+    ingest = IngestEventHandler(factory, SystemClock())
+    ingest.execute(IngestEventCommand("deal-1", "note", {}))
+    app.dependency_overrides[provide_get_state_handler] = lambda: GetDealStateHandler(factory)
+    client = TestClient(app)
+    try:
+        first = client.get("/state/deal-1")
+        etag = first.headers["ETag"]
+        repo.full_reads = 0
+        cached = client.get("/state/deal-1", headers={"If-None-Match": f"W/{etag}, \"x\""})
+        reads_for_304 = repo.full_reads
+        ingest.execute(IngestEventCommand("deal-1", "note", {}))
+        changed = client.get("/state/deal-1", headers={"If-None-Match": etag})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200 and etag.startswith('"1.')
+    assert (cached.status_code, cached.content, cached.headers["ETag"]) == (304, b"", etag)
+    assert reads_for_304 == 0
+    assert changed.status_code == 200 and changed.json()["version"] == 2
+    assert changed.headers["ETag"] != etag
+
+
+def test_sql_stamp_matches_stored_model(sql_uow_factory: UnitOfWorkFactory) -> None:
+    IngestEventHandler(sql_uow_factory, SystemClock()).execute(
+        IngestEventCommand("deal-1", "note", {})
+    )
+    with sql_uow_factory() as uow:
+        stamp = uow.read_models.get_stamp("deal-1")
+        model = uow.read_models.get("deal-1")
+        missing = uow.read_models.get_stamp("deal-2")
+
+    assert model is not None and stamp is not None
+    assert stamp == model.stamp and stamp.version == 1
+    assert missing is None
@@ -0,0 +1,34 @@
+"""Проверка прямой сериализации read-model: те же байты, что у DealStateOut, и прежняя схема."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from backend.app.main import app
+from backend.domain.entities import DealReadModel
+from backend.schemas.read_model import DealStateOut, deal_state_json
+
+
+def test_fast_path_matches_dto_serialization() -> None:
+    model = DealReadModel(
+        deal_id="deal-1",
+        status="progress",
+        score=0.25,
+        last_event={"kind": "note", "payload": {"text": "Бюджет согласован"}},
+        updated_at=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        letters={"B": {"facets": {"budget": {"evidence": ["«есть бюджет»"]}}}},
+        version=3,
+    )
+
+    expected = DealStateOut.from_domain(model).model_dump_json().encode()
+    assert deal_state_json(model) == expected
+    assert deal_state_json(DealReadModel.empty("d")) == (
+        DealStateOut.from_domain(DealReadModel.empty("d")).model_dump_json().encode()
+    )
+
+
+def test_openapi_still_describes_state_with_dto() -> None:
+    operation = app.openapi()["paths"]["/state/{deal_id}"]["get"]
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert schema == {"$ref": "#/components/schemas/DealStateOut"}
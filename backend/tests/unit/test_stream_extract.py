@@ -0,0 +1,100 @@
+"""Проверка потокового Extract: инкрементальный парсер и время до первого факта."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.adapters.llm.fake_adapter import FakeLLMClient
+from backend.adapters.metrics.in_memory_metrics import InMemoryMetrics
+from backend.adapters.persistence.unit_of_work import InMemoryUnitOfWork
+from backend.application.use_cases.extract_facts import ExtractFactsCommand
+from backend.application.use_cases.stream_extract import StreamExtractFactsHandler
+from backend.pipelines.extract_llm import ExtractSource
+from backend.pipelines.json_stream import JsonArrayStream, iter_json_array
+from backend.ports.clock import ClockPort
+from backend.ports.llm_client import LLMResponseInvalid
+from backend.prompts.renderer import PromptRenderer
+
+
+class _FixedClock(ClockPort):
+    def utcnow(self) -> datetime:
+        return datetime(2025, 1, 20, tzinfo=timezone.utc)
+
+
+def _item(
+    letter: str, facet: str, evidence: str, confidence: float = 0.8
+) -> dict[str, object]:
+    return {
+        "letter": letter,
+        "facet": facet,
+        "value": True,
+        "confidence": confidence,
+        "source": "chat",
+        "evidence": evidence,
+        "ts": None,
+    }
+
+
+def test_parser_yields_objects_split_across_chunks() -> None:
+    items = [{"evidence": 'скобки } и ] и "кавычки"', "nested": {"a": [1, {"b": 2}]}}, {"x": 1}]
+    text = json.dumps(items, ensure_ascii=False)
+    parser = JsonArrayStream()
+    emitted = [len(parser.feed(char)) for char in text]
+    parser.close()
+
+    assert list(iter_json_array(text[i : i + 3] for i in range(0, len(text), 3))) == items
+    assert emitted.index(1) < len(text) - len(json.dumps(items[1])) - 1
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['[{"a": 1}, {"b"', '[{"a": 1}{"b": 2}]', '[,,{"a": 1}]', '[{"a": 1},,{"b": 2}]', "[{}, ]"],
+)
+def test_parser_rejects_truncated_or_malformed_stream(text: str) -> None:
+    with pytest.raises(LLMResponseInvalid):
+        list(iter_json_array([text]))
+
+
+def test_parser_accepts_empty_array() -> None:
+    assert list(iter_json_array([" [ ] "])) == []
+
+
+def test_stream_extract_stores_first_fact_before_stream_ends() -> None:
+    text = json.dumps(
+        [_item("B", "budget_confirmed", "Бюджет есть"), _item("N", "pain_confirmed", "Болит")],
+        ensure_ascii=False,
+    )
+    llm = FakeLLMClient(text, chunk_size=8, chunk_delay=0.002)
+    uow = InMemoryUnitOfWork()
+    metrics = InMemoryMetrics()
+    handler = StreamExtractFactsHandler(
+        lambda: uow, llm, PromptRenderer(), _FixedClock(), metrics=metrics
+    )
+    facts = handler.execute(
+        ExtractFactsCommand("deal-1", ExtractSource(crm={}), framework_ids=("bant",))
+    )
+
+    assert {fact.kind for fact in facts} == {"bant.B", "bant.N"}
+    assert len(uow.facts.list_for_deal("deal-1")) == 2
+    first = metrics.histogram("extract_time_to_first_fact_seconds")
+    total = metrics.histogram("extract_stream_seconds")
+    assert first.count == 1 and first.total < total.total
+    assert metrics.counter("extract_stream_facts_total") == 2
+
+
+def test_stream_extract_keeps_the_most_confident_repeat_of_a_facet() -> None:
+    uow = InMemoryUnitOfWork()
+    command = ExtractFactsCommand("deal-1", ExtractSource(crm={}), framework_ids=("bant",))
+    for items in (
+        [_item("B", "budget_confirmed", "Точно есть", 0.9)],
+        [_item("B", "budget_confirmed", "Вроде", 0.4), _item("B", "budget_confirmed", "Да", 0.6)],
+    ):
+        llm = FakeLLMClient(json.dumps(items, ensure_ascii=False), chunk_size=16)
+        handler = StreamExtractFactsHandler(lambda: uow, llm, PromptRenderer(), _FixedClock())
+        handler.execute(command)
+
+    (fact,) = uow.facts.list_for_deal("deal-1")
+    assert fact.payload["facets"]["budget_confirmed"]["evidence"] == "Точно есть"
@@ -1,2 +1,25 @@
-# Утилиты хэширования данных
+"""Утилиты хэширования данных: стабильный отпечаток JSON-совместимых структур."""
 
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> str:
+    """Сериализовать значение детерминированно: сортировка ключей, без пробелов."""
+
+    return json.dumps(
+        value,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def stable_hash(value: Any) -> str:
+    """Вернуть sha256 от канонического JSON значения (hex)."""
+
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
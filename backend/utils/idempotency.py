@@ -1,2 +1,47 @@
-# Утилиты идемпотентности: генерация idem_key, хэширование evidence
+"""Утилиты идемпотентности: ключ приёма события из заголовка или отпечатка payload."""
 
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Mapping
+
+from backend.utils.hashing import stable_hash
+
+MAX_HEADER_KEY_LENGTH = 128
+
+
+def key_from_header(value: str) -> str:
+    """Ключ из заголовка Idempotency-Key; длинные значения заменяются их sha256."""
+
+    value = value.strip()
+    if len(value) > MAX_HEADER_KEY_LENGTH:
+        value = hashlib.sha256(value.encode("utf-8")).hexdigest()
+    return f"h:{value}"
+
+
+def key_from_event(
+    deal_id: str,
+    kind: str,
+    payload: Mapping[str, Any],
+    window_seconds: float = 3600.0,
+    now: datetime | None = None,
+) -> str:
+    """Ключ из sha256 канонического JSON события и номера окна — для клиентов без заголовка.
+
+    Повтором считается такое же событие в том же окне window_seconds: то же
+    содержимое позже — новое событие, а не вечный дубликат. Повтор на стыке
+    окон получает новый ключ; 0 отключает окно (ключ бессрочный).
+    """
+
+    digest = stable_hash({"deal_id": deal_id, "kind": kind, "payload": dict(payload)})
+    if window_seconds <= 0:
+        return f"p:{digest}"
+    moment = (now or datetime.now(timezone.utc)).timestamp()
+    return f"p:{digest}:{int(moment // window_seconds)}"
+
+
+def item_key(batch_key: str, index: int) -> str:
+    """Ключ элемента пачки, пришедшей с общим Idempotency-Key."""
+
+    return f"{batch_key}#{index}"
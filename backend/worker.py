@@ -0,0 +1,74 @@
+"""Отдельный процесс-воркер outbox: python -m backend.worker [--threads N]."""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.adapters.recompute.outbox_worker import OutboxWorker
+from backend.adapters.sse.fanout import FanoutNotifier
+from backend.adapters.sse.postgres_backend import PostgresNotifyBackend
+from backend.adapters.time.system_clock import SystemClock
+from backend.app.database import build_engine
+from backend.app.metrics import get_metrics
+from backend.app.notifications import cross_worker_channel
+from backend.application.use_cases.recompute import RecomputeCommand, RecomputeHandler
+from backend.config.settings import Settings, get_settings
+from backend.ports.notifier import NullNotifier, StateNotifierPort
+
+
+def build_worker(settings: Settings, batch_size: int) -> OutboxWorker:
+    """Собрать воркер с обработчиком пересчёта поверх настроек приложения."""
+
+    # С METRICS_MULTIPROC_DIR снимки метрик воркера попадают в /metrics веб-процессов.
+    metrics = get_metrics()
+    engine = build_engine(settings, metrics, label="worker")
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def uow_factory() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(session_factory)
+
+    # Подписчиков SSE в воркере нет: новые версии только рассылаются веб-воркерам,
+    # которые по ним сбрасывают кэш read-model и (при SSE_BACKEND=postgres) шлют SSE.
+    notifier: StateNotifierPort = NullNotifier()
+    if cross_worker_channel(settings):
+        notifier = FanoutNotifier(NullNotifier(), PostgresNotifyBackend(engine))
+    recompute = RecomputeHandler(uow_factory=uow_factory, notifier=notifier, metrics=metrics)
+    return OutboxWorker(
+        uow_factory=uow_factory,
+        handlers={"recompute": lambda deal_id: recompute.execute(RecomputeCommand(deal_id))},
+        clock=SystemClock(),
+        batch_size=batch_size,
+        metrics=metrics,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Запустить потоки воркера до SIGINT/SIGTERM."""
+
+    parser = argparse.ArgumentParser(description="Воркер outbox задач сделок")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--idle-seconds", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    worker = build_worker(get_settings(), args.batch_size)
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    threads = [
+        threading.Thread(target=worker.run_forever, args=(stop, args.idle_seconds))
+        for _ in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
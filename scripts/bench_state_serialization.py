@@ -0,0 +1,68 @@
+"""Сравнить CPU-стоимость сериализации ответа /state: DTO + response_model против прямого пути."""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+
+from backend.domain.entities import DealReadModel
+from backend.schemas.read_model import DealStateOut, deal_state_json
+
+
+def build_model(letters: int = 8, facets: int = 40) -> DealReadModel:
+    """Read-model с крупным payload letters, как у сделки с полным MED2IC3."""
+
+    now = datetime.now(timezone.utc)
+    return DealReadModel(
+        deal_id="bench-deal",
+        status="progress",
+        score=0.73,
+        last_event={"kind": "note", "payload": {"text": "x" * 200}, "created_at": now.isoformat()},
+        updated_at=now,
+        letters={
+            f"L{letter}": {
+                "score": 0.5,
+                "facets": {
+                    f"facet_{facet}": {
+                        "value": f"Значение {facet}",
+                        "confidence": 0.8,
+                        "evidence": [f"цитата {index} из переписки" for index in range(3)],
+                    }
+                    for facet in range(facets)
+                },
+            }
+            for letter in range(letters)
+        },
+        version=42,
+    )
+
+
+def via_response_model(model: DealReadModel) -> bytes:
+    """Прежний путь: from_domain, повторная валидация response_model и JSONResponse."""
+
+    dto = DealStateOut.from_domain(model)
+    validated = DealStateOut.model_validate(dto.model_dump())
+    content = validated.model_dump(mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def main(rounds: int = 2000) -> int:
+    """Замерить оба пути и вывести время на ответ и выигрыш."""
+
+    model = build_model()
+    if json.loads(via_response_model(model)) != json.loads(deal_state_json(model)):
+        print("Ответы различаются")
+        return 1
+    size = len(deal_state_json(model))
+    old = timeit.timeit(lambda: via_response_model(model), number=rounds) / rounds
+    new = timeit.timeit(lambda: deal_state_json(model), number=rounds) / rounds
+    print(f"payload: {size / 1024:.1f} KiB, rounds: {rounds}")
+    print(f"response_model: {old * 1e6:8.1f} мкс/ответ")
+    print(f"deal_state_json: {new * 1e6:8.1f} мкс/ответ  (x{old / new:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,9 @@ from datetime import datetime, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from backend.adapters.persistence.orm_models import Base
 from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from backend.config.settings import get_settings
+from backend.db.migrate import create_schema
 from backend.domain.entities import DealReadModel
 
 
@@ -23,8 +23,7 @@ def seed_demo_deal() -> None:
         future=True,
         pool_pre_ping=True,
     )
-    if settings.create_schema:
-        Base.metadata.create_all(engine)
+    create_schema(engine)
     session_factory = sessionmaker(
         bind=engine,
         autoflush=False,